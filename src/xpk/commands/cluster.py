@@ -14,6 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable
+
 from tabulate import tabulate
 
 from ..utils.feature_flags import FeatureFlags
@@ -25,6 +28,7 @@ from .managed_ml_diagnostics import MANAGED_MLDIAGNOSTICS_MIN_GKE_VERSION
 from ..core.pathways import get_pathways_machine_types
 from ..core.cluster import (
     get_all_clusters_programmatic,
+    forget_cluster_credentials,
     get_cluster_credentials,
     install_nccl_on_cluster,
     install_nri_on_cluster,
@@ -52,6 +56,7 @@ from ..core.reservation import (
     get_reservation_deployment_type,
 )
 from ..core.gcloud_context import (
+    GkeServerConfig,
     add_zone_and_project,
     get_gke_control_plane_version,
     get_gke_server_config,
@@ -66,14 +71,18 @@ from ..core.network import (
     delete_cluster_subnets,
     set_up_cluster_network_for_a3,
 )
+from ..core.node_inventory import NodeInventory, get_node_inventory
 from ..core.nodepool import (
     get_gke_node_pool_version,
+    print_reservation_packing_plan,
     run_gke_node_pool_create_command,
 )
 from ..core.ray import install_ray_cluster
 from ..core.mtc import install_mtc_on_cluster
 from ..core.resources import AutoprovisioningConfig, create_cluster_configmaps
 from ..core.scheduling import get_total_chips_requested_from_args
+from ..core.step_graph import Step, format_step_results, run_step_graph
+from ..core.step_journal import clear_step_journal, get_step_journal
 from ..core.storage import install_storage_crd
 from ..core.system_characteristics import (
     AcceleratorType,
@@ -394,9 +403,13 @@ def cluster_create(args) -> None:
         ' --adapt-from-ct flag.'
     )
 
+  if getattr(args, 'plan_only', False):
+    xpk_exit(print_reservation_packing_plan(args, system))
+
   _log_cluster_create_telemetry(args)
   gke_server_config = None
   gke_control_plane_version = None
+  release_channel = None
 
   if not adapt_from_ct:
     release_channel = (
@@ -427,160 +440,325 @@ def cluster_create(args) -> None:
       )
       xpk_exit(0)
 
-    create_cluster_command_code = create_cluster_if_necessary(
-        args, gke_control_plane_version, system, release_channel=release_channel
-    )
-    if create_cluster_command_code != 0:
-      xpk_exit(create_cluster_command_code)
+  journal = get_step_journal(
+      'cluster_create',
+      _cluster_create_journal_key(args),
+      {key: value for key, value in vars(args).items() if not callable(value)},
+  )
+  return_code, results = run_step_graph(
+      _cluster_create_steps(
+          args,
+          system,
+          adapt_from_ct,
+          gke_server_config,
+          gke_control_plane_version,
+          release_channel,
+      ),
+      journal=journal,
+  )
+  if not is_dry_run():
+    xpk_print(f'Cluster create steps:\n{format_step_results(results)}')
+  if return_code != 0:
+    if journal is not None:
+      xpk_print(
+          'Rerun the same command to resume from the steps that did not'
+          ' complete, or add --no-cache to run every step again.'
+      )
+    xpk_exit(return_code)
 
-    authorize_private_cluster_access_command_code = (
-        authorize_private_cluster_access_if_necessary(args)
-    )
-    if authorize_private_cluster_access_command_code != 0:
-      xpk_exit(authorize_private_cluster_access_command_code)
+  xpk_print('GKE commands done! Resources are created.')
+  xpk_print(
+      'See your GKE Cluster here:'
+      # pylint: disable=line-too-long
+      f' https://console.cloud.google.com/kubernetes/clusters/details/{get_cluster_location(args.project, args.cluster, args.zone)}/{args.cluster}/details?project={args.project}'
+  )
 
-    # ToDo(roshanin@) - Re-enable CloudDNS on Pathways clusters conditionally.
-    # Enable WorkloadIdentity if not enabled already.
-    if args.enable_workload_identity or args.enable_gcsfuse_csi_driver:
-      update_cluster_command_code = (
-          update_cluster_with_workload_identity_if_necessary(args)
+  if args.managed_mldiagnostics:
+    if adapt_from_ct:
+      xpk_print(
+          'Managed ML diagnostics setup was skipped due to the'
+          ' --adapt-from-ct flag.'
+      )
+    else:
+      grant_permissions_code = (
+          grant_compute_default_sa_mldiagnostics_permissions(args.project)
       )
-      if update_cluster_command_code != 0:
-        xpk_exit(update_cluster_command_code)
+      if grant_permissions_code != 0:
+        xpk_exit(grant_permissions_code)
 
-    # Enable MTC if not enabled already.
-    if getattr(args, 'enable_mtc', False):
-      update_cluster_command_code = update_cluster_with_mtc_if_necessary(args)
-      if update_cluster_command_code != 0:
-        xpk_exit(update_cluster_command_code)
+      assert gke_control_plane_version is not None
+      if not is_gke_version_at_least(
+          gke_control_plane_version, MANAGED_MLDIAGNOSTICS_MIN_GKE_VERSION
+      ):
+        return_code = install_mldiagnostics_prerequisites()
+        if return_code != 0:
+          xpk_print('Installation of MLDiagnostics failed.')
+          xpk_exit(return_code)
 
-  get_cluster_credentials(args)
+  xpk_exit(0)
 
-  if not adapt_from_ct:
-    update_coredns_command_code = update_coredns_if_necessary(args)
-    if update_coredns_command_code != 0:
-      xpk_exit(update_coredns_command_code)
 
-  if not is_dry_run():
-    k8s_client = setup_k8s_env(args)
-    install_storage_crd(k8s_client)
+@dataclass
+class _ClusterCreateOutputs:
+  """Values produced by cluster create steps for the steps that follow."""
 
-  install_storage_csis(args)
+  k8s_client: Any = None
+  tensorboard_config: dict = field(default_factory=dict)
+  autoprovisioning_config: AutoprovisioningConfig | None = None
 
-  # create Vertex Tensorboard for new and existing clusters if create-vertex-tensorboard is set
-  tensorboard_config = {}
-  if VERTEX_TENSORBOARD_FEATURE_FLAG and args.create_vertex_tensorboard:
-    tensorboard_config = create_vertex_tensorboard(args)
-    # exit if failed to create Tensorboard in Vertex AI
-    if not tensorboard_config:
-      xpk_exit(1)
 
-  if not adapt_from_ct:
-    if system.device_type == H100_DEVICE_TYPE:
-      xpk_print('Setting up Network for cluster')
-      set_up_cluster_network_code = set_up_cluster_network_for_a3(args)
-      if set_up_cluster_network_code != 0:
-        xpk_exit(set_up_cluster_network_code)
-
-      xpk_print('Creating Network Config for cluster')
-      create_cluster_network_config_code = create_cluster_network_config(args)
-      if create_cluster_network_config_code != 0:
-        xpk_exit(create_cluster_network_config_code)
-
-    # Check the control plane version of the cluster and determine the node pool
-    # version to use.
+def _cluster_create_journal_key(args) -> str:
+  return f'{args.project}/{args.zone}/{args.cluster}'
+
+
+def _cluster_create_steps(
+    args,
+    system: SystemCharacteristics,
+    adapt_from_ct: bool,
+    gke_server_config: GkeServerConfig | None,
+    gke_control_plane_version: str | None,
+    release_channel: ReleaseChannel | None,
+) -> list[Step]:
+  """Lists the steps of cluster create with the steps they depend on.
+
+  Steps that update the GKE cluster or its node pools share the `gke`
+  exclusive key, as GKE rejects concurrent operations on a cluster. The
+  Kubernetes and Vertex AI steps overlap with them.
+
+  Args:
+    args: user provided arguments for running the command.
+    system: system characteristics of the cluster.
+    adapt_from_ct: whether the cluster and node pools already exist.
+    gke_server_config: GKE server config, None if adapt_from_ct.
+    gke_control_plane_version: control plane version, None if adapt_from_ct.
+    release_channel: release channel of the cluster, None if adapt_from_ct.
+
+  Returns:
+    Steps to pass to `run_step_graph`.
+  """
+  outputs = _ClusterCreateOutputs()
+  steps: list[Step] = []
+
+  def add(
+      name: str,
+      run: Callable[[], int],
+      depends_on: tuple[str, ...] = (),
+      **options: Any,
+  ) -> None:
+    # Dependencies on steps that are disabled for this cluster are dropped.
+    declared = {step.name for step in steps}
+    depends_on = tuple(
+        dependency for dependency in depends_on if dependency in declared
+    )
+    steps.append(Step(name, run, depends_on, **options))
+
+  def create_cluster() -> int:
+    assert gke_control_plane_version is not None
+    assert release_channel is not None
+    return create_cluster_if_necessary(
+        args, gke_control_plane_version, system, release_channel=release_channel
+    )
+
+  def get_credentials() -> int:
+    get_cluster_credentials(args)
+    if not is_dry_run():
+      outputs.k8s_client = setup_k8s_env(args)
+    return 0
+
+  def install_crd() -> int:
+    install_storage_crd(outputs.k8s_client)
+    return 0
+
+  def install_csis() -> int:
+    install_storage_csis(args)
+    return 0
+
+  def create_tensorboard() -> int:
+    outputs.tensorboard_config = create_vertex_tensorboard(args)
+    # fail if Tensorboard could not be created in Vertex AI
+    return 0 if outputs.tensorboard_config else 1
+
+  def restore_tensorboard(tensorboard_config: dict) -> None:
+    outputs.tensorboard_config = tensorboard_config
+
+  def create_node_pools() -> int:
+    # Check the control plane version of the cluster and determine the node
+    # pool version to use.
     assert gke_server_config is not None
     return_code, gke_node_pool_version = get_gke_node_pool_version(
         args, gke_server_config
     )
     if return_code != 0:
-      xpk_exit(return_code)
+      return return_code
     assert gke_node_pool_version
+    return run_gke_node_pool_create_command(args, system, gke_node_pool_version)
 
-    run_gke_node_pool_create_command_code = run_gke_node_pool_create_command(
-        args, system, gke_node_pool_version
+  def enable_autoprovisioning() -> int:
+    xpk_print('Enabling Autoprovisioning')
+    outputs.autoprovisioning_config, return_code = (
+        enable_autoprovisioning_on_cluster(args, system)
     )
-    if run_gke_node_pool_create_command_code != 0:
-      xpk_exit(run_gke_node_pool_create_command_code)
+    return return_code
 
-  # Provision node pools dynamically based on incoming workloads:
-  # Currently autoprovisioning is not supported with Pathways.
-  autoprovisioning_config = None
-  if args.enable_autoprovisioning:
-    xpk_print('Enabling Autoprovisioning')
-    autoprovisioning_config, return_code = enable_autoprovisioning_on_cluster(
-        args, system
+  def save_autoprovisioning() -> dict | None:
+    config = outputs.autoprovisioning_config
+    return asdict(config) if config else None
+
+  def restore_autoprovisioning(config: dict | None) -> None:
+    outputs.autoprovisioning_config = (
+        AutoprovisioningConfig(**config) if config else None
     )
-    if return_code != 0:
-      xpk_exit(return_code)
 
-  xpk_print('Creating ConfigMap for cluster')
-  create_cluster_configmaps_code = create_cluster_configmaps(
-      args, system, tensorboard_config, autoprovisioning_config
-  )
-  if create_cluster_configmaps_code != 0:
-    xpk_exit(create_cluster_configmaps_code)
+  def create_configmaps() -> int:
+    xpk_print('Creating ConfigMap for cluster')
+    return create_cluster_configmaps(
+        args,
+        system,
+        outputs.tensorboard_config,
+        outputs.autoprovisioning_config,
+    )
 
-  xpk_print(
-      'Enabling the jobset API on our cluster, to be deprecated when Jobset is'
-      ' globally available'
-  )
-  set_jobset_on_cluster_code = set_jobset_on_cluster(args)
-  if set_jobset_on_cluster_code != 0:
-    xpk_exit(set_jobset_on_cluster_code)
-  update_jobset_resources_code = update_jobset_resources_if_necessary()
-  if update_jobset_resources_code != 0:
-    xpk_exit(update_jobset_resources_code)
+  def enable_jobset() -> int:
+    xpk_print(
+        'Enabling the jobset API on our cluster, to be deprecated when Jobset'
+        ' is globally available'
+    )
+    return set_jobset_on_cluster(args)
 
-  install_kueue_code = _install_kueue(args, system, autoprovisioning_config)
-  if install_kueue_code != 0:
-    xpk_exit(install_kueue_code)
+  def install_kueue() -> int:
+    return _install_kueue(args, system, outputs.autoprovisioning_config)
 
-  if system.accelerator_type == AcceleratorType.GPU:
+  def install_gpu_drivers() -> int:
     prepare_gpus(system)
+    return 0
 
-  if args.enable_ray_cluster:
+  def install_ray() -> int:
     return_code = install_ray_cluster(args, system)
     if return_code != 0:
       xpk_print('Installation of RayCluster failed.')
-      xpk_exit(return_code)
+    return return_code
 
-  if hasattr(args, 'enable_mtc') and args.enable_mtc:
+  def install_mtc() -> int:
     return_code = install_mtc_on_cluster(args, system)
     if return_code != 0:
       xpk_print('Installation of MTC failed.')
-      xpk_exit(return_code)
+    return return_code
 
-  xpk_print('GKE commands done! Resources are created.')
-  xpk_print(
-      'See your GKE Cluster here:'
-      # pylint: disable=line-too-long
-      f' https://console.cloud.google.com/kubernetes/clusters/details/{get_cluster_location(args.project, args.cluster, args.zone)}/{args.cluster}/details?project={args.project}'
+  if not adapt_from_ct:
+    add('cluster', create_cluster, exclusive='gke')
+    add(
+        'private-access',
+        lambda: authorize_private_cluster_access_if_necessary(args),
+        ('cluster',),
+        exclusive='gke',
+        # Authorizes the current IP address, which changes between runs.
+        resumable=False,
+    )
+  # Fetching the credentials points KUBECONFIG of the whole process at a new
+  # file, so every step launching commands waits for them to be in place.
+  add(
+      'credentials',
+      get_credentials,
+      ('cluster', 'private-access'),
+      resumable=False,
   )
-
-  if args.managed_mldiagnostics:
-    if adapt_from_ct:
-      xpk_print(
-          'Managed ML diagnostics setup was skipped due to the'
-          ' --adapt-from-ct flag.'
+  if not adapt_from_ct:
+    # ToDo(roshanin@) - Re-enable CloudDNS on Pathways clusters conditionally.
+    # Enable WorkloadIdentity if not enabled already.
+    if args.enable_workload_identity or args.enable_gcsfuse_csi_driver:
+      add(
+          'workload-identity',
+          lambda: update_cluster_with_workload_identity_if_necessary(args),
+          ('cluster', 'credentials'),
+          exclusive='gke',
       )
-    else:
-      grant_permissions_code = (
-          grant_compute_default_sa_mldiagnostics_permissions(args.project)
+    # Enable MTC if not enabled already.
+    if getattr(args, 'enable_mtc', False):
+      add(
+          'mtc-addon',
+          lambda: update_cluster_with_mtc_if_necessary(args),
+          ('cluster', 'credentials'),
+          exclusive='gke',
       )
-      if grant_permissions_code != 0:
-        xpk_exit(grant_permissions_code)
+    add(
+        'coredns',
+        lambda: update_coredns_if_necessary(args),
+        ('credentials',),
+    )
+  if not is_dry_run():
+    add('storage-crd', install_crd, ('credentials',))
+  add(
+      'storage-csi',
+      install_csis,
+      ('cluster', 'credentials', 'workload-identity'),
+      exclusive='gke',
+  )
+  # create Vertex Tensorboard for new and existing clusters if
+  # create-vertex-tensorboard is set
+  if VERTEX_TENSORBOARD_FEATURE_FLAG and args.create_vertex_tensorboard:
+    add(
+        'vertex-tensorboard',
+        create_tensorboard,
+        ('credentials',),
+        save=lambda: outputs.tensorboard_config,
+        restore=restore_tensorboard,
+    )
 
-      assert gke_control_plane_version is not None
-      if not is_gke_version_at_least(
-          gke_control_plane_version, MANAGED_MLDIAGNOSTICS_MIN_GKE_VERSION
-      ):
-        return_code = install_mldiagnostics_prerequisites()
-        if return_code != 0:
-          xpk_print('Installation of MLDiagnostics failed.')
-          xpk_exit(return_code)
+  if not adapt_from_ct:
+    if system.device_type == H100_DEVICE_TYPE:
+      add(
+          'a3-networks',
+          lambda: set_up_cluster_network_for_a3(args),
+          ('credentials',),
+      )
+      add(
+          'a3-network-config',
+          lambda: create_cluster_network_config(args),
+          ('a3-networks', 'credentials'),
+      )
+    # Node pools use GKE_METADATA with workload identity, which needs the
+    # workload pool of the cluster.
+    add(
+        'node-pools',
+        create_node_pools,
+        ('cluster', 'credentials', 'workload-identity', 'a3-network-config'),
+        exclusive='gke',
+    )
 
-  xpk_exit(0)
+  # Provision node pools dynamically based on incoming workloads:
+  # Currently autoprovisioning is not supported with Pathways.
+  if args.enable_autoprovisioning:
+    add(
+        'autoprovisioning',
+        enable_autoprovisioning,
+        ('node-pools',),
+        exclusive='gke',
+        save=save_autoprovisioning,
+        restore=restore_autoprovisioning,
+    )
+  add(
+      'configmaps',
+      create_configmaps,
+      ('credentials', 'node-pools', 'autoprovisioning', 'vertex-tensorboard'),
+  )
+  add('jobset', enable_jobset, ('credentials',))
+  add(
+      'jobset-resources',
+      update_jobset_resources_if_necessary,
+      ('jobset', 'node-pools'),
+  )
+  add(
+      'kueue',
+      install_kueue,
+      ('jobset-resources', 'node-pools', 'autoprovisioning'),
+  )
+  if system.accelerator_type == AcceleratorType.GPU:
+    add('gpu-drivers', install_gpu_drivers, ('credentials', 'node-pools'))
+  if args.enable_ray_cluster:
+    add('ray', install_ray, ('kueue',))
+  if getattr(args, 'enable_mtc', False):
+    add('mtc', install_mtc, ('credentials', 'mtc-addon', 'node-pools'))
+  return steps
 
 
 def cluster_delete(args) -> None:
@@ -688,10 +866,11 @@ def cluster_describe(args) -> None:
 
   get_cluster_credentials(args)
 
-  return_code, data_table = nodepools_build_table()
+  return_code, inventory = get_node_inventory()
   if return_code != 0:
     xpk_exit(return_code)
 
+  data_table = nodepools_build_table(inventory)
   if len(data_table) > 1:
     xpk_print(
         'Nodepools info:\n',
@@ -700,15 +879,7 @@ def cluster_describe(args) -> None:
   else:
     xpk_print('No nodepools info found')
 
-  return_code_node_output, node_output = run_command_for_value(
-      r'kubectl get node --no-headers=true'
-      r" --selector='cloud.google.com/gke-tpu-accelerator' | wc -l",
-      'Count TPU Nodes',
-  )
-  if return_code_node_output != 0:
-    xpk_exit(return_code_node_output)
-  node_output = node_output.splitlines()[-1]
-  number_tpu_vms_in_cluster = int(node_output)
+  number_tpu_vms_in_cluster = inventory.tpu_nodes
 
   return_code_pod_output, pod_output = run_command_for_value(
       "kubectl get pod -o=custom-columns='Status:.status.phase' | grep -i"
@@ -728,8 +899,8 @@ def cluster_describe(args) -> None:
   xpk_exit(0)
 
 
-def nodepools_build_table() -> tuple[int, list[list]]:
-  table = [[
+def nodepools_build_table(inventory: NodeInventory) -> list[list]:
+  table: list[list] = [[
       'NODEPOOL_NAME',
       'SLICE',
       'TYPE',
@@ -737,170 +908,16 @@ def nodepools_build_table() -> tuple[int, list[list]]:
       'ACTUAL_HEALTHY_NODES',
       'TOTAL_NODES',
   ]]
-
-  nodepools_data = {}
-
-  nodepools, return_code = get_node_pools_name()
-  if return_code != 0:
-    xpk_print(f'Get node pools name returned ERROR {return_code}')
-
-  for name in nodepools:
-    nodepools_data[name] = [name]
-
-  slices, return_code = get_slice_node_pool_size()
-  if return_code != 0:
-    xpk_print(f'Get slice node pool size returned ERROR {return_code}')
-
-  for line in slices:
-    s = line.split()
-    count, nodepool_name = s[0], s[1]
-    nodepools_data[nodepool_name].append(count)
-
-  type_nodepool, return_code = get_node_pool_instance_type()
-  if return_code != 0:
-    xpk_print(f'Get node pool instance type returned ERROR {return_code}')
-
-  for line in type_nodepool:
-    tn = line.split()
-    nodepool_name, instance_type = tn[0], tn[1]
-    nodepools_data[nodepool_name].append(instance_type)
-
-  expected_healthy_nodes, return_code = get_expected_healthy_nodes()
-  if return_code != 0:
-    xpk_print(f'Get expected healthy nodes returned ERROR {return_code}')
-
-  for line in expected_healthy_nodes:
-    ehn = line.split()
-    count, nodepool_name = ehn[0], ehn[1]
-    nodepools_data[nodepool_name].append(count)
-
-  actual_healthy_nodes, return_code = get_actual_healthy_nodes()
-  if return_code != 0:
-    xpk_print(f'Get actual healthy nodes returned ERROR {return_code}')
-
-  for line in actual_healthy_nodes:
-    ahn = line.split()
-    count, nodepool_name = ahn[0], ahn[1]
-    nodepools_data[nodepool_name].append(count)
-
-  total_nodes, return_code = get_total_nodes_per_node_pool()
-  if return_code != 0:
-    xpk_print(f'Get total nodes per node pool returned ERROR {return_code}')
-
-  for line in total_nodes:
-    tn = line.split()
-    count, nodepool_name = tn[0], tn[1]
-    nodepools_data[nodepool_name].append(count)
-
-  for _, np_data in nodepools_data.items():
-    table.append(np_data)
-
-  return 0, table
-
-
-def get_node_pools_name() -> tuple[list[str], int]:
-  cmd_nodepools = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns='NODEPOOL:.metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-      " | grep -v 'none' | sort | uniq"
-  )
-  return_code, out = run_command_for_value(cmd_nodepools, 'Nodepool list')
-  if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
-
-
-def get_slice_node_pool_size() -> tuple[list[str], int]:
-  cmd_slices = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns=':metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-      " | grep -v 'none'"
-      ' | sort'
-      ' | uniq -c'
-  )
-  return_code, out = run_command_for_value(
-      cmd_slices, 'Count nodes per nodepool slice'
-  )
-  if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
-
-
-def get_node_pool_instance_type() -> tuple[list[str], int]:
-  cmd_type_nodepool = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns='NODEPOOL:.metadata.labels.cloud\\.google\\.com/gke-nodepool,"
-      " TYPE:.metadata.labels.node\\.kubernetes\\.io/instance-type' | grep -v"
-      " 'none' | sort | uniq"
-  )
-  return_code, out = run_command_for_value(
-      cmd_type_nodepool, 'Instance type of nodepools'
-  )
-  if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
-
-
-def get_expected_healthy_nodes() -> tuple[list[str], int]:
-  cmd_expected_healthy_nodes = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns=':metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-      " | grep -v 'none'"
-      ' | sort'
-      ' | uniq -c'
-  )
-  return_code, out = run_command_for_value(
-      cmd_expected_healthy_nodes,
-      'Count expected healthy nodes per nodepool',
-  )
-  if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
-
-
-def get_actual_healthy_nodes() -> tuple[list[str], int]:
-  cmd_actual_healthy_nodes = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns='NODE_NAME:metadata.name,"
-      ' READY_STATUS:.status.conditions[?(@.type=="Ready")].status,'
-      " NODEPOOL:metadata.labels.cloud\\.google\\.com/gke-nodepool' "
-      ' | grep -w True'
-      " | grep -v 'none'"
-      " | awk {'print $3'}"
-      ' | sort'
-      ' | uniq -c'
-  )
-  return_code, out = run_command_for_value(
-      cmd_actual_healthy_nodes, 'Count actual healthy nodes per nodepool'
-  )
-  if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
-
-
-def get_total_nodes_per_node_pool() -> tuple[list[str], int]:
-  cmd_total_nodes = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns='NODE_NAME:metadata.name,"
-      ' READY_STATUS:.status.conditions[?(@.type=="Ready")].status,'
-      " NODEPOOL:metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-      " | grep -v 'none'"
-      " | awk {'print $3'}"
-      ' | sort'
-      ' | uniq -c'
-  )
-  return_code, out = run_command_for_value(
-      cmd_total_nodes, 'Count total nodes per nodepool'
-  )
-  if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
+  for nodepool in inventory.nodepools.values():
+    table.append([
+        nodepool.name,
+        nodepool.total_nodes,
+        nodepool.instance_type,
+        nodepool.expected_healthy_nodes,
+        nodepool.healthy_nodes,
+        nodepool.total_nodes,
+    ])
+  return table
 
 
 def cluster_list(args) -> None:
@@ -1269,6 +1286,9 @@ def run_gke_cluster_delete_command(args) -> int:
   if return_code != 0:
     xpk_print(f'Cluster delete request returned ERROR {return_code}')
     return 1
+  forget_cluster_credentials(args)
+  # A create of the same cluster must not resume from the deleted one.
+  clear_step_journal('cluster_create', _cluster_create_journal_key(args))
 
   return_code = delete_cluster_subnets(args)
   if return_code != 0:
@@ -1416,6 +1436,7 @@ def run_gke_cluster_create_command(
   if return_code != 0:
     xpk_print(f'GKE Cluster Create request returned ERROR {return_code}')
     return 1
+  forget_cluster_credentials(args)
   return 0
 
 
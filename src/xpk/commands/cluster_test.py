@@ -58,6 +58,12 @@ class _ClusterCreateMocks:
   grant_compute_default_sa_mldiagnostics_permissions: MagicMock
 
 
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch: pytest.MonkeyPatch):
+  # Keeps the cluster create step journals of the tests apart.
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path / 'cache'))
+
+
 @pytest.fixture
 def mocks(mocker) -> _Mocks:
   common_print_mock = mocker.patch(
@@ -975,6 +981,72 @@ def test_cluster_create_with_managed_mldiagnostics_and_older_gke_runs_prerequisi
   mock_install_prerequisites.assert_called_once()
 
 
+@patch('xpk.commands.cluster._install_kueue')
+@patch('xpk.commands.cluster.run_gke_node_pool_create_command')
+def test_cluster_create_exits_with_node_pool_failure_before_dependent_steps(
+    mock_run_gke_node_pool_create_command: MagicMock,
+    mock_install_kueue: MagicMock,
+    mocks: _Mocks,
+    cluster_create_mocks: _ClusterCreateMocks,
+):
+  cluster_create_mocks.get_gke_control_plane_version.return_value = (
+      0,
+      '1.2.3',
+  )
+  mock_run_gke_node_pool_create_command.return_value = 5
+
+  cluster_create(construct_args())
+
+  assert cluster_create_mocks.xpk_exit.call_args_list[0].args == (5,)
+  mock_install_kueue.assert_not_called()
+
+
+@patch('xpk.commands.cluster._install_kueue', return_value=0)
+@patch('xpk.commands.cluster.create_cluster_if_necessary', return_value=0)
+@patch('xpk.commands.cluster.run_gke_node_pool_create_command')
+def test_cluster_create_rerun_resumes_from_failed_step(
+    mock_run_gke_node_pool_create_command: MagicMock,
+    mock_create_cluster_if_necessary: MagicMock,
+    mock_install_kueue: MagicMock,
+    mocks: _Mocks,
+    cluster_create_mocks: _ClusterCreateMocks,
+):
+  cluster_create_mocks.get_gke_control_plane_version.return_value = (
+      0,
+      '1.2.3',
+  )
+  mock_run_gke_node_pool_create_command.return_value = 5
+  cluster_create(construct_args())
+  mock_run_gke_node_pool_create_command.return_value = 0
+
+  cluster_create(construct_args())
+
+  mock_create_cluster_if_necessary.assert_called_once()
+  assert mock_run_gke_node_pool_create_command.call_count == 2
+  mock_install_kueue.assert_called_once()
+
+
+@patch('xpk.commands.cluster.create_cluster_if_necessary', return_value=0)
+@patch('xpk.commands.cluster.run_gke_node_pool_create_command', return_value=5)
+def test_cluster_create_rerun_with_other_arguments_runs_every_step(
+    mock_run_gke_node_pool_create_command: MagicMock,
+    mock_create_cluster_if_necessary: MagicMock,
+    mocks: _Mocks,
+    cluster_create_mocks: _ClusterCreateMocks,
+):
+  cluster_create_mocks.get_gke_control_plane_version.return_value = (
+      0,
+      '1.2.3',
+  )
+  cluster_create(construct_args())
+
+  cluster_create(construct_args(num_slices=2))
+
+  assert cluster_create_mocks.xpk_exit.call_args_list[0].args == (5,)
+  assert mock_create_cluster_if_necessary.call_count == 2
+  assert mock_run_gke_node_pool_create_command.call_count == 2
+
+
 @patch('xpk.commands.cluster._validate_cluster_create_args')
 @patch('xpk.commands.cluster.create_cluster_if_necessary')
 @patch('xpk.commands.cluster.run_gke_node_pool_create_command')
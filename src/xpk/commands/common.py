@@ -14,9 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from ..core.commands import run_command_with_updates_retry, run_command_for_value
+from ..core.commands import run_command_with_updates_retry
 from ..core.capacity import H100_DEVICE_TYPE, H100_MEGA_DEVICE_TYPE, CapacityType
 from ..core.gcloud_context import get_cluster_location
+from ..core.nodepool import list_node_pools
 from ..utils.console import xpk_print, xpk_exit
 from ..utils.execution_context import is_dry_run
 from ..core.system_characteristics import (
@@ -88,25 +89,13 @@ def is_GPU_TAS_possible(
     return True
 
   # For A3-Ultra or newer, all capacity types support TAS as long as COMPACT placement is used
-  command = (
-      'gcloud container node-pools list'
-      f' --cluster {cluster_name}'
-      f' --location={zone}'
-      f' --project={project}'
-      ' --filter="placementPolicy.type=COMPACT"'
-      ' --format="value(name)"'
-  )
-  return_code, compact_placement_nps = run_command_for_value(
-      command=command,
-      task=(
-          'Check if there is a COMPACT placement policy nodepool in this'
-          ' cluster'
-      ),
-  )
+  return_code, node_pools = list_node_pools(project, zone, cluster_name)
   if return_code != 0:
     xpk_print('Node pool retrieval failed, assuming TAS is not possible')
     return False
-  return compact_placement_nps.splitlines() != []
+  return any(
+      node_pool.placement_policy_type == 'COMPACT' for node_pool in node_pools
+  )
 
 
 def validate_sub_slicing_system(system: SystemCharacteristics):
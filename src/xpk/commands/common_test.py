@@ -23,6 +23,7 @@ from xpk.core.capacity import (
     H100_MEGA_DEVICE_TYPE,
     CapacityType,
 )
+from xpk.core.nodepool import NodePool
 from xpk.core.system_characteristics import (
     SystemCharacteristics,
     AcceleratorType,
@@ -31,12 +32,12 @@ from xpk.core.system_characteristics import (
 
 class CommonCommandsTest(unittest.TestCase):
 
-  @patch("xpk.commands.common.run_command_for_value")
+  @patch("xpk.commands.common.list_node_pools")
   @patch("xpk.commands.common.xpk_exit")
   @patch("xpk.commands.common.xpk_print")
   @patch("xpk.commands.common.is_dry_run")
   def test_is_GPU_TAS_possible_dry_run(
-      self, mock_is_dry_run, mock_xpk_print, mock_xpk_exit, mock_run_command
+      self, mock_is_dry_run, mock_xpk_print, mock_xpk_exit, mock_list_node_pools
   ):
     """Test is_GPU_TAS_possible returns True in dry_run mode."""
     mock_is_dry_run.return_value = True
@@ -46,7 +47,7 @@ class CommonCommandsTest(unittest.TestCase):
     mock_is_dry_run.assert_called_once()
     mock_xpk_print.assert_not_called()
     mock_xpk_exit.assert_not_called()
-    mock_run_command.assert_not_called()
+    mock_list_node_pools.assert_not_called()
 
   @patch("xpk.commands.common.is_dry_run", return_value=False)
   @patch("xpk.commands.common.xpk_exit")
@@ -111,17 +112,23 @@ class CommonCommandsTest(unittest.TestCase):
         )
     )
 
-  @patch("xpk.commands.common.run_command_for_value")
+  @patch("xpk.commands.common.list_node_pools")
   @patch("xpk.commands.common.is_dry_run", return_value=False)
   def test_is_GPU_TAS_possible_compact_placement_exists(
-      self, mock_is_dry_run, mock_run_command
+      self, mock_is_dry_run, mock_list_node_pools
   ):
     """Test is_GPU_TAS_possible with COMPACT placement returns True."""
     mock_system = MagicMock(spec=SystemCharacteristics)
     mock_system.accelerator_type = AcceleratorType.GPU
     mock_system.gpu_requires_topology = True
     mock_system.device_type = "a3-ultra"
-    mock_run_command.return_value = (0, "some-nodepool\nsome-other-nodepool\n")
+    mock_list_node_pools.return_value = (
+        0,
+        [
+            NodePool("some-nodepool"),
+            NodePool("some-other-nodepool", placement_policy_type="COMPACT"),
+        ],
+    )
     self.assertTrue(
         is_GPU_TAS_possible(
             mock_system,
@@ -132,17 +139,17 @@ class CommonCommandsTest(unittest.TestCase):
         )
     )
 
-  @patch("xpk.commands.common.run_command_for_value")
+  @patch("xpk.commands.common.list_node_pools")
   @patch("xpk.commands.common.is_dry_run", return_value=False)
   def test_is_GPU_TAS_possible_no_compact_placement(
-      self, mock_is_dry_run, mock_run_command
+      self, mock_is_dry_run, mock_list_node_pools
   ):
     """Test is_GPU_TAS_possible without COMPACT placement returns False."""
     mock_system = MagicMock(spec=SystemCharacteristics)
     mock_system.accelerator_type = AcceleratorType.GPU
     mock_system.gpu_requires_topology = True
     mock_system.device_type = "a3-ultra"
-    mock_run_command.return_value = (0, "")
+    mock_list_node_pools.return_value = (0, [NodePool("some-nodepool")])
     self.assertFalse(
         is_GPU_TAS_possible(
             mock_system,
@@ -154,17 +161,17 @@ class CommonCommandsTest(unittest.TestCase):
     )
 
   @patch("xpk.commands.common.xpk_print")
-  @patch("xpk.commands.common.run_command_for_value")
+  @patch("xpk.commands.common.list_node_pools")
   @patch("xpk.commands.common.is_dry_run", return_value=False)
   def test_is_GPU_TAS_possible_command_fails(
-      self, mock_is_dry_run, mock_run_command, mock_xpk_print
+      self, mock_is_dry_run, mock_list_node_pools, mock_xpk_print
   ):
     """Test is_GPU_TAS_possible when gcloud command fails."""
     mock_system = MagicMock(spec=SystemCharacteristics)
     mock_system.accelerator_type = AcceleratorType.GPU
     mock_system.gpu_requires_topology = True
     mock_system.device_type = "a3-ultra"
-    mock_run_command.return_value = (1, "Error")
+    mock_list_node_pools.return_value = (1, [])
     self.assertFalse(
         is_GPU_TAS_possible(
             mock_system,
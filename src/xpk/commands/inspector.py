@@ -14,10 +14,13 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from tabulate import tabulate
+
 from ..core.cluster import get_cluster_credentials
 from ..core.commands import run_command_for_value
 from ..core.gcloud_context import add_zone_and_project, get_cluster_location
 from ..core.kueue_manager import CLUSTER_QUEUE_NAME, LOCAL_QUEUE_NAME
+from ..core.node_inventory import get_node_inventory
 from ..core.resources import ConfigMapType, get_config_map_name
 from ..utils.console import xpk_exit, xpk_print
 from ..utils.file import append_tmp_file, write_tmp_file
@@ -84,6 +87,54 @@ def inspector_run_workload_list_helper(args, command_description, file) -> int:
   return 0
 
 
+def inspector_run_node_inventory_helper(args, file) -> int:
+  """Lists the cluster nodes once and adds per-node and per-nodepool views.
+
+  Args:
+    args: user provided arguments for running the command.
+    file: file to add the node inventory to.
+
+  Returns:
+    0 if successful and 1 otherwise.
+  """
+  return_code, inventory = get_node_inventory()
+  if return_code != 0:
+    xpk_print(f'Listing cluster nodes returned ERROR {return_code}')
+    return 1
+
+  nodepools = inventory.nodepools.values()
+  views = [
+      (
+          'Kubectl: All Nodes',
+          [['NODE_NAME', 'READY_STATUS', 'NODEPOOL']]
+          + [
+              [node.name, node.ready, node.nodepool or '<none>']
+              for node in inventory.nodes
+          ],
+      ),
+      (
+          'Kubectl: Number of Nodes per Node Pool',
+          [['NODEPOOL', 'NODES']]
+          + [[np.name, np.total_nodes] for np in nodepools],
+      ),
+      (
+          'Kubectl: Healthy Node Count Per Node Pool',
+          [['NODEPOOL', 'HEALTHY_NODES']]
+          + [[np.name, np.healthy_nodes] for np in nodepools],
+      ),
+  ]
+  for description, table in views:
+    output = (
+        f'Command Description: {description}\n'
+        f' \n{tabulate(table, headers="firstrow", tablefmt="plain")}'
+        f' \n{_SPACER} \n'
+    )
+    append_tmp_file(output, file)
+    if args.print_to_terminal:
+      xpk_print(output)
+  return 0
+
+
 def inspector_run_sub_slicing_helper(args, file: str):
   return_code, result = has_sub_slicing_enabled()
   if return_code != 0:
@@ -210,31 +261,6 @@ def inspector(args) -> None:
           ),
           'GKE: Node pool Details',
       ),
-      (
-          (
-              "kubectl get node -o custom-columns='NODE_NAME:metadata.name,"
-              ' READY_STATUS:.status.conditions[?(@.type=="Ready")].status,'
-              " NODEPOOL:metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-          ),
-          'Kubectl: All Nodes',
-      ),
-      (
-          (
-              'kubectl get node -o'
-              " custom-columns=':metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-              ' | sort | uniq -c'
-          ),
-          'Kubectl: Number of Nodes per Node Pool',
-      ),
-      (
-          (
-              "kubectl get node -o custom-columns='NODE_NAME:metadata.name,"
-              ' READY_STATUS:.status.conditions[?(@.type=="Ready")].status,'
-              " NODEPOOL:metadata.labels.cloud\\.google\\.com/gke-nodepool' |"
-              " grep -w True | awk {'print $3'} | sort | uniq -c"
-          ),
-          'Kubectl: Healthy Node Count Per Node Pool',
-      ),
       (
           f'kubectl describe ClusterQueue {CLUSTER_QUEUE_NAME}',
           'Kueue: ClusterQueue Details',
@@ -285,6 +311,11 @@ def inspector(args) -> None:
           f' {description} return code: {return_code}'
       )
 
+  return_code = inspector_run_node_inventory_helper(args, inspector_file)
+  if return_code != 0:
+    final_return_code = return_code
+    xpk_print(f'inspector failed in node inventory return code: {return_code}')
+
   inspector_run_sub_slicing_helper(args, inspector_file)
   inspector_run_slice_controller_helper(args, inspector_file)
 
@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import json
 import pytest
 from unittest import mock
 from xpk.commands import inspector
@@ -137,3 +138,46 @@ def test_inspector_run_slice_controller_helper_with_slice_controller_not_found(
   assert any(
       "Error: Deployment not found" in args[0] for args, _ in call_args_list
   )
+
+
+def test_inspector_run_node_inventory_helper_lists_nodes_once(
+    args: mock.Mock,
+    commands_tester: CommandsTester,
+    mock_append_tmp_file: mock.Mock,
+):
+  nodes = [
+      {
+          "metadata": {
+              "name": f"node-{i}",
+              "labels": {"cloud.google.com/gke-nodepool": "np-0"},
+          },
+          "status": {"conditions": [{"type": "Ready", "status": str(i == 0)}]},
+      }
+      for i in range(2)
+  ]
+  commands_tester.set_result_for_command(
+      (0, json.dumps({"items": nodes})), "kubectl get nodes"
+  )
+
+  assert inspector.inspector_run_node_inventory_helper(args, "test_file") == 0
+
+  commands_tester.assert_command_run("kubectl get nodes", times=1)
+  outputs = [
+      [line.split() for line in args[0].splitlines()]
+      for args, _ in mock_append_tmp_file.call_args_list
+  ]
+  assert len(outputs) == 3
+  assert ["node-1", "False", "np-0"] in outputs[0]
+  assert ["np-0", "2"] in outputs[1]
+  assert ["np-0", "1"] in outputs[2]
+
+
+def test_inspector_run_node_inventory_helper_failure(
+    args: mock.Mock,
+    commands_tester: CommandsTester,
+    mock_append_tmp_file: mock.Mock,
+):
+  commands_tester.set_result_for_command((1, ""), "kubectl get nodes")
+
+  assert inspector.inspector_run_node_inventory_helper(args, "test_file") == 1
+  mock_append_tmp_file.assert_not_called()
@@ -27,12 +27,13 @@ from ..core.cluster import (
     get_cluster_credentials,
     setup_k8s_env,
 )
-from ..core.commands import run_command_with_updates, run_commands
+from ..core.commands import run_command_with_updates
 from ..core.config import (VERTEX_TENSORBOARD_FEATURE_FLAG, XPK_CURRENT_VERSION)
 from ..core.docker_container import (
     get_main_container_docker_image,
     get_user_workload_container,
 )
+from ..core.kube_backend import DeleteOutcome, get_kube_backend
 from ..core.kueue_manager import LOCAL_QUEUE_NAME
 from ..core.docker_resources import get_volumes, parse_env_config
 from ..core.gcloud_context import add_zone_and_project
@@ -46,7 +47,6 @@ from ..core.pathways import (
     check_if_pathways_job_is_installed,
     ensure_pathways_workload_prerequisites,
     get_pathways_unified_query_link,
-    try_to_delete_pathwaysjob_first,
 )
 from ..core.resources import get_cluster_capacity_type, get_cluster_system_characteristics_from_config_map
 from ..core.resources import ConfigMapType, get_cluster_configmap
@@ -86,6 +86,7 @@ from ..core.workload import (
     get_jobsets_list_gcp_link,
     get_workload_list,
     wait_for_job_completion,
+    wait_for_jobs,
     get_cluster_location,
 )
 from ..core.workload_decorators import (
@@ -906,34 +907,17 @@ def delete_workloads(args, workloads: list[str]) -> int:
   Returns:
     0 if successful and non-zero otherwise.
   """
-  # If PathwaysJob exists, delete it.
-  if check_if_pathways_job_is_installed(
-      args
-  ) and try_to_delete_pathwaysjob_first(args, workloads):
-    return 0
-  # PathwaysJob workload does not exist, delete JobSet
-  commands = []
-  task_names = []
-  for workload in workloads:
-    args.workload = workload
-    command = f'kubectl delete jobset {workload} -n default'
-    task_name = f'WorkloadDelete-{workload}'
-    commands.append(command)
-    task_names.append(task_name)
-
-  # Not batching deletion for single workload
-  if len(workloads) == 1:
-    return_code = run_command_with_updates(commands[0], 'Delete Workload')
-  else:
-    maybe_failure = run_commands(
-        commands,
-        'Delete Workload',
-        task_names,
-        batch=100,
-    )
-    return_code = maybe_failure[0].return_code if maybe_failure else 0
-
-  return return_code
+  outcomes = get_kube_backend().delete_workloads(
+      workloads,
+      delete_pathways_jobs=check_if_pathways_job_is_installed(args),
+  )
+  deleted = [w for w, o in outcomes.items() if o == DeleteOutcome.DELETED]
+  xpk_print(f'Deleted {len(deleted)} of {len(outcomes)} workloads.')
+  for outcome in (DeleteOutcome.NOT_FOUND, DeleteOutcome.FAILED):
+    names = [w for w, o in outcomes.items() if o == outcome]
+    if names:
+      xpk_print(f'{outcome.value}: {", ".join(names)}')
+  return 0 if len(deleted) == len(outcomes) else 1
 
 
 def workload_delete(args) -> None:
@@ -1002,6 +986,12 @@ def workload_list(args) -> None:
   add_zone_and_project(args)
   get_cluster_credentials(args)
 
+  if args.wait_for_jobs or args.wait_for_jobs_selector:
+    return_code, return_value = wait_for_jobs(args)
+    if return_value:
+      xpk_print(f'Wait For Jobs Output:\n{return_value}')
+    xpk_exit(return_code)
+
   if args.wait_for_job_completion:
     return_code = wait_for_job_completion(args)
     if return_code != 0:
@@ -628,9 +628,6 @@ def test_workload_create_workload_exists_user_accepts_overwrite_pathways(
       'xpk.commands.workload.check_if_pathways_job_is_installed',
       return_value=True,
   )
-  mock_try_delete = mocker.patch(
-      'xpk.commands.workload.try_to_delete_pathwaysjob_first', return_value=True
-  )
 
   # ensure pathways logic avoids the else branch kubeconfig errors
   mocker.patch(
@@ -645,4 +642,6 @@ def test_workload_create_workload_exists_user_accepts_overwrite_pathways(
   mock_ask_for_user_consent.assert_called_once_with(
       'test-workload already exists, do you want to overwrite it?'
   )
-  mock_try_delete.assert_called_once_with(args, ['test-workload'])
+  workload_create_mocks.commands_tester.assert_command_run(
+      'kubectl delete pathwaysjob test-workload -n default'
+  )
@@ -15,8 +15,10 @@ limitations under the License.
 """
 
 import enum
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Callable, Hashable, Sequence, TypeVar
 
 from .system_characteristics import AcceleratorType, SystemCharacteristics
 from .gcloud_context import project_id_to_project_number
@@ -28,6 +30,7 @@ from .reservation import (
     BlockReservationLink,
     SubBlockReservationLink,
     Reservation,
+    ReservationSubBlock,
     verify_reservations_exist,
     to_reservation_path,
     get_reservation,
@@ -41,6 +44,8 @@ AUTOPROVISIONING_CONFIG_VALUE = 'AUTOPROVISION'
 AUTOPROVISIONING_CONFIG_MINIMUM_KEY = 'minimum_chips'
 AUTOPROVISIONING_CONFIG_MAXIMUM_KEY = 'maximum_chips'
 CAPACITY_TYPE_CONFIG_KEY = 'capacity_type'
+# gcloud requests in flight while assessing the capacity of reservations.
+CAPACITY_ASSESSMENT_CONCURRENCY = 8
 
 H100_DEVICE_TYPE = 'h100-80gb-8'
 H100_MEGA_DEVICE_TYPE = 'h100-mega-80gb-8'
@@ -50,6 +55,9 @@ GB200_DEVICE_TYPE = 'gb200-4'
 GB200_DEVICE_TYPE_NOLSSD = 'gb200-4-no-ssd'
 
 
+_T = TypeVar('_T')
+
+
 class CapacityType(enum.Enum):
   ON_DEMAND = 'on_demand'
   RESERVATION = 'reservation'
@@ -195,6 +203,79 @@ def get_capacity_node_selectors_from_capacity_type(
   return node_selector, return_code
 
 
+class _CapacityRequests:
+  """Runs the gcloud requests of one capacity assessment concurrently.
+
+  Requests are submitted to a bounded thread pool and deduplicated by key,
+  so identical requests, for example describing the reservation of several
+  blocks, are sent only once and share their result.
+  """
+
+  def __init__(self, pool: ThreadPoolExecutor) -> None:
+    self._pool = pool
+    self._futures: dict[Hashable, Future] = {}
+    # Reentrant, follow-up requests may be submitted from a done callback
+    # that runs while the lock is held.
+    self._lock = threading.RLock()
+
+  def submit(
+      self,
+      key: Hashable,
+      fn: Callable[[], _T],
+      then: Callable[['Future[_T]'], None] | None = None,
+  ) -> 'Future[_T]':
+    """Submits `fn` unless a request with the same key was submitted.
+
+    `then` is called with the completed future of a newly submitted request,
+    to send the requests that depend on its result.
+    """
+    with self._lock:
+      future = self._futures.get(key)
+      if future is None:
+        future = self._pool.submit(fn)
+        self._futures[key] = future
+        if then is not None:
+          future.add_done_callback(then)
+      return future
+
+  def reservation(self, link: ReservationLink) -> 'Future[Reservation | None]':
+    return self.submit(
+        ('describe', link.project, link.zone, link.name),
+        lambda: get_reservation(link),
+    )
+
+  def blocks(
+      self, link: ReservationLink
+  ) -> 'Future[tuple[list[BlockReservationLink], int]]':
+    """Lists the blocks of a reservation, then their sub-blocks right away."""
+
+    def list_sub_blocks(
+        future: 'Future[tuple[list[BlockReservationLink], int]]',
+    ) -> None:
+      if future.exception() is not None:
+        return
+      blocks, _ = future.result()
+      try:
+        for block in blocks:
+          self.sub_blocks(block)
+      except RuntimeError:
+        # The pool is shut down, the assessment ended on an earlier error.
+        pass
+
+    return self.submit(
+        ('blocks', link.project, link.zone, link.name),
+        lambda: get_blocks_in_reservation(link),
+        then=list_sub_blocks,
+    )
+
+  def sub_blocks(
+      self, link: BlockReservationLink | SubBlockReservationLink
+  ) -> 'Future[tuple[list[ReservationSubBlock], int]]':
+    return self.submit(
+        ('sub-blocks', link), lambda: list_healthy_sub_blocks(link)
+    )
+
+
 def assess_available_slices(
     reservations: Sequence[ReservationLink],
     force_sub_block_targeting: bool,
@@ -204,6 +285,10 @@ def assess_available_slices(
 ) -> tuple[list[ReservationCapacity], int]:
   """Assess the available slices in the reservations.
 
+  The reservation, block and sub-block listings are sent concurrently with at
+  most `CAPACITY_ASSESSMENT_CONCURRENCY` in flight. The results and the first
+  reported error follow the order of `reservations` and of their blocks.
+
   Args:
     reservations: list of reservations to assess.
     force_sub_block_targeting: if `True`, then the passed `ReservationLink` or `BlockReservationLink` will be flattened to adequate sub-blocks.
@@ -214,31 +299,43 @@ def assess_available_slices(
   Returns:
     List of capacity reservations with available slices.
   """
-  reservation_capacities = []
-  for reservation in reservations:
-    if validate_reservations:
-      parent_reservation = get_reservation(reservation)
-
-      if not parent_reservation:
-        xpk_print(f"ERROR: Failed to fetch reservation '{reservation.name}'.")
-        return [], 1
-
-      if not _verify_reservation_configuration(parent_reservation, system):
-        return [], 1
-
-    capacities, return_code = _assess_available_slices_for_reservation(
-        reservation, force_sub_block_targeting, system, vms_per_slice
-    )
-    if return_code != 0:
-      return [], return_code
-    if not capacities and validate_reservations:
-      xpk_print(
-          'ERROR: Reservation'
-          f' {to_reservation_path(reservation, reservation.project)} has no'
-          ' available capacity.'
+  with ThreadPoolExecutor(max_workers=CAPACITY_ASSESSMENT_CONCURRENCY) as pool:
+    requests = _CapacityRequests(pool)
+    # Send every request known upfront before waiting on any of them.
+    for reservation in reservations:
+      if validate_reservations:
+        requests.reservation(reservation)
+      _request_capacity(requests, reservation, force_sub_block_targeting)
+
+    reservation_capacities = []
+    for reservation in reservations:
+      if validate_reservations:
+        parent_reservation = requests.reservation(reservation).result()
+
+        if not parent_reservation:
+          xpk_print(f"ERROR: Failed to fetch reservation '{reservation.name}'.")
+          return [], 1
+
+        if not _verify_reservation_configuration(parent_reservation, system):
+          return [], 1
+
+      capacities, return_code = _assess_available_slices_for_reservation(
+          requests,
+          reservation,
+          force_sub_block_targeting,
+          system,
+          vms_per_slice,
       )
-      return [], 1
-    reservation_capacities.extend(capacities)
+      if return_code != 0:
+        return [], return_code
+      if not capacities and validate_reservations:
+        xpk_print(
+            'ERROR: Reservation'
+            f' {to_reservation_path(reservation, reservation.project)} has no'
+            ' available capacity.'
+        )
+        return [], 1
+      reservation_capacities.extend(capacities)
 
   # Deduplicate reservation_capacities, preserving order:
   reservation_capacities = list(dict.fromkeys(reservation_capacities))
@@ -246,7 +343,32 @@ def assess_available_slices(
   return reservation_capacities, 0
 
 
+def _targets_sub_blocks(
+    reservation: ReservationLink, force_sub_block_targeting: bool
+) -> bool:
+  return isinstance(reservation, SubBlockReservationLink) or (
+      force_sub_block_targeting
+      and isinstance(reservation, BlockReservationLink)
+  )
+
+
+def _request_capacity(
+    requests: _CapacityRequests,
+    reservation: ReservationLink,
+    force_sub_block_targeting: bool,
+) -> None:
+  """Sends the first request needed to assess a reservation."""
+  if _targets_sub_blocks(reservation, force_sub_block_targeting):
+    assert isinstance(reservation, BlockReservationLink)
+    requests.sub_blocks(reservation)
+  elif force_sub_block_targeting:
+    requests.blocks(reservation)
+  else:
+    requests.reservation(reservation)
+
+
 def _assess_available_slices_for_reservation(
+    requests: _CapacityRequests,
     reservation: (
         ReservationLink | BlockReservationLink | SubBlockReservationLink
     ),
@@ -257,6 +379,7 @@ def _assess_available_slices_for_reservation(
   """Assess the available slices for a single reservation.
 
   Args:
+    requests: the concurrent requests of the assessment.
     reservation: reservation to assess.
     force_sub_block_targeting: if `True`, then the passed `ReservationLink` or `BlockReservationLink` will be flattened to adequate sub-blocks.
     system: The system characteristics of the accelerator type.
@@ -265,32 +388,30 @@ def _assess_available_slices_for_reservation(
   Returns:
     List of available reservations (targeting sub-blocks if applicable).
   """
-  if (
-      isinstance(reservation, SubBlockReservationLink)
-      or force_sub_block_targeting
-      and isinstance(reservation, BlockReservationLink)
-  ):
+  if _targets_sub_blocks(reservation, force_sub_block_targeting):
+    assert isinstance(reservation, BlockReservationLink)
     return _assess_healthy_and_fitting_sub_blocks_in_block(
-        reservation, vms_per_slice
+        requests, reservation, vms_per_slice
     )
   elif force_sub_block_targeting:
     # reservation instanceof ReservationLink (not Block/SubBlock):
-    blocks, return_code = get_blocks_in_reservation(reservation)
+    blocks, return_code = requests.blocks(reservation).result()
     if return_code != 0:
       return [], return_code
-    if blocks:
-      return assess_available_slices(
-          blocks,
-          force_sub_block_targeting,
-          system,
-          vms_per_slice=vms_per_slice,
-          validate_reservations=False,
+    capacities = []
+    for block in blocks:
+      block_capacities, return_code = (
+          _assess_healthy_and_fitting_sub_blocks_in_block(
+              requests, block, vms_per_slice
+          )
       )
-
-    return [], 0
+      if return_code != 0:
+        return [], return_code
+      capacities.extend(block_capacities)
+    return capacities, 0
 
   slices_count, return_code = _get_reservation_slices_count(
-      reservation, system, vms_per_slice
+      requests.reservation(reservation).result(), system, vms_per_slice
   )
   if return_code != 0:
     return [], return_code
@@ -302,11 +423,12 @@ def _assess_available_slices_for_reservation(
 
 
 def _assess_healthy_and_fitting_sub_blocks_in_block(
+    requests: _CapacityRequests,
     reservation: BlockReservationLink | SubBlockReservationLink,
     required_hosts: int,
 ) -> tuple[list[ReservationCapacity], int]:
   """Get healthy and fitting sub-block capacities in a block. Also works for sub-block links."""
-  sub_blocks, return_code = list_healthy_sub_blocks(reservation)
+  sub_blocks, return_code = requests.sub_blocks(reservation).result()
 
   if return_code != 0:
     return [], return_code
@@ -430,21 +552,20 @@ def _verify_reservation_configuration(
 
 
 def _get_reservation_slices_count(
-    reservation_link: ReservationLink,
+    reservation: Reservation | None,
     system: SystemCharacteristics,
     vms_per_slice: int,
 ) -> tuple[int, int]:
   """Get capacity count of a reservation.
 
   Args:
-    reservation: The reservation object.
+    reservation: The reservation object, None if it could not be fetched.
     system: The system characteristics of the accelerator type.
     vms_per_slice: The number of VMs required per slice.
 
   Returns:
     Number of available slots in the reservation.
   """
-  reservation = get_reservation(reservation_link)
   if not reservation:
     return 0, 1
 
@@ -49,7 +49,8 @@ def commands_tester(mocker) -> CommandsTester:
 
 
 @pytest.fixture(autouse=True)
-def clear_capacity_cache() -> Iterator[None]:
+def clear_capacity_cache(tmp_path, monkeypatch) -> Iterator[None]:
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path / 'cache'))
   _get_reservation_cached.cache_clear()
   yield
   _get_reservation_cached.cache_clear()
@@ -638,6 +639,64 @@ def test_assess_available_slices_mixed_reservations_with_subblock_targeting(
   ]
 
 
+def test_assess_available_slices_lists_each_block_once(
+    commands_tester: CommandsTester,
+    test_system: SystemCharacteristics,
+):
+  setup_mock_reservation(
+      commands_tester,
+      specific_reservation=SpecificReservation(
+          count=48, in_use_count=2, machine_type='test-machine'
+      ),
+      blocks=[
+          MockBlock(
+              name='block10',
+              sub_blocks=[MockSubBlock(name='sub11', count=1, in_use_count=0)],
+          ),
+          MockBlock(
+              name='block20',
+              sub_blocks=[MockSubBlock(name='sub21', count=1, in_use_count=0)],
+          ),
+      ],
+  )
+  block_link = BlockReservationLink(
+      project='project', name='res1', zone='zone', block_name='block20'
+  )
+  reservation_link = ReservationLink(
+      project='project', name='res1', zone='zone'
+  )
+
+  slices, return_code = assess_available_slices(
+      [block_link, reservation_link, reservation_link],
+      force_sub_block_targeting=True,
+      system=test_system,
+      vms_per_slice=test_system.vms_per_slice,
+  )
+
+  assert return_code == 0
+  sub_block_names = []
+  for s in slices:
+    assert isinstance(s.reservation, SubBlockReservationLink)
+    sub_block_names.append(s.reservation.sub_block_name)
+  assert sub_block_names == ['sub21', 'sub11']
+  commands_tester.assert_command_run(
+      'gcloud beta compute reservations describe', times=1
+  )
+  commands_tester.assert_command_run(
+      'gcloud beta compute reservations blocks list', times=1
+  )
+  commands_tester.assert_command_run(
+      'gcloud beta compute reservations sub-blocks list',
+      '--block-name=block10',
+      times=1,
+  )
+  commands_tester.assert_command_run(
+      'gcloud beta compute reservations sub-blocks list',
+      '--block-name=block20',
+      times=1,
+  )
+
+
 def test_assess_available_slices_tpu_reservation_success(
     commands_tester: CommandsTester, test_system: SystemCharacteristics
 ):
@@ -14,14 +14,18 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import yaml
+from pathlib import Path
+
 from kubernetes import client as k8s_client
 from kubernetes import config
 from kubernetes.client.exceptions import ApiException
 
 from .kubectl_common import PatchResources, patch_controller_manager_resources, is_managed_externally
 from ..utils.console import xpk_exit, xpk_print
+from ..utils.execution_context import is_cache_enabled, is_dry_run
+from ..utils.kubeconfig import ClusterKubeconfig
 from .capacity import H200_DEVICE_TYPE
+from .cluster_descriptor import get_cluster_descriptor
 from .commands import (
     run_command_for_value,
     run_command_with_updates,
@@ -33,6 +37,7 @@ from .gcloud_context import (
     get_project_number,
     zone_to_region,
 )
+from .kube_backend import get_kube_backend
 from .nodepool import recreate_nodes_in_existing_node_pools
 from .resources import get_cluster_system_characteristics
 from .system_characteristics import INSTALLER_NCCL_TCPXO, SystemCharacteristics
@@ -193,21 +198,16 @@ def install_nri_on_cluster() -> int:
 
 
 def get_cluster_nodes_info() -> list[dict]:
-  """Get list of cluster's nodes description in yaml format
+  """Get list of cluster's nodes description
 
   Returns:
-    List of nodes info yaml objects.
+    List of nodes info objects.
   """
   xpk_print("Getting cluster's info...")
-  command = 'kubectl get nodes -o yaml'
-  err_code, val = run_command_for_value(
-      command=command,
-      task='Get cluster nodes info',
-  )
+  err_code, nodes = get_kube_backend().list_nodes(lambda node: node)
   if err_code != 0:
     xpk_exit(err_code)
-  data: dict[str, list[dict]] = yaml.safe_load(val)
-  return data['items']
+  return nodes
 
 
 def count_nodes_on_cluster(system: SystemCharacteristics) -> int:
@@ -230,17 +230,10 @@ def count_nodes_on_cluster(system: SystemCharacteristics) -> int:
 
 def get_cluster_network(args) -> str:
   xpk_print("Getting cluster's VPC network...")
-  cluster_network_cmd = (
-      'gcloud container clusters describe'
-      f' {args.cluster} --location={get_cluster_location(args.project, args.cluster, args.zone)} --project={args.project} --format="value(network)"'
-  )
-  err_code, val = run_command_for_value(
-      command=cluster_network_cmd,
-      task='Get network cluster is in',
-  )
-  if err_code != 0:
-    xpk_exit(err_code)
-  return val.strip()
+  return_code, descriptor = get_cluster_descriptor(args)
+  if return_code != 0:
+    xpk_exit(return_code)
+  return descriptor.network
 
 
 def update_cluster_with_gcpfilestore_driver_if_necessary(args) -> int:
@@ -341,19 +334,10 @@ def is_driver_enabled_on_cluster(
   Returns:
     True if driver is enabled on the cluster and False otherwise.
   """
-  command = (
-      f'gcloud container clusters describe {args.cluster}'
-      f' --project={args.project} --location={get_cluster_location(args.project, args.cluster, args.zone)}'
-      f' --format="value(addonsConfig.{driver}Config.{config_key})"'
-  )
-  return_code, driver_enabled = run_command_for_value(
-      command,
-      f"Checks if {driver} driver's {config_key} is enabled in cluster"
-      ' describe.',
-  )
+  return_code, descriptor = get_cluster_descriptor(args)
   if return_code != 0:
     xpk_exit(return_code)
-  if driver_enabled.strip().lower() == config_val.lower():
+  if descriptor.addon_config(driver, config_key) == config_val.lower():
     xpk_print(
         f"{driver} driver's {config_key} config is {config_val} on the cluster."
     )
@@ -644,18 +628,10 @@ def is_workload_identity_enabled_on_cluster(args) -> bool:
   Returns:
     True if Workload Identity Federation is enabled on the cluster and False otherwise.
   """
-  command = (
-      f'gcloud container clusters describe {args.cluster}'
-      f' --project={args.project} --location={get_cluster_location(args.project, args.cluster, args.zone)}'
-      ' --format="value(workloadIdentityConfig.workloadPool)"'
-  )
-  return_code, workload_pool = run_command_for_value(
-      command,
-      'Checks if Workload Identity Federation is enabled in cluster describe.',
-  )
+  return_code, descriptor = get_cluster_descriptor(args)
   if return_code != 0:
     xpk_exit(return_code)
-  if workload_pool == f'{args.project}.svc.id.goog':
+  if descriptor.workload_pool == f'{args.project}.svc.id.goog':
     xpk_print(
         'Workload Identity Federation is enabled on the cluster, no update'
         ' needed.'
@@ -671,18 +647,10 @@ def is_gcsfuse_driver_enabled_on_cluster(args) -> bool:
   Returns:
     True if GCSFuse CSI driver is enabled on the cluster and False otherwise.
   """
-  command = (
-      f'gcloud container clusters describe {args.cluster}'
-      f' --project={args.project} --location={get_cluster_location(args.project, args.cluster, args.zone)}'
-      ' --format="value(addonsConfig.gcsFuseCsiDriverConfig.enabled)"'
-  )
-  return_code, gcsfuse_driver_enabled = run_command_for_value(
-      command,
-      'Checks if GCSFuse CSI driver is enabled in cluster describe.',
-  )
+  return_code, descriptor = get_cluster_descriptor(args)
   if return_code != 0:
     xpk_exit(return_code)
-  if gcsfuse_driver_enabled.strip().lower() == 'true':
+  if descriptor.addon_config('gcsFuseCsiDriver') == 'true':
     xpk_print('GCSFuse CSI driver is enabled on the cluster, no update needed.')
     return True
   return False
@@ -755,6 +723,12 @@ def update_cluster_with_mtc_if_necessary(args) -> int:
 def get_cluster_credentials(args) -> int:
   """Run cluster configuration command to set the kubectl config.
 
+  The credentials are kept in a kubeconfig of the cluster in the xpk cache
+  directory and reused by the xpk runs of the next
+  `CLUSTER_KUBECONFIG_TTL_SECONDS`, unless `--no-cache` is given or they no
+  longer reach the cluster, for example after it was recreated with another
+  endpoint. The context of the default kubeconfig is left unchanged.
+
   Args:
     args: user provided arguments for running the command.
 
@@ -762,10 +736,53 @@ def get_cluster_credentials(args) -> int:
     0 if successful and 1 otherwise.
   """
   location = get_cluster_location(args.project, args.cluster, args.zone)
+  if not is_cache_enabled() or is_dry_run():
+    return _fetch_cluster_credentials(args.project, args.cluster, location)
+
+  kubeconfig = ClusterKubeconfig(args.project, location, args.cluster)
+  with kubeconfig.lock():
+    if kubeconfig.is_fresh():
+      if _can_reach_cluster(kubeconfig.path):
+        kubeconfig.activate()
+        xpk_print(f'Reusing cached credentials of cluster {args.cluster}.')
+        return 0
+      xpk_print(
+          f'Cached credentials of cluster {args.cluster} no longer work,'
+          ' fetching them again.'
+      )
+
+    with kubeconfig.staging() as staged:
+      return_code = _fetch_cluster_credentials(
+          args.project, args.cluster, location
+      )
+      stored = return_code == 0 and kubeconfig.store(staged)
+  if stored:
+    kubeconfig.activate()
+    return 0
+  if return_code != 0:
+    return return_code
+  xpk_print('Caching the credentials failed, fetching them without the cache.')
+  return _fetch_cluster_credentials(args.project, args.cluster, location)
+
+
+def forget_cluster_credentials(args) -> None:
+  """Drops the cached credentials of a cluster that was created or deleted.
+
+  Args:
+    args: user provided arguments for running the command.
+  """
+  if is_dry_run():
+    return
+  location = get_cluster_location(args.project, args.cluster, args.zone)
+  ClusterKubeconfig(args.project, location, args.cluster).forget()
+
 
+def _fetch_cluster_credentials(
+    project: str, cluster: str, location: str
+) -> int:
   return_code = _get_credentials(
-      project=args.project,
-      cluster=args.cluster,
+      project=project,
+      cluster=cluster,
       location=location,
       dns_endpoint=True,
   )
@@ -773,8 +790,8 @@ def get_cluster_credentials(args) -> int:
   if return_code != 0 or not _are_credentials_valid():
     xpk_print('Detected error. Retrying without --dns-endpoint flag...')
     return_code = _get_credentials(
-        project=args.project,
-        cluster=args.cluster,
+        project=project,
+        cluster=cluster,
         location=location,
         dns_endpoint=False,
     )
@@ -799,6 +816,18 @@ def _get_credentials(
   return run_command_with_updates(command, task, verbose=False)
 
 
+def _can_reach_cluster(kubeconfig_path: Path) -> bool:
+  """Checks that a kubeconfig still authenticates to its cluster."""
+  return_code, _ = run_command_for_value(
+      f'kubectl --kubeconfig={kubeconfig_path} get namespace default -o name'
+      ' --request-timeout=10s',
+      'Check cached cluster credentials',
+      quiet=True,
+      hide_error=True,
+  )
+  return return_code == 0
+
+
 def _are_credentials_valid() -> bool:
   kubectl_command = 'kubectl get pods'
   kubectl_return_code = run_command_with_updates(
@@ -0,0 +1,154 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from ..utils.console import xpk_print
+from .command_cache import get_mutation_count
+from .commands import run_command_for_value
+from .gcloud_context import get_cluster_location
+from .retry import DEFAULT_RETRY_POLICY
+
+# Stands in for the describe output in dry run, keeping the placeholders that
+# the per-field describe commands used to return.
+_DRY_RUN_DESCRIBE_OUTPUT = json.dumps({
+    'currentMasterVersion': '0',
+    'network': '0',
+    'workloadIdentityConfig': {'workloadPool': '0'},
+    'masterAuthorizedNetworksConfig': {
+        'cidrBlocks': [{'cidrBlock': '127.0.0.1/32'}]
+    },
+})
+
+
+@dataclass(frozen=True)
+class ClusterDescriptor:
+  """Fields of a GKE cluster read from a single `clusters describe`."""
+
+  data: dict[str, Any] = field(default_factory=dict)
+
+  def _get(self, *keys: str) -> Any:
+    value: Any = self.data
+    for key in keys:
+      if not isinstance(value, dict):
+        return None
+      value = value.get(key)
+    return value
+
+  @property
+  def current_master_version(self) -> str:
+    return str(self._get('currentMasterVersion') or '')
+
+  @property
+  def network(self) -> str:
+    return str(self._get('network') or '')
+
+  @property
+  def workload_pool(self) -> str:
+    return str(self._get('workloadIdentityConfig', 'workloadPool') or '')
+
+  @property
+  def private_nodes_enabled(self) -> bool:
+    return self._get('privateClusterConfig', 'enablePrivateNodes') is True
+
+  @property
+  def authorized_networks(self) -> list[str]:
+    blocks = self._get('masterAuthorizedNetworksConfig', 'cidrBlocks') or []
+    return [block['cidrBlock'] for block in blocks if 'cidrBlock' in block]
+
+  def addon_config(self, addon: str, key: str = 'enabled') -> str:
+    """Returns `addonsConfig.<addon>Config.<key>` as lowercase text.
+
+    Args:
+      addon: name of the addon, for example `gcsFuseCsiDriver`.
+      key: field of the addon config.
+
+    Returns:
+      The value, with booleans rendered as `true` and `false`, or an empty
+      string if the cluster does not set it.
+    """
+    value = self._get('addonsConfig', f'{addon}Config', key)
+    if value is None:
+      return ''
+    if isinstance(value, bool):
+      return 'true' if value else 'false'
+    return str(value).lower()
+
+
+class _DescribeError(Exception):
+  """Failed describe, raised so that lru_cache does not memoize it."""
+
+  def __init__(self, return_code: int):
+    super().__init__(return_code)
+    self.return_code = return_code
+
+
+@lru_cache()
+def _describe_cluster(
+    project: str, location: str, cluster: str, mutation_count: int
+) -> ClusterDescriptor:
+  """Runs `clusters describe` once per cluster and mutation count.
+
+  Raises:
+    _DescribeError: if the cluster could not be described.
+  """
+  del mutation_count  # Only part of the cache key.
+  return_code, output = run_command_for_value(
+      f'gcloud container clusters describe {cluster} --project={project}'
+      f' --location={location} --format=json',
+      'Describe cluster',
+      dry_run_return_val=_DRY_RUN_DESCRIBE_OUTPUT,
+      retry_policy=DEFAULT_RETRY_POLICY,
+  )
+  if return_code != 0:
+    raise _DescribeError(return_code)
+  if not output.strip():
+    return ClusterDescriptor()
+  try:
+    data = json.loads(output)
+  except json.JSONDecodeError as e:
+    xpk_print(f'Error processing cluster describe output: {e}.')
+    raise _DescribeError(1) from e
+  return ClusterDescriptor(data if isinstance(data, dict) else {})
+
+
+def get_cluster_descriptor(args) -> tuple[int, ClusterDescriptor]:
+  """Describes the cluster of `args`, reusing the result within this run.
+
+  The cluster is described again once xpk ran a command mutating it, for
+  example `clusters update` enabling an addon. Failed describes are not
+  reused.
+
+  Args:
+    args: user provided arguments for running the command.
+
+  Returns:
+    Tuple of
+    int: 0 if successful and the describe error code otherwise.
+    ClusterDescriptor: the described cluster, empty on failure.
+  """
+  try:
+    return 0, _describe_cluster(
+        args.project,
+        get_cluster_location(args.project, args.cluster, args.zone),
+        args.cluster,
+        get_mutation_count(f'cluster:{args.cluster}'),
+    )
+  except _DescribeError as e:
+    return e.return_code, ClusterDescriptor()
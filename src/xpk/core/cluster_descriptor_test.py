@@ -0,0 +1,159 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .cluster_descriptor import (
+    ClusterDescriptor,
+    _describe_cluster,
+    get_cluster_descriptor,
+)
+from .command_cache import invalidate_for_command
+from .testing.commands_tester import CommandsTester
+
+_DESCRIBE_OUTPUT = {
+    "currentMasterVersion": "1.33.2-gke.100",
+    "network": "my-network",
+    "workloadIdentityConfig": {"workloadPool": "project.svc.id.goog"},
+    "privateClusterConfig": {"enablePrivateNodes": True},
+    "masterAuthorizedNetworksConfig": {
+        "cidrBlocks": [{"cidrBlock": "10.0.0.0/8"}, {"cidrBlock": "1.2.3.4/32"}]
+    },
+    "addonsConfig": {
+        "gcsFuseCsiDriverConfig": {"enabled": True},
+        "lustreCsiDriverConfig": {"enableLegacyLustrePort": False},
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def commands_tester(
+    mocker: MockerFixture, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[CommandsTester]:
+  monkeypatch.setenv("XPK_CACHE_HOME", str(tmp_path))
+  mocker.patch(
+      "xpk.core.cluster_descriptor.get_cluster_location",
+      return_value="us-central1",
+  )
+  _describe_cluster.cache_clear()
+  yield CommandsTester(mocker)
+  _describe_cluster.cache_clear()
+
+
+@pytest.fixture
+def command_args(mocker: MockerFixture):
+  return mocker.Mock(cluster="cluster", project="project", zone="zone")
+
+
+def test_descriptor_accessors():
+  descriptor = ClusterDescriptor(_DESCRIBE_OUTPUT)
+
+  assert descriptor.current_master_version == "1.33.2-gke.100"
+  assert descriptor.network == "my-network"
+  assert descriptor.workload_pool == "project.svc.id.goog"
+  assert descriptor.private_nodes_enabled
+  assert descriptor.authorized_networks == ["10.0.0.0/8", "1.2.3.4/32"]
+  assert descriptor.addon_config("gcsFuseCsiDriver") == "true"
+  assert (
+      descriptor.addon_config("lustreCsiDriver", "enableLegacyLustrePort")
+      == "false"
+  )
+  assert descriptor.addon_config("parallelstoreCsiDriver") == ""
+
+
+def test_empty_descriptor_has_defaults():
+  descriptor = ClusterDescriptor()
+
+  assert descriptor.current_master_version == ""
+  assert descriptor.network == ""
+  assert not descriptor.private_nodes_enabled
+  assert not descriptor.authorized_networks
+
+
+def test_cluster_is_described_once(
+    commands_tester: CommandsTester, command_args
+):
+  commands_tester.set_result_for_command(
+      (0, json.dumps(_DESCRIBE_OUTPUT)), "gcloud container clusters describe"
+  )
+
+  first = get_cluster_descriptor(command_args)
+  second = get_cluster_descriptor(command_args)
+
+  assert first == second == (0, ClusterDescriptor(_DESCRIBE_OUTPUT))
+  commands_tester.assert_command_run(
+      "gcloud container clusters describe cluster --project=project"
+      " --location=us-central1 --format=json"
+  )
+
+
+def test_cluster_is_described_again_after_update(
+    commands_tester: CommandsTester, command_args
+):
+  commands_tester.set_result_for_command(
+      (0, "{}"), "gcloud container clusters describe"
+  )
+  get_cluster_descriptor(command_args)
+
+  invalidate_for_command(
+      "gcloud container clusters update cluster --project=project"
+      " --update-addons=GcsFuseCsiDriver=ENABLED"
+  )
+  commands_tester.set_result_for_command(
+      (0, json.dumps(_DESCRIBE_OUTPUT)), "gcloud container clusters describe"
+  )
+  _, descriptor = get_cluster_descriptor(command_args)
+
+  assert descriptor.addon_config("gcsFuseCsiDriver") == "true"
+  commands_tester.assert_command_run(
+      "gcloud container clusters describe", times=2
+  )
+
+
+def test_describe_failure_returns_error_code(
+    commands_tester: CommandsTester, command_args
+):
+  commands_tester.set_result_for_command(
+      (5, ""), "gcloud container clusters describe"
+  )
+
+  assert get_cluster_descriptor(command_args) == (5, ClusterDescriptor())
+
+
+def test_failed_describe_is_retried(
+    commands_tester: CommandsTester, command_args
+):
+  commands_tester.set_result_for_command(
+      (5, ""), "gcloud container clusters describe"
+  )
+  get_cluster_descriptor(command_args)
+
+  commands_tester.set_result_for_command(
+      (0, json.dumps(_DESCRIBE_OUTPUT)), "gcloud container clusters describe"
+  )
+
+  assert get_cluster_descriptor(command_args) == (
+      0,
+      ClusterDescriptor(_DESCRIBE_OUTPUT),
+  )
+  commands_tester.assert_command_run(
+      "gcloud container clusters describe", times=2
+  )
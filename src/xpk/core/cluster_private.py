@@ -20,8 +20,8 @@ from ..utils.network import (
     is_current_machine_in_any_network,
 )
 from ..utils.execution_context import is_dry_run
-from ..utils.objects import is_text_true
-from .commands import run_command_for_value, run_command_with_updates
+from .cluster_descriptor import get_cluster_descriptor
+from .commands import run_command_with_updates
 from .gcloud_context import get_cluster_location
 
 
@@ -138,21 +138,13 @@ def is_cluster_private(args) -> bool:
   Returns:
     True if cluster is private and False otherwise.
   """
-  command = (
-      f'gcloud container clusters describe {args.cluster}'
-      f' --project={args.project} --location={get_cluster_location(args.project, args.cluster, args.zone)}'
-      ' --format="value(privateClusterConfig.enablePrivateNodes)"'
-  )
-  return_code, private_nodes_enabled = run_command_for_value(
-      command,
-      'Check if Private Nodes is enabled in cluster.',
-  )
+  return_code, descriptor = get_cluster_descriptor(args)
 
   if return_code != 0:
     xpk_print('Checking if Private Nodes is enabled failed!')
     xpk_exit(return_code)
 
-  if is_text_true(private_nodes_enabled):
+  if descriptor.private_nodes_enabled:
     xpk_print('Private Nodes is enabled on the cluster.')
     return True
 
@@ -168,26 +160,13 @@ def get_cluster_authorized_networks(args) -> list[str]:
   Returns:
     List of networks CIDRs as strings
   """
-  command = (
-      f'gcloud container clusters describe {args.cluster}'
-      f' --project={args.project} --location={get_cluster_location(args.project, args.cluster, args.zone)}'
-      ' --format="value(masterAuthorizedNetworksConfig.cidrBlocks[].cidrBlock)"'
-  )
-  return_code, authorized_networks = run_command_for_value(
-      command,
-      'Fetching the list of authorized network from cluster describe.',
-      dry_run_return_val='127.0.0.1/32',
-  )
+  return_code, descriptor = get_cluster_descriptor(args)
 
   if return_code != 0:
     xpk_print('Fetching authorized networks failed!')
     xpk_exit(return_code)
 
-  return (
-      authorized_networks.strip().split(';')
-      if authorized_networks.strip() != ''
-      else []
-  )
+  return descriptor.authorized_networks
 
 
 def update_cluster_authorized_networks(args, authorized_networks) -> int:
@@ -14,10 +14,13 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import os
+from pathlib import Path
 from unittest.mock import MagicMock
 import pytest
 from .testing.commands_tester import CommandsTester
-from .cluster import get_cluster_credentials, update_gke_cluster_with_lustre_driver_enabled, update_cluster_with_lustre_driver_if_necessary, set_jobset_on_cluster, update_cluster_with_mtc_if_necessary
+from .cluster_descriptor import _describe_cluster
+from .cluster import forget_cluster_credentials, get_cluster_credentials, update_gke_cluster_with_lustre_driver_enabled, update_cluster_with_lustre_driver_if_necessary, set_jobset_on_cluster, update_cluster_with_mtc_if_necessary
 from pytest_mock import MockerFixture
 
 
@@ -31,6 +34,29 @@ def mock_location(mocker: MockerFixture):
   mocker.patch(
       "xpk.core.cluster.get_cluster_location", return_value="us-central1"
   )
+  mocker.patch(
+      "xpk.core.cluster_descriptor.get_cluster_location",
+      return_value="us-central1",
+  )
+
+
+@pytest.fixture(autouse=True)
+def clear_cluster_descriptors():
+  _describe_cluster.cache_clear()
+  yield
+  _describe_cluster.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+  monkeypatch.setenv("XPK_CACHE_HOME", str(tmp_path / "cache"))
+  monkeypatch.setenv("KUBECONFIG", str(tmp_path / "kubeconfig"))
+  return tmp_path
+
+
+@pytest.fixture
+def disable_cache(mocker: MockerFixture):
+  mocker.patch("xpk.core.cluster.is_cache_enabled", return_value=False)
 
 
 @pytest.fixture(autouse=True)
@@ -48,6 +74,7 @@ def mock_patch_controller_manager_resources(mocker: MockerFixture) -> MagicMock:
   )
 
 
+@pytest.mark.usefixtures("disable_cache")
 def test_get_cluster_credentials_returns_1_when_retrieval_commands_fail(
     commands_tester: CommandsTester, command_args
 ):
@@ -61,6 +88,7 @@ def test_get_cluster_credentials_returns_1_when_retrieval_commands_fail(
   assert get_cluster_credentials(command_args) == 1
 
 
+@pytest.mark.usefixtures("disable_cache")
 def test_get_cluster_credentials_returns_0_when_retrieval_succeeds(
     commands_tester: CommandsTester, command_args
 ):
@@ -70,6 +98,7 @@ def test_get_cluster_credentials_returns_0_when_retrieval_succeeds(
   assert get_cluster_credentials(command_args) == 0
 
 
+@pytest.mark.usefixtures("disable_cache")
 def test_get_cluster_credentials_does_not_retry_with_dns_when_retrieval_succeeds(
     commands_tester: CommandsTester, command_args
 ):
@@ -88,6 +117,7 @@ def test_get_cluster_credentials_does_not_retry_with_dns_when_retrieval_succeeds
   assert len(non_dns_endpoint_commands) == 0
 
 
+@pytest.mark.usefixtures("disable_cache")
 def test_get_cluster_credentials_retries_without_dns_when_dns_retrieval_fails(
     commands_tester: CommandsTester, command_args
 ):
@@ -106,6 +136,7 @@ def test_get_cluster_credentials_retries_without_dns_when_dns_retrieval_fails(
   assert len(non_dns_endpoint_commands) == 1
 
 
+@pytest.mark.usefixtures("disable_cache")
 def test_get_cluster_credentials_retries_without_dns_when_dns_retrieval_returns_error(
     commands_tester: CommandsTester, command_args
 ):
@@ -129,11 +160,107 @@ def test_get_cluster_credentials_retries_without_dns_when_dns_retrieval_returns_
   assert len(non_dns_endpoint_commands) == 1
 
 
+@pytest.fixture
+def fetch_credentials(mocker: MockerFixture) -> MagicMock:
+  def write_kubeconfig(project: str, cluster: str, location: str) -> int:
+    with open(os.environ["KUBECONFIG"], "w", encoding="utf-8") as f:
+      f.write(f"current-context: {project}_{location}_{cluster}\n")
+    return 0
+
+  return mocker.patch(
+      "xpk.core.cluster._fetch_cluster_credentials",
+      side_effect=write_kubeconfig,
+  )
+
+
+def test_get_cluster_credentials_reuses_cached_kubeconfig(
+    commands_tester: CommandsTester,
+    command_args,
+    cache_home: Path,
+    fetch_credentials: MagicMock,
+):
+  assert get_cluster_credentials(command_args) == 0
+  kubeconfig = os.environ["KUBECONFIG"]
+  os.environ["KUBECONFIG"] = str(cache_home / "kubeconfig")
+  assert get_cluster_credentials(command_args) == 0
+
+  fetch_credentials.assert_called_once_with("project", "cluster", "us-central1")
+  commands_tester.assert_command_run(
+      f"kubectl --kubeconfig={kubeconfig} get namespace default"
+  )
+  assert os.environ["KUBECONFIG"] == kubeconfig
+  assert kubeconfig.startswith(str(cache_home / "cache"))
+  with open(kubeconfig, "r", encoding="utf-8") as f:
+    assert f.read() == "current-context: project_us-central1_cluster\n"
+  assert not (cache_home / "kubeconfig").exists()
+
+
+def test_get_cluster_credentials_uses_a_kubeconfig_per_cluster(
+    command_args, fetch_credentials: MagicMock
+):
+  get_cluster_credentials(command_args)
+  first = os.environ["KUBECONFIG"]
+  command_args.cluster = "other-cluster"
+  get_cluster_credentials(command_args)
+
+  assert fetch_credentials.call_count == 2
+  assert os.environ["KUBECONFIG"] != first
+
+
+def test_get_cluster_credentials_refetches_expired_kubeconfig(
+    command_args, fetch_credentials: MagicMock, mocker: MockerFixture
+):
+  time_mock = mocker.patch("xpk.utils.kubeconfig.time.time", return_value=0)
+  get_cluster_credentials(command_args)
+
+  time_mock.return_value = 10_000
+  get_cluster_credentials(command_args)
+
+  assert fetch_credentials.call_count == 2
+
+
+def test_get_cluster_credentials_refetches_forgotten_kubeconfig(
+    command_args, fetch_credentials: MagicMock
+):
+  get_cluster_credentials(command_args)
+
+  forget_cluster_credentials(command_args)
+  get_cluster_credentials(command_args)
+
+  assert fetch_credentials.call_count == 2
+
+
+def test_get_cluster_credentials_refetches_kubeconfig_not_reaching_cluster(
+    commands_tester: CommandsTester,
+    command_args,
+    fetch_credentials: MagicMock,
+):
+  get_cluster_credentials(command_args)
+  commands_tester.set_result_for_command(
+      (1, "Unable to connect to the server"), "kubectl --kubeconfig="
+  )
+
+  assert get_cluster_credentials(command_args) == 0
+  assert fetch_credentials.call_count == 2
+
+
+def test_get_cluster_credentials_does_not_cache_failures(
+    command_args, fetch_credentials: MagicMock
+):
+  fetch_credentials.side_effect = None
+  fetch_credentials.return_value = 1
+
+  assert get_cluster_credentials(command_args) == 1
+  assert get_cluster_credentials(command_args) == 1
+
+  assert fetch_credentials.call_count == 2
+
+
 def test_update_cluster_with_lustre_driver_if_necessary_with_default_port_runs_correct_checks(
     commands_tester: CommandsTester, command_args
 ):
   commands_tester.set_result_for_command(
-      (0, "True"),
+      (0, '{"addonsConfig": {"lustreCsiDriverConfig": {"enabled": true}}}'),
       "gcloud container clusters describe",
   )
   command_args.enable_legacy_lustre_port = None
@@ -142,8 +269,7 @@ def test_update_cluster_with_lustre_driver_if_necessary_with_default_port_runs_c
   executed_commands = commands_tester.get_matching_commands()
   assert executed_commands == [
       "gcloud container clusters describe cluster --project=project"
-      " --location=us-central1"
-      ' --format="value(addonsConfig.lustreCsiDriverConfig.enabled)"'
+      " --location=us-central1 --format=json"
   ]
 
 
@@ -151,7 +277,13 @@ def test_update_cluster_with_lustre_driver_if_necessary_with_legacy_port_runs_co
     commands_tester: CommandsTester, command_args
 ):
   commands_tester.set_result_for_command(
-      (0, "True"),
+      (
+          0,
+          (
+              '{"addonsConfig": {"lustreCsiDriverConfig":'
+              ' {"enabled": true, "enableLegacyLustrePort": true}}}'
+          ),
+      ),
       "gcloud container clusters describe",
   )
   command_args.enable_legacy_lustre_port = True
@@ -159,16 +291,8 @@ def test_update_cluster_with_lustre_driver_if_necessary_with_legacy_port_runs_co
 
   executed_commands = commands_tester.get_matching_commands()
   assert executed_commands == [
-      (
-          "gcloud container clusters describe cluster --project=project"
-          " --location=us-central1"
-          ' --format="value(addonsConfig.lustreCsiDriverConfig.enabled)"'
-      ),
-      (
-          "gcloud container clusters describe cluster --project=project"
-          " --location=us-central1"
-          ' --format="value(addonsConfig.lustreCsiDriverConfig.enableLegacyLustrePort)"'
-      ),
+      "gcloud container clusters describe cluster --project=project"
+      " --location=us-central1 --format=json"
   ]
 
 
@@ -271,7 +395,13 @@ def test_update_cluster_with_mtc_if_necessary_already_enabled(
     commands_tester: CommandsTester, command_args
 ):
   commands_tester.set_result_for_command(
-      (0, "True"),
+      (
+          0,
+          (
+              '{"addonsConfig": {"highScaleCheckpointingConfig":'
+              ' {"enabled": true}}}'
+          ),
+      ),
       "gcloud container clusters describe",
   )
   return_code = update_cluster_with_mtc_if_necessary(command_args)
@@ -280,8 +410,7 @@ def test_update_cluster_with_mtc_if_necessary_already_enabled(
   executed_commands = commands_tester.get_matching_commands()
   assert executed_commands == [
       "gcloud container clusters describe cluster --project=project"
-      " --location=us-central1"
-      ' --format="value(addonsConfig.highScaleCheckpointingConfig.enabled)"'
+      " --location=us-central1 --format=json"
   ]
 
 
@@ -289,7 +418,7 @@ def test_update_cluster_with_mtc_if_necessary_enables_addon_successfully(
     commands_tester: CommandsTester, command_args
 ):
   commands_tester.set_result_for_command(
-      (0, "False"),
+      (0, "{}"),
       "gcloud container clusters describe",
   )
   commands_tester.set_result_for_command(
@@ -310,7 +439,7 @@ def test_update_cluster_with_mtc_if_necessary_returns_error_code(
     commands_tester: CommandsTester, command_args
 ):
   commands_tester.set_result_for_command(
-      (0, "False"),
+      (0, "{}"),
       "gcloud container clusters describe",
   )
   commands_tester.set_result_for_command(
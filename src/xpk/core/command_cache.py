@@ -0,0 +1,226 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import contextlib
+import hashlib
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from ..utils.cache import get_cache_dir, read_json_file, write_json_file
+from ..utils.execution_context import is_cache_enabled, is_dry_run
+from ..utils.kubeconfig import get_current_context_key
+
+
+@dataclass(frozen=True)
+class _CommandFamily:
+  """Read-only commands whose output can be reused for `ttl_seconds`."""
+
+  pattern: re.Pattern
+  ttl_seconds: float
+
+
+_CACHEABLE_COMMAND_FAMILIES = [
+    _CommandFamily(
+        re.compile(r'^gcloud container get-server-config\b'), ttl_seconds=3600
+    ),
+    _CommandFamily(
+        re.compile(r'^gcloud (beta )?container clusters (describe|list)\b'),
+        ttl_seconds=300,
+    ),
+    _CommandFamily(
+        re.compile(r'^gcloud (beta )?container node-pools (describe|list)\b'),
+        ttl_seconds=120,
+    ),
+    _CommandFamily(re.compile(r'^kubectl get configmap\b'), ttl_seconds=120),
+]
+
+_MUTATING_VERB = re.compile(
+    r'(?:^|\s)(apply|create|delete|patch|replace|update|upgrade|resize|label'
+    r'|annotate|scale|set|edit|rollout)(?=\s|$)'
+)
+
+_RESOURCE_PATTERNS = [
+    (
+        'cluster',
+        re.compile(
+            r'clusters\s+(?:describe|create|update|delete|upgrade|resize'
+            r'|get-credentials)\s+([^\s\-][^\s]*)'
+        ),
+    ),
+    ('cluster', re.compile(r'--cluster[=\s]+([^\s"\']+)')),
+    ('cluster', re.compile(r'--filter=["\']?name[=:]([^\s"\']+)')),
+    ('configmap', re.compile(r'configmaps?\s+([^\s\-][^\s]*)')),
+]
+
+# Listings of several clusters, made stale by a mutation of any cluster.
+_CLUSTER_LIST_TAG = 'clusters'
+_CLUSTER_LIST = re.compile(r'\bclusters\s+list\b')
+
+# Number of mutating commands run by this process per resource tag, used by
+# in-memory caches to notice that a resource they hold may have changed.
+_mutation_counts: dict[str, int] = {}
+_mutation_counts_lock = threading.Lock()
+
+
+def _normalize(command: str) -> str:
+  return ' '.join(command.split())
+
+
+def _tool(command: str) -> str:
+  return command.split(' ', 1)[0]
+
+
+def _resource_tags(command: str) -> set[str]:
+  tags = set()
+  for kind, pattern in _RESOURCE_PATTERNS:
+    for name in pattern.findall(command):
+      tags.add(f'{kind}:{name}')
+  if _CLUSTER_LIST.search(command):
+    tags.add(_CLUSTER_LIST_TAG)
+  return tags
+
+
+def _cache_dir() -> Path:
+  return get_cache_dir() / 'commands'
+
+
+def _entry_path(key: str) -> Path:
+  return _cache_dir() / f'{hashlib.sha256(key.encode()).hexdigest()}.json'
+
+
+def _cache_key(command: str, variant: str) -> str:
+  key = f'{variant}|{command}'
+  if _tool(command) == 'kubectl':
+    key = f'{get_current_context_key()}|{key}'
+  return key
+
+
+def _family(command: str) -> _CommandFamily | None:
+  for family in _CACHEABLE_COMMAND_FAMILIES:
+    if family.pattern.match(command):
+      return family
+  return None
+
+
+def _is_active() -> bool:
+  return is_cache_enabled() and not is_dry_run()
+
+
+def get_cached_output(command: str, variant: str = '') -> str | None:
+  """Returns the cached output of a read-only command if it is still fresh.
+
+  Args:
+    command: command about to be run.
+    variant: distinguishes invocations of the same command whose output is
+        captured differently.
+
+  Returns:
+    The output of the last successful run, or None on a cache miss.
+  """
+  command = _normalize(command)
+  if not _is_active() or _family(command) is None:
+    return None
+  path = _entry_path(_cache_key(command, variant))
+  entry = read_json_file(path)
+  if not isinstance(entry, dict):
+    return None
+  if entry.get('expires_at', 0) < time.time():
+    path.unlink(missing_ok=True)
+    return None
+  output = entry.get('output')
+  return output if isinstance(output, str) else None
+
+
+def store_output(command: str, output: str, variant: str = '') -> None:
+  """Stores the output of a successful command if its family is cacheable."""
+  command = _normalize(command)
+  family = _family(command)
+  if not _is_active() or family is None:
+    return
+  write_json_file(
+      _entry_path(_cache_key(command, variant)),
+      {
+          'command': command,
+          'tool': _tool(command),
+          'tags': sorted(_resource_tags(command)),
+          'expires_at': time.time() + family.ttl_seconds,
+          'output': output,
+      },
+  )
+
+
+def get_mutation_count(tag: str) -> int:
+  """Returns how many mutating commands touched `tag` in this process.
+
+  Args:
+    tag: resource tag such as `cluster:<name>`, or `tool:<tool>` for mutating
+        commands of a tool whose resource could not be extracted.
+  """
+  with _mutation_counts_lock:
+    return _mutation_counts.get(tag, 0)
+
+
+def _count_mutation(tags: set[str]) -> None:
+  with _mutation_counts_lock:
+    for tag in tags:
+      _mutation_counts[tag] = _mutation_counts.get(tag, 0) + 1
+
+
+def invalidate_for_command(command: str) -> None:
+  """Drops cached outputs that a mutating command may have made stale.
+
+  Entries sharing a resource (cluster or configmap name) with the command are
+  removed. If no resource can be extracted from the command, for example for
+  `kubectl apply -f <file>`, every entry of the same tool is removed.
+  """
+  command = _normalize(command)
+  if is_dry_run() or _family(command) is not None:
+    return
+  # Compound commands such as `gcloud ... && kubectl ...` are checked per part.
+  for part in re.split(r'\s*(?:&&|\|\||;|\|)\s*', command):
+    if not _MUTATING_VERB.search(part):
+      continue
+    tags = _resource_tags(part)
+    if any(tag.startswith('cluster:') for tag in tags):
+      tags.add(_CLUSTER_LIST_TAG)
+    tool = _tool(part)
+    _count_mutation(tags or {f'tool:{tool}'})
+    for path in _cache_dir().glob('*.json'):
+      entry = read_json_file(path)
+      if not isinstance(entry, dict):
+        continue
+      if tags.intersection(entry.get('tags', [])) or (
+          not tags and entry.get('tool') == tool
+      ):
+        path.unlink(missing_ok=True)
+
+
+@contextlib.contextmanager
+def invalidating(command: str) -> Iterator[None]:
+  """Drops cached outputs made stale by `command` before and after its run.
+
+  Reads running concurrently with the command may cache the output from
+  before the mutation, so the entries are dropped again once it completed.
+  """
+  invalidate_for_command(command)
+  try:
+    yield
+  finally:
+    invalidate_for_command(command)
@@ -0,0 +1,160 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .command_cache import (
+    get_cached_output,
+    get_mutation_count,
+    invalidate_for_command,
+    invalidating,
+    store_output,
+)
+
+_DESCRIBE = "gcloud container clusters describe my-cluster --project=p"
+_CONFIGMAP = (
+    "kubectl get configmap my-cluster-resources-configmap"
+    ' -o=custom-columns="ConfigData:data" --no-headers=true'
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+  monkeypatch.setenv("XPK_CACHE_HOME", str(tmp_path / "cache"))
+  kubeconfig = tmp_path / "kubeconfig"
+  kubeconfig.write_text("current-context: ctx-a\n", encoding="utf-8")
+  monkeypatch.setenv("KUBECONFIG", str(kubeconfig))
+  return tmp_path
+
+
+def test_stores_and_returns_read_only_command_output():
+  store_output(_DESCRIBE, "output")
+
+  assert get_cached_output(_DESCRIBE) == "output"
+  assert get_cached_output(" ".join(_DESCRIBE.split(" ")) + "  ") == "output"
+
+
+def test_does_not_cache_mutating_commands():
+  command = "gcloud container clusters update my-cluster --project=p"
+  store_output(command, "output")
+
+  assert get_cached_output(command) is None
+
+
+def test_entries_expire(mocker: MockerFixture):
+  time_mock = mocker.patch("xpk.core.command_cache.time.time", return_value=0)
+  store_output(_DESCRIBE, "output")
+
+  time_mock.return_value = 10_000
+
+  assert get_cached_output(_DESCRIBE) is None
+
+
+def test_variants_are_cached_separately():
+  store_output(_DESCRIBE, "output", variant="a")
+
+  assert get_cached_output(_DESCRIBE, variant="b") is None
+
+
+def test_kubectl_entries_are_scoped_to_current_context(cache_home: Path):
+  store_output(_CONFIGMAP, "map[]")
+
+  (cache_home / "kubeconfig").write_text(
+      "current-context: ctx-b\n", encoding="utf-8"
+  )
+
+  assert get_cached_output(_CONFIGMAP) is None
+
+
+def test_mutation_invalidates_entries_of_same_cluster():
+  other = "gcloud container clusters describe other-cluster --project=p"
+  store_output(_DESCRIBE, "output")
+  store_output(other, "other")
+
+  invalidate_for_command(
+      "gcloud beta container node-pools create np --cluster=my-cluster"
+  )
+
+  assert get_cached_output(_DESCRIBE) is None
+  assert get_cached_output(other) == "other"
+
+
+def test_cluster_mutation_invalidates_cluster_listings():
+  listing = (
+      "gcloud container clusters list --project=p"
+      ' --filter=location~"us-central1.*" --format="csv[no-heading](name)"'
+  )
+  store_output(listing, "other-cluster")
+
+  invalidate_for_command(
+      "gcloud container clusters delete my-cluster --project=p --quiet"
+  )
+
+  assert get_cached_output(listing) is None
+
+
+def test_invalidating_drops_entries_cached_while_command_runs():
+  count = get_mutation_count("cluster:my-cluster")
+
+  with invalidating("gcloud container clusters update my-cluster --project=p"):
+    store_output(_DESCRIBE, "stale")
+
+  assert get_cached_output(_DESCRIBE) is None
+  assert get_mutation_count("cluster:my-cluster") == count + 2
+
+
+def test_mutation_without_resource_invalidates_whole_tool():
+  store_output(_DESCRIBE, "output")
+  store_output(_CONFIGMAP, "map[]")
+
+  invalidate_for_command("kubectl apply -f /tmp/manifest.yaml")
+
+  assert get_cached_output(_CONFIGMAP) is None
+  assert get_cached_output(_DESCRIBE) == "output"
+
+
+def test_mutations_are_counted_per_resource():
+  count = get_mutation_count("cluster:my-cluster")
+  other_count = get_mutation_count("cluster:other-cluster")
+
+  invalidate_for_command(
+      "gcloud container clusters update my-cluster --project=p"
+  )
+  invalidate_for_command(_DESCRIBE)
+
+  assert get_mutation_count("cluster:my-cluster") == count + 1
+  assert get_mutation_count("cluster:other-cluster") == other_count
+
+
+def test_read_only_commands_do_not_invalidate():
+  store_output(_CONFIGMAP, "map[]")
+
+  invalidate_for_command(
+      "gcloud container clusters get-credentials my-cluster && kubectl config"
+      " set-context --current --namespace=default"
+  )
+
+  assert get_cached_output(_CONFIGMAP) == "map[]"
+
+
+def test_cache_is_disabled_with_no_cache(mocker: MockerFixture):
+  mocker.patch("xpk.core.command_cache.is_cache_enabled", return_value=False)
+  store_output(_DESCRIBE, "output")
+
+  assert get_cached_output(_DESCRIBE) is None
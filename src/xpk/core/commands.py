@@ -14,16 +14,35 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import datetime
+import heapq
+import os
+import queue
+import signal
+import statistics
 import subprocess
 import sys
+import threading
 import time
 
-from dataclasses import dataclass
-from ..utils.objects import chunks
+from dataclasses import dataclass, replace
+from typing import Iterator, TextIO
 from ..utils.file import make_tmp_files, write_tmp_file
 from ..utils.console import xpk_print
 from ..utils.execution_context import is_dry_run
+from .command_cache import (
+    get_cached_output,
+    invalidate_for_command,
+    invalidating,
+    store_output,
+)
+from .retry import (
+    DEFAULT_RETRY_POLICY,
+    RetryPolicy,
+    classify_error,
+    run_with_retry,
+)
+
+_PROGRESS_INTERVAL_SECONDS = 10
 
 
 @dataclass
@@ -39,42 +58,45 @@ def run_commands(
     jobname: str,
     per_command_name: list[str],
     batch: int = 10,
+    priorities: list[int] | None = None,
+    retry_policy: RetryPolicy | None = None,
 ) -> list[FailedCommand]:
-  """Run commands in groups of `batch`.
+  """Run commands with at most `batch` of them in parallel.
+
+  A new command is started as soon as any running one finishes, so a single
+  slow command never holds back the rest of the queue.
 
   Args:
     commands: list of command.
     jobname: the name of the job.
     per_command_name: list of command names.
     batch: number of commands to run in parallel.
+    priorities: optional per command priority, higher values start first.
+    retry_policy: optional policy for retrying commands that failed with a
+        retryable error.
 
   Returns:
     A list of FailedCommand instances containing details of all failing commands.
   """
 
-  temporary_files_batches = chunks(make_tmp_files(per_command_name), batch)
-  commands_batched = chunks(commands, batch)
-  per_command_name_batches = chunks(per_command_name, batch)
-
   xpk_print(
-      f'Breaking up a total of {len(commands)} commands into'
-      f' {len(commands_batched)} batches'
+      f'Running a total of {len(commands)} commands with at most {batch} in'
+      ' parallel'
   )
+  output_logs = make_tmp_files(per_command_name)
   if is_dry_run():
     xpk_print('Pretending all the jobs succeeded')
     return []
 
-  all_failures = []
-  for i, _ in enumerate(commands_batched):
-    xpk_print(f'Dispatching batch {i}/{len(commands_batched)}')
-    failures = run_command_batch(
-        commands_batched[i],
-        jobname,
-        per_command_name_batches[i],
-        temporary_files_batches[i],
-    )
-    all_failures.extend(failures)
-  return all_failures
+  return run_command_batch(
+      commands,
+      jobname,
+      per_command_name,
+      output_logs,
+      max_concurrency=batch,
+      priorities=priorities,
+      retry_policy=retry_policy,
+  )
 
 
 def run_command_batch(
@@ -82,104 +104,221 @@ def run_command_batch(
     jobname: str,
     per_command_name: list[str],
     output_logs: list[str],
+    max_concurrency: int | None = None,
+    priorities: list[int] | None = None,
+    retry_policy: RetryPolicy | None = None,
 ) -> list[FailedCommand]:
   """Runs commands in parallel.
 
+  Completion is event driven: every child is reaped by a waiter thread, so the
+  next queued command starts, and the batch returns, as soon as a command
+  exits. Progress is printed at most every `_PROGRESS_INTERVAL_SECONDS`,
+  naming the longest running command, and the batch ends with a summary of
+  the per-command wall times.
+
   Args:
     commands: list of n commands, each command is a a list of strings
     jobname: Useful debugging name for the group of commands
     per_command_name: specific name per task
     output_logs: list of n log paths, each command will output to each log.
+    max_concurrency: maximum number of commands running at once, unbounded
+        if not set.
+    priorities: optional list of n priorities, higher values start first.
+        Commands with equal priority start in the given order.
+    retry_policy: if set, a failed command whose log is classified as
+        retryable is queued again once its backoff elapses.
 
   Returns:
     A list of FailedCommand instances containing details of all failing commands.
   """
 
-  files = [open(f, 'w', encoding='utf-8') for f in output_logs]
-  children = []
-  start_time = datetime.datetime.now()
-  for command, file in zip(commands, files):
-    children.append(
-        # subprocess managed by list pylint: disable=consider-using-with
-        subprocess.Popen(command, stdout=file, stderr=file, shell=True)
+  for command in commands:
+    invalidate_for_command(command)
+
+  total = len(commands)
+  if max_concurrency is None or max_concurrency < 1:
+    max_concurrency = max(total, 1)
+  negated_priorities = [
+      -priorities[i] if priorities else 0 for i in range(total)
+  ]
+  pending = [(negated_priorities[index], index) for index in range(total)]
+  heapq.heapify(pending)
+  # Commands waiting for their retry backoff, as (ready_at, priority, index).
+  delayed: list[tuple[float, int, int]] = []
+
+  completions: queue.Queue[tuple[int, int]] = queue.Queue()
+  files: dict[int, TextIO] = {}
+  started_at: dict[int, float] = {}
+  first_started_at: dict[int, float] = {}
+  attempts = [0] * total
+  start_time = last_update = time.monotonic()
+
+  def start_next() -> None:
+    _, index = heapq.heappop(pending)
+    # closed once the waiter thread reports the exit pylint: disable=consider-using-with
+    files[index] = open(output_logs[index], 'w', encoding='utf-8')
+    started_at[index] = time.monotonic()
+    first_started_at.setdefault(index, started_at[index])
+    attempts[index] += 1
+    # subprocess reaped by the waiter thread pylint: disable=consider-using-with
+    child = subprocess.Popen(
+        commands[index], stdout=files[index], stderr=files[index], shell=True
     )
-
-  failures: list[FailedCommand] = []
-  while True:
-    returncodes = [child.poll() for child in children]
-    completed = len([r for r in returncodes if r is not None])
-    total = len(returncodes)
-    seconds_elapsed = (datetime.datetime.now() - start_time).total_seconds()
-    if completed < total:
-      slow_worker_index = returncodes.index(None)
-      slow_worker_text = per_command_name[slow_worker_index]
-      slow_str = (
-          f', task {slow_worker_text} still working, logfile'
+    threading.Thread(
+        target=_wait_for_exit, args=(index, child, completions), daemon=True
+    ).start()
+
+  def retry_delay(index: int, now: float) -> float | None:
+    if retry_policy is None or attempts[index] >= retry_policy.max_attempts:
+      return None
+    error_class = classify_error(_read_log(output_logs[index]))
+    if not retry_policy.is_retryable(error_class):
+      return None
+    delay = retry_policy.backoff_seconds(attempts[index], error_class)
+    if now + delay > first_started_at[index] + retry_policy.deadline_seconds:
+      return None
+    xpk_print(
+        f'[t={now - start_time:.2f}, {jobname}] Task'
+        f' {per_command_name[index]} failed with a {error_class.value},'
+        f' retrying in {delay:.1f} seconds'
+    )
+    return delay
+
+  def report_progress(now: float) -> None:
+    running = ''
+    if started_at:
+      slow_worker_index = min(started_at, key=started_at.__getitem__)
+      running = (
+          f', {len(started_at)} running, task'
+          f' {per_command_name[slow_worker_index]} still working after'
+          f' {now - started_at[slow_worker_index]:.0f}s, logfile'
           f' {output_logs[slow_worker_index]}'
       )
+    xpk_print(
+        f'[t={now - start_time:.2f}, {jobname}] Completed'
+        f' {completed}/{total}{running}'
+    )
+
+  returncodes: list[int | None] = [None] * total
+  wall_times: dict[int, float] = {}
+  completed = 0
+  while completed < total:
+    now = time.monotonic()
+    while delayed and delayed[0][0] <= now:
+      _, priority, index = heapq.heappop(delayed)
+      heapq.heappush(pending, (priority, index))
+    while pending and len(files) < max_concurrency:
+      start_next()
+    timeout: float = _PROGRESS_INTERVAL_SECONDS
+    if delayed:
+      timeout = min(timeout, max(delayed[0][0] - now, 0))
+    try:
+      index, return_code = completions.get(timeout=timeout)
+    except queue.Empty:
+      pass
     else:
-      slow_str = ''
+      files.pop(index).close()
+      # Reads that ran while the command did may have cached stale outputs.
+      invalidate_for_command(commands[index])
+      now = time.monotonic()
+      wall_time = now - started_at.pop(index)
+      delay = retry_delay(index, now) if return_code != 0 else None
+      if delay is not None:
+        heapq.heappush(delayed, (now + delay, negated_priorities[index], index))
+      else:
+        returncodes[index] = return_code
+        wall_times[index] = wall_time
+        completed += 1
+    now = time.monotonic()
+    if completed < total and now - last_update >= _PROGRESS_INTERVAL_SECONDS:
+      last_update = now
+      report_progress(now)
+
+  if wall_times:
+    slowest_index = max(wall_times, key=wall_times.__getitem__)
+    failed = sum(1 for code in returncodes if code is not None and code > 0)
     xpk_print(
-        f'[t={seconds_elapsed:.2f}, {jobname}] Completed'
-        f' {completed}/{total}{slow_str}'
+        f'[t={time.monotonic() - start_time:.2f}, {jobname}] Completed'
+        f' {completed}/{total}, {failed} failed, median wall time'
+        f' {statistics.median(wall_times.values()):.2f}s, slowest task'
+        f' {per_command_name[slowest_index]} took'
+        f' {wall_times[slowest_index]:.2f}s'
     )
 
-    if completed < total:
-      time.sleep(1)
+  failures: list[FailedCommand] = []
+  for failing_index, returncode in enumerate(returncodes):
+    if returncode is None or returncode <= 0:
       continue
+    xpk_print(
+        f'Failure is {per_command_name[failing_index]}'
+        f' and logfile {output_logs[failing_index]}'
+    )
+    failures.append(
+        FailedCommand(
+            return_code=returncode,
+            name=per_command_name[failing_index],
+            command=commands[failing_index],
+            logfile=output_logs[failing_index],
+        )
+    )
 
-    failing_indices = [
-        i for i, x in enumerate(returncodes) if x is not None and x > 0
-    ]
-    for failing_index in failing_indices:
-      xpk_print(
-          f'Failure is {per_command_name[failing_index]}'
-          f' and logfile {output_logs[failing_index]}'
-      )
-      failures.append(
-          FailedCommand(
-              return_code=returncodes[failing_index] or 0,
-              name=per_command_name[failing_index],
-              command=commands[failing_index],
-              logfile=output_logs[failing_index],
-          )
-      )
-    break
+  return failures
 
-  for file in files:
-    file.close()
 
-  return failures
+def _read_log(path: str) -> str:
+  try:
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+      return f.read()
+  except OSError:
+    return ''
+
+
+def _wait_for_exit(
+    index: int,
+    child: subprocess.Popen,
+    completions: queue.Queue[tuple[int, int]],
+) -> None:
+  completions.put((index, child.wait()))
 
 
 def run_command_with_updates_retry(
-    command, task, verbose=True, num_retry_attempts=5, wait_seconds=10
+    command,
+    task,
+    verbose=True,
+    num_retry_attempts=5,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
 ) -> int:
   """Generic run commands function with updates and retry logic.
 
+  Failures are classified from the command output, which is only captured
+  when `verbose` is False. Permanent errors are not retried, the rest are
+  retried with exponential backoff and jitter as defined by `retry_policy`.
+
   Args:
     command: command to execute
     task: user-facing name of the task
     verbose: shows stdout and stderr if set to true. Set to True by default.
     num_retry_attempts: number of attempts to retry the command.
         This has a default value in the function arguments.
-    wait_seconds: Seconds to wait between attempts.
-        Has a default value in the function arguments.
+    retry_policy: backoff and deadline to use between attempts.
 
   Returns:
     0 if successful and 1 otherwise.
   """
 
-  i = 0
-  return_code = -1
-  while return_code != 0 and i < num_retry_attempts:
-    # Do not sleep before first try.
-    if i != 0:
-      xpk_print(f'Wait {wait_seconds} seconds before retrying.')
-      time.sleep(wait_seconds)
-    i += 1
-    xpk_print(f'Try {i}: {task}')
-    return_code = run_command_with_updates(command, task, verbose=verbose)
+  attempt = 0
+
+  def run_attempt() -> tuple[int, str | None]:
+    nonlocal attempt
+    attempt += 1
+    xpk_print(f'Try {attempt}: {task}')
+    return _run_command_with_updates(command, task, verbose=verbose)
+
+  return_code, _ = run_with_retry(
+      run_attempt,
+      task,
+      replace(retry_policy, max_attempts=num_retry_attempts),
+  )
   return return_code
 
 
@@ -194,48 +333,57 @@ def run_command_with_updates(command, task, verbose=True) -> int:
   Returns:
     0 if successful and 1 otherwise.
   """
+  return _run_command_with_updates(command, task, verbose=verbose)[0]
+
+
+def _run_command_with_updates(
+    command, task, verbose=True
+) -> tuple[int, str | None]:
+  """Runs the command with updates and returns its captured output, if any."""
   if is_dry_run():
     xpk_print(
         f'Task: `{task}` is implemented by the following command'
         ' not running since it is a dry run.'
         f' \n{command}'
     )
-    return 0
-  if verbose:
-    xpk_print(
-        f'Task: `{task}` is implemented by `{command}`, streaming output live.'
-    )
-    with subprocess.Popen(
-        command,
-        stdout=sys.stdout,
-        stderr=sys.stderr,
-        shell=True,
-    ) as child:
-      i = 0
-      while True:
-        return_code = child.poll()
-        if return_code is None:
-          xpk_print(f'Waiting for `{task}`, for {i} seconds...', end='\r')
-          time.sleep(10)
-          i += 10
-        else:
-          xpk_print(f'Task: `{task}` terminated with code `{return_code}`')
-          return return_code
-  else:
-    xpk_print(f'Task: `{task}` is implemented by `{command}`')
-    try:
-      subprocess.check_output(command, shell=True, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
+    return 0, None
+  with invalidating(command):
+    if verbose:
       xpk_print(
-          f'Task: `{task}` terminated with ERROR `{e.returncode}`, printing'
-          ' logs'
+          f'Task: `{task}` is implemented by `{command}`, streaming output'
+          ' live.'
       )
-      xpk_print('*' * 80)
-      xpk_print(e.output)
-      xpk_print('*' * 80)
-      return e.returncode
-    xpk_print(f'Task: `{task}` succeeded.')
-    return 0
+      with subprocess.Popen(
+          command,
+          stdout=sys.stdout,
+          stderr=sys.stderr,
+          shell=True,
+      ) as child:
+        i = 0
+        while True:
+          return_code = child.poll()
+          if return_code is None:
+            xpk_print(f'Waiting for `{task}`, for {i} seconds...', end='\r')
+            time.sleep(10)
+            i += 10
+          else:
+            xpk_print(f'Task: `{task}` terminated with code `{return_code}`')
+            return return_code, None
+    else:
+      xpk_print(f'Task: `{task}` is implemented by `{command}`')
+      try:
+        subprocess.check_output(command, shell=True, stderr=subprocess.STDOUT)
+      except subprocess.CalledProcessError as e:
+        xpk_print(
+            f'Task: `{task}` terminated with ERROR `{e.returncode}`, printing'
+            ' logs'
+        )
+        xpk_print('*' * 80)
+        xpk_print(e.output)
+        xpk_print('*' * 80)
+        return e.returncode, str(e.output, 'UTF-8', errors='replace')
+      xpk_print(f'Task: `{task}` succeeded.')
+      return 0, None
 
 
 def run_command_for_value(
@@ -245,6 +393,7 @@ def run_command_for_value(
     print_timer=False,
     hide_error=False,
     quiet=False,
+    retry_policy: RetryPolicy | None = None,
 ) -> tuple[int, str]:
   """Runs the command and returns the error code and stdout.
 
@@ -256,6 +405,8 @@ def run_command_for_value(
     dry_run_return_val: return value of this command for dry run.
     print_timer: print out the time the command is running.
     hide_error: hide the error from the command output upon success.
+    retry_policy: if set, failures classified as retryable are retried
+        following this policy.
 
   Returns:
     tuple[int, str]
@@ -270,6 +421,34 @@ def run_command_for_value(
     )
     return 0, dry_run_return_val
 
+  cache_variant = f'print_timer={print_timer},hide_error={hide_error}'
+  cached_output = get_cached_output(command, cache_variant)
+  if cached_output is not None:
+    if not quiet:
+      xpk_print(f'Task: `{task}` is served from the xpk cache for `{command}`')
+    return 0, cached_output
+  with invalidating(command):
+    if retry_policy is not None:
+      return_code, output = run_with_retry(
+          lambda: _run_command_for_value(
+              command, task, print_timer, hide_error, quiet
+          ),
+          task,
+          retry_policy,
+      )
+      output = output or ''
+    else:
+      return_code, output = _run_command_for_value(
+          command, task, print_timer, hide_error, quiet
+      )
+  if return_code == 0:
+    store_output(command, output, cache_variant)
+  return return_code, output
+
+
+def _run_command_for_value(
+    command, task, print_timer, hide_error, quiet
+) -> tuple[int, str]:
   if print_timer:
     if not quiet:
       xpk_print(f'Task: `{task}` is implemented by `{command}`')
@@ -312,6 +491,66 @@ def run_command_for_value(
     return 0, str(output, 'UTF-8')
 
 
+def run_command_for_stream(
+    command: str,
+    task: str,
+    timeout_seconds: float | None = None,
+) -> Iterator[str]:
+  """Runs a long-lived command and yields its stdout line by line.
+
+  Args:
+    command: command to execute, for example a `kubectl get --watch`.
+    task: user-facing name of the task.
+    timeout_seconds: if set, the command is terminated after this time and
+        the stream ends.
+
+  Yields:
+    Lines of the command output as soon as they are printed.
+  """
+  if is_dry_run():
+    xpk_print(
+        f'Task: `{task}` is implemented by the following command'
+        ' not running since it is a dry run.'
+        f' \n{command}'
+    )
+    return
+
+  xpk_print(f'Task: `{task}` is implemented by `{command}`')
+  # The command runs in its own process group so that terminating it also
+  # stops the processes started by the shell, which hold the output pipe.
+  with subprocess.Popen(
+      command,
+      stdout=subprocess.PIPE,
+      stderr=subprocess.PIPE,
+      shell=True,
+      text=True,
+      start_new_session=True,
+  ) as child:
+
+    def terminate() -> None:
+      try:
+        os.killpg(child.pid, signal.SIGTERM)
+      except ProcessLookupError:
+        pass
+
+    timer = None
+    if timeout_seconds is not None:
+      timer = threading.Timer(max(timeout_seconds, 0), terminate)
+      timer.daemon = True
+      timer.start()
+    try:
+      assert child.stdout is not None
+      yield from child.stdout
+    finally:
+      if timer is not None:
+        timer.cancel()
+      terminate()
+      _, err = child.communicate()
+    if child.returncode not in (0, -signal.SIGTERM):
+      xpk_print(f'Task: `{task}` terminated with code `{child.returncode}`')
+      xpk_print(err)
+
+
 def run_command_with_full_controls(
     command: str,
     task: str,
@@ -344,18 +583,19 @@ def run_command_with_full_controls(
   if instructions is not None:
     xpk_print(instructions)
 
-  try:
-    with subprocess.Popen(
-        command,
-        stdout=sys.stdout,
-        stderr=sys.stderr,
-        stdin=sys.stdin,
-        shell=True,
-    ) as child:
-      return_code = child.wait()
-      xpk_print(f'Task: `{task}` terminated with code `{return_code}`')
-  except KeyboardInterrupt:
-    return_code = 0
+  with invalidating(command):
+    try:
+      with subprocess.Popen(
+          command,
+          stdout=sys.stdout,
+          stderr=sys.stderr,
+          stdin=sys.stdin,
+          shell=True,
+      ) as child:
+        return_code = child.wait()
+        xpk_print(f'Task: `{task}` terminated with code `{return_code}`')
+    except KeyboardInterrupt:
+      return_code = 0
 
   return return_code
 
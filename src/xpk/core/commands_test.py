@@ -0,0 +1,258 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import queue
+import time
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .commands import (
+    FailedCommand,
+    run_command_batch,
+    run_command_for_stream,
+    run_command_for_value,
+    run_commands,
+)
+from .retry import RetryPolicy
+
+
+@pytest.fixture
+def output_logs(tmp_path: Path) -> list[str]:
+  return [str(tmp_path / f"log{i}") for i in range(3)]
+
+
+def test_run_command_batch_returns_failures(output_logs: list[str]):
+  failures = run_command_batch(
+      commands=["true", "echo oops && exit 3", "true"],
+      jobname="test",
+      per_command_name=["ok1", "bad", "ok2"],
+      output_logs=output_logs,
+  )
+
+  assert failures == [
+      FailedCommand(
+          return_code=3,
+          name="bad",
+          command="echo oops && exit 3",
+          logfile=output_logs[1],
+      )
+  ]
+  assert Path(output_logs[1]).read_text(encoding="utf-8") == "oops\n"
+
+
+class _RecordingQueue(queue.Queue):
+  """Counts the waits for a completion that timed out."""
+
+  timeouts = 0
+
+  def get(self, block=True, timeout=None):
+    try:
+      return super().get(block, timeout)
+    except queue.Empty:
+      _RecordingQueue.timeouts += 1
+      raise
+
+
+def test_run_command_batch_wakes_up_on_completion(
+    output_logs: list[str], mocker: MockerFixture
+):
+  mocker.patch("xpk.core.commands.queue.Queue", _RecordingQueue)
+  _RecordingQueue.timeouts = 0
+
+  failures = run_command_batch(
+      commands=["true"] * 3,
+      jobname="test",
+      per_command_name=["a", "b", "c"],
+      output_logs=output_logs,
+  )
+
+  assert not failures
+  assert _RecordingQueue.timeouts == 0
+
+
+def test_run_command_batch_reports_heartbeat_and_summary(
+    output_logs: list[str], mocker: MockerFixture
+):
+  mocker.patch("xpk.core.commands._PROGRESS_INTERVAL_SECONDS", 0.05)
+  xpk_print = mocker.patch("xpk.core.commands.xpk_print")
+
+  run_command_batch(
+      commands=["true", "sleep 0.3"],
+      jobname="test",
+      per_command_name=["fast", "slow"],
+      output_logs=output_logs[:2],
+  )
+
+  printed = [call.args[0] for call in xpk_print.call_args_list]
+  assert any("task slow still working" in line for line in printed)
+  assert "Completed 2/2, 0 failed" in printed[-1]
+  assert "slowest task slow took" in printed[-1]
+
+
+def test_run_command_batch_does_not_print_every_completion(
+    tmp_path: Path, mocker: MockerFixture
+):
+  xpk_print = mocker.patch("xpk.core.commands.xpk_print")
+
+  run_command_batch(
+      commands=["true"] * 20,
+      jobname="test",
+      per_command_name=[f"task{i}" for i in range(20)],
+      output_logs=[str(tmp_path / f"log{i}") for i in range(20)],
+  )
+
+  printed = [call.args[0] for call in xpk_print.call_args_list]
+  assert [line for line in printed if "Completed" in line] == [printed[-1]]
+  assert "Completed 20/20" in printed[-1]
+
+
+def test_run_command_batch_starts_next_command_when_slot_frees(
+    output_logs: list[str],
+):
+  start = time.monotonic()
+
+  failures = run_command_batch(
+      commands=["sleep 0.6", "sleep 0.1", "sleep 0.1"],
+      jobname="test",
+      per_command_name=["slow", "fast1", "fast2"],
+      output_logs=output_logs,
+      max_concurrency=2,
+  )
+
+  assert not failures
+  # Fixed batches of two would take 0.6s + 0.1s.
+  assert time.monotonic() - start < 0.68
+
+
+def test_run_command_batch_respects_priorities(
+    output_logs: list[str], tmp_path: Path
+):
+  order_file = tmp_path / "order"
+
+  run_command_batch(
+      commands=[f"echo {name} >> {order_file}" for name in ["a", "b", "c"]],
+      jobname="test",
+      per_command_name=["a", "b", "c"],
+      output_logs=output_logs,
+      max_concurrency=1,
+      priorities=[0, 1, 2],
+  )
+
+  assert order_file.read_text(encoding="utf-8").split() == ["c", "b", "a"]
+
+
+def test_run_commands_returns_failures(mocker: MockerFixture, tmp_path: Path):
+  mocker.patch(
+      "xpk.core.commands.make_tmp_files",
+      return_value=[str(tmp_path / "log0"), str(tmp_path / "log1")],
+  )
+
+  failures = run_commands(
+      commands=["true", "exit 2"],
+      jobname="test",
+      per_command_name=["ok", "bad"],
+      batch=1,
+  )
+
+  assert [(f.name, f.return_code) for f in failures] == [("bad", 2)]
+
+
+def test_run_command_batch_retries_retryable_failures(
+    output_logs: list[str], tmp_path: Path
+):
+  marker = tmp_path / "marker"
+  command = (
+      f"if [ -f {marker} ]; then exit 0; fi; touch {marker};"
+      " echo 'code=429 Too Many Requests'; exit 1"
+  )
+
+  failures = run_command_batch(
+      commands=[command],
+      jobname="test",
+      per_command_name=["flaky"],
+      output_logs=output_logs[:1],
+      retry_policy=RetryPolicy(initial_backoff_seconds=0.01),
+  )
+
+  assert not failures
+
+
+def test_run_command_batch_does_not_retry_permanent_failures(
+    output_logs: list[str], tmp_path: Path
+):
+  counter = tmp_path / "counter"
+
+  failures = run_command_batch(
+      commands=[f"echo run >> {counter}; echo 'already exists'; exit 1"],
+      jobname="test",
+      per_command_name=["bad"],
+      output_logs=output_logs[:1],
+      retry_policy=RetryPolicy(initial_backoff_seconds=0.01),
+  )
+
+  assert len(failures) == 1
+  assert counter.read_text(encoding="utf-8").split() == ["run"]
+
+
+def test_run_command_for_value_retries_with_policy(
+    tmp_path: Path, mocker: MockerFixture
+):
+  mocker.patch("xpk.core.retry.time.sleep")
+  marker = tmp_path / "marker"
+  command = (
+      f"if [ -f {marker} ]; then echo value; exit 0; fi; touch {marker};"
+      " echo 'HttpError 503'; exit 1"
+  )
+
+  result = run_command_for_value(
+      command, "task", retry_policy=RetryPolicy(), quiet=True
+  )
+
+  assert result == (0, "value\n")
+
+
+def test_run_command_for_value_serves_read_only_commands_from_cache(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+  monkeypatch.setenv("XPK_CACHE_HOME", str(tmp_path))
+  monkeypatch.setenv("KUBECONFIG", str(tmp_path / "kubeconfig"))
+  run = mocker.patch(
+      "xpk.core.commands._run_command_for_value", return_value=(0, "out")
+  )
+  command = "gcloud container clusters describe c --project=p"
+
+  assert run_command_for_value(command, "task") == (0, "out")
+  assert run_command_for_value(command, "task") == (0, "out")
+  run.assert_called_once()
+
+
+def test_run_command_for_stream_yields_lines_as_printed():
+  lines = run_command_for_stream("echo a; echo b", "task")
+
+  assert list(lines) == ["a\n", "b\n"]
+
+
+def test_run_command_for_stream_stops_at_timeout():
+  start = time.monotonic()
+
+  lines = list(
+      run_command_for_stream("echo a; sleep 30", "task", timeout_seconds=0.2)
+  )
+
+  assert lines == ["a\n"]
+  assert time.monotonic() - start < 5
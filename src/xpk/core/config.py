@@ -16,8 +16,9 @@ limitations under the License.
 
 import os
 
-import ruamel.yaml
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any
 from ..utils import file
 from ..utils.execution_context import is_dry_run
 from ..utils.console import xpk_print
@@ -55,6 +56,7 @@ CLIENT_ID_KEY = 'client-id'
 SEND_TELEMETRY_KEY = 'send-telemetry'
 ZONE_KEY = 'zone'
 CUSTOM_BINARIES_PATH_KEY = 'custom-binaries-path'
+CHECK_FOR_UPDATES_KEY = 'check-for-updates'
 
 DEFAULT_KEYS = [
     CFG_BUCKET_KEY,
@@ -64,11 +66,18 @@ DEFAULT_KEYS = [
     SEND_TELEMETRY_KEY,
     ZONE_KEY,
     CUSTOM_BINARIES_PATH_KEY,
+    CHECK_FOR_UPDATES_KEY,
 ]
 VERTEX_TENSORBOARD_FEATURE_FLAG = XPK_CURRENT_VERSION >= '0.4.0'
+DEFAULT_VERTEX_TENSORBOARD_NAME = 'tb-instance'
 
 
-yaml = ruamel.yaml.YAML()
+@lru_cache()
+def _yaml() -> Any:
+  """Returns the YAML parser, importing ruamel.yaml on first use."""
+  import ruamel.yaml  # pylint: disable=import-outside-toplevel
+
+  return ruamel.yaml.YAML()
 
 
 class Config(ABC):
@@ -105,7 +114,7 @@ class FileSystemConfig(Config):
       return None
 
     with open(self._config, encoding='utf-8', mode='r') as stream:
-      config_yaml: dict = yaml.load(stream)
+      config_yaml: dict = _yaml().load(stream)
       return config_yaml
 
   def _save_configs(self, config_yaml: dict) -> None:
@@ -113,7 +122,7 @@ class FileSystemConfig(Config):
       return None
 
     with open(self._config, encoding='utf-8', mode='w') as stream:
-      yaml.dump(config_yaml, stream)
+      _yaml().dump(config_yaml, stream)
 
   def set(self, key: str, value: str | None) -> None:
     if key not in self._allowed_keys:
@@ -18,15 +18,16 @@ import datetime
 import os
 import random
 import string
-import tarfile
+from pathlib import Path
 
-from docker.utils import build
 from .system_characteristics import DockerPlatform
+from ..utils.cache import get_cache_dir, read_json_file, write_json_file
 from ..utils.console import xpk_exit, xpk_print
 from ..utils.feature_flags import FeatureFlags
 from ..utils.file import write_tmp_file
-from ..utils.execution_context import is_dry_run
-from .commands import run_command_with_updates
+from ..utils.execution_context import is_cache_enabled, is_dry_run
+from .commands import run_command_for_value, run_command_with_updates
+from .image_archive import script_dir_digest, write_image_archive
 
 DEFAULT_DOCKER_IMAGE = 'python:3.10'
 DEFAULT_SCRIPT_DIR = os.getcwd()
@@ -71,6 +72,10 @@ def build_docker_image_from_base_image(
 ) -> tuple[int, str]:
   """Adds script dir to the base docker image and uploads the image.
 
+  The image built last for the same files, base image digest and platform is
+  reused if it is still available, so that unchanged code is not uploaded
+  again.
+
   Args:
     args: user provided arguments for running the command.
 
@@ -85,6 +90,27 @@ def build_docker_image_from_base_image(
       'dry-run' if is_dry_run() else os.getenv('USER', 'unknown')
   )
   docker_name = f'{docker_image_prefix}-runner'
+  repository = f'gcr.io/{args.project}/{docker_name}'
+
+  digest = None
+  base_image_digest = (
+      _resolve_base_image_digest(args.base_docker_image, docker_platform)
+      if is_cache_enabled() and not is_dry_run()
+      else None
+  )
+  if base_image_digest is not None:
+    digest = script_dir_digest(
+        args.script_dir,
+        f'{args.base_docker_image}@{base_image_digest}',
+        docker_platform,
+    )
+    cached_image = _get_cached_script_image(repository, digest)
+    if cached_image is not None and _image_exists(cached_image, args.project):
+      xpk_print(
+          f'{args.script_dir} did not change, reusing container image'
+          f' {cached_image}'
+      )
+      return 0, cached_image
 
   # Pick a randomly generated `tag_length` character docker tag.
   tag_length = 4
@@ -99,8 +125,8 @@ def build_docker_image_from_base_image(
       else datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')
   )
   tag_name = f'{tag_random_prefix}-{tag_datetime}'
-  cloud_docker_image = f'gcr.io/{args.project}/{docker_name}:{tag_name}'
-  return (
+  cloud_docker_image = f'{repository}:{tag_name}'
+  return_code, image = (
       _build_image_with_crane(
           args,
           docker_platform,
@@ -116,6 +142,68 @@ def build_docker_image_from_base_image(
           verbose=verbose,
       )
   )
+  if return_code == 0 and digest is not None:
+    _cache_script_image(repository, digest, image)
+  return return_code, image
+
+
+def _resolve_base_image_digest(
+    base_docker_image: str, docker_platform: DockerPlatform
+) -> str | None:
+  """Returns the digest of the base image the build would start from.
+
+  Tags such as `latest` move, so built images are only reused for the same
+  base image digest. Crane reads the base image from its registry, while
+  docker builds from the local copy if there is one.
+
+  Returns:
+    The digest, None if it could not be resolved and the image must be built.
+  """
+  command = (
+      f'crane digest {base_docker_image} --platform {docker_platform.value}'
+      if FeatureFlags.CRANE_WORKLOADS_ENABLED
+      else f"docker image inspect --format='{{{{.Id}}}}' {base_docker_image}"
+  )
+  return_code, output = run_command_for_value(
+      command, 'Resolve Base Image Digest', quiet=True, hide_error=True
+  )
+  if return_code != 0 or not output.strip():
+    return None
+  return output.strip()
+
+
+def _script_images_path() -> Path:
+  return get_cache_dir() / 'script_images.json'
+
+
+def _get_cached_script_image(repository: str, digest: str) -> str | None:
+  """Returns the image last built in a repository if it has this digest."""
+  cached = read_json_file(_script_images_path())
+  if not isinstance(cached, dict):
+    return None
+  entry = cached.get(repository)
+  if not isinstance(entry, dict) or entry.get('digest') != digest:
+    return None
+  image = entry.get('image')
+  return image if isinstance(image, str) else None
+
+
+def _cache_script_image(repository: str, digest: str, image: str) -> None:
+  cached = read_json_file(_script_images_path())
+  if not isinstance(cached, dict):
+    cached = {}
+  cached[repository] = {'digest': digest, 'image': image}
+  write_json_file(_script_images_path(), cached)
+
+
+def _image_exists(image: str, project: str) -> bool:
+  return_code, _ = run_command_for_value(
+      f'gcloud container images describe {image} --project {project}',
+      'Check Cached Container Image',
+      quiet=True,
+      hide_error=True,
+  )
+  return return_code == 0
 
 
 def _build_image_archive(script_dir: str) -> str:
@@ -126,33 +214,13 @@ def _build_image_archive(script_dir: str) -> str:
   if is_dry_run():
     return image_archive_path
 
-  ignore_patterns = []
-  ignore_path = os.path.join(script_dir, '.dockerignore')
-  if os.path.exists(ignore_path):
-    with open(ignore_path, 'r', encoding='utf=8') as ignore_file:
-      ignore_patterns = [
-          line.strip()
-          for line in ignore_file
-          if not line.isspace() and not line.startswith('#')
-      ]
-
-  paths_to_add = build.exclude_paths(script_dir, ignore_patterns)
-
-  with tarfile.open(image_archive_path, 'w') as tar:
-    for path in sorted(paths_to_add):
-      full_path = os.path.join(script_dir, path)
-      archive_name = os.path.join('app', path)
-      info = tar.gettarinfo(full_path, arcname=archive_name)
-      info.uid = info.gid = 0
-      info.uname = info.gname = 'root'
-
-      if os.path.isfile(full_path):
-        with open(full_path, 'rb') as f:
-          tar.addfile(info, f)
-      else:
-        # Directories and special files (symlinks, etc.)
-        tar.addfile(info, None)
-    return image_archive_path
+  stats = write_image_archive(script_dir, image_archive_path)
+  xpk_print(
+      f'Archived {stats.files} files, {stats.input_bytes / 1e6:.1f} MB in'
+      f' {stats.seconds:.1f}s ({stats.throughput_mb_per_second:.1f} MB/s),'
+      f' archive size {stats.archive_bytes / 1e6:.1f} MB'
+  )
+  return image_archive_path
 
 
 def _build_image_with_crane(
@@ -14,9 +14,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import os
+from pathlib import Path
+
 import pytest
 from pytest_mock import MockerFixture
-from .docker_image import build_docker_image_from_base_image
+from .docker_image import _build_image_archive, build_docker_image_from_base_image
 from .testing.commands_tester import CommandsTester
 from .system_characteristics import DockerPlatform
 from ..utils.feature_flags import FeatureFlags
@@ -85,3 +88,119 @@ def test_build_docker_image_from_base_image_uses_crane_if_feature_flag_enabled(
       "--tag gcr.io/project/dry-run-runner:prefix-current",
       "--workdir /app",
   )
+
+
+@pytest.fixture
+def script_dir(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    commands_tester: CommandsTester,
+) -> Path:
+  mocker.patch("xpk.core.docker_image.is_dry_run", return_value=False)
+  commands_tester.set_result_for_command((0, "sha256:aaa\n"), "crane digest")
+  monkeypatch.setenv("XPK_CACHE_HOME", str(tmp_path / "cache"))
+  FeatureFlags.CRANE_WORKLOADS_ENABLED = True
+  script_dir = tmp_path / "script_dir"
+  (script_dir / "src").mkdir(parents=True)
+  (script_dir / "src" / "train.py").write_text("print('train')\n")
+  (script_dir / "notes.txt").write_text("notes\n")
+  (script_dir / ".dockerignore").write_text("# ignored files\n*.txt\n")
+  return script_dir
+
+
+def test_build_docker_image_reuses_image_for_unchanged_script_dir(
+    commands_tester: CommandsTester, command_args, script_dir: Path
+):
+  command_args.script_dir = str(script_dir)
+
+  _, first_image = build_docker_image_from_base_image(
+      command_args, DockerPlatform.ARM
+  )
+  (script_dir / "notes.txt").write_text("ignored change\n")
+  return_code, second_image = build_docker_image_from_base_image(
+      command_args, DockerPlatform.ARM
+  )
+
+  assert return_code == 0
+  assert second_image == first_image
+  commands_tester.assert_command_run("crane mutate", times=1)
+  commands_tester.assert_command_run(
+      f"gcloud container images describe {first_image}"
+  )
+
+
+def test_build_docker_image_rebuilds_changed_script_dir(
+    commands_tester: CommandsTester, command_args, script_dir: Path
+):
+  command_args.script_dir = str(script_dir)
+
+  build_docker_image_from_base_image(command_args, DockerPlatform.ARM)
+  (script_dir / "src" / "train.py").write_text("print('changed')\n")
+  build_docker_image_from_base_image(command_args, DockerPlatform.ARM)
+
+  commands_tester.assert_command_run("crane mutate", times=2)
+
+
+def test_build_docker_image_rebuilds_for_another_platform(
+    commands_tester: CommandsTester, command_args, script_dir: Path
+):
+  command_args.script_dir = str(script_dir)
+
+  build_docker_image_from_base_image(command_args, DockerPlatform.ARM)
+  build_docker_image_from_base_image(command_args, DockerPlatform.AMD)
+
+  commands_tester.assert_command_run("crane mutate", times=2)
+
+
+def test_build_docker_image_rebuilds_when_cached_image_is_gone(
+    commands_tester: CommandsTester, command_args, script_dir: Path
+):
+  command_args.script_dir = str(script_dir)
+  commands_tester.set_result_for_command(
+      (1, ""), "gcloud container images describe"
+  )
+
+  build_docker_image_from_base_image(command_args, DockerPlatform.ARM)
+  build_docker_image_from_base_image(command_args, DockerPlatform.ARM)
+
+  commands_tester.assert_command_run("crane mutate", times=2)
+
+
+def test_build_image_archive_is_reproducible(script_dir: Path):
+  first_archive = _build_image_archive(str(script_dir))
+  os.utime(script_dir / "src" / "train.py", (1, 1))
+  second_archive = _build_image_archive(str(script_dir))
+
+  try:
+    assert Path(first_archive).read_bytes() == Path(second_archive).read_bytes()
+  finally:
+    os.remove(first_archive)
+    os.remove(second_archive)
+
+
+def test_build_docker_image_rebuilds_when_base_image_moved(
+    commands_tester: CommandsTester, command_args, script_dir: Path
+):
+  command_args.script_dir = str(script_dir)
+
+  build_docker_image_from_base_image(command_args, DockerPlatform.ARM)
+  commands_tester.set_result_for_command((0, "sha256:bbb\n"), "crane digest")
+  build_docker_image_from_base_image(command_args, DockerPlatform.ARM)
+
+  commands_tester.assert_command_run(
+      "crane digest base_docker_image --platform linux/arm64", times=2
+  )
+  commands_tester.assert_command_run("crane mutate", times=2)
+
+
+def test_build_docker_image_rebuilds_when_base_image_is_unresolved(
+    commands_tester: CommandsTester, command_args, script_dir: Path
+):
+  command_args.script_dir = str(script_dir)
+  commands_tester.set_result_for_command((1, ""), "crane digest")
+
+  build_docker_image_from_base_image(command_args, DockerPlatform.ARM)
+  build_docker_image_from_base_image(command_args, DockerPlatform.ARM)
+
+  commands_tester.assert_command_run("crane mutate", times=2)
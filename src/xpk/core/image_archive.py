@@ -0,0 +1,151 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import os
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ..utils.imports import lazy_import
+from .system_characteristics import DockerPlatform
+
+if TYPE_CHECKING:
+  import docker.utils.build
+else:
+  docker = lazy_import('docker')
+
+# Number of files hashed at the same time, hashlib releases the GIL.
+_HASH_CONCURRENCY = 8
+# Modification time of the files added to container image archives, fixed so
+# that the same files always produce the same layer.
+_ARCHIVE_MTIME = 0
+_CHUNK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True)
+class ArchiveStats:
+  """Size and duration of writing a container image archive."""
+
+  files: int
+  input_bytes: int
+  archive_bytes: int
+  seconds: float
+
+  @property
+  def throughput_mb_per_second(self) -> float:
+    return self.input_bytes / 1e6 / max(self.seconds, 1e-9)
+
+
+def script_dir_paths(script_dir: str) -> list[str]:
+  """Lists the paths in script dir that are not excluded by .dockerignore."""
+  ignore_patterns = []
+  ignore_path = os.path.join(script_dir, '.dockerignore')
+  if os.path.exists(ignore_path):
+    with open(ignore_path, 'r', encoding='utf=8') as ignore_file:
+      ignore_patterns = [
+          line.strip()
+          for line in ignore_file
+          if not line.isspace() and not line.startswith('#')
+      ]
+  return sorted(docker.utils.build.exclude_paths(script_dir, ignore_patterns))
+
+
+def _hash_entry(full_path: str) -> tuple[int, bytes]:
+  """Returns the mode and the link target or content digest of a path."""
+  mode = os.lstat(full_path).st_mode
+  if os.path.islink(full_path):
+    return mode, os.readlink(full_path).encode()
+  if not os.path.isfile(full_path):
+    return mode, b''
+  content = hashlib.sha256()
+  with open(full_path, 'rb') as f:
+    while chunk := f.read(_CHUNK_SIZE):
+      content.update(chunk)
+  return mode, content.digest()
+
+
+def script_dir_digest(
+    script_dir: str, base_docker_image: str, docker_platform: DockerPlatform
+) -> str:
+  """Hashes everything the image built from script dir depends on.
+
+  Files are hashed in parallel, a few at a time.
+
+  Args:
+    script_dir: directory added to the image.
+    base_docker_image: image the directory is added to.
+    docker_platform: platform of the image.
+
+  Returns:
+    SHA-256 hex digest of the base image, the platform and the path, mode
+    and content of every file that is added to the image.
+  """
+  paths = script_dir_paths(script_dir)
+  with ThreadPoolExecutor(max_workers=_HASH_CONCURRENCY) as pool:
+    entries = pool.map(
+        _hash_entry, [os.path.join(script_dir, path) for path in paths]
+    )
+    sha256 = hashlib.sha256(
+        f'{base_docker_image}\0{docker_platform.value}\0'.encode()
+    )
+    for path, (mode, entry) in zip(paths, entries):
+      sha256.update(f'{path}\0{mode}\0'.encode())
+      sha256.update(entry)
+      sha256.update(b'\0')
+  return sha256.hexdigest()
+
+
+def write_image_archive(script_dir: str, archive_path: str) -> ArchiveStats:
+  """Writes script dir as an uncompressed layer rooted at /app.
+
+  The files are streamed into the archive, which is reproducible: entries are
+  sorted, owned by root and have a fixed modification time. The layer is left
+  uncompressed because `crane mutate --append` gzips it before the upload.
+
+  Args:
+    script_dir: directory to archive, filtered by its .dockerignore.
+    archive_path: path of the archive, for `crane mutate --append`.
+
+  Returns:
+    The number and size of the archived files and the archive size.
+  """
+  start = time.perf_counter()
+  files = input_bytes = 0
+  with tarfile.TarFile(archive_path, mode='w', copybufsize=_CHUNK_SIZE) as tar:
+    for path in script_dir_paths(script_dir):
+      full_path = os.path.join(script_dir, path)
+      info = tar.gettarinfo(full_path, arcname=os.path.join('app', path))
+      info.uid = info.gid = 0
+      info.uname = info.gname = 'root'
+      info.mtime = _ARCHIVE_MTIME
+
+      if info.isreg():
+        with open(full_path, 'rb') as f:
+          tar.addfile(info, f)
+        files += 1
+        input_bytes += info.size
+      else:
+        # Directories and special files (symlinks, etc.)
+        tar.addfile(info, None)
+  return ArchiveStats(
+      files=files,
+      input_bytes=input_bytes,
+      archive_bytes=os.path.getsize(archive_path),
+      seconds=time.perf_counter() - start,
+  )
@@ -0,0 +1,207 @@
+"""
+Copyright 2025 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import os
+import tarfile
+import time
+from pathlib import Path
+
+import pytest
+
+from .image_archive import (
+    ArchiveStats,
+    script_dir_digest,
+    script_dir_paths,
+    write_image_archive,
+)
+from .system_characteristics import DockerPlatform
+
+# Size of the synthetic script dir of the benchmark, which only runs when it
+# is set, e.g. to 67108864 for a 64 MiB tree or 1073741824 for a 1 GB one.
+_BENCHMARK_BYTES = int(os.environ.get('XPK_ARCHIVE_BENCHMARK_BYTES', '0'))
+
+
+@pytest.fixture
+def script_dir(tmp_path: Path) -> Path:
+  directory = tmp_path / 'script_dir'
+  (directory / 'pkg').mkdir(parents=True)
+  (directory / 'main.py').write_text('print("hello")\n')
+  (directory / 'pkg' / 'data.bin').write_bytes(os.urandom(4096))
+  (directory / 'cache.log').write_text('ignored\n')
+  (directory / 'link.py').symlink_to('main.py')
+  (directory / '.dockerignore').write_text('# logs\n*.log\n')
+  return directory
+
+
+def _sequential_digest(
+    script_dir: str, base_docker_image: str, docker_platform: DockerPlatform
+) -> str:
+  sha256 = hashlib.sha256()
+  sha256.update(f'{base_docker_image}\0{docker_platform.value}\0'.encode())
+  for path in script_dir_paths(script_dir):
+    full_path = os.path.join(script_dir, path)
+    sha256.update(f'{path}\0{os.lstat(full_path).st_mode}\0'.encode())
+    if os.path.islink(full_path):
+      sha256.update(os.readlink(full_path).encode())
+    elif os.path.isfile(full_path):
+      with open(full_path, 'rb') as f:
+        sha256.update(hashlib.sha256(f.read()).digest())
+    sha256.update(b'\0')
+  return sha256.hexdigest()
+
+
+def _write_sequential_archive(script_dir: str, archive_path: str) -> None:
+  """Builds the archive the way xpk did before image_archive existed."""
+  with tarfile.open(archive_path, 'w') as tar:
+    for path in script_dir_paths(script_dir):
+      full_path = os.path.join(script_dir, path)
+      info = tar.gettarinfo(full_path, arcname=os.path.join('app', path))
+      info.uid = info.gid = 0
+      info.uname = info.gname = 'root'
+      info.mtime = 0
+      if os.path.isfile(full_path):
+        with open(full_path, 'rb') as f:
+          tar.addfile(info, f)
+      else:
+        tar.addfile(info, None)
+
+
+def test_script_dir_paths_applies_dockerignore(script_dir: Path):
+  assert script_dir_paths(str(script_dir)) == [
+      '.dockerignore',
+      'link.py',
+      'main.py',
+      'pkg',
+      'pkg/data.bin',
+  ]
+
+
+def test_script_dir_digest_matches_sequential_digest(script_dir: Path):
+  digest = script_dir_digest(str(script_dir), 'python:3.10', DockerPlatform.AMD)
+
+  assert digest == _sequential_digest(
+      str(script_dir), 'python:3.10', DockerPlatform.AMD
+  )
+
+
+def test_script_dir_digest_changes_with_content_and_base_image(
+    script_dir: Path,
+):
+  digest = script_dir_digest(str(script_dir), 'python:3.10', DockerPlatform.AMD)
+
+  assert digest != script_dir_digest(
+      str(script_dir), 'python:3.11', DockerPlatform.AMD
+  )
+  (script_dir / 'cache.log').write_text('still ignored\n')
+  assert digest == script_dir_digest(
+      str(script_dir), 'python:3.10', DockerPlatform.AMD
+  )
+  (script_dir / 'main.py').write_text('print("bye")\n')
+  assert digest != script_dir_digest(
+      str(script_dir), 'python:3.10', DockerPlatform.AMD
+  )
+
+
+def test_write_image_archive_writes_uncompressed_layer_under_app(
+    script_dir: Path, tmp_path: Path
+):
+  archive_path = tmp_path / 'layer.tar'
+
+  stats = write_image_archive(str(script_dir), str(archive_path))
+
+  with tarfile.open(archive_path, mode='r:') as tar:
+    members = {member.name: member for member in tar.getmembers()}
+    assert sorted(members) == [
+        'app/.dockerignore',
+        'app/link.py',
+        'app/main.py',
+        'app/pkg',
+        'app/pkg/data.bin',
+    ]
+    assert members['app/link.py'].issym()
+    assert all(m.uid == 0 and m.mtime == 0 for m in members.values())
+    main = tar.extractfile('app/main.py')
+    assert main is not None and main.read() == b'print("hello")\n'
+  assert stats.files == 3
+  assert stats.input_bytes == sum(
+      (script_dir / path).stat().st_size
+      for path in ('.dockerignore', 'main.py', 'pkg/data.bin')
+  )
+  assert stats.archive_bytes == archive_path.stat().st_size
+
+
+def test_write_image_archive_is_reproducible(script_dir: Path, tmp_path: Path):
+  write_image_archive(str(script_dir), str(tmp_path / 'first.tar'))
+  os.utime(script_dir / 'main.py', (1, 1))
+  write_image_archive(str(script_dir), str(tmp_path / 'second.tar'))
+
+  assert (tmp_path / 'first.tar').read_bytes() == (
+      tmp_path / 'second.tar'
+  ).read_bytes()
+
+
+def test_archive_stats_throughput():
+  stats = ArchiveStats(
+      files=1, input_bytes=50_000_000, archive_bytes=1, seconds=2.0
+  )
+
+  assert stats.throughput_mb_per_second == 25.0
+
+
+@pytest.mark.skipif(
+    not _BENCHMARK_BYTES, reason='set XPK_ARCHIVE_BENCHMARK_BYTES to run'
+)
+def test_benchmark_archive_builders(
+    tmp_path: Path, request: pytest.FixtureRequest
+):
+  """Compares the streaming builder with the sequential one it replaced.
+
+  The timings are attached to the test report, run with -rP to see them.
+  """
+  script_dir = tmp_path / 'script_dir'
+  file_size = 4 << 20
+  # Half random, half repetitive data, like a mix of checkpoints and code.
+  block = os.urandom(file_size // 2) + b'xpk' * (file_size // 6)
+  for i in range(max(_BENCHMARK_BYTES // len(block), 1)):
+    directory = script_dir / f'dir{i % 16}'
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f'file{i}.bin').write_bytes(block)
+
+  start = time.perf_counter()
+  _sequential_digest(str(script_dir), 'python:3.10', DockerPlatform.AMD)
+  old_digest_seconds = time.perf_counter() - start
+  start = time.perf_counter()
+  _write_sequential_archive(str(script_dir), str(tmp_path / 'old.tar'))
+  old_archive_seconds = time.perf_counter() - start
+
+  start = time.perf_counter()
+  script_dir_digest(str(script_dir), 'python:3.10', DockerPlatform.AMD)
+  new_digest_seconds = time.perf_counter() - start
+  stats = write_image_archive(str(script_dir), str(tmp_path / 'new.tar'))
+
+  request.node.add_report_section(
+      'call',
+      'benchmark',
+      f'{stats.input_bytes / 1e6:.0f} MB script dir: digest sequential'
+      f' {old_digest_seconds:.2f}s, parallel {new_digest_seconds:.2f}s;'
+      f' archive sequential {old_archive_seconds:.2f}s, streaming'
+      f' {stats.seconds:.2f}s ({stats.throughput_mb_per_second:.0f} MB/s)',
+  )
+  assert stats.archive_bytes == (tmp_path / 'old.tar').stat().st_size
+  # Leaves room for noise, a compressing builder is several times slower.
+  assert stats.seconds < 2 * old_archive_seconds + 0.05
+  assert new_digest_seconds < 2 * old_digest_seconds + 0.05
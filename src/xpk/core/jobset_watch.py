@@ -0,0 +1,211 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import time
+from collections.abc import Generator
+from enum import Enum
+from typing import Any, Callable, Collection
+
+from ..utils.console import xpk_print
+from .kube_backend import get_kube_backend, workload_label_selector
+from .kubectl_common import parse_kubernetes_status
+
+# Same upper bound as `kubectl wait --timeout=-1s`.
+MAX_WAIT_SECONDS = 7 * 24 * 60 * 60
+# Pause before reopening a watch that ended without delivering any event.
+_WATCH_RETRY_SECONDS = 1.0
+# Watches in a row ending early without any event before the wait fails.
+_MAX_FAILED_WATCHES = 5
+
+
+class JobSetPhase(Enum):
+  """Lifecycle phase of a JobSet as seen by a waiting client."""
+
+  QUEUED = 'Queued'
+  ADMITTED = 'Admitted'
+  RUNNING = 'Running'
+  COMPLETED = 'Completed'
+  FAILED = 'Failed'
+  DELETED = 'Deleted'
+
+  def is_terminal(self) -> bool:
+    return self in (
+        JobSetPhase.COMPLETED,
+        JobSetPhase.FAILED,
+        JobSetPhase.DELETED,
+    )
+
+
+def get_jobset_phase(jobset: dict[str, Any]) -> JobSetPhase:
+  """Derives the phase of a JobSet from its spec and status.
+
+  Kueue keeps a JobSet suspended until its Workload is admitted, so the
+  JobSet alone tells queued, admitted and running workloads apart.
+  """
+  status = jobset.get('status') or {}
+  for condition in parse_kubernetes_status(status).conditions:
+    if condition.type in ('Completed', 'Failed') and condition.status == 'True':
+      return JobSetPhase(condition.type)
+
+  if (jobset.get('spec') or {}).get('suspend'):
+    return JobSetPhase.QUEUED
+
+  active_jobs = sum(
+      (replicated_job.get('active') or 0) + (replicated_job.get('ready') or 0)
+      for replicated_job in status.get('replicatedJobsStatus') or []
+  )
+  return JobSetPhase.RUNNING if active_jobs > 0 else JobSetPhase.ADMITTED
+
+
+def _name_selectors(names: Collection[str]) -> tuple[str, str]:
+  """Returns the label and field selectors of JobSets looked up by name.
+
+  A field selector matches a single name, several JobSets are found among
+  all the JobSets of the namespace.
+  """
+  if len(names) == 1:
+    return '', f'metadata.name={next(iter(names))}'
+  return '', ''
+
+
+def watch_jobset_phases(
+    names: Collection[str] | None,
+    timeout_seconds: float,
+    on_transition: Callable[[str, JobSetPhase], None],
+    label_selector: str | None = None,
+) -> tuple[int, dict[str, JobSetPhase]]:
+  """Follows JobSets until all of them reach a terminal phase.
+
+  The JobSets are listed once and then followed through a single watch
+  stream, which is resumed from the last seen resource version when the
+  server closes it and relisted when that version expired or the watch ended
+  early without any event. `on_transition` is called for the initial phase of
+  every JobSet and for each later change.
+
+  JobSets followed by name are looked up by their xpk workload label. If
+  none of them is found that way, for example JobSets created by the
+  PathwaysJob controller or outside of xpk, they are looked up by name.
+
+  Args:
+    names: names of the xpk workloads to follow, None to follow every JobSet
+        matching `label_selector` when the wait starts.
+    timeout_seconds: how long to wait for the terminal phases.
+    on_transition: callback receiving the workload name and its new phase.
+    label_selector: selector of the JobSets to watch, defaults to the one
+        matching the xpk workload label of `names`.
+
+  Returns:
+    Return code of the listing or watch and the last phase of each workload. Workloads
+    that did not exist when the wait started are absent from the result, the
+    phase of the others is not terminal if the timeout expired.
+  """
+  deadline = time.monotonic() + timeout_seconds
+  backend = get_kube_backend()
+  look_up_by_name = label_selector is None
+  if label_selector is None:
+    assert names is not None
+    label_selector = workload_label_selector(names)
+  field_selector = ''
+  followed = set(names) if names is not None else None
+  phases: dict[str, JobSetPhase] = {}
+
+  def observe(jobset: dict[str, Any], deleted: bool = False) -> None:
+    name = (jobset.get('metadata') or {}).get('name', '')
+    if followed is not None and name not in followed:
+      return
+    previous = phases.get(name)
+    if previous is not None and previous.is_terminal():
+      return
+    if deleted and previous is None:
+      return
+    phase = JobSetPhase.DELETED if deleted else get_jobset_phase(jobset)
+    if phase != previous:
+      phases[name] = phase
+      on_transition(name, phase)
+
+  def all_terminal() -> bool:
+    return all(phase.is_terminal() for phase in phases.values())
+
+  resource_version: str | None = None
+  failed_watches = 0
+  while True:
+    if resource_version is None:
+      return_code, jobsets, resource_version = backend.list_jobsets(
+          label_selector, field_selector
+      )
+      if return_code != 0:
+        return return_code, phases
+      listed = {
+          (jobset.get('metadata') or {}).get('name', '') for jobset in jobsets
+      }
+      if look_up_by_name and followed is not None and not followed & listed:
+        look_up_by_name = False
+        label_selector, field_selector = _name_selectors(followed)
+        resource_version = None
+        continue
+      if followed is None:
+        followed = listed
+      for jobset in jobsets:
+        observe(jobset)
+      for name in list(phases):
+        if name not in listed:
+          observe({'metadata': {'name': name}}, deleted=True)
+    if not phases or all_terminal():
+      return 0, phases
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+      return 0, phases
+    started = time.monotonic()
+    received = False
+    events = backend.watch_jobsets(
+        label_selector, resource_version, remaining, field_selector
+    )
+    try:
+      for event_type, jobset in events:
+        received = True
+        if event_type == 'ERROR':
+          xpk_print(
+              'JobSet watch expired, listing JobSets again:'
+              f' {jobset.get("message", "")}'
+          )
+          resource_version = None
+          break
+        resource_version = (jobset.get('metadata') or {}).get(
+            'resourceVersion', resource_version
+        )
+        if event_type != 'BOOKMARK':
+          observe(jobset, deleted=event_type == 'DELETED')
+        if all_terminal():
+          return 0, phases
+    finally:
+      if isinstance(events, Generator):
+        events.close()
+
+    if received or time.monotonic() - started >= _WATCH_RETRY_SECONDS:
+      failed_watches = 0
+      continue
+    failed_watches += 1
+    if failed_watches >= _MAX_FAILED_WATCHES:
+      xpk_print(
+          f'Error: JobSet watch ended without any event {failed_watches} times'
+          ' in a row, giving up waiting.'
+      )
+      return 1, phases
+    # The watch may be failing for good, relisting catches up on missed
+    # changes and surfaces errors of the API server.
+    resource_version = None
+    time.sleep(max(min(_WATCH_RETRY_SECONDS, deadline - time.monotonic()), 0))
@@ -0,0 +1,352 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from typing import Any, Iterator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .jobset_watch import (
+    JobSetPhase,
+    get_jobset_phase,
+    watch_jobset_phases,
+)
+
+
+def _jobset(
+    name: str,
+    resource_version: str = '1',
+    suspend: bool = False,
+    active: int = 0,
+    condition: str | None = None,
+) -> dict[str, Any]:
+  status: dict[str, Any] = {
+      'replicatedJobsStatus': [{'name': 'slice', 'active': active}]
+  }
+  if condition:
+    status['conditions'] = [{'type': condition, 'status': 'True'}]
+  return {
+      'metadata': {'name': name, 'resourceVersion': resource_version},
+      'spec': {'suspend': suspend},
+      'status': status,
+  }
+
+
+class _FakeBackend:
+  """Serves one list result and a scripted sequence of watch streams."""
+
+  def __init__(
+      self,
+      jobsets: list[dict[str, Any]],
+      watches: list[list[tuple[str, dict[str, Any]]]],
+  ) -> None:
+    self.jobsets = jobsets
+    self.watches = watches
+    self.list_calls = 0
+    self.watch_versions: list[str] = []
+
+  def list_jobsets(self, label_selector: str, field_selector: str = ''):
+    del label_selector, field_selector
+    self.list_calls += 1
+    return 0, self.jobsets, '10'
+
+  def watch_jobsets(
+      self,
+      label_selector: str,
+      resource_version: str,
+      timeout_seconds: float,
+      field_selector: str = '',
+  ) -> Iterator[tuple[str, dict[str, Any]]]:
+    del label_selector, timeout_seconds, field_selector
+    self.watch_versions.append(resource_version)
+    yield from self.watches.pop(0) if self.watches else []
+
+
+@pytest.fixture
+def backend(mocker: MockerFixture):
+  def install(fake: _FakeBackend) -> _FakeBackend:
+    mocker.patch('xpk.core.jobset_watch.get_kube_backend', return_value=fake)
+    return fake
+
+  mocker.patch('xpk.core.jobset_watch.time.sleep')
+  return install
+
+
+@pytest.mark.parametrize(
+    'jobset,expected',
+    [
+        (_jobset('a', suspend=True), JobSetPhase.QUEUED),
+        (_jobset('a'), JobSetPhase.ADMITTED),
+        (_jobset('a', active=2), JobSetPhase.RUNNING),
+        (_jobset('a', active=2, condition='Completed'), JobSetPhase.COMPLETED),
+        (_jobset('a', condition='Failed'), JobSetPhase.FAILED),
+        ({'metadata': {'name': 'a'}}, JobSetPhase.ADMITTED),
+    ],
+)
+def test_get_jobset_phase(jobset: dict[str, Any], expected: JobSetPhase):
+  assert get_jobset_phase(jobset) == expected
+
+
+def test_get_jobset_phase_terminal_condition_takes_precedence():
+  jobset = {
+      'status': {
+          'conditions': [
+              {
+                  'type': 'StartupPolicyCompleted',
+                  'status': 'True',
+                  'lastTransitionTime': '2024-01-01T00:00:00Z',
+              },
+              {
+                  'type': 'Failed',
+                  'status': 'True',
+                  'lastTransitionTime': '2024-01-01T00:00:00Z',
+              },
+          ]
+      }
+  }
+
+  assert get_jobset_phase(jobset) == JobSetPhase.FAILED
+
+
+def test_watch_reports_transitions_until_terminal(backend):
+  fake = backend(
+      _FakeBackend(
+          [_jobset('a', suspend=True)],
+          [[
+              ('MODIFIED', _jobset('a', '11')),
+              ('MODIFIED', _jobset('a', '12')),
+              ('BOOKMARK', {'metadata': {'resourceVersion': '13'}}),
+              ('MODIFIED', _jobset('a', '14', active=1)),
+              ('MODIFIED', _jobset('a', '15', condition='Completed')),
+              ('MODIFIED', _jobset('a', '16', condition='Failed')),
+          ]],
+      )
+  )
+  transitions = []
+
+  return_code, phases = watch_jobset_phases(
+      {'a'}, 60, lambda name, phase: transitions.append((name, phase))
+  )
+
+  assert return_code == 0
+  assert phases == {'a': JobSetPhase.COMPLETED}
+  assert transitions == [
+      ('a', JobSetPhase.QUEUED),
+      ('a', JobSetPhase.ADMITTED),
+      ('a', JobSetPhase.RUNNING),
+      ('a', JobSetPhase.COMPLETED),
+  ]
+  assert fake.watch_versions == ['10']
+
+
+def test_watch_resumes_from_last_resource_version(backend):
+  fake = backend(
+      _FakeBackend(
+          [_jobset('a', active=1), _jobset('b', active=1)],
+          [
+              [('MODIFIED', _jobset('a', '20', condition='Completed'))],
+              [('BOOKMARK', {'metadata': {'resourceVersion': '25'}})],
+              [('MODIFIED', _jobset('b', '30', condition='Failed'))],
+          ],
+      )
+  )
+
+  return_code, phases = watch_jobset_phases({'a', 'b'}, 60, lambda *_: None)
+
+  assert return_code == 0
+  assert phases == {'a': JobSetPhase.COMPLETED, 'b': JobSetPhase.FAILED}
+  assert fake.watch_versions == ['10', '20', '25']
+  assert fake.list_calls == 1
+
+
+def test_watch_relists_after_expired_resource_version(backend):
+  fake = backend(
+      _FakeBackend(
+          [_jobset('a', active=1)],
+          [[('ERROR', {'code': 410, 'message': 'too old resource version'})]],
+      )
+  )
+
+  def finish_on_relist(name: str, phase: JobSetPhase) -> None:
+    del name, phase
+    fake.jobsets = [_jobset('a', condition='Completed')]
+
+  return_code, phases = watch_jobset_phases({'a'}, 60, finish_on_relist)
+
+  assert return_code == 0
+  assert phases == {'a': JobSetPhase.COMPLETED}
+  assert fake.list_calls == 2
+
+
+def test_watch_marks_jobsets_missing_from_relist_as_deleted(backend):
+  fake = backend(
+      _FakeBackend([_jobset('a', active=1)], [[('ERROR', {'code': 410})]])
+  )
+  transitions = []
+
+  def record(name: str, phase: JobSetPhase) -> None:
+    transitions.append(phase)
+    fake.jobsets = []
+
+  return_code, phases = watch_jobset_phases({'a'}, 60, record)
+
+  assert return_code == 0
+  assert phases == {'a': JobSetPhase.DELETED}
+  assert transitions == [JobSetPhase.RUNNING, JobSetPhase.DELETED]
+
+
+def test_watch_skips_unknown_workloads(backend):
+  fake = backend(_FakeBackend([_jobset('other', active=1)], []))
+
+  return_code, phases = watch_jobset_phases({'a'}, 60, lambda *_: None)
+
+  assert return_code == 0
+  assert not phases
+  assert not fake.watch_versions
+
+
+class _UnlabeledBackend(_FakeBackend):
+  """Serves JobSets without the xpk workload label, found only by name."""
+
+  def __init__(
+      self,
+      jobsets: list[dict[str, Any]],
+      watches: list[list[tuple[str, dict[str, Any]]]],
+  ) -> None:
+    super().__init__(jobsets, watches)
+    self.selectors: list[tuple[str, str]] = []
+
+  def list_jobsets(self, label_selector: str, field_selector: str = ''):
+    self.selectors.append((label_selector, field_selector))
+    self.list_calls += 1
+    if label_selector:
+      return 0, [], '10'
+    return 0, self.jobsets, '10'
+
+  def watch_jobsets(
+      self,
+      label_selector: str,
+      resource_version: str,
+      timeout_seconds: float,
+      field_selector: str = '',
+  ) -> Iterator[tuple[str, dict[str, Any]]]:
+    self.selectors.append((label_selector, field_selector))
+    yield from super().watch_jobsets(
+        label_selector, resource_version, timeout_seconds, field_selector
+    )
+
+
+def test_watch_finds_jobset_without_workload_label_by_name(backend):
+  fake = backend(
+      _UnlabeledBackend(
+          [_jobset('a', active=1)],
+          [[('MODIFIED', _jobset('a', '11', condition='Completed'))]],
+      )
+  )
+
+  return_code, phases = watch_jobset_phases({'a'}, 60, lambda *_: None)
+
+  assert return_code == 0
+  assert phases == {'a': JobSetPhase.COMPLETED}
+  assert fake.selectors == [
+      ('xpk.google.com/workload=a', ''),
+      ('', 'metadata.name=a'),
+      ('', 'metadata.name=a'),
+  ]
+
+
+def test_watch_finds_several_jobsets_without_workload_label(backend):
+  fake = backend(
+      _UnlabeledBackend(
+          [_jobset('a', condition='Completed'), _jobset('other', active=1)],
+          [],
+      )
+  )
+
+  return_code, phases = watch_jobset_phases({'a', 'b'}, 60, lambda *_: None)
+
+  assert return_code == 0
+  assert phases == {'a': JobSetPhase.COMPLETED}
+  assert fake.selectors[1:] == [('', '')]
+
+
+class _QuietBackend(_FakeBackend):
+  """Serves watch streams delivering nothing but a bookmark."""
+
+  def watch_jobsets(
+      self,
+      label_selector: str,
+      resource_version: str,
+      timeout_seconds: float,
+      field_selector: str = '',
+  ) -> Iterator[tuple[str, dict[str, Any]]]:
+    del label_selector, timeout_seconds, field_selector
+    self.watch_versions.append(resource_version)
+    yield 'BOOKMARK', {'metadata': {'resourceVersion': resource_version}}
+
+
+def test_watch_stops_at_timeout(backend):
+  fake = backend(_QuietBackend([_jobset('a', active=1)], []))
+
+  return_code, phases = watch_jobset_phases({'a'}, 0.05, lambda *_: None)
+
+  assert return_code == 0
+  assert phases == {'a': JobSetPhase.RUNNING}
+  assert fake.watch_versions
+
+
+def test_watch_follows_jobsets_matching_selector_at_start(backend):
+  fake = backend(
+      _FakeBackend(
+          [_jobset('a', active=1)],
+          [[
+              ('ADDED', _jobset('late', '11', condition='Failed')),
+              ('MODIFIED', _jobset('a', '12', condition='Completed')),
+          ]],
+      )
+  )
+
+  return_code, phases = watch_jobset_phases(
+      None, 60, lambda *_: None, label_selector='team=ml'
+  )
+
+  assert return_code == 0
+  assert phases == {'a': JobSetPhase.COMPLETED}
+  assert fake.watch_versions == ['10']
+
+
+def test_watch_relists_after_empty_watch(backend):
+  fake = backend(_FakeBackend([_jobset('a', active=1)], []))
+
+  def finish_on_relist(name: str, phase: JobSetPhase) -> None:
+    del name, phase
+    fake.jobsets = [_jobset('a', condition='Completed')]
+
+  return_code, phases = watch_jobset_phases({'a'}, 60, finish_on_relist)
+
+  assert return_code == 0
+  assert phases == {'a': JobSetPhase.COMPLETED}
+  assert fake.list_calls == 2
+
+
+def test_watch_fails_after_repeated_empty_watches(backend):
+  fake = backend(_FakeBackend([_jobset('a', active=1)], []))
+
+  return_code, phases = watch_jobset_phases({'a'}, 60, lambda *_: None)
+
+  assert return_code == 1
+  assert phases == {'a': JobSetPhase.RUNNING}
+  assert len(fake.watch_versions) == 5
@@ -0,0 +1,757 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Collection, Iterator, TypeVar
+
+from ..utils.console import xpk_print
+from ..utils.execution_context import is_dry_run
+from ..utils.imports import lazy_import
+from ..utils.kubeconfig import get_current_context_key, get_kubeconfig_path
+from .commands import run_command_for_stream, run_command_for_value
+
+if TYPE_CHECKING:
+  import kubernetes
+  import urllib3
+else:
+  kubernetes = lazy_import('kubernetes')
+  urllib3 = lazy_import('urllib3')
+
+KUEUE_API_GROUP = 'kueue.x-k8s.io'
+KUEUE_API_VERSION = 'v1beta1'
+JOBSET_API_GROUP = 'jobset.x-k8s.io'
+JOBSET_API_VERSION = 'v1alpha2'
+PATHWAYS_JOB_API_GROUP = 'pathways-job.pathways.domain'
+PATHWAYS_JOB_API_VERSION = 'v1'
+DEFAULT_NAMESPACE = 'default'
+WORKLOAD_LABEL = 'xpk.google.com/workload'
+# Same chunk size as kubectl, keeps responses of large clusters bounded.
+LIST_PAGE_SIZE = 500
+# Workloads per delete request, keeps selectors and command lines bounded.
+DELETE_CHUNK_SIZE = 100
+# Concurrent DELETE requests for objects that a selector cannot match.
+DELETE_CONCURRENCY = 16
+
+_T = TypeVar('_T')
+
+
+def _transform_items(
+    items: list[dict[str, Any]],
+    transform: Callable[[dict[str, Any]], _T | None],
+) -> list[_T]:
+  """Transforms items in order, releasing each raw item once transformed."""
+  results = []
+  items.reverse()
+  while items:
+    result = transform(items.pop())
+    if result is not None:
+      results.append(result)
+  return results
+
+
+def _selector_params(
+    label_selector: str | None, field_selector: str | None
+) -> list[tuple[str, str]]:
+  """Returns the query parameters of the non-empty selectors."""
+  params = []
+  if label_selector:
+    params.append(('labelSelector', label_selector))
+  if field_selector:
+    params.append(('fieldSelector', field_selector))
+  return params
+
+
+def _selector_flags(label_selector: str, field_selector: str) -> str:
+  """Returns the kubectl flags of the non-empty selectors."""
+  flags = ''
+  if label_selector:
+    flags += f" -l '{label_selector}'"
+  if field_selector:
+    flags += f" --field-selector '{field_selector}'"
+  return flags
+
+
+def workload_label_selector(names: Collection[str]) -> str:
+  """Returns the label selector matching the JobSets of xpk workloads."""
+  if len(names) == 1:
+    return f'{WORKLOAD_LABEL}={next(iter(names))}'
+  return f'{WORKLOAD_LABEL} in ({",".join(sorted(names))})'
+
+
+def _chunks(names: list[str]) -> Iterator[list[str]]:
+  for start in range(0, len(names), DELETE_CHUNK_SIZE):
+    yield names[start : start + DELETE_CHUNK_SIZE]
+
+
+class DeleteOutcome(Enum):
+  """Result of deleting one workload."""
+
+  DELETED = 'Deleted'
+  NOT_FOUND = 'NotFound'
+  FAILED = 'Failed'
+
+
+class KubeBackend(ABC):
+  """Serves the Kubernetes reads and workload deletes used across xpk."""
+
+  @abstractmethod
+  def list_workloads(
+      self,
+      task: str,
+      transform: Callable[[dict[str, Any]], _T | None],
+      label_selector: str | None = None,
+  ) -> tuple[int, list[_T]]:
+    """Lists Kueue Workloads in the current namespace.
+
+    Args:
+      task: user-facing name of the listing.
+      transform: converts each Workload object into the value kept by the
+          caller, or None to drop it. Raw objects are released as soon as
+          they are transformed.
+      label_selector: optional Kubernetes label selector.
+
+    Returns:
+      Return code and the transformed Workloads, empty if the Kueue CRD is
+      not installed.
+    """
+
+  @abstractmethod
+  def list_jobsets(
+      self, label_selector: str, field_selector: str = ''
+  ) -> tuple[int, list[dict[str, Any]], str]:
+    """Lists JobSets matching selectors in the current namespace.
+
+    Args:
+      label_selector: Kubernetes label selector, empty to match any labels.
+      field_selector: Kubernetes field selector, empty to match any fields.
+
+    Returns:
+      Return code, the JobSet objects and the resource version to start
+      watching from, empty if unknown.
+    """
+
+  @abstractmethod
+  def watch_jobsets(
+      self,
+      label_selector: str,
+      resource_version: str,
+      timeout_seconds: float,
+      field_selector: str = '',
+  ) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Streams watch events of JobSets matching selectors.
+
+    The stream ends when the timeout expires or the server closes it, callers
+    resume from the resource version of the last received object. Events may
+    repeat the current state of objects, so consumers must be idempotent.
+
+    Yields:
+      Event type (ADDED, MODIFIED, DELETED, BOOKMARK or ERROR) and the object.
+    """
+
+  @abstractmethod
+  def delete_workloads(
+      self, names: list[str], delete_pathways_jobs: bool
+  ) -> dict[str, DeleteOutcome]:
+    """Deletes the workloads of the given names in the default namespace.
+
+    With `delete_pathways_jobs`, the PathwaysJob of a workload is deleted
+    first, the JobSet it owns is then removed by the garbage collector. The
+    JobSet is deleted directly for workloads without a PathwaysJob.
+
+    Returns:
+      The outcome for each workload.
+    """
+
+  @abstractmethod
+  def get_configmap_data(
+      self, name: str, dry_run_data: str = 'map[]'
+  ) -> tuple[int, dict[str, str]]:
+    """Returns the data of a ConfigMap in the current namespace."""
+
+  @abstractmethod
+  def list_nodes(
+      self, transform: Callable[[dict[str, Any]], _T | None]
+  ) -> tuple[int, list[_T]]:
+    """Lists all nodes of the cluster.
+
+    Args:
+      transform: converts each Node object into the value kept by the
+          caller, or None to drop it. Raw objects are released as soon as
+          they are transformed.
+
+    Returns:
+      Return code and the transformed Nodes.
+    """
+
+  @abstractmethod
+  def get_deployment_image(
+      self, name: str, namespace: str, dry_run_image: str = ''
+  ) -> tuple[int, str]:
+    """Returns the image of the first container of a Deployment.
+
+    Returns:
+      Return code and the image, empty if the Deployment does not exist.
+    """
+
+
+class KubectlBackend(KubeBackend):
+  """Serves the queries by running kubectl subprocesses."""
+
+  def list_workloads(
+      self,
+      task: str,
+      transform: Callable[[dict[str, Any]], _T | None],
+      label_selector: str | None = None,
+  ) -> tuple[int, list[_T]]:
+    command = 'kubectl get workloads --ignore-not-found -o=json'
+    if label_selector:
+      command += f" -l '{label_selector}'"
+    return_code, data = run_command_for_value(
+        command, task, dry_run_return_val=''
+    )
+    if return_code != 0:
+      return return_code, []
+    if not data:
+      return 0, []
+    try:
+      items: list[dict[str, Any]] = json.loads(data).get('items', [])
+    except json.JSONDecodeError:
+      xpk_print('Error: Failed to parse JSON output from kubectl.')
+      return 1, []
+    return 0, _transform_items(items, transform)
+
+  def list_jobsets(
+      self, label_selector: str, field_selector: str = ''
+  ) -> tuple[int, list[dict[str, Any]], str]:
+    return_code, val = run_command_for_value(
+        f'kubectl get jobsets{_selector_flags(label_selector, field_selector)}'
+        ' -o json',
+        'List JobSets',
+        dry_run_return_val='{"items": []}',
+    )
+    if return_code != 0:
+      return return_code, [], ''
+    try:
+      body = json.loads(val)
+    except json.JSONDecodeError:
+      xpk_print('Error: Failed to parse JSON output from kubectl.')
+      return 1, [], ''
+    return 0, body.get('items', []), ''
+
+  def watch_jobsets(
+      self,
+      label_selector: str,
+      resource_version: str,
+      timeout_seconds: float,
+      field_selector: str = '',
+  ) -> Iterator[tuple[str, dict[str, Any]]]:
+    # kubectl cannot resume from a resource version, it replays the current
+    # state of all objects as ADDED events instead.
+    command = (
+        f'kubectl get jobsets{_selector_flags(label_selector, field_selector)}'
+        ' --watch --output-watch-events -o json'
+    )
+    buffer = ''
+    for line in run_command_for_stream(
+        command, 'Watch JobSets', timeout_seconds=timeout_seconds
+    ):
+      buffer += line
+      # Every event is a pretty-printed JSON object closed at column 0.
+      if not line.startswith('}'):
+        continue
+      try:
+        event = json.loads(buffer)
+      except json.JSONDecodeError:
+        xpk_print('Error: Failed to parse JSON output from kubectl.')
+        return
+      buffer = ''
+      yield event.get('type', ''), event.get('object') or {}
+
+  def delete_workloads(
+      self, names: list[str], delete_pathways_jobs: bool
+  ) -> dict[str, DeleteOutcome]:
+    outcomes: dict[str, DeleteOutcome] = {}
+    remaining = list(dict.fromkeys(names))
+    kinds = ['pathwaysjob', 'jobset'] if delete_pathways_jobs else ['jobset']
+    for kind in kinds:
+      for chunk in _chunks(remaining):
+        # Dry runs pretend that every workload is a plain JobSet.
+        return_code, output = run_command_for_value(
+            f'kubectl delete {kind} {" ".join(chunk)} -n'
+            f' {DEFAULT_NAMESPACE} --ignore-not-found -o name',
+            f'Delete {len(chunk)} {kind}s',
+            dry_run_return_val=(
+                '\n'.join(f'{kind}/{name}' for name in chunk)
+                if kind == 'jobset'
+                else ''
+            ),
+        )
+        deleted = {line.rsplit('/', 1)[-1] for line in output.splitlines()}
+        for name in chunk:
+          if name in deleted:
+            outcomes[name] = DeleteOutcome.DELETED
+          elif return_code != 0:
+            outcomes[name] = DeleteOutcome.FAILED
+      remaining = [name for name in remaining if name not in outcomes]
+    for name in remaining:
+      outcomes[name] = DeleteOutcome.NOT_FOUND
+    return outcomes
+
+  def get_configmap_data(
+      self, name: str, dry_run_data: str = 'map[]'
+  ) -> tuple[int, dict[str, str]]:
+    command = (
+        'kubectl get configmap'
+        f' {name} -o=custom-columns="ConfigData:data"'
+        ' --no-headers=true'
+    )
+    return_code, return_value = run_command_for_value(
+        command,
+        'GKE Cluster Get ConfigMap',
+        dry_run_return_val=dry_run_data,
+    )
+    if return_code != 0:
+      return return_code, {}
+
+    config_map = {}
+    return_value = return_value.strip()
+    if return_value:
+      # Format of ConfigMap: map[key1:value1 key2:value2]
+      return_value = return_value[return_value.index('map') :]
+      configs = return_value[4:-1].split(' ')
+
+      for config in configs:
+        parts = config.strip().split(':')
+        if len(parts) != 2:
+          continue
+        config_map[parts[0]] = parts[1]
+    return 0, config_map
+
+  def list_nodes(
+      self, transform: Callable[[dict[str, Any]], _T | None]
+  ) -> tuple[int, list[_T]]:
+    return_code, val = run_command_for_value(
+        command='kubectl get nodes -o json',
+        task='Get cluster nodes info',
+        dry_run_return_val='{"items": []}',
+    )
+    if return_code != 0:
+      return return_code, []
+    try:
+      items: list[dict[str, Any]] = json.loads(val).get('items', [])
+    except json.JSONDecodeError:
+      xpk_print('Error: Failed to parse JSON output from kubectl.')
+      return 1, []
+    return 0, _transform_items(items, transform)
+
+  def get_deployment_image(
+      self, name: str, namespace: str, dry_run_image: str = ''
+  ) -> tuple[int, str]:
+    command = (
+        f'kubectl get deployment {name} -n {namespace} -o'
+        " jsonpath='{.spec.template.spec.containers[0].image}'"
+    )
+    return run_command_for_value(
+        command,
+        'Get kueue version on server',
+        dry_run_return_val=dry_run_image,
+    )
+
+
+class _NativeClientUnavailable(Exception):
+  """Raised when the Kubernetes API cannot be reached through the client."""
+
+
+class ApiClientBackend(KubeBackend):
+  """Serves the queries through one pooled, keep-alive Kubernetes ApiClient.
+
+  The client is created lazily from the kubeconfig and recreated when the
+  current kubectl context changes. Responses are requested without model
+  deserialization and parsed straight from JSON, so callers get the same
+  dictionaries as with `kubectl -o json`. If the API cannot be reached, the
+  backend falls back to kubectl for the rest of the process.
+  """
+
+  def __init__(
+      self,
+      api_client: 'kubernetes.client.ApiClient | None' = None,
+      namespace: str = DEFAULT_NAMESPACE,
+  ) -> None:
+    self._api_client = api_client
+    self._namespace = namespace
+    # An explicitly provided client is never replaced on context changes.
+    self._context_key = None if api_client is None else ''
+    self._fallback: KubeBackend | None = None
+    self._kubectl = KubectlBackend()
+
+  def _client(self) -> 'kubernetes.client.ApiClient':
+    context_key = get_current_context_key()
+    if self._api_client is None or (
+        self._context_key and self._context_key != context_key
+    ):
+      configuration = kubernetes.client.Configuration()
+      try:
+        config_file = str(get_kubeconfig_path())
+        kubernetes.config.load_kube_config(
+            config_file=config_file, client_configuration=configuration
+        )
+        _, active_context = kubernetes.config.list_kube_config_contexts(
+            config_file
+        )
+      except (kubernetes.config.ConfigException, OSError, TypeError) as e:
+        raise _NativeClientUnavailable(e) from e
+      # The default pool size depends on the CPU count, bulk deletes would
+      # open and drop connections beyond it.
+      configuration.connection_pool_maxsize = max(
+          configuration.connection_pool_maxsize or 0, DELETE_CONCURRENCY
+      )
+      if self._api_client is not None:
+        self._api_client.close()
+      self._api_client = kubernetes.client.ApiClient(configuration)
+      self._namespace = active_context['context'].get(
+          'namespace', DEFAULT_NAMESPACE
+      )
+      self._context_key = context_key
+    return self._api_client
+
+  def _current_namespace(self) -> str:
+    self._client()
+    return self._namespace
+
+  def _open(
+      self,
+      path: str,
+      query_params: list[tuple[str, str]] | None = None,
+      request_timeout: float = 60,
+      method: str = 'GET',
+  ) -> tuple[int, Any]:
+    """Requests an API path and returns the raw response, None if not found."""
+    client = self._client()
+    try:
+      response = client.call_api(
+          path,
+          method,
+          query_params=query_params or [],
+          header_params={'Accept': 'application/json'},
+          auth_settings=['BearerToken'],
+          _return_http_data_only=True,
+          _preload_content=False,
+          _request_timeout=request_timeout,
+      )
+    except kubernetes.client.exceptions.ApiException as e:
+      if e.status == 404:
+        return 0, None
+      if e.status in (401, 403):
+        raise _NativeClientUnavailable(e) from e
+      xpk_print(f'Kubernetes API exception for {method} {path}: {e}')
+      return 1, None
+    except urllib3.exceptions.HTTPError as e:
+      raise _NativeClientUnavailable(e) from e
+    return 0, response
+
+  def _get_json(
+      self,
+      path: str,
+      query_params: list[tuple[str, str]] | None = None,
+      method: str = 'GET',
+  ) -> tuple[int, dict[str, Any] | None]:
+    """Requests an API path and returns its decoded JSON, None if not found."""
+    return_code, response = self._open(path, query_params, method=method)
+    if response is None:
+      return return_code, None
+    return 0, json.loads(response.data)
+
+  def _watch_json(
+      self,
+      path: str,
+      query_params: list[tuple[str, str]],
+      timeout_seconds: float,
+  ) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Opens a watch on a collection and returns a stream of its events.
+
+    The request is sent eagerly so connection failures surface to the caller
+    before the stream is consumed.
+    """
+    timeout = max(int(timeout_seconds), 1)
+    return_code, response = self._open(
+        path,
+        query_params
+        + [
+            ('watch', 'true'),
+            ('allowWatchBookmarks', 'true'),
+            ('timeoutSeconds', str(timeout)),
+        ],
+        # The server ends the watch after timeoutSeconds, the client side
+        # timeout only guards against a stalled connection.
+        request_timeout=timeout + 30,
+    )
+    if return_code != 0 or response is None:
+      return iter(())
+
+    def events() -> Iterator[tuple[str, dict[str, Any]]]:
+      try:
+        for line in kubernetes.watch.watch.iter_resp_lines(response):
+          if not line:
+            continue
+          event = json.loads(line)
+          yield event.get('type', ''), event.get('object') or {}
+      except (urllib3.exceptions.HTTPError, json.JSONDecodeError) as e:
+        xpk_print(f'Watch of {path} was interrupted: {e}')
+      finally:
+        response.release_conn()
+
+    return events()
+
+  def _with_fallback(
+      self,
+      native_call: Callable[[], _T],
+      kubectl_call: Callable[[KubeBackend], _T],
+  ) -> _T:
+    if is_dry_run() or self._fallback is not None:
+      return kubectl_call(self._fallback or self._kubectl)
+    try:
+      return native_call()
+    except _NativeClientUnavailable as e:
+      xpk_print(
+          f'Kubernetes API client is unavailable ({e}), falling back to'
+          ' kubectl.'
+      )
+      self._fallback = self._kubectl
+      return kubectl_call(self._kubectl)
+
+  def _list_json(
+      self,
+      path: str,
+      transform: Callable[[dict[str, Any]], _T | None],
+      label_selector: str | None = None,
+      field_selector: str | None = None,
+  ) -> tuple[int, list[_T], str]:
+    """Lists a collection page by page, empty if its API is not served.
+
+    Only one page of raw objects is held in memory at a time, each item is
+    transformed before the next page is requested.
+
+    Returns:
+      Return code, the transformed items and the resource version of the
+      list.
+    """
+    results: list[_T] = []
+    continue_token = ''
+    while True:
+      query_params = [('limit', str(LIST_PAGE_SIZE))]
+      query_params.extend(_selector_params(label_selector, field_selector))
+      if continue_token:
+        query_params.append(('continue', continue_token))
+      return_code, body = self._get_json(path, query_params)
+      if return_code != 0:
+        return return_code, [], ''
+      if body is None:
+        return 0, results, ''
+      results.extend(_transform_items(body.get('items') or [], transform))
+      metadata = body.get('metadata') or {}
+      continue_token = metadata.get('continue', '')
+      if not continue_token:
+        return 0, results, metadata.get('resourceVersion', '')
+
+  def list_workloads(
+      self,
+      task: str,
+      transform: Callable[[dict[str, Any]], _T | None],
+      label_selector: str | None = None,
+  ) -> tuple[int, list[_T]]:
+    def native() -> tuple[int, list[_T]]:
+      return_code, workloads, _ = self._list_json(
+          f'/apis/{KUEUE_API_GROUP}/{KUEUE_API_VERSION}/namespaces/'
+          f'{self._current_namespace()}/workloads',
+          transform,
+          label_selector,
+      )
+      return return_code, workloads
+
+    return self._with_fallback(
+        native, lambda b: b.list_workloads(task, transform, label_selector)
+    )
+
+  def _jobsets_path(self) -> str:
+    return (
+        f'/apis/{JOBSET_API_GROUP}/{JOBSET_API_VERSION}/namespaces/'
+        f'{self._current_namespace()}/jobsets'
+    )
+
+  def list_jobsets(
+      self, label_selector: str, field_selector: str = ''
+  ) -> tuple[int, list[dict[str, Any]], str]:
+    return self._with_fallback(
+        lambda: self._list_json(
+            self._jobsets_path(),
+            lambda jobset: jobset,
+            label_selector,
+            field_selector,
+        ),
+        lambda b: b.list_jobsets(label_selector, field_selector),
+    )
+
+  def watch_jobsets(
+      self,
+      label_selector: str,
+      resource_version: str,
+      timeout_seconds: float,
+      field_selector: str = '',
+  ) -> Iterator[tuple[str, dict[str, Any]]]:
+    query_params = _selector_params(label_selector, field_selector)
+    if resource_version:
+      query_params.append(('resourceVersion', resource_version))
+    return self._with_fallback(
+        lambda: self._watch_json(
+            self._jobsets_path(), query_params, timeout_seconds
+        ),
+        lambda b: b.watch_jobsets(
+            label_selector, resource_version, timeout_seconds, field_selector
+        ),
+    )
+
+  def _delete_by_selector(
+      self, path: str, names: list[str], outcomes: dict[str, DeleteOutcome]
+  ) -> None:
+    """Deletes the labeled objects of workloads with one request per chunk."""
+    for chunk in _chunks(names):
+      return_code, body = self._get_json(
+          path,
+          [('labelSelector', workload_label_selector(chunk))],
+          method='DELETE',
+      )
+      if return_code != 0 or body is None:
+        continue
+      for item in body.get('items') or []:
+        name = (item.get('metadata') or {}).get('name', '')
+        if name in chunk:
+          outcomes[name] = DeleteOutcome.DELETED
+
+  def _delete_by_name(
+      self, path: str, names: list[str], outcomes: dict[str, DeleteOutcome]
+  ) -> None:
+    """Deletes objects one by one over a bounded pool of requests."""
+
+    def delete(name: str) -> tuple[int, bool]:
+      return_code, response = self._open(f'{path}/{name}', method='DELETE')
+      if response is None:
+        return return_code, False
+      # An unread response keeps its connection out of the pool.
+      try:
+        response.drain_conn()
+      finally:
+        response.release_conn()
+      return return_code, True
+
+    with ThreadPoolExecutor(max_workers=DELETE_CONCURRENCY) as pool:
+      for name, (return_code, found) in zip(names, pool.map(delete, names)):
+        if return_code != 0:
+          outcomes[name] = DeleteOutcome.FAILED
+        elif found:
+          outcomes[name] = DeleteOutcome.DELETED
+
+  def delete_workloads(
+      self, names: list[str], delete_pathways_jobs: bool
+  ) -> dict[str, DeleteOutcome]:
+    outcomes: dict[str, DeleteOutcome] = {}
+    names = list(dict.fromkeys(names))
+
+    def native() -> dict[str, DeleteOutcome]:
+      paths = [
+          f'/apis/{JOBSET_API_GROUP}/{JOBSET_API_VERSION}/namespaces/'
+          f'{DEFAULT_NAMESPACE}/jobsets'
+      ]
+      if delete_pathways_jobs:
+        paths.insert(
+            0,
+            f'/apis/{PATHWAYS_JOB_API_GROUP}/{PATHWAYS_JOB_API_VERSION}/'
+            f'namespaces/{DEFAULT_NAMESPACE}/pathwaysjobs',
+        )
+      for path in paths:
+        # xpk labels its objects with the workload name, objects created
+        # otherwise are only reachable by name.
+        self._delete_by_selector(
+            path, [n for n in names if n not in outcomes], outcomes
+        )
+        self._delete_by_name(
+            path, [n for n in names if n not in outcomes], outcomes
+        )
+      for name in names:
+        outcomes.setdefault(name, DeleteOutcome.NOT_FOUND)
+      return outcomes
+
+    def kubectl(backend: KubeBackend) -> dict[str, DeleteOutcome]:
+      # Workloads already deleted natively are not deleted again.
+      remaining = [n for n in names if n not in outcomes]
+      outcomes.update(backend.delete_workloads(remaining, delete_pathways_jobs))
+      return outcomes
+
+    return self._with_fallback(native, kubectl)
+
+  def get_configmap_data(
+      self, name: str, dry_run_data: str = 'map[]'
+  ) -> tuple[int, dict[str, str]]:
+    def native() -> tuple[int, dict[str, str]]:
+      return_code, body = self._get_json(
+          f'/api/v1/namespaces/{self._current_namespace()}/configmaps/{name}'
+      )
+      if return_code != 0 or body is None:
+        return 1, {}
+      return 0, dict(body.get('data') or {})
+
+    return self._with_fallback(
+        native, lambda b: b.get_configmap_data(name, dry_run_data)
+    )
+
+  def list_nodes(
+      self, transform: Callable[[dict[str, Any]], _T | None]
+  ) -> tuple[int, list[_T]]:
+    def native() -> tuple[int, list[_T]]:
+      return_code, nodes, _ = self._list_json('/api/v1/nodes', transform)
+      return return_code, nodes
+
+    return self._with_fallback(native, lambda b: b.list_nodes(transform))
+
+  def get_deployment_image(
+      self, name: str, namespace: str, dry_run_image: str = ''
+  ) -> tuple[int, str]:
+    def native() -> tuple[int, str]:
+      return_code, body = self._get_json(
+          f'/apis/apps/v1/namespaces/{namespace}/deployments/{name}'
+      )
+      if return_code != 0 or body is None:
+        return return_code, ''
+      containers = body['spec']['template']['spec'].get('containers') or [{}]
+      return 0, containers[0].get('image', '')
+
+    return self._with_fallback(
+        native, lambda b: b.get_deployment_image(name, namespace, dry_run_image)
+    )
+
+
+_kube_backend: KubeBackend = KubectlBackend()
+
+
+def set_kube_backend(backend: KubeBackend) -> None:
+  global _kube_backend
+  _kube_backend = backend
+
+
+def get_kube_backend() -> KubeBackend:
+  return _kube_backend
@@ -0,0 +1,520 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import os
+import stat
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import pytest
+from kubernetes import client as k8s_client
+from pytest_mock import MockerFixture
+
+from ..utils.execution_context import set_context
+from .kube_backend import (
+    DELETE_CONCURRENCY,
+    ApiClientBackend,
+    DeleteOutcome,
+    KubectlBackend,
+    _NativeClientUnavailable,
+    workload_label_selector,
+)
+from .testing.commands_tester import CommandsTester
+
+NODES = [
+    {
+        'metadata': {
+            'name': f'node-{i}',
+            'labels': {'cloud.google.com/gke-nodepool': f'np-{i % 4}'},
+        }
+    }
+    for i in range(50)
+]
+
+
+class _FakeApiServer:
+  """Serves canned JSON responses keyed by request path.
+
+  A response registered for a path with a query string takes precedence over
+  the one registered for the bare path. DELETE requests are recorded and
+  looked up with a `DELETE ` prefix. Bytes bodies are sent as they are,
+  for example newline-delimited watch events. The client address of every
+  connection is recorded, to check that connections are reused.
+  """
+
+  def __init__(self) -> None:
+    self.responses: dict[str, tuple[int, Any]] = {}
+    self.requests: list[str] = []
+    self.connections: set[tuple[str, int]] = set()
+    responses, requests, connections = (
+        self.responses,
+        self.requests,
+        self.connections,
+    )
+
+    class Handler(BaseHTTPRequestHandler):
+      """Answers GET requests from `responses`."""
+
+      protocol_version = 'HTTP/1.1'
+      disable_nagle_algorithm = True
+
+      def do_GET(self):  # pylint: disable=invalid-name
+        self._respond('')
+
+      def do_DELETE(self):  # pylint: disable=invalid-name
+        self._respond('DELETE ')
+
+      def _respond(self, prefix: str):
+        path = prefix + self.path.split('?', 1)[0]
+        requests.append(path)
+        connections.add(self.client_address)
+        status, body = responses.get(
+            prefix + self.path,
+            responses.get(path, (404, {'kind': 'Status'})),
+        )
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+      def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+    self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    self.host = f'http://127.0.0.1:{self._server.server_port}'
+    self._thread = threading.Thread(
+        target=self._server.serve_forever, daemon=True
+    )
+    self._thread.start()
+
+  def close(self) -> None:
+    self._server.shutdown()
+    self._server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def context(tmp_path, monkeypatch) -> Iterator[None]:
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path / 'cache'))
+  set_context(dry_run_value=False, quiet_value=False)
+  yield
+  set_context(dry_run_value=False, quiet_value=False)
+
+
+@pytest.fixture
+def api_server() -> Iterator[_FakeApiServer]:
+  server = _FakeApiServer()
+  yield server
+  server.close()
+
+
+def _keep(node: dict[str, Any]) -> dict[str, Any]:
+  return node
+
+
+def _backend(server: _FakeApiServer) -> ApiClientBackend:
+  configuration = k8s_client.Configuration(host=server.host)
+  return ApiClientBackend(k8s_client.ApiClient(configuration))
+
+
+def test_kubectl_backend_parses_configmap(mocker: MockerFixture):
+  commands_tester = CommandsTester(mocker)
+  commands_tester.set_result_for_command(
+      (0, 'map[capacity_type:RESERVATION reservation_id:res-1]'),
+      'kubectl get configmap',
+  )
+
+  return_code, data = KubectlBackend().get_configmap_data('cluster-metadata')
+
+  assert return_code == 0
+  assert data == {'capacity_type': 'RESERVATION', 'reservation_id': 'res-1'}
+
+
+def test_kubectl_backend_lists_nodes(mocker: MockerFixture):
+  commands_tester = CommandsTester(mocker)
+  commands_tester.set_result_for_command(
+      (0, json.dumps({'items': NODES})), 'kubectl get nodes -o json'
+  )
+
+  assert KubectlBackend().list_nodes(_keep) == (0, NODES)
+
+
+def test_api_backend_reads_configmap(api_server: _FakeApiServer):
+  api_server.responses['/api/v1/namespaces/default/configmaps/cm'] = (
+      200,
+      {'data': {'capacity_type': 'SPOT'}},
+  )
+
+  assert _backend(api_server).get_configmap_data('cm') == (
+      0,
+      {'capacity_type': 'SPOT'},
+  )
+
+
+def test_api_backend_missing_configmap_fails(api_server: _FakeApiServer):
+  assert _backend(api_server).get_configmap_data('missing') == (1, {})
+
+
+def test_api_backend_missing_workload_crd_returns_no_workloads(
+    api_server: _FakeApiServer,
+):
+  assert _backend(api_server).list_workloads(
+      'Get workloads', lambda item: item
+  ) == (0, [])
+
+
+def test_api_backend_transforms_workload_pages(api_server: _FakeApiServer):
+  path = '/apis/kueue.x-k8s.io/v1beta1/namespaces/default/workloads'
+  workloads = [
+      {'metadata': {'name': f'wl-{i}'}, 'spec': {'podSets': []}}
+      for i in range(6)
+  ]
+  api_server.responses[f'{path}?limit=500&labelSelector=team%3Dml'] = (
+      200,
+      {'metadata': {'continue': 'next'}, 'items': workloads[:3]},
+  )
+  api_server.responses[
+      f'{path}?limit=500&labelSelector=team%3Dml&continue=next'
+  ] = (200, {'metadata': {}, 'items': workloads[3:]})
+
+  def keep_even(item: dict) -> str | None:
+    name = item['metadata']['name']
+    return name if int(name[-1]) % 2 == 0 else None
+
+  assert _backend(api_server).list_workloads(
+      'Get workloads', keep_even, label_selector='team=ml'
+  ) == (0, ['wl-0', 'wl-2', 'wl-4'])
+  assert api_server.requests == [path] * 2
+
+
+def test_kubectl_backend_passes_workload_label_selector(
+    mocker: MockerFixture,
+):
+  commands_tester = CommandsTester(mocker)
+  commands_tester.set_result_for_command(
+      (0, json.dumps({'items': [{'metadata': {'name': 'wl'}}]})),
+      'kubectl get workloads',
+  )
+
+  assert KubectlBackend().list_workloads(
+      'Get workloads',
+      lambda item: item['metadata']['name'],
+      label_selector='team=ml',
+  ) == (0, ['wl'])
+  commands_tester.assert_command_run('kubectl get workloads', "-l 'team=ml'")
+
+
+def test_api_backend_lists_jobsets_with_resource_version(
+    api_server: _FakeApiServer,
+):
+  path = '/apis/jobset.x-k8s.io/v1alpha2/namespaces/default/jobsets'
+  jobset = {'metadata': {'name': 'job'}}
+  api_server.responses[f'{path}?limit=500&labelSelector=team%3Dml'] = (
+      200,
+      {'metadata': {'resourceVersion': '42'}, 'items': [jobset]},
+  )
+
+  assert _backend(api_server).list_jobsets('team=ml') == (0, [jobset], '42')
+
+
+def test_api_backend_lists_jobsets_by_field_selector(
+    api_server: _FakeApiServer,
+):
+  path = '/apis/jobset.x-k8s.io/v1alpha2/namespaces/default/jobsets'
+  jobset = {'metadata': {'name': 'job'}}
+  api_server.responses[
+      f'{path}?limit=500&fieldSelector=metadata.name%3Djob'
+  ] = (200, {'metadata': {'resourceVersion': '42'}, 'items': [jobset]})
+
+  assert _backend(api_server).list_jobsets('', 'metadata.name=job') == (
+      0,
+      [jobset],
+      '42',
+  )
+
+
+def test_kubectl_backend_lists_jobsets_by_field_selector(
+    mocker: MockerFixture,
+):
+  commands_tester = CommandsTester(mocker)
+  commands_tester.set_result_for_command(
+      (0, json.dumps({'items': [{'metadata': {'name': 'job'}}]})),
+      'kubectl get jobsets',
+  )
+
+  assert KubectlBackend().list_jobsets('', 'metadata.name=job') == (
+      0,
+      [{'metadata': {'name': 'job'}}],
+      '',
+  )
+  commands_tester.assert_command_run(
+      "kubectl get jobsets --field-selector 'metadata.name=job' -o json"
+  )
+
+
+def test_api_backend_streams_jobset_watch_events(api_server: _FakeApiServer):
+  path = '/apis/jobset.x-k8s.io/v1alpha2/namespaces/default/jobsets'
+  events = [
+      {'type': 'ADDED', 'object': {'metadata': {'name': 'job'}}},
+      {'type': 'BOOKMARK', 'object': {'metadata': {'resourceVersion': '43'}}},
+  ]
+  api_server.responses[
+      f'{path}?labelSelector=team%3Dml&resourceVersion=42&watch=true'
+      '&allowWatchBookmarks=true&timeoutSeconds=30'
+  ] = (200, b''.join(json.dumps(e).encode() + b'\n' for e in events))
+
+  assert list(_backend(api_server).watch_jobsets('team=ml', '42', 30)) == [
+      ('ADDED', {'metadata': {'name': 'job'}}),
+      ('BOOKMARK', {'metadata': {'resourceVersion': '43'}}),
+  ]
+
+
+def test_kubectl_backend_parses_jobset_watch_events(mocker: MockerFixture):
+  commands_tester = CommandsTester(mocker)
+  events = [
+      {'type': 'ADDED', 'object': {'metadata': {'name': 'job'}}},
+      {'type': 'MODIFIED', 'object': {'metadata': {'name': 'job'}}},
+  ]
+  commands_tester.set_result_for_command(
+      (0, ''.join(json.dumps(e, indent=2) + '\n' for e in events)),
+      'kubectl get jobsets',
+      '--watch',
+  )
+
+  assert list(KubectlBackend().watch_jobsets('team=ml', '', 30)) == [
+      ('ADDED', {'metadata': {'name': 'job'}}),
+      ('MODIFIED', {'metadata': {'name': 'job'}}),
+  ]
+  commands_tester.assert_command_run(
+      'kubectl get jobsets', "-l 'team=ml'", '--watch'
+  )
+
+
+def test_workload_label_selector():
+  assert workload_label_selector(['a']) == 'xpk.google.com/workload=a'
+  assert (
+      workload_label_selector(['b', 'a']) == 'xpk.google.com/workload in (a,b)'
+  )
+
+
+def test_api_backend_deletes_workloads_by_selector_then_by_name(
+    api_server: _FakeApiServer,
+):
+  jobsets = '/apis/jobset.x-k8s.io/v1alpha2/namespaces/default/jobsets'
+  pathways_jobs = (
+      '/apis/pathways-job.pathways.domain/v1/namespaces/default/pathwaysjobs'
+  )
+  api_server.responses[
+      'DELETE'
+      f' {pathways_jobs}?labelSelector=xpk.google.com%2Fworkload+in+%28a%2Cb%2Cc%2Cd%2Ce%29'
+  ] = (200, {'items': [{'metadata': {'name': 'a'}}]})
+  api_server.responses[
+      'DELETE'
+      f' {jobsets}?labelSelector=xpk.google.com%2Fworkload+in+%28b%2Cc%2Cd%2Ce%29'
+  ] = (200, {'items': [{'metadata': {'name': 'b'}}]})
+  api_server.responses[f'DELETE {jobsets}/c'] = (200, {'kind': 'Status'})
+  api_server.responses[f'DELETE {jobsets}/d'] = (500, {'kind': 'Status'})
+
+  outcomes = _backend(api_server).delete_workloads(
+      ['a', 'b', 'c', 'd', 'e'], delete_pathways_jobs=True
+  )
+
+  assert outcomes == {
+      'a': DeleteOutcome.DELETED,
+      'b': DeleteOutcome.DELETED,
+      'c': DeleteOutcome.DELETED,
+      'd': DeleteOutcome.FAILED,
+      'e': DeleteOutcome.NOT_FOUND,
+  }
+  assert api_server.requests.count(f'DELETE {jobsets}') == 1
+  assert api_server.requests.count(f'DELETE {pathways_jobs}') == 1
+  assert f'DELETE {pathways_jobs}/a' not in api_server.requests
+
+
+def test_api_backend_releases_connections_of_deletes_by_name(
+    api_server: _FakeApiServer,
+):
+  jobsets = '/apis/jobset.x-k8s.io/v1alpha2/namespaces/default/jobsets'
+  names = [f'wl-{i}' for i in range(4 * DELETE_CONCURRENCY)]
+  for name in names:
+    api_server.responses[f'DELETE {jobsets}/{name}'] = (200, {'kind': 'Status'})
+  configuration = k8s_client.Configuration(host=api_server.host)
+  # The default pool size depends on the CPU count, a smaller pool than the
+  # deletes running at once opens extra connections.
+  configuration.connection_pool_maxsize = DELETE_CONCURRENCY
+  backend = ApiClientBackend(k8s_client.ApiClient(configuration))
+
+  outcomes = backend.delete_workloads(names, delete_pathways_jobs=False)
+
+  assert set(outcomes.values()) == {DeleteOutcome.DELETED}
+  assert len(api_server.connections) <= DELETE_CONCURRENCY
+
+
+def test_kubectl_backend_deletes_workloads_in_chunks(
+    mocker: MockerFixture,
+):
+  commands_tester = CommandsTester(mocker)
+  names = [f'wl-{i}' for i in range(150)]
+  commands_tester.set_result_for_command(
+      (0, 'pathwaysjob.pathways-job.pathways.domain/wl-0\n'),
+      'kubectl delete pathwaysjob wl-0 ',
+  )
+  commands_tester.set_result_for_command(
+      (
+          0,
+          ''.join(f'jobset.jobset.x-k8s.io/{name}\n' for name in names[1:100]),
+      ),
+      'kubectl delete jobset wl-1 ',
+  )
+  commands_tester.set_result_for_command(
+      (1, 'Error from server (Forbidden): jobsets are forbidden'),
+      'kubectl delete jobset wl-101 ',
+  )
+
+  outcomes = KubectlBackend().delete_workloads(names, delete_pathways_jobs=True)
+
+  assert outcomes['wl-0'] == DeleteOutcome.DELETED
+  assert outcomes['wl-99'] == DeleteOutcome.DELETED
+  assert outcomes['wl-100'] == DeleteOutcome.NOT_FOUND
+  assert outcomes['wl-101'] == DeleteOutcome.FAILED
+  assert len(outcomes) == 150
+  commands_tester.assert_command_run('kubectl delete pathwaysjob', times=2)
+  commands_tester.assert_command_run('kubectl delete jobset', times=2)
+
+
+def test_api_backend_reads_deployment_image(api_server: _FakeApiServer):
+  api_server.responses[
+      '/apis/apps/v1/namespaces/kueue-system/deployments/kueue-controller-manager'
+  ] = (
+      200,
+      {
+          'spec': {
+              'template': {
+                  'spec': {
+                      'containers': [{'image': 'kueue:v0.14.1'}],
+                  }
+              }
+          }
+      },
+  )
+
+  assert _backend(api_server).get_deployment_image(
+      'kueue-controller-manager', 'kueue-system'
+  ) == (0, 'kueue:v0.14.1')
+
+
+def test_api_backend_reuses_connection(api_server: _FakeApiServer):
+  api_server.responses['/api/v1/nodes'] = (200, {'items': NODES})
+  backend = _backend(api_server)
+
+  for _ in range(5):
+    assert backend.list_nodes(_keep) == (0, NODES)
+
+  assert api_server.requests == ['/api/v1/nodes'] * 5
+
+
+def test_api_backend_follows_list_pages(api_server: _FakeApiServer):
+  api_server.responses['/api/v1/nodes?limit=500'] = (
+      200,
+      {'metadata': {'continue': 'page-2'}, 'items': NODES[:30]},
+  )
+  api_server.responses['/api/v1/nodes?limit=500&continue=page-2'] = (
+      200,
+      {'metadata': {}, 'items': NODES[30:]},
+  )
+
+  requests_at_transform: list[int] = []
+
+  def name_of(node: dict[str, Any]) -> str:
+    requests_at_transform.append(len(api_server.requests))
+    return str(node['metadata']['name'])
+
+  assert _backend(api_server).list_nodes(name_of) == (
+      0,
+      [node['metadata']['name'] for node in NODES],
+  )
+  assert api_server.requests == ['/api/v1/nodes'] * 2
+  # The first page is transformed before the second one is requested.
+  assert requests_at_transform == [1] * 30 + [2] * 20
+
+
+def test_api_backend_falls_back_to_kubectl_when_unavailable(
+    mocker: MockerFixture, api_server: _FakeApiServer
+):
+  commands_tester = CommandsTester(mocker)
+  commands_tester.set_result_for_command(
+      (0, json.dumps({'items': NODES})), 'kubectl get nodes -o json'
+  )
+  backend = _backend(api_server)
+  get_json = mocker.patch.object(
+      backend, '_get_json', side_effect=_NativeClientUnavailable('refused')
+  )
+
+  assert backend.list_nodes(_keep) == (0, NODES)
+  assert backend.list_nodes(_keep) == (0, NODES)
+
+  commands_tester.assert_command_run('kubectl get nodes', times=2)
+  assert get_json.call_count == 1
+
+
+def test_api_backend_uses_kubectl_in_dry_run(
+    mocker: MockerFixture, api_server: _FakeApiServer
+):
+  set_context(dry_run_value=True, quiet_value=False)
+  commands_tester = CommandsTester(mocker)
+
+  assert _backend(api_server).list_nodes(_keep) == (0, [])
+
+  commands_tester.assert_command_run('kubectl get nodes -o json')
+  assert not api_server.requests
+
+
+def test_benchmark_api_backend_against_kubectl(
+    tmp_path, monkeypatch, api_server: _FakeApiServer
+):
+  """Compares repeated node listings through both backends.
+
+  kubectl is replaced by a script that prints the same nodes, which
+  underestimates the real kubectl startup and kubeconfig parsing cost.
+  """
+  api_server.responses['/api/v1/nodes'] = (200, {'items': NODES})
+  fake_kubectl = tmp_path / 'bin' / 'kubectl'
+  fake_kubectl.parent.mkdir()
+  (tmp_path / 'nodes.json').write_text(json.dumps({'items': NODES}))
+  fake_kubectl.write_text(f'#!/bin/sh\ncat {tmp_path / "nodes.json"}\n')
+  fake_kubectl.chmod(fake_kubectl.stat().st_mode | stat.S_IEXEC)
+  monkeypatch.setenv(
+      'PATH', f'{fake_kubectl.parent}{os.pathsep}{os.environ["PATH"]}'
+  )
+  iterations = 20
+
+  def measure(backend) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+      assert backend.list_nodes(_keep) == (0, NODES)
+    return (time.perf_counter() - start) / iterations
+
+  kubectl_seconds = measure(KubectlBackend())
+  api_seconds = measure(_backend(api_server))
+
+  print(
+      f'list_nodes: kubectl {kubectl_seconds * 1000:.1f} ms, API client'
+      f' {api_seconds * 1000:.1f} ms per call'
+  )
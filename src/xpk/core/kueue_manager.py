@@ -39,6 +39,7 @@ from ..core.commands import (
 )
 from ..utils.file import write_tmp_file
 from ..utils.console import xpk_print, xpk_exit, ask_for_user_consent
+from .kube_backend import get_kube_backend
 from ..utils.templates import TEMPLATE_PATH, get_templates_absolute_path
 from packaging.version import Version, InvalidVersion
 
@@ -571,15 +572,10 @@ def get_installed_kueue_version(
     - A Version object if the image tag can be parsed as a valid version.
     - A string if the image tag contains a custom SHA or is unparseable.
   """
-  command = (
-      "kubectl get deployment kueue-controller-manager -n kueue-system -o"
-      " jsonpath='{.spec.template.spec.containers[0].image}'"
-  )
-  task = "Get kueue version on server"
-  return_code, val = run_command_for_value(
-      command,
-      task,
-      dry_run_return_val=(
+  return_code, val = get_kube_backend().get_deployment_image(
+      "kueue-controller-manager",
+      "kueue-system",
+      dry_run_image=(
           f"registry.k8s.io/kueue/kueue:v{dry_run_version}"
           if dry_run_version
           else ""
@@ -0,0 +1,133 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from .kube_backend import get_kube_backend
+
+NODEPOOL_LABEL = 'cloud.google.com/gke-nodepool'
+INSTANCE_TYPE_LABEL = 'node.kubernetes.io/instance-type'
+TPU_ACCELERATOR_LABEL = 'cloud.google.com/gke-tpu-accelerator'
+
+
+@dataclass(frozen=True)
+class NodeSummary:
+  """Fields of a single node used by cluster describe and inspector."""
+
+  name: str
+  nodepool: str | None
+  ready: str
+  instance_type: str | None
+  is_tpu: bool
+
+
+@dataclass
+class NodePoolSummary:
+  """Aggregated node counts of a single nodepool."""
+
+  name: str
+  instance_types: list[str] = field(default_factory=list)
+  total_nodes: int = 0
+  healthy_nodes: int = 0
+
+  @property
+  def expected_healthy_nodes(self) -> int:
+    return self.total_nodes
+
+  @property
+  def instance_type(self) -> str:
+    return ','.join(self.instance_types)
+
+
+@dataclass
+class NodeInventory:
+  """Per-nodepool summary built from a single listing of the cluster nodes."""
+
+  nodes: list[NodeSummary] = field(default_factory=list)
+  nodepools: dict[str, NodePoolSummary] = field(default_factory=dict)
+
+  @property
+  def tpu_nodes(self) -> int:
+    return sum(1 for node in self.nodes if node.is_tpu)
+
+
+def _node_summary(node: dict[str, Any]) -> NodeSummary:
+  metadata = node.get('metadata') or {}
+  labels = metadata.get('labels') or {}
+  conditions = (node.get('status') or {}).get('conditions') or []
+  ready = next(
+      (c.get('status', '') for c in conditions if c.get('type') == 'Ready'),
+      '',
+  )
+  return NodeSummary(
+      name=metadata.get('name', ''),
+      nodepool=labels.get(NODEPOOL_LABEL),
+      ready=ready,
+      instance_type=labels.get(INSTANCE_TYPE_LABEL),
+      is_tpu=TPU_ACCELERATOR_LABEL in labels,
+  )
+
+
+def build_node_inventory(nodes: Iterable[dict[str, Any]]) -> NodeInventory:
+  """Aggregates node objects into per-nodepool counts in a single pass.
+
+  Args:
+    nodes: node objects as returned by the Kubernetes API.
+
+  Returns:
+    The inventory, with nodepools sorted by name. Nodes without a nodepool
+    label are listed but not counted towards any nodepool.
+  """
+  return _aggregate(_node_summary(node) for node in nodes)
+
+
+def _aggregate(summaries: Iterable[NodeSummary]) -> NodeInventory:
+  inventory = NodeInventory()
+  for summary in summaries:
+    inventory.nodes.append(summary)
+    if summary.nodepool is None:
+      continue
+    nodepool = inventory.nodepools.setdefault(
+        summary.nodepool, NodePoolSummary(summary.nodepool)
+    )
+    nodepool.total_nodes += 1
+    if summary.ready == 'True':
+      nodepool.healthy_nodes += 1
+    if (
+        summary.instance_type is not None
+        and summary.instance_type not in nodepool.instance_types
+    ):
+      nodepool.instance_types.append(summary.instance_type)
+
+  inventory.nodepools = dict(sorted(inventory.nodepools.items()))
+  for nodepool in inventory.nodepools.values():
+    nodepool.instance_types.sort()
+  return inventory
+
+
+def get_node_inventory() -> tuple[int, NodeInventory]:
+  """Lists the cluster nodes once and aggregates them.
+
+  Each page of nodes is reduced to summaries before the next one is listed.
+
+  Returns:
+    Return code and the node inventory.
+  """
+  return_code, summaries = get_kube_backend().list_nodes(_node_summary)
+  if return_code != 0:
+    return return_code, NodeInventory()
+  return 0, _aggregate(summaries)
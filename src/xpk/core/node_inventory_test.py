@@ -0,0 +1,109 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+
+from pytest_mock import MockerFixture
+
+from .node_inventory import build_node_inventory, get_node_inventory
+from .testing.commands_tester import CommandsTester
+
+
+def _node(
+    name: str,
+    nodepool: str | None,
+    ready: str = 'True',
+    instance_type: str = 'ct6e-standard-4t',
+    tpu: bool = True,
+) -> dict:
+  labels = {'node.kubernetes.io/instance-type': instance_type}
+  if nodepool is not None:
+    labels['cloud.google.com/gke-nodepool'] = nodepool
+  if tpu:
+    labels['cloud.google.com/gke-tpu-accelerator'] = 'tpu-v6e-slice'
+  return {
+      'metadata': {'name': name, 'labels': labels},
+      'status': {
+          'conditions': [
+              {'type': 'MemoryPressure', 'status': 'False'},
+              {'type': 'Ready', 'status': ready},
+          ]
+      },
+  }
+
+
+def test_build_node_inventory_aggregates_per_nodepool():
+  inventory = build_node_inventory([
+      _node('b-1', 'np-b'),
+      _node('a-1', 'np-a'),
+      _node('a-2', 'np-a', ready='False'),
+      _node('a-3', 'np-a', ready='Unknown'),
+      _node('cpu-1', 'default-pool', instance_type='e2-standard-16', tpu=False),
+  ])
+
+  assert list(inventory.nodepools) == ['default-pool', 'np-a', 'np-b']
+  np_a = inventory.nodepools['np-a']
+  assert np_a.total_nodes == 3
+  assert np_a.expected_healthy_nodes == 3
+  assert np_a.healthy_nodes == 1
+  assert np_a.instance_type == 'ct6e-standard-4t'
+  assert inventory.tpu_nodes == 4
+
+
+def test_build_node_inventory_skips_nodes_without_nodepool():
+  inventory = build_node_inventory(
+      [_node('n-1', None), _node('n-2', 'np'), {'metadata': {'name': 'bare'}}]
+  )
+
+  assert list(inventory.nodepools) == ['np']
+  assert [node.name for node in inventory.nodes] == ['n-1', 'n-2', 'bare']
+  assert inventory.nodes[2].ready == ''
+
+
+def test_build_node_inventory_lists_all_instance_types():
+  inventory = build_node_inventory([
+      _node('n-1', 'np', instance_type='n2-standard-8'),
+      _node('n-2', 'np', instance_type='e2-standard-4'),
+      _node('n-3', 'np', instance_type='n2-standard-8'),
+  ])
+
+  assert inventory.nodepools['np'].instance_type == (
+      'e2-standard-4,n2-standard-8'
+  )
+
+
+def test_get_node_inventory_lists_nodes_once(mocker: MockerFixture):
+  commands_tester = CommandsTester(mocker)
+  commands_tester.set_result_for_command(
+      (0, json.dumps({'items': [_node('n-1', 'np'), _node('n-2', 'np')]})),
+      'kubectl get nodes',
+  )
+
+  return_code, inventory = get_node_inventory()
+
+  assert return_code == 0
+  assert inventory.nodepools['np'].total_nodes == 2
+  commands_tester.assert_command_run('kubectl get nodes', times=1)
+
+
+def test_get_node_inventory_returns_error(mocker: MockerFixture):
+  commands_tester = CommandsTester(mocker)
+  commands_tester.set_result_for_command((1, ''), 'kubectl get nodes')
+
+  return_code, inventory = get_node_inventory()
+
+  assert return_code == 1
+  assert not inventory.nodepools
@@ -14,8 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import Iterator, List
-from itertools import chain, repeat, cycle
+import json
+from dataclasses import dataclass
+from typing import Any, Iterator, List
+from itertools import cycle
 
 from ..utils.feature_flags import FeatureFlags
 from ..utils.console import ask_for_user_consent, xpk_print
@@ -34,8 +36,11 @@ from .reservation import (
     to_reservation_path,
     ReservationLink,
 )
+from .cluster_descriptor import get_cluster_descriptor
 from .commands import run_command_for_value, run_commands, FailedCommand
+from .retry import DEFAULT_RETRY_POLICY, TRANSIENT_ERRORS_RETRY_POLICY
 from .gcloud_context import GkeServerConfig, get_cluster_location, zone_to_region
+from .slice_packing import format_packing_plan, plan_slice_packing
 from .resources import (
     ConfigMapType,
     check_cluster_resources,
@@ -51,6 +56,81 @@ CLOUD_PLATFORM_AUTH_SCOPE_URL = (
 OLDER_PATHWAYS_CPU_NP_TO_DELETE = ['cpu-rm-np', 'cpu-proxy-np', 'cpu-user-np']
 
 
+@dataclass(frozen=True)
+class NodePool:
+  """Fields of a GKE node pool read from `node-pools list`."""
+
+  name: str
+  locations: tuple[str, ...] = ()
+  machine_type: str = ''
+  workload_metadata_mode: str = ''
+  placement_policy_type: str = ''
+  accelerator_type: str = ''
+  accelerator_count: int = 0
+  version: str = ''
+
+
+def _parse_node_pool(data: dict[str, Any]) -> NodePool:
+  config = data.get('config') or {}
+  accelerators = config.get('accelerators') or [{}]
+  return NodePool(
+      name=data['name'],
+      locations=tuple(data.get('locations') or ()),
+      machine_type=config.get('machineType', ''),
+      workload_metadata_mode=(config.get('workloadMetadataConfig') or {}).get(
+          'mode', ''
+      ),
+      placement_policy_type=(data.get('placementPolicy') or {}).get('type', ''),
+      accelerator_type=accelerators[0].get('acceleratorType', ''),
+      accelerator_count=int(accelerators[0].get('acceleratorCount', 0)),
+      version=data.get('version', ''),
+  )
+
+
+def list_node_pools(
+    project: str, location: str, cluster: str
+) -> tuple[int, list[NodePool]]:
+  """Lists the node pools of a cluster with a single gcloud call.
+
+  Args:
+    project: project of the cluster.
+    location: region or zone of the cluster.
+    cluster: name of the cluster.
+
+  Returns:
+    Tuple of
+    int: 0 if successful and the error code otherwise.
+    list[NodePool]: node pools of the cluster, in the order listed by gcloud.
+  """
+  return_code, output = run_command_for_value(
+      'gcloud beta container node-pools list'
+      f' --cluster {cluster} --project={project} --location={location}'
+      ' --format=json',
+      'Get All Node Pools',
+      dry_run_return_val='[]',
+      retry_policy=DEFAULT_RETRY_POLICY,
+  )
+  if return_code != 0:
+    xpk_print(f'Get All Node Pools returned ERROR {return_code}')
+    return return_code, []
+  if not output.strip():
+    return 0, []
+  try:
+    return 0, [_parse_node_pool(node_pool) for node_pool in json.loads(output)]
+  except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+    xpk_print(f'Error processing node pools: {e}. Output: "{output}".')
+    return 1, []
+
+
+def get_node_pools(args) -> tuple[int, list[NodePool]]:
+  """Lists the node pools of the cluster / project / region of `args`."""
+  return list_node_pools(
+      args.project,
+      get_cluster_location(args.project, args.cluster, args.zone),
+      args.cluster,
+  )
+
+
 def run_gke_node_pool_create_command(
     args, system: SystemCharacteristics, gke_node_pool_version: str
 ) -> int:
@@ -69,10 +149,13 @@ def run_gke_node_pool_create_command(
       f'Creating {args.num_slices} node pool or pools of {device_type}\n'
       f'We assume that the underlying system is: {system}'
   )
-  existing_node_pool_names, return_code = get_all_nodepools_programmatic(args)
+  return_code, existing_node_pools = get_node_pools(args)
   if return_code > 0:
     xpk_print('Listing all node pools failed!')
     return return_code
+  existing_node_pool_names = [
+      node_pool.name for node_pool in existing_node_pools
+  ]
 
   capacity_type, return_code = get_capacity_type(args)
   if return_code > 0:
@@ -120,12 +203,7 @@ def run_gke_node_pool_create_command(
   update_WI_commands = []
   update_WI_task_names = []
   if existing_node_pool_names:
-    return_code, existing_node_pool_zone = get_nodepool_zone(
-        args, existing_node_pool_names[0]
-    )
-    if return_code != 0:
-      return 1
-
+    existing_node_pool_zone = ';'.join(existing_node_pools[0].locations)
     if existing_node_pool_zone and existing_node_pool_zone != args.zone:
       xpk_print(
           f'Cluster {args.cluster} already has nodepools in zone:'
@@ -159,18 +237,13 @@ def run_gke_node_pool_create_command(
 
     # Workload Identity for existing nodepools
     if args.enable_workload_identity or args.enable_gcsfuse_csi_driver:
-      for node_pool_name in existing_node_pool_names:
+      for node_pool in existing_node_pools:
+        node_pool_name = node_pool.name
         if not node_pool_name in node_pools_to_delete:
           # Check if workload identity is not already enabled:
-          return_code, existing_node_pool_medadata_mode = (
-              get_nodepool_workload_metadata_mode(args, node_pool_name)
-          )
-          if return_code != 0:
-            return 1
-
           if (
               existing_node_pool_zone
-              and existing_node_pool_medadata_mode != 'GKE_METADATA'
+              and node_pool.workload_metadata_mode != 'GKE_METADATA'
           ):
             command = (
                 'gcloud container node-pools update'
@@ -207,6 +280,7 @@ def run_gke_node_pool_create_command(
         delete_commands,
         'Delete Nodepools',
         delete_task_names,
+        retry_policy=TRANSIENT_ERRORS_RETRY_POLICY,
     )
     if maybe_failure:
       xpk_print(
@@ -287,17 +361,12 @@ def run_gke_node_pool_create_command(
   ):
     reservations = get_reservations_list(args)
     if FeatureFlags.RESERVATIONS_VALIDATION_ENABLED:
-      vms_per_pool = (
-          args.num_nodes
-          if system.accelerator_type == AcceleratorType.GPU
-          else system.vms_per_slice
-      )
       reservations_iter, return_code = _prepare_reservation_iterator(
           reservations=reservations,
           num_new_node_pools=len(node_pools_to_create),
           force_sub_block_targeting=super_slicing,
           system=system,
-          vms_per_pool=vms_per_pool,
+          vms_per_pool=_get_vms_per_pool(args, system),
       )
       if return_code > 0:
         return return_code
@@ -426,6 +495,7 @@ def run_gke_node_pool_create_command(
       'Create Nodepools',
       create_task_names,
       batch=100,
+      retry_policy=TRANSIENT_ERRORS_RETRY_POLICY,
   )
   if maybe_failure:
     display_nodepool_creation_error(maybe_failure[0])
@@ -528,48 +598,10 @@ def get_all_nodepools_programmatic(args) -> tuple[list[str], int]:
   Returns:
     List of nodepools and 0 if successful and 1 otherwise.
   """
-  command = (
-      'gcloud beta container node-pools list'
-      ' --cluster'
-      f' {args.cluster} --project={args.project} '
-      f'--location={get_cluster_location(args.project, args.cluster, args.zone)}'
-      ' --format="csv[no-heading](name)"'
-  )
-  return_code, raw_nodepool_output = run_command_for_value(
-      command, 'Get All Node Pools'
-  )
+  return_code, node_pools = get_node_pools(args)
   if return_code != 0:
-    xpk_print(f'Get All Node Pools returned ERROR {return_code}')
     return [], 1
-
-  return raw_nodepool_output.splitlines(), 0
-
-
-def get_nodepool_zone(args, nodepool_name) -> tuple[int, str | None]:
-  """Return zone in which nodepool exists in the cluster.
-
-  Args:
-    args: user provided arguments for running the command.
-    nodepool_name: name of nodepool.
-
-  Returns:
-    Tuple of int, str where
-    int is the return code - 0 if successful, 1 otherwise.
-    str is the zone of nodepool.
-  """
-  command = (
-      f'gcloud beta container node-pools describe {nodepool_name}'
-      f' --cluster {args.cluster} --project={args.project}'
-      f' --location={get_cluster_location(args.project, args.cluster, args.zone)} --format="value(locations)"'
-  )
-  return_code, nodepool_zone = run_command_for_value(
-      command, 'Get Node Pool Zone', dry_run_return_val=args.zone
-  )
-  if return_code != 0:
-    xpk_print(f'Get Node Pool Zone returned ERROR {return_code}')
-    return 1, None
-
-  return 0, nodepool_zone.strip()
+  return [node_pool.name for node_pool in node_pools], 0
 
 
 def get_gke_node_pool_version(
@@ -588,27 +620,16 @@ def get_gke_node_pool_version(
   """
 
   # By default use the current gke master version for creating node pools.
-  command_description = 'Determine current gke master version'
-  command = (
-      f'gcloud beta container clusters describe {args.cluster} --location'
-      f' {get_cluster_location(args.project, args.cluster, args.zone)} --project'
-      f' {args.project} --format="value(currentMasterVersion)"'
-  )
-
-  return_code, current_gke_master_version = run_command_for_value(
-      command, command_description
-  )
+  return_code, descriptor = get_cluster_descriptor(args)
   if return_code != 0:
-    xpk_print(
-        f'Unable to get server config for command: {command_description}.'
-    )
+    xpk_print('Unable to determine current gke master version.')
     return return_code, None
 
   # Override with user provide gke version if specified.
   if args.gke_version is not None:
     node_pool_gke_version = args.gke_version
   else:
-    master_gke_version = current_gke_master_version.strip()
+    master_gke_version = descriptor.current_master_version
     node_pool_gke_version = ''
     # Select minimum version which is >= master_gke_version and has the same minor version.
     # If this does not exist select maximum version which is < master_gke_version.
@@ -634,42 +655,12 @@ def get_gke_node_pool_version(
         ' valid version'
         f' {gke_server_config.valid_versions}\nPlease adjust the gke version'
         ' using --gke-version=x or remove the arg and depend on xpk default of'
-        f' {current_gke_master_version}'
+        f' {descriptor.current_master_version}'
     )
     return 1, None
   return 0, node_pool_gke_version
 
 
-def get_nodepool_workload_metadata_mode(
-    args, nodepool_name
-) -> tuple[int, str | None]:
-  """Return Workload Identity metadata mode of the nodepool.
-  Args:
-    args: user provided arguments for running the command.
-    nodepool_name: name of nodepool.
-  Returns:
-    Tuple of int, str where
-    int is the return code - 0 if successful, 1 otherwise.
-    str is the workload metadata mode of nodepool.
-  """
-  command = (
-      f'gcloud beta container node-pools describe {nodepool_name}'
-      f' --cluster {args.cluster} --project={args.project}'
-      f' --location={get_cluster_location(args.project, args.cluster, args.zone)} --format="value(config.workloadMetadataConfig.mode)"'
-  )
-  return_code, nodepool_WI_mode = run_command_for_value(
-      command, 'Get Node Pool Workload Identity Metadata Mode'
-  )
-  if return_code != 0:
-    xpk_print(
-        'Get Node Pool Workload Identity Metadata Mode returned ERROR'
-        f' {return_code}'
-    )
-    return 1, None
-
-  return 0, nodepool_WI_mode.strip()
-
-
 def get_desired_node_pool_names(
     existing_node_pool_names: List[str],
     cluster_name: str,
@@ -771,13 +762,21 @@ def recreate_nodes_in_existing_node_pools(args) -> int:
   return maybe_failure[0].return_code if maybe_failure else 0
 
 
-def _prepare_reservation_iterator(
+def _get_vms_per_pool(args, system: SystemCharacteristics) -> int:
+  return (
+      args.num_nodes
+      if system.accelerator_type == AcceleratorType.GPU
+      else system.vms_per_slice
+  )
+
+
+def _plan_reservation_assignment(
     reservations: List[ReservationLink],
     num_new_node_pools: int,
     force_sub_block_targeting: bool,
     system: SystemCharacteristics,
     vms_per_pool: int,
-) -> tuple[Iterator[ReservationLink] | None, int]:
+) -> tuple[list[ReservationLink] | None, int]:
   available_capacity, return_code = assess_available_slices(
       reservations,
       force_sub_block_targeting=force_sub_block_targeting,
@@ -788,9 +787,9 @@ def _prepare_reservation_iterator(
   if return_code > 0:
     return None, return_code
 
-  total_available = sum(cap.available_slices for cap in available_capacity)
-
-  if total_available < num_new_node_pools:
+  assignment = plan_slice_packing(available_capacity, num_new_node_pools)
+  if assignment is None:
+    total_available = sum(cap.available_slices for cap in available_capacity)
     xpk_print(
         'Error: Not enough available reservation capacity. Needed'
         f' {num_new_node_pools} slices, but only found'
@@ -799,9 +798,60 @@ def _prepare_reservation_iterator(
     )
     return None, 1
 
-  reservations_iter = chain.from_iterable(
-      repeat(cap.reservation, cap.available_slices)
-      for cap in available_capacity
+  return assignment, 0
+
+
+def _prepare_reservation_iterator(
+    reservations: List[ReservationLink],
+    num_new_node_pools: int,
+    force_sub_block_targeting: bool,
+    system: SystemCharacteristics,
+    vms_per_pool: int,
+) -> tuple[Iterator[ReservationLink] | None, int]:
+  assignment, return_code = _plan_reservation_assignment(
+      reservations,
+      num_new_node_pools,
+      force_sub_block_targeting,
+      system,
+      vms_per_pool,
+  )
+  if assignment is None:
+    return None, return_code
+  return iter(assignment), 0
+
+
+def print_reservation_packing_plan(args, system: SystemCharacteristics) -> int:
+  """Prints which reservations the slices of a new cluster would use.
+
+  Args:
+    args: user provided arguments for running the command.
+    system: System characteristics based on device type/topology.
+
+  Returns:
+    0 if successful and 1 otherwise.
+  """
+  capacity_type, return_code = get_capacity_type(args)
+  if return_code > 0:
+    return return_code
+  if capacity_type != CapacityType.RESERVATION:
+    xpk_print('Error: --plan-only requires --reservation.')
+    return 1
+
+  num_slices = (
+      1 if system.accelerator_type == AcceleratorType.GPU else args.num_slices
   )
+  assignment, return_code = _plan_reservation_assignment(
+      reservations=get_reservations_list(args),
+      num_new_node_pools=num_slices,
+      force_sub_block_targeting=args.super_slicing,
+      system=system,
+      vms_per_pool=_get_vms_per_pool(args, system),
+  )
+  if assignment is None:
+    return return_code
 
-  return reservations_iter, 0
+  xpk_print(
+      f'Reservation plan for {num_slices} node pool or pools:\n'
+      f'{format_packing_plan(assignment, args.project)}'
+  )
+  return 0
@@ -14,11 +14,16 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import json
+
 import pytest
 from xpk.core.nodepool import (
+    NodePool,
     display_nodepool_creation_error,
     ensure_resource_policy_exists,
     get_desired_node_pool_names,
+    list_node_pools,
+    print_reservation_packing_plan,
     run_gke_node_pool_create_command,
     recreate_nodes_in_existing_node_pools,
 )
@@ -30,7 +35,7 @@ from xpk.core.testing.mock_reservation import (
     MockBlock,
     MockSubBlock,
 )
-from xpk.core.reservation import SpecificReservation
+from xpk.core.reservation import SpecificReservation, _get_reservation_cached
 
 
 CLUSTER_NAME = "running-cucumber"
@@ -112,6 +117,14 @@ def commands_tester(mocker):
   return CommandsTester(mocker)
 
 
+@pytest.fixture(autouse=True)
+def reservation_cache(tmp_path, monkeypatch):
+  monkeypatch.setenv("XPK_CACHE_HOME", str(tmp_path / "cache"))
+  _get_reservation_cached.cache_clear()
+  yield
+  _get_reservation_cached.cache_clear()
+
+
 def test_ensure_resource_policy_exists_with_existing_policy_retrieves_existing_policy(
     commands_tester: CommandsTester,
 ):
@@ -209,9 +222,7 @@ def mock_xpk_print(mocker):
 @pytest.fixture
 def mock_nodepool_dependencies(mocker):
   """Mocks dependencies for run_gke_node_pool_create_command."""
-  mocker.patch(
-      "xpk.core.nodepool.get_all_nodepools_programmatic", return_value=([], 0)
-  )
+  mocker.patch("xpk.core.nodepool.get_node_pools", return_value=(0, []))
   mocker.patch(
       "xpk.core.nodepool.get_capacity_type", return_value=("on-demand", 0)
   )
@@ -562,13 +573,8 @@ def test_run_gke_node_pool_create_command_partial_reservations(
       docker_platform=DockerPlatform.AMD,
   )
   commands_tester.set_result_for_command(
-      (0, "test-cluster-np-0"), "gcloud beta container node-pools list"
-  )
-  commands_tester.set_result_for_command(
-      (0, "us-central1-a"),
-      "gcloud",
-      "node-pools describe",
-      '--format="value(locations)"',
+      (0, '[{"name": "test-cluster-np-0", "locations": ["us-central1-a"]}]'),
+      "gcloud beta container node-pools list",
   )
   setup_mock_reservation(
       commands_tester,
@@ -596,6 +602,138 @@ def test_run_gke_node_pool_create_command_partial_reservations(
   )
 
 
+def test_list_node_pools_parses_snapshot(commands_tester: CommandsTester):
+  commands_tester.set_result_for_command(
+      (
+          0,
+          json.dumps([
+              {
+                  "name": "gpu-np",
+                  "locations": ["us-central1-a"],
+                  "version": "1.33.2-gke.100",
+                  "placementPolicy": {"type": "COMPACT"},
+                  "config": {
+                      "machineType": "a3-ultragpu-8g",
+                      "workloadMetadataConfig": {"mode": "GKE_METADATA"},
+                      "accelerators": [{
+                          "acceleratorType": "nvidia-h200-141gb",
+                          "acceleratorCount": "8",
+                      }],
+                  },
+              },
+              {"name": "cpu-np"},
+          ]),
+      ),
+      "gcloud beta container node-pools list",
+  )
+
+  return_code, node_pools = list_node_pools(
+      "test-project", "us-central1", "test-cluster"
+  )
+
+  assert return_code == 0
+  assert node_pools == [
+      NodePool(
+          name="gpu-np",
+          locations=("us-central1-a",),
+          machine_type="a3-ultragpu-8g",
+          workload_metadata_mode="GKE_METADATA",
+          placement_policy_type="COMPACT",
+          accelerator_type="nvidia-h200-141gb",
+          accelerator_count=8,
+          version="1.33.2-gke.100",
+      ),
+      NodePool(name="cpu-np"),
+  ]
+  commands_tester.assert_command_run(
+      "gcloud beta container node-pools list --cluster test-cluster"
+      " --project=test-project --location=us-central1 --format=json"
+  )
+
+
+def test_list_node_pools_returns_error_code(commands_tester: CommandsTester):
+  commands_tester.set_result_for_command(
+      (2, ""), "gcloud beta container node-pools list"
+  )
+
+  assert list_node_pools("test-project", "us-central1", "test-cluster") == (
+      2,
+      [],
+  )
+
+
+def test_run_gke_node_pool_create_command_reconciles_against_one_snapshot(
+    mocker,
+    commands_tester: CommandsTester,
+):
+  mocker.patch(
+      "xpk.core.nodepool.get_cluster_location", return_value="us-central1"
+  )
+  mocker.patch("xpk.core.nodepool.get_node_pools_to_delete", return_value=[])
+  mocker.patch("xpk.core.nodepool.ensure_resource_policy_exists")
+  mocker.patch("xpk.core.nodepool.ask_for_user_consent", return_value=True)
+  args = mocker.Mock(
+      num_slices=2,
+      reservation=None,
+      tpu_type="v4-8",
+      device_type=None,
+      cluster="test-cluster",
+      project="test-project",
+      zone="us-central1-a",
+      on_demand=True,
+      spot=False,
+      flex=False,
+      enable_workload_identity=True,
+      enable_gcsfuse_csi_driver=False,
+      enable_pathways=False,
+      host_maintenance_interval="AS_NEEDED",
+      custom_nodepool_arguments="",
+      custom_tpu_nodepool_arguments="",
+      super_slicing=False,
+  )
+  system = SystemCharacteristics(
+      topology="2x2x1",
+      vms_per_slice=2,
+      gke_accelerator="tpu-v4",
+      gce_machine_type="ct4p-hightpu-4t",
+      chips_per_vm=4,
+      accelerator_type=AcceleratorType.TPU,
+      device_type="v4-8",
+      supports_sub_slicing=False,
+      supports_super_slicing=False,
+      supports_accelerator_network_profile=False,
+      docker_platform=DockerPlatform.AMD,
+  )
+  commands_tester.set_result_for_command(
+      (
+          0,
+          json.dumps([
+              {
+                  "name": f"test-cluster-np-{i}",
+                  "locations": ["us-central1-a"],
+                  "config": {"workloadMetadataConfig": {"mode": mode}},
+              }
+              for i, mode in enumerate(["GKE_METADATA", "GCE_METADATA"])
+          ]),
+      ),
+      "gcloud beta container node-pools list",
+  )
+
+  result = run_gke_node_pool_create_command(args, system, "1.2.3")
+
+  assert result == 0
+  commands_tester.assert_command_run("gcloud beta container node-pools list")
+  commands_tester.assert_command_not_run("node-pools describe")
+  commands_tester.assert_command_run(
+      "gcloud container node-pools update test-cluster-np-1",
+      "--workload-metadata=GKE_METADATA",
+  )
+  commands_tester.assert_command_not_run(
+      "gcloud container node-pools update test-cluster-np-0"
+  )
+  commands_tester.assert_command_not_run("node-pools create")
+
+
 def test_recreate_nodes_in_existing_node_pools_upgrades_existing_nodepools(
     mocker,
     commands_tester: CommandsTester,
@@ -1224,10 +1362,72 @@ def test_run_gke_node_pool_create_command_skips_reservation_check_when_no_nodepo
   )
 
   commands_tester.set_result_for_command(
-      (0, "test-cluster-np-0\ntest-cluster-np-1"),
+      (0, '[{"name": "test-cluster-np-0"}, {"name": "test-cluster-np-1"}]'),
       "gcloud beta container node-pools list",
   )
 
   result = run_gke_node_pool_create_command(args, system, "1.2.3")
 
   assert result == 0
+
+
+def test_print_reservation_packing_plan_packs_slices_into_one_block(
+    mocker,
+    commands_tester: CommandsTester,
+    mock_xpk_print,
+):
+  mocker.patch("xpk.core.capacity.verify_reservations_exist", return_value=0)
+  args = mocker.Mock(
+      num_slices=3,
+      reservation="reservation1",
+      project="test-project",
+      zone="us-central1-a",
+      on_demand=False,
+      spot=False,
+      flex=False,
+      super_slicing=True,
+  )
+  system = SystemCharacteristics(
+      topology="2x2x1",
+      vms_per_slice=2,
+      gke_accelerator="tpu-v4",
+      gce_machine_type="ct4p-hightpu-4t",
+      chips_per_vm=4,
+      accelerator_type=AcceleratorType.TPU,
+      device_type="v4-8",
+      supports_sub_slicing=False,
+      supports_super_slicing=False,
+      supports_accelerator_network_profile=False,
+      docker_platform=DockerPlatform.AMD,
+  )
+  setup_mock_reservation(
+      commands_tester,
+      specific_reservation=SpecificReservation(
+          count=100, in_use_count=0, machine_type="ct4p-hightpu-4t"
+      ),
+      blocks=[
+          MockBlock(
+              name="block1",
+              sub_blocks=[
+                  MockSubBlock(name="sub-block1", count=4, in_use_count=0)
+              ],
+          ),
+          MockBlock(
+              name="block2",
+              sub_blocks=[
+                  MockSubBlock(name="sub-block1", count=4, in_use_count=0),
+                  MockSubBlock(name="sub-block2", count=2, in_use_count=0),
+              ],
+          ),
+      ],
+  )
+
+  result = print_reservation_packing_plan(args, system)
+
+  assert result == 0
+  plan = mock_xpk_print.call_args[0][0]
+  assert "block2/reservationSubBlocks/sub-block1" in plan
+  assert "block2/reservationSubBlocks/sub-block2" in plan
+  assert "block1/" not in plan
+  assert "3 slices in 1 blocks and 2 sub-blocks." in plan
+  commands_tester.assert_command_not_run("node-pools create")
@@ -15,7 +15,7 @@ limitations under the License.
 """
 
 import urllib
-from ..core.commands import run_command_for_value, run_command_with_updates, run_commands
+from ..core.commands import run_command_for_value
 from ..core.gcloud_context import get_cluster_location
 from ..core.nodepool import get_all_nodepools_programmatic
 from ..utils.console import xpk_exit, xpk_print
@@ -128,41 +128,6 @@ def get_proxy_address(args) -> str:
   return proxy_address
 
 
-def try_to_delete_pathwaysjob_first(args, workloads) -> bool:
-  """Function to delete PathwaysJob workload. This is needed as PathwaysJob
-  owns the JobSet it creates.
-
-  Args:
-    args: user provided arguments for running the command.
-    workloads: list of workloads that match the delete filter.
-
-  Returns:
-    True if successful and False otherwise.
-  """
-  commands = []
-  task_names = []
-  for workload in workloads:
-    args.workload = workload
-    command = f'kubectl delete pathwaysjob {workload} -n default'
-    task_name = f'PathwaysWorkloadDelete-{workload}'
-    commands.append(command)
-    task_names.append(task_name)
-
-  # Not batching deletion for single workload
-  if len(workloads) == 1:
-    return_code = run_command_with_updates(commands[0], 'Delete Workload')
-  else:
-    maybe_failure = run_commands(
-        commands, 'Delete Workload', task_names, batch=100
-    )
-    return_code = 0 if not maybe_failure else maybe_failure[0].return_code
-
-  if return_code != 0:
-    xpk_print(f'Delete Workload request returned ERROR {return_code}')
-    return False
-  return True
-
-
 def get_pathways_machine_types(
     project: str, zone: str
 ) -> tuple[int, list[str]]:
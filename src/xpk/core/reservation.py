@@ -16,15 +16,24 @@ limitations under the License.
 
 import json
 import os
+import time
 from dataclasses import dataclass, field
 from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 from .commands import run_command_with_updates, run_command_for_value
 from .system_characteristics import AcceleratorType, SystemCharacteristics
+from ..utils.cache import get_cache_dir, read_json_file, write_json_file
 from ..utils.console import xpk_print, xpk_exit
+from ..utils.execution_context import is_cache_enabled, is_dry_run
 
 RESERVATION_CONFIG_KEY = 'reservation_id'
+# How long a reservation snapshot, including its in-use counts, is reused by
+# later xpk runs.
+RESERVATION_SNAPSHOT_TTL_SECONDS = 120
+
+_refresh_reservations = False
 
 
 @dataclass(frozen=True)
@@ -165,17 +174,63 @@ def _parse_reservation_sub_block(
   )
 
 
-@lru_cache()
-def _get_reservation_cached(
+def set_refresh_reservations(refresh: bool) -> None:
+  """Makes reservation lookups ignore the snapshots of previous xpk runs."""
+  global _refresh_reservations
+  _refresh_reservations = refresh
+
+
+def _snapshots_enabled() -> bool:
+  return is_cache_enabled() and not is_dry_run()
+
+
+def _snapshot_path(reservation: ReservationLink) -> Path:
+  return (
+      get_cache_dir()
+      / 'reservations'
+      / f'{reservation.project}.{reservation.zone}.{reservation.name}.json'
+  )
+
+
+def _read_reservation_snapshot(
     reservation: ReservationLink,
-) -> Reservation | None:
-  """Fetches reservation details using gcloud and returns Reservation object.
+) -> dict[str, Any] | None:
+  """Returns the describe output stored by a recent xpk run, if still fresh."""
+  if _refresh_reservations or not _snapshots_enabled():
+    return None
+  snapshot = read_json_file(_snapshot_path(reservation))
+  if not isinstance(snapshot, dict):
+    return None
+  data = snapshot.get('data')
+  fetched_at = snapshot.get('fetched_at', 0)
+  if (
+      not isinstance(data, dict)
+      or fetched_at + RESERVATION_SNAPSHOT_TTL_SECONDS < time.time()
+  ):
+    return None
+  return data
+
+
+def _write_reservation_snapshot(
+    reservation: ReservationLink, data: dict[str, Any]
+) -> None:
+  if _snapshots_enabled():
+    write_json_file(
+        _snapshot_path(reservation),
+        {'fetched_at': time.time(), 'data': data},
+    )
+
+
+def _describe_reservation(
+    reservation: ReservationLink,
+) -> dict[str, Any] | None:
+  """Runs the single describe of a reservation that every lookup relies on.
 
   Args:
     reservation: ReservationLink object.
 
   Returns:
-    Reservation object or None on failure.
+    The describe output of a READY reservation, or None on failure.
   """
   command = (
       f'gcloud beta compute reservations describe {reservation.name} '
@@ -203,12 +258,45 @@ def _get_reservation_cached(
 
   try:
     data = json.loads(output)
-    if not data or data.get('status') != 'READY':
-      return None
-    return _parse_reservation(reservation, data)
-  except (ValueError, IndexError, AttributeError, json.JSONDecodeError) as e:
+  except json.JSONDecodeError as e:
     xpk_print(f'Error processing reservation data: {e}. Output: "{output}".')
     return None
+  if not isinstance(data, dict) or data.get('status') != 'READY':
+    return None
+  return data
+
+
+@lru_cache()
+def _get_reservation_cached(
+    reservation: ReservationLink,
+) -> Reservation | None:
+  """Fetches reservation details using gcloud and returns Reservation object.
+
+  The describe output is stored as a snapshot reused by the xpk runs of the
+  next `RESERVATION_SNAPSHOT_TTL_SECONDS`, unless `--no-cache` or
+  `--refresh-reservations` is given.
+
+  Args:
+    reservation: ReservationLink object.
+
+  Returns:
+    Reservation object or None on failure.
+  """
+  data = _read_reservation_snapshot(reservation)
+  from_snapshot = data is not None
+  if data is None:
+    data = _describe_reservation(reservation)
+    if data is None:
+      return None
+
+  try:
+    parsed = _parse_reservation(reservation, data)
+  except (ValueError, IndexError, AttributeError, TypeError) as e:
+    xpk_print(f'Error processing reservation data: {e}. Output: "{data}".')
+    return None
+  if not from_snapshot:
+    _write_reservation_snapshot(reservation, data)
+  return parsed
 
 
 def get_reservation(
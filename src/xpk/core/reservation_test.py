@@ -39,6 +39,7 @@ from .reservation import (
     _get_reservation_cached,
     get_reservation_accelerator_type,
     ReservationSubBlock,
+    set_refresh_reservations,
 )
 from .system_characteristics import (
     SystemCharacteristics,
@@ -54,7 +55,8 @@ def commands_tester(mocker):
 
 
 @pytest.fixture(autouse=True)
-def clear_capacity_cache():
+def clear_capacity_cache(tmp_path, monkeypatch):
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path / 'cache'))
   _get_reservation_cached.cache_clear()
   yield
   _get_reservation_cached.cache_clear()
@@ -504,6 +506,96 @@ def test_get_reservation_cached_returns_none_on_invalid_json(
   mock_print.assert_called()
 
 
+_READY_RESERVATION = (
+    '{"status": "READY", "specificReservation": {"count": 8, "inUseCount": 3}}'
+)
+
+
+def test_get_reservation_reuses_snapshot_of_previous_run(
+    commands_tester: CommandsTester,
+):
+  commands_tester.set_result_for_command(
+      (0, _READY_RESERVATION), 'reservations', 'describe'
+  )
+  link = ReservationLink('project', 'res1', 'zone')
+
+  get_reservation(link)
+  _get_reservation_cached.cache_clear()
+  reservation = get_reservation(link)
+
+  commands_tester.assert_command_run('reservations', 'describe', times=1)
+  assert reservation is not None
+  assert reservation.specific_reservation is not None
+  assert reservation.specific_reservation.in_use_count == 3
+
+
+def test_get_reservation_describes_again_after_snapshot_expires(
+    commands_tester: CommandsTester, mocker
+):
+  time_mock = mocker.patch('xpk.core.reservation.time.time', return_value=0)
+  commands_tester.set_result_for_command(
+      (0, _READY_RESERVATION), 'reservations', 'describe'
+  )
+  link = ReservationLink('project', 'res1', 'zone')
+
+  get_reservation(link)
+  _get_reservation_cached.cache_clear()
+  time_mock.return_value = 10_000
+  get_reservation(link)
+
+  commands_tester.assert_command_run('reservations', 'describe', times=2)
+
+
+def test_get_reservation_refresh_ignores_snapshot(
+    commands_tester: CommandsTester,
+):
+  commands_tester.set_result_for_command(
+      (0, _READY_RESERVATION), 'reservations', 'describe'
+  )
+  link = ReservationLink('project', 'res1', 'zone')
+
+  get_reservation(link)
+  _get_reservation_cached.cache_clear()
+  set_refresh_reservations(True)
+  try:
+    get_reservation(link)
+  finally:
+    set_refresh_reservations(False)
+
+  commands_tester.assert_command_run('reservations', 'describe', times=2)
+
+
+def test_get_reservation_does_not_store_failed_describe(
+    commands_tester: CommandsTester,
+):
+  commands_tester.set_result_for_command(
+      (0, '{"status": "CREATING"}'), 'reservations', 'describe'
+  )
+  link = ReservationLink('project', 'res1', 'zone')
+
+  get_reservation(link)
+  _get_reservation_cached.cache_clear()
+  get_reservation(link)
+
+  commands_tester.assert_command_run('reservations', 'describe', times=2)
+
+
+@patch('xpk.core.reservation.is_cache_enabled', return_value=False)
+def test_get_reservation_without_cache_ignores_snapshot(
+    _, commands_tester: CommandsTester
+):
+  commands_tester.set_result_for_command(
+      (0, _READY_RESERVATION), 'reservations', 'describe'
+  )
+  link = ReservationLink('project', 'res1', 'zone')
+
+  get_reservation(link)
+  _get_reservation_cached.cache_clear()
+  get_reservation(link)
+
+  commands_tester.assert_command_run('reservations', 'describe', times=2)
+
+
 def test_parse_reservation_sub_block():
   data = {'name': 'sub1', 'count': 10, 'inUseCount': 2}
   parent_link = BlockReservationLink(
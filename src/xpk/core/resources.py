@@ -28,7 +28,8 @@ from .capacity import (
     get_capacity_type,
 )
 from .reservation import RESERVATION_CONFIG_KEY
-from .commands import run_command_for_value, run_commands
+from .commands import run_commands
+from .kube_backend import get_kube_backend
 from .config import XPK_CURRENT_VERSION
 from .system_characteristics import AcceleratorType, get_system_characteristics_by_device_type, SystemCharacteristics
 from enum import Enum
@@ -73,34 +74,13 @@ def get_cluster_configmap(
     key:value pairs stored in cluster ConfigMap.
   """
   config_map_name = get_config_map_name(cluster_name, config_map_type)
-  command = (
-      'kubectl get configmap'
-      f' {config_map_name} -o=custom-columns="ConfigData:data"'
-      ' --no-headers=true'
-  )
-
-  return_code, return_value = run_command_for_value(
-      command,
-      'GKE Cluster Get ConfigMap',
-      dry_run_return_val=_get_dry_run_config_map_value(config_map_type),
+  return_code, config_map = get_kube_backend().get_configmap_data(
+      config_map_name,
+      dry_run_data=_get_dry_run_config_map_value(config_map_type),
   )
   if return_code != 0:
     xpk_print(f'GKE Cluster Get ConfigMap request returned ERROR {return_code}')
     return None
-
-  config_map = {}
-  return_value = return_value.strip()
-
-  if return_value:
-    # Format of ConfigMap: map[key1:value1 key2:value2]
-    return_value = return_value[return_value.index('map') :]
-    configs = return_value[4:-1].split(' ')
-
-    for config in configs:
-      parts = config.strip().split(':')
-      if len(parts) != 2:
-        continue
-      config_map[parts[0]] = parts[1]
   return config_map
 
 
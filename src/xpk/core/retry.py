@@ -0,0 +1,209 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import random
+import re
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
+
+from ..utils.console import xpk_print
+
+
+class ErrorClass(Enum):
+  """Classification of a failed gcloud/kubectl invocation."""
+
+  RATE_LIMITED = 'rate limited'
+  SERVER_ERROR = 'server error'
+  NETWORK_ERROR = 'network error'
+  PERMANENT = 'permanent error'
+  UNKNOWN = 'unknown error'
+
+
+# Order matters: the first matching class wins. Stockouts and resource quotas
+# share the RESOURCE_EXHAUSTED status with API rate limiting, so they are
+# recognized before the rate limit patterns.
+_ERROR_PATTERNS: list[tuple[ErrorClass, re.Pattern]] = [
+    (
+        ErrorClass.PERMANENT,
+        re.compile(
+            r'lack of capacity|GCE_STOCKOUT|ZONE_RESOURCE_POOL_EXHAUSTED'
+            r'|Requested resource is exhausted|QUOTA_EXCEEDED|quotaExceeded'
+            r"|Quota '[^']+' exceeded",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        ErrorClass.RATE_LIMITED,
+        re.compile(
+            r'\b429\b|RESOURCE_EXHAUSTED|Too Many Requests|rateLimitExceeded'
+            r'|RATE_LIMIT_EXCEEDED|Quota exceeded for quota metric'
+            r'|per minute|per user per',
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        ErrorClass.NETWORK_ERROR,
+        re.compile(
+            r'Temporary failure in name resolution|Could not resolve host'
+            r'|no such host|getaddrinfo|Name or service not known'
+            r'|Connection reset|Connection refused|Connection aborted'
+            r'|TLS handshake timeout|i/o timeout|timed out',
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        ErrorClass.SERVER_ERROR,
+        re.compile(
+            r'\b50[0234]\b|Internal Server Error|Internal error|Bad Gateway'
+            r'|Service Unavailable|Gateway Timeout|UNAVAILABLE'
+            r'|DEADLINE_EXCEEDED|incompatible operation'
+            r'|operation .* is currently'
+        ),
+    ),
+    (
+        ErrorClass.PERMANENT,
+        re.compile(
+            r'PERMISSION_DENIED|\b403\b|NOT_FOUND|\b404\b|was not found'
+            r'|ALREADY_EXISTS|already exists|INVALID_ARGUMENT|\b400\b'
+            r'|unrecognized arguments|Invalid value|UNAUTHENTICATED'
+            r'|does not have permission|Forbidden'
+        ),
+    ),
+]
+
+
+def classify_error(output: str | None) -> ErrorClass:
+  """Classifies a failed command based on its captured output.
+
+  Args:
+    output: stdout and stderr of the failed command, if it was captured.
+
+  Returns:
+    The first ErrorClass whose pattern matches the output.
+  """
+  if not output:
+    return ErrorClass.UNKNOWN
+  for error_class, pattern in _ERROR_PATTERNS:
+    if pattern.search(output):
+      return error_class
+  return ErrorClass.UNKNOWN
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+  """Exponential backoff with jitter, bounded by attempts and a deadline.
+
+  Attributes:
+    max_attempts: total number of attempts, including the first one.
+    initial_backoff_seconds: base delay after the first failed attempt.
+    max_backoff_seconds: upper bound of a single delay.
+    backoff_multiplier: growth of the base delay per attempt.
+    rate_limit_backoff_multiplier: extra factor applied to rate limited
+        errors, which need to back off harder than transient failures.
+    deadline_seconds: total time budget for all attempts and delays.
+    retry_unknown_errors: whether errors that cannot be classified are
+        retried. Should be False for commands that are not idempotent.
+  """
+
+  max_attempts: int = 5
+  initial_backoff_seconds: float = 2.0
+  max_backoff_seconds: float = 60.0
+  backoff_multiplier: float = 2.0
+  rate_limit_backoff_multiplier: float = 4.0
+  deadline_seconds: float = 600.0
+  retry_unknown_errors: bool = True
+
+  def is_retryable(self, error_class: ErrorClass) -> bool:
+    if error_class == ErrorClass.PERMANENT:
+      return False
+    if error_class == ErrorClass.UNKNOWN:
+      return self.retry_unknown_errors
+    return True
+
+  def backoff_seconds(self, attempt: int, error_class: ErrorClass) -> float:
+    """Returns a jittered delay to wait after the given failed attempt.
+
+    Args:
+      attempt: number of the attempt that failed, starting from 1.
+      error_class: classification of the failure.
+
+    Returns:
+      Delay in seconds, drawn uniformly from the upper half of the capped
+      exponential backoff so concurrent callers spread out.
+    """
+    backoff = self.initial_backoff_seconds * (
+        self.backoff_multiplier ** (attempt - 1)
+    )
+    if error_class == ErrorClass.RATE_LIMITED:
+      backoff *= self.rate_limit_backoff_multiplier
+    backoff = min(backoff, self.max_backoff_seconds)
+    return random.uniform(backoff / 2, backoff)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# Used for fanned out mutations such as nodepool creation, where retrying an
+# unrecognized failure could repeat a partially applied operation.
+TRANSIENT_ERRORS_RETRY_POLICY = RetryPolicy(retry_unknown_errors=False)
+
+
+def run_with_retry(
+    run_attempt: Callable[[], tuple[int, str | None]],
+    task: str,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> tuple[int, str | None]:
+  """Runs `run_attempt` until it succeeds or the policy gives up.
+
+  Args:
+    run_attempt: runs a single attempt and returns its return code and
+        captured output, or None if the output was not captured.
+    task: user-facing name of the task.
+    policy: retry policy to follow.
+
+  Returns:
+    The return code and output of the last attempt.
+  """
+  deadline = time.monotonic() + policy.deadline_seconds
+  attempt = 1
+  while True:
+    return_code, output = run_attempt()
+    if return_code == 0:
+      return return_code, output
+
+    error_class = classify_error(output)
+    if not policy.is_retryable(error_class):
+      xpk_print(f'Task: `{task}` failed with a {error_class.value}, giving up.')
+      return return_code, output
+    if attempt >= policy.max_attempts:
+      xpk_print(f'Task: `{task}` failed after {attempt} attempts.')
+      return return_code, output
+
+    delay = policy.backoff_seconds(attempt, error_class)
+    if time.monotonic() + delay > deadline:
+      xpk_print(
+          f'Task: `{task}` failed with a {error_class.value} and its retry'
+          f' deadline of {policy.deadline_seconds:.0f} seconds is exhausted.'
+      )
+      return return_code, output
+
+    xpk_print(
+        f'Task: `{task}` failed with a {error_class.value}, waiting'
+        f' {delay:.1f} seconds before retrying.'
+    )
+    time.sleep(delay)
+    attempt += 1
@@ -0,0 +1,152 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .retry import ErrorClass, RetryPolicy, classify_error, run_with_retry
+
+
+@pytest.fixture
+def mock_sleep(mocker: MockerFixture) -> MagicMock:
+  return mocker.patch("xpk.core.retry.time.sleep")
+
+
+@pytest.mark.parametrize(
+    "output,expected",
+    [
+        (
+            (
+                "ERROR: (gcloud.container.node-pools.create) ResponseError:"
+                " code=429, message=Too many operations"
+            ),
+            ErrorClass.RATE_LIMITED,
+        ),
+        (
+            (
+                "RESOURCE_EXHAUSTED: Quota exceeded for quota metric 'Read"
+                " requests' and limit 'Read requests per minute'"
+            ),
+            ErrorClass.RATE_LIMITED,
+        ),
+        (
+            (
+                "Quota 'TPUS_PER_TPU_FAMILY' exceeded. Limit: 8.0 in region"
+                " us-central2."
+            ),
+            ErrorClass.PERMANENT,
+        ),
+        (
+            "finished with error: Requested resource is exhausted",
+            ErrorClass.PERMANENT,
+        ),
+        ("HttpError 503 Service Unavailable", ErrorClass.SERVER_ERROR),
+        (
+            (
+                "dial tcp: lookup container.googleapis.com: Temporary failure"
+                " in name resolution"
+            ),
+            ErrorClass.NETWORK_ERROR,
+        ),
+        (
+            (
+                "ERROR: (gcloud.container.clusters.describe) ResponseError:"
+                " code=404, message=Not found: cluster"
+            ),
+            ErrorClass.PERMANENT,
+        ),
+        ("Node pool np-0 already exists", ErrorClass.PERMANENT),
+        ("something odd happened", ErrorClass.UNKNOWN),
+        (None, ErrorClass.UNKNOWN),
+    ],
+)
+def test_classify_error(output: str | None, expected: ErrorClass):
+  assert classify_error(output) == expected
+
+
+def test_backoff_grows_exponentially_and_is_capped():
+  policy = RetryPolicy(
+      initial_backoff_seconds=1, backoff_multiplier=2, max_backoff_seconds=5
+  )
+
+  assert 0.5 <= policy.backoff_seconds(1, ErrorClass.SERVER_ERROR) <= 1
+  assert 2 <= policy.backoff_seconds(3, ErrorClass.SERVER_ERROR) <= 4
+  assert 2.5 <= policy.backoff_seconds(10, ErrorClass.SERVER_ERROR) <= 5
+
+
+def test_backoff_is_longer_for_rate_limited_errors():
+  policy = RetryPolicy(
+      initial_backoff_seconds=1, rate_limit_backoff_multiplier=4
+  )
+
+  assert 2 <= policy.backoff_seconds(1, ErrorClass.RATE_LIMITED) <= 4
+
+
+def test_run_with_retry_retries_transient_errors(mock_sleep: MagicMock):
+  results = [(1, "code=503"), (1, "code=429"), (0, "done")]
+
+  result = run_with_retry(lambda: results.pop(0), "task")
+
+  assert result == (0, "done")
+  assert mock_sleep.call_count == 2
+
+
+def test_run_with_retry_fails_fast_on_permanent_errors(
+    mock_sleep: MagicMock,
+):
+  run_attempt = MagicMock(return_value=(1, "PERMISSION_DENIED"))
+
+  result = run_with_retry(run_attempt, "task")
+
+  assert result == (1, "PERMISSION_DENIED")
+  run_attempt.assert_called_once()
+  mock_sleep.assert_not_called()
+
+
+def test_run_with_retry_stops_after_max_attempts(mock_sleep: MagicMock):
+  run_attempt = MagicMock(return_value=(1, None))
+
+  result = run_with_retry(run_attempt, "task", RetryPolicy(max_attempts=3))
+
+  assert result == (1, None)
+  assert run_attempt.call_count == 3
+  assert mock_sleep.call_count == 2
+
+
+def test_run_with_retry_does_not_retry_unknown_errors_if_disabled(
+    mock_sleep: MagicMock,
+):
+  run_attempt = MagicMock(return_value=(1, "something odd happened"))
+
+  run_with_retry(run_attempt, "task", RetryPolicy(retry_unknown_errors=False))
+
+  run_attempt.assert_called_once()
+  mock_sleep.assert_not_called()
+
+
+def test_run_with_retry_respects_deadline(mock_sleep: MagicMock):
+  run_attempt = MagicMock(return_value=(1, "code=503"))
+
+  run_with_retry(
+      run_attempt,
+      "task",
+      RetryPolicy(initial_backoff_seconds=10, deadline_seconds=1),
+  )
+
+  run_attempt.assert_called_once()
+  mock_sleep.assert_not_called()
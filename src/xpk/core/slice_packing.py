@@ -0,0 +1,153 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Hashable, Sequence, TypeVar
+
+from tabulate import tabulate
+
+from .capacity import ReservationCapacity
+from .reservation import (
+    BlockReservationLink,
+    ReservationLink,
+    to_reservation_path,
+)
+
+_T = TypeVar('_T')
+
+
+@dataclass(frozen=True, order=True)
+class PackingScore:
+  """Spread of an assignment, lower is better and blocks weigh the most.
+
+  A link that does not name a block counts as its own block, and a link that
+  does not name a sub-block counts as its own sub-block.
+  """
+
+  blocks: int
+  sub_blocks: int
+
+
+def _block_key(link: ReservationLink) -> Hashable:
+  if isinstance(link, BlockReservationLink):
+    return (link.project, link.zone, link.name, link.block_name)
+  return link
+
+
+def score_assignment(assignment: Sequence[ReservationLink]) -> PackingScore:
+  """Scores how many blocks and sub-blocks the slices of an assignment use."""
+  return PackingScore(
+      blocks=len({_block_key(link) for link in assignment}),
+      sub_blocks=len(set(assignment)),
+  )
+
+
+def _take_fewest(
+    items: Sequence[tuple[_T, int]],
+    needed: int,
+    spread: Callable[[_T, int], int] = lambda item, taken: 0,
+) -> list[tuple[_T, int]]:
+  """Picks the fewest items whose capacities add up to `needed`.
+
+  The largest items are taken whole, and the rest goes to the smallest item
+  that still holds it, keeping the larger ones free for later requests.
+
+  Args:
+    items: items with their capacities, ties are broken by this order.
+    needed: total capacity to take, at most the sum of the capacities.
+    spread: number of sub-blocks used to take a capacity from an item,
+        breaks ties between items of equal capacity.
+
+  Returns:
+    The picked items with the capacity taken from each of them.
+  """
+  ranked = sorted(items, key=lambda c: (-c[1], spread(c[0], c[1])))
+  taken: list[tuple[_T, int]] = []
+  remaining = needed
+  i = 0
+  while remaining > 0 and ranked[i][1] < remaining:
+    taken.append(ranked[i])
+    remaining -= ranked[i][1]
+    i += 1
+  if remaining > 0:
+    # `ranked` is sorted, so the items holding the rest follow each other.
+    fitting = [c for c in ranked[i:] if c[1] >= remaining]
+    tightest = min(fitting, key=lambda c: (c[1], spread(c[0], remaining)))
+    taken.append((tightest[0], remaining))
+  return taken
+
+
+def plan_slice_packing(
+    capacities: Sequence[ReservationCapacity], num_slices: int
+) -> list[ReservationLink] | None:
+  """Assigns slices to reservations, packing them into few blocks.
+
+  Slices are first spread over the fewest blocks and then, within each
+  block, over the fewest sub-blocks, so that they share ICI and DCN locality
+  and leave the other blocks unfragmented. No link gets more slices than its
+  `available_slices`.
+
+  Args:
+    capacities: available capacity, as returned by `assess_available_slices`.
+    num_slices: number of slices to place.
+
+  Returns:
+    The reservation link of each slice, grouped by link, or None if the
+    capacities cannot hold `num_slices` slices.
+  """
+  blocks: dict[Hashable, list[tuple[ReservationLink, int]]] = {}
+  for capacity in capacities:
+    if capacity.available_slices > 0:
+      blocks.setdefault(_block_key(capacity.reservation), []).append(
+          (capacity.reservation, capacity.available_slices)
+      )
+
+  block_totals = [
+      (key, sum(available for _, available in links))
+      for key, links in blocks.items()
+  ]
+  if sum(total for _, total in block_totals) < num_slices:
+    return None
+
+  def sub_blocks_used(key: Hashable, slices: int) -> int:
+    return len(_take_fewest(blocks[key], slices))
+
+  assignment: list[ReservationLink] = []
+  for key, block_slices in _take_fewest(
+      block_totals, num_slices, sub_blocks_used
+  ):
+    for link, slices in _take_fewest(blocks[key], block_slices):
+      assignment.extend([link] * slices)
+  return assignment
+
+
+def format_packing_plan(
+    assignment: Sequence[ReservationLink], cluster_project: str
+) -> str:
+  """Renders the number of slices assigned to each reservation link."""
+  slices: dict[ReservationLink, int] = {}
+  for link in assignment:
+    slices[link] = slices.get(link, 0) + 1
+  score = score_assignment(assignment)
+  table = [['RESERVATION', 'SLICES']] + [
+      [to_reservation_path(link, cluster_project), count]
+      for link, count in slices.items()
+  ]
+  return (
+      f'{tabulate(table, headers="firstrow", tablefmt="plain")}\n'
+      f'{len(assignment)} slices in {score.blocks} blocks and'
+      f' {score.sub_blocks} sub-blocks.'
+  )
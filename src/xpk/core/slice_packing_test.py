@@ -0,0 +1,206 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import random
+import time
+from collections import Counter
+
+import pytest
+
+from .capacity import ReservationCapacity
+from .reservation import (
+    BlockReservationLink,
+    ReservationLink,
+    SubBlockReservationLink,
+)
+from .slice_packing import (
+    PackingScore,
+    format_packing_plan,
+    plan_slice_packing,
+    score_assignment,
+)
+
+
+def _sub_block(block: str, sub_block: str) -> SubBlockReservationLink:
+  return SubBlockReservationLink(
+      project='project',
+      name='res',
+      zone='zone',
+      block_name=block,
+      sub_block_name=sub_block,
+  )
+
+
+def _capacity(block: str, sub_block: str, slices: int) -> ReservationCapacity:
+  return ReservationCapacity(_sub_block(block, sub_block), slices)
+
+
+def test_score_assignment_counts_blocks_and_sub_blocks():
+  assignment = [
+      _sub_block('b1', 's1'),
+      _sub_block('b1', 's1'),
+      _sub_block('b1', 's2'),
+      _sub_block('b2', 's1'),
+      ReservationLink(project='project', name='other', zone='zone'),
+  ]
+
+  assert score_assignment(assignment) == PackingScore(blocks=3, sub_blocks=4)
+
+
+def test_packing_score_orders_blocks_first():
+  assert PackingScore(blocks=1, sub_blocks=5) < PackingScore(
+      blocks=2, sub_blocks=2
+  )
+
+
+def test_plan_fits_all_slices_in_one_block_when_possible():
+  capacities = [
+      _capacity('b1', 's1', 2),
+      _capacity('b2', 's1', 2),
+      _capacity('b2', 's2', 2),
+      _capacity('b3', 's1', 1),
+  ]
+
+  assignment = plan_slice_packing(capacities, 4)
+
+  assert assignment is not None
+  assert Counter(assignment) == {
+      _sub_block('b2', 's1'): 2,
+      _sub_block('b2', 's2'): 2,
+  }
+
+
+def test_plan_uses_tightest_sub_block_for_the_rest():
+  capacities = [
+      _capacity('b1', 's1', 4),
+      _capacity('b1', 's2', 1),
+      _capacity('b1', 's3', 2),
+  ]
+
+  assignment = plan_slice_packing(capacities, 5)
+
+  assert assignment is not None
+  assert Counter(assignment) == {
+      _sub_block('b1', 's1'): 4,
+      _sub_block('b1', 's2'): 1,
+  }
+
+
+def test_plan_prefers_block_that_keeps_larger_blocks_free():
+  capacities = [_capacity('b1', 's1', 8), _capacity('b2', 's1', 3)]
+
+  assignment = plan_slice_packing(capacities, 2)
+
+  assert assignment == [_sub_block('b2', 's1')] * 2
+
+
+def test_plan_spreads_over_fewest_blocks():
+  capacities = [
+      _capacity('b1', 's1', 1),
+      _capacity('b1', 's2', 1),
+      _capacity('b2', 's1', 3),
+      _capacity('b3', 's1', 2),
+  ]
+
+  assignment = plan_slice_packing(capacities, 5)
+
+  assert assignment is not None
+  assert score_assignment(assignment) == PackingScore(blocks=2, sub_blocks=2)
+  assert Counter(assignment) == {
+      _sub_block('b2', 's1'): 3,
+      _sub_block('b3', 's1'): 2,
+  }
+
+
+def test_plan_keeps_order_of_equal_candidates():
+  capacities = [_capacity('b1', 's1', 1), _capacity('b2', 's1', 1)]
+
+  assert plan_slice_packing(capacities, 1) == [_sub_block('b1', 's1')]
+
+
+def test_plan_treats_reservations_without_blocks_as_blocks():
+  whole = ReservationLink(project='project', name='whole', zone='zone')
+  block = BlockReservationLink(
+      project='project', name='res', zone='zone', block_name='b1'
+  )
+
+  assignment = plan_slice_packing(
+      [ReservationCapacity(whole, 3), ReservationCapacity(block, 2)], 4
+  )
+
+  assert assignment == [whole, whole, whole, block]
+
+
+def test_plan_returns_none_without_enough_capacity():
+  capacities = [_capacity('b1', 's1', 1), _capacity('b2', 's1', 0)]
+
+  assert plan_slice_packing(capacities, 2) is None
+
+
+def test_format_packing_plan():
+  assignment = [_sub_block('b1', 's1'), _sub_block('b1', 's1')]
+
+  plan = format_packing_plan(assignment, 'project')
+
+  assert 'res/reservationBlocks/b1/reservationSubBlocks/s1' in plan
+  assert plan.endswith('2 slices in 1 blocks and 1 sub-blocks.')
+
+
+@pytest.mark.parametrize('num_slices', [1, 250, 1500])
+def test_plan_respects_available_slices(num_slices: int):
+  rng = random.Random(num_slices)
+  capacities = [
+      _capacity(f'b{i // 20}', f's{i % 20}', rng.randint(0, 4))
+      for i in range(200)
+  ]
+  available = {c.reservation: c.available_slices for c in capacities}
+
+  assignment = plan_slice_packing(capacities, num_slices)
+
+  if num_slices > sum(available.values()):
+    assert assignment is None
+  else:
+    assert assignment is not None
+    assert len(assignment) == num_slices
+    for link, count in Counter(assignment).items():
+      assert count <= available[link]
+
+
+def test_benchmark_plan_on_1000_sub_blocks():
+  """Compares the planner with filling capacities in the given order."""
+  rng = random.Random(0)
+  capacities = [
+      _capacity(f'b{i // 50}', f's{i % 50}', rng.randint(0, 4))
+      for i in range(1000)
+  ]
+  num_slices = 300
+  iterations = 20
+
+  start = time.perf_counter()
+  for _ in range(iterations):
+    assignment = plan_slice_packing(capacities, num_slices)
+  seconds = (time.perf_counter() - start) / iterations
+
+  in_order = [
+      c.reservation for c in capacities for _ in range(c.available_slices)
+  ][:num_slices]
+  assert assignment is not None
+  planned, greedy = score_assignment(assignment), score_assignment(in_order)
+  assert planned <= greedy
+  print(
+      f'plan_slice_packing: {seconds * 1000:.2f} ms for 1000 sub-blocks,'
+      f' {planned} vs {greedy} in order'
+  )
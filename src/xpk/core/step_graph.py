@@ -0,0 +1,236 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from tabulate import tabulate
+
+from ..utils.console import xpk_print
+from ..utils.execution_context import is_dry_run
+from .step_journal import StepJournal
+
+# Maximum number of steps running at the same time.
+STEP_CONCURRENCY = 8
+
+
+@dataclass(frozen=True)
+class Step:
+  """A unit of work of a step graph.
+
+  Attributes:
+    name: unique name of the step, used in logs and by `depends_on`.
+    run: runs the step and returns its return code.
+    depends_on: names of the steps that must succeed before this one starts.
+    exclusive: steps sharing this key never run at the same time, for example
+        because the server rejects concurrent operations on the same resource.
+    resumable: whether a journaled step is skipped when a previous run
+        completed it. Steps that set up local state, like credentials, are
+        not resumable.
+    save: returns the JSON serializable outputs of the step to journal.
+    restore: restores the journaled outputs of a skipped step.
+  """
+
+  name: str
+  run: Callable[[], int]
+  depends_on: tuple[str, ...] = ()
+  exclusive: str | None = None
+  resumable: bool = True
+  save: Callable[[], Any] | None = None
+  restore: Callable[[Any], None] | None = None
+
+
+@dataclass(frozen=True)
+class StepResult:
+  """Outcome of a step, `return_code` is None if the step did not run."""
+
+  name: str
+  return_code: int | None
+  seconds: float
+  resumed: bool = False
+
+
+def _check_step_graph(steps: Sequence[Step]) -> None:
+  """Raises ValueError if the names or dependencies of steps are invalid."""
+  names = [step.name for step in steps]
+  if len(set(names)) != len(names):
+    raise ValueError(f'Step names are not unique: {names}')
+  # Steps are only allowed to depend on the steps declared before them, which
+  # keeps the graph acyclic and the declaration order a valid sequential run.
+  declared: set[str] = set()
+  for step in steps:
+    for dependency in step.depends_on:
+      if dependency not in declared:
+        raise ValueError(
+            f'Step {step.name} depends on {dependency}, which is not declared'
+            ' before it.'
+        )
+    declared.add(step.name)
+
+
+def run_step_graph(
+    steps: Sequence[Step],
+    max_concurrency: int = STEP_CONCURRENCY,
+    journal: StepJournal | None = None,
+) -> tuple[int, list[StepResult]]:
+  """Runs steps as soon as the steps they depend on succeeded.
+
+  Ready steps start in declaration order. After a step fails, no new step
+  starts, the running ones are waited for and the first failure is returned.
+  Exceptions raised by a step, including `SystemExit` from `xpk_exit`, are
+  re-raised once the running steps finished. Steps run one at a time in
+  declaration order in dry run mode, so that its output is deterministic.
+
+  With a journal, completed steps are recorded and a resumable step that a
+  previous run completed with the same inputs is skipped, unless one of the
+  steps it depends on ran again. The journal is cleared once every step
+  succeeded, so that the next run starts from scratch.
+
+  Args:
+    steps: steps to run, each declared after the steps it depends on.
+    max_concurrency: maximum number of steps running at the same time.
+    journal: journal of a previous run to resume, if any.
+
+  Returns:
+    Return code of the first failed step, 0 if all succeeded, and the result
+    of every step in declaration order.
+  """
+  _check_step_graph(steps)
+  if is_dry_run():
+    max_concurrency = 1
+
+  pending = list(steps)
+  running: dict[Future, tuple[Step, float]] = {}
+  results: dict[str, StepResult] = {}
+  return_code = 0
+  error: BaseException | None = None
+  inputs: dict[str, str] = {}
+  if journal is not None:
+    for declared in steps:
+      inputs[declared.name] = journal.step_inputs(
+          declared.name,
+          [inputs[dependency] for dependency in declared.depends_on],
+      )
+  # Steps that ran in this run, rather than being resumed from the journal.
+  ran: set[str] = set()
+
+  def resume(step: Step) -> bool:
+    """Skips the step if the journal shows that it is already done."""
+    if (
+        journal is None
+        or not step.resumable
+        or any(dependency in ran for dependency in step.depends_on)
+    ):
+      return False
+    completed, outputs = journal.completed(step.name, inputs[step.name])
+    if not completed:
+      return False
+    if step.restore is not None:
+      step.restore(outputs)
+    results[step.name] = StepResult(step.name, 0, 0.0, resumed=True)
+    xpk_print(f'Step `{step.name}` was completed by a previous run, skipping.')
+    return True
+
+  def is_ready(step: Step) -> bool:
+    if any(
+        dependency not in results or results[dependency].return_code != 0
+        for dependency in step.depends_on
+    ):
+      return False
+    return step.exclusive is None or all(
+        running_step.exclusive != step.exclusive
+        for running_step, _ in running.values()
+    )
+
+  with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+    while True:
+      while (
+          return_code == 0 and error is None and len(running) < max_concurrency
+      ):
+        step = next((step for step in pending if is_ready(step)), None)
+        if step is None:
+          break
+        pending.remove(step)
+        if resume(step):
+          continue
+        xpk_print(f'Step `{step.name}` started.')
+        running[pool.submit(step.run)] = step, time.perf_counter()
+      if not running:
+        break
+
+      done, _ = wait(running, return_when=FIRST_COMPLETED)
+      for future in done:
+        step, started = running.pop(future)
+        seconds = time.perf_counter() - started
+        # Durations are left out of dry runs, whose output is compared.
+        took = '' if is_dry_run() else f' after {seconds:.1f}s'
+        step_error = future.exception()
+        step_code = 1 if step_error is not None else future.result()
+        results[step.name] = StepResult(step.name, step_code, seconds)
+        if step_error is not None:
+          xpk_print(f'Step `{step.name}` failed{took}.')
+          error = error or step_error
+        elif step_code != 0:
+          xpk_print(f'Step `{step.name}` failed with code {step_code}{took}.')
+          return_code = return_code or step_code
+        else:
+          xpk_print(f'Step `{step.name}` finished{took}.')
+          if journal is not None and step.resumable:
+            journal.record(
+                step.name,
+                inputs[step.name],
+                step.save() if step.save is not None else None,
+            )
+        if step.resumable or any(
+            dependency in ran for dependency in step.depends_on
+        ):
+          ran.add(step.name)
+
+  ordered = [
+      results.get(step.name, StepResult(step.name, None, 0.0)) for step in steps
+  ]
+  if error is not None:
+    raise error
+  if journal is not None and return_code == 0:
+    journal.clear()
+  return return_code, ordered
+
+
+def _format_status(result: StepResult) -> str:
+  if result.return_code is None:
+    return 'skipped'
+  if result.resumed:
+    return 'resumed'
+  return 'ok' if result.return_code == 0 else 'failed'
+
+
+def format_step_results(results: Sequence[StepResult]) -> str:
+  """Renders the status and duration of each step."""
+  table = [['STEP', 'STATUS', 'SECONDS']] + [
+      [
+          result.name,
+          _format_status(result),
+          f'{result.seconds:.1f}',
+      ]
+      for result in results
+  ]
+  return str(
+      tabulate(
+          table, headers='firstrow', tablefmt='plain', disable_numparse=True
+      )
+  )
@@ -0,0 +1,231 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .step_graph import (
+    Step,
+    StepResult,
+    format_step_results,
+    run_step_graph,
+)
+from .step_journal import StepJournal
+
+
+@pytest.fixture(autouse=True)
+def dry_run(mocker: MockerFixture):
+  return mocker.patch('xpk.core.step_graph.is_dry_run', return_value=False)
+
+
+def _recorder(log: list[str], name: str, return_code: int = 0):
+  def run() -> int:
+    log.append(name)
+    return return_code
+
+  return run
+
+
+def test_runs_independent_steps_concurrently():
+  barrier = threading.Barrier(2, timeout=5)
+
+  def wait_for_other() -> int:
+    barrier.wait()
+    return 0
+
+  return_code, results = run_step_graph(
+      [Step('a', wait_for_other), Step('b', wait_for_other)]
+  )
+
+  assert return_code == 0
+  assert [r.return_code for r in results] == [0, 0]
+
+
+def test_runs_steps_after_their_dependencies():
+  log: list[str] = []
+  b_started = threading.Event()
+
+  def slow_a() -> int:
+    assert b_started.wait(5)
+    log.append('a')
+    return 0
+
+  def b() -> int:
+    b_started.set()
+    log.append('b')
+    return 0
+
+  return_code, _ = run_step_graph([
+      Step('a', slow_a),
+      Step('b', b),
+      Step('c', _recorder(log, 'c'), depends_on=('a', 'b')),
+  ])
+
+  assert return_code == 0
+  assert log == ['b', 'a', 'c']
+
+
+def test_exclusive_steps_do_not_overlap():
+  active = 0
+  overlaps = 0
+  lock = threading.Lock()
+
+  def exclusive() -> int:
+    nonlocal active, overlaps
+    with lock:
+      active += 1
+      overlaps += active > 1
+    threading.Event().wait(0.01)
+    with lock:
+      active -= 1
+    return 0
+
+  return_code, _ = run_step_graph(
+      [Step(f's{i}', exclusive, exclusive='gke') for i in range(4)]
+  )
+
+  assert return_code == 0
+  assert overlaps == 0
+
+
+def test_failure_stops_new_steps_and_returns_its_code():
+  log: list[str] = []
+
+  return_code, results = run_step_graph(
+      [
+          Step('a', _recorder(log, 'a', return_code=3)),
+          Step('b', _recorder(log, 'b')),
+          Step('c', _recorder(log, 'c'), depends_on=('a',)),
+      ],
+      max_concurrency=1,
+  )
+
+  assert return_code == 3
+  assert log == ['a']
+  assert results[0].return_code == 3
+  assert results[1] == StepResult('b', None, 0.0)
+  assert results[2] == StepResult('c', None, 0.0)
+
+
+def test_exception_is_raised_after_running_steps_finish():
+  finished = threading.Event()
+
+  def slow() -> int:
+    finished.wait(0.05)
+    finished.set()
+    return 0
+
+  def fail() -> int:
+    raise SystemExit(2)
+
+  with pytest.raises(SystemExit) as exit_info:
+    run_step_graph([Step('slow', slow), Step('fail', fail)])
+
+  assert exit_info.value.code == 2
+  assert finished.is_set()
+
+
+def test_dry_run_runs_steps_in_declaration_order(dry_run):
+  dry_run.return_value = True
+  log: list[str] = []
+
+  run_step_graph([
+      Step('a', _recorder(log, 'a')),
+      Step('b', _recorder(log, 'b'), depends_on=('a',)),
+      Step('c', _recorder(log, 'c')),
+  ])
+
+  assert log == ['a', 'b', 'c']
+
+
+@pytest.mark.parametrize(
+    'steps',
+    [
+        [Step('a', lambda: 0), Step('a', lambda: 0)],
+        [Step('a', lambda: 0, depends_on=('b',)), Step('b', lambda: 0)],
+        [Step('a', lambda: 0, depends_on=('missing',))],
+    ],
+)
+def test_rejects_invalid_graphs(steps: list[Step]):
+  with pytest.raises(ValueError):
+    run_step_graph(steps)
+
+
+def test_format_step_results():
+  table = format_step_results([
+      StepResult('cluster', 0, 61.25),
+      StepResult('node-pools', 1, 2.0),
+      StepResult('kueue', None, 0.0),
+      StepResult('coredns', 0, 0.0, resumed=True),
+  ])
+
+  lines = [line.split() for line in table.splitlines()]
+  assert lines == [
+      ['STEP', 'STATUS', 'SECONDS'],
+      ['cluster', 'ok', '61.2'],
+      ['node-pools', 'failed', '2.0'],
+      ['kueue', 'skipped', '0.0'],
+      ['coredns', 'resumed', '0.0'],
+  ]
+
+
+def test_resumes_steps_completed_by_previous_run(tmp_path: Path):
+  log: list[str] = []
+  restored: list[Any] = []
+  steps = [
+      Step('a', _recorder(log, 'a'), save=lambda: {'id': 1}),
+      Step(
+          'b', _recorder(log, 'b'), depends_on=('a',), restore=restored.append
+      ),
+      Step('c', _recorder(log, 'c', return_code=2), depends_on=('b',)),
+  ]
+  run_step_graph(steps, journal=StepJournal(tmp_path / 'j.json', {}))
+  steps[0] = Step('a', _recorder(log, 'a'), restore=restored.append)
+  steps[2] = Step('c', _recorder(log, 'c'), depends_on=('b',))
+
+  return_code, results = run_step_graph(
+      steps, journal=StepJournal(tmp_path / 'j.json', {})
+  )
+
+  assert return_code == 0
+  assert log == ['a', 'b', 'c', 'c']
+  assert restored == [{'id': 1}, None]
+  assert [r.resumed for r in results] == [True, True, False]
+  assert not (tmp_path / 'j.json').exists()
+
+
+def test_reruns_dependents_of_steps_that_ran_again(tmp_path: Path):
+  log: list[str] = []
+  journal = StepJournal(tmp_path / 'j.json', {})
+  steps = [
+      Step('credentials', _recorder(log, 'credentials'), resumable=False),
+      Step('a', _recorder(log, 'a')),
+      Step('b', _recorder(log, 'b'), depends_on=('credentials', 'a')),
+      Step('c', _recorder(log, 'c', return_code=1), depends_on=('b',)),
+  ]
+  run_step_graph(steps, max_concurrency=1, journal=journal)
+  journal.record('a', 'stale')
+  log.clear()
+
+  run_step_graph(
+      steps, max_concurrency=1, journal=StepJournal(tmp_path / 'j.json', {})
+  )
+
+  assert log == ['credentials', 'a', 'b', 'c']
@@ -0,0 +1,129 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import contextlib
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Sequence
+
+from ..utils.cache import get_cache_dir, read_json_file, write_json_file
+from ..utils.execution_context import is_cache_enabled, is_dry_run
+from .config import __version__ as xpk_version
+
+# Completed steps older than this are run again, the resources they created
+# may have been deleted outside of xpk in the meantime.
+STEP_JOURNAL_TTL_SECONDS = 6 * 3600
+
+
+class StepJournal:
+  """Records the steps of a step graph that completed, to resume a rerun.
+
+  The journal is a JSON file in the xpk cache. A step is recorded with the
+  hash of its inputs, derived from the inputs of the whole run and of the
+  steps it depends on, and with the outputs that later steps need. Entries
+  written by another version of xpk, or older than `STEP_JOURNAL_TTL_SECONDS`,
+  are ignored.
+  """
+
+  def __init__(self, path: Path, inputs: Any) -> None:
+    """Loads the journal at `path`.
+
+    Args:
+      path: location of the journal file.
+      inputs: JSON serializable inputs of the run, usually its arguments.
+    """
+    self._path = path
+    self._inputs = json.dumps(inputs, sort_keys=True, default=repr)
+    self._lock = threading.Lock()
+    journal = read_json_file(path)
+    self._steps: dict[str, Any] = {}
+    if isinstance(journal, dict) and journal.get('xpk_version') == xpk_version:
+      self._steps = journal.get('steps') or {}
+
+  def step_inputs(self, name: str, dependency_inputs: Sequence[str]) -> str:
+    """Hashes the inputs of a step, given the ones of its dependencies."""
+    sha256 = hashlib.sha256(f'{self._inputs}\0{name}\0'.encode())
+    for inputs in dependency_inputs:
+      sha256.update(f'{inputs}\0'.encode())
+    return sha256.hexdigest()
+
+  def completed(self, name: str, inputs: str) -> tuple[bool, Any]:
+    """Returns whether the step completed with `inputs`, and its outputs."""
+    with self._lock:
+      entry = self._steps.get(name)
+    if (
+        not isinstance(entry, dict)
+        or entry.get('inputs') != inputs
+        or entry.get('expires_at', 0) <= time.time()
+    ):
+      return False, None
+    return True, entry.get('outputs')
+
+  def record(self, name: str, inputs: str, outputs: Any = None) -> None:
+    """Records that the step completed with `inputs`."""
+    with self._lock:
+      self._steps[name] = {
+          'inputs': inputs,
+          'outputs': outputs,
+          'expires_at': time.time() + STEP_JOURNAL_TTL_SECONDS,
+      }
+      write_json_file(
+          self._path, {'xpk_version': xpk_version, 'steps': self._steps}
+      )
+
+  def clear(self) -> None:
+    """Removes the journal, so that the next run starts from scratch."""
+    with self._lock:
+      self._steps = {}
+      with contextlib.suppress(OSError):
+        self._path.unlink()
+
+
+def get_step_journal(kind: str, key: str, inputs: Any) -> StepJournal | None:
+  """Opens the journal of a command run on a resource.
+
+  Args:
+    kind: kind of command, for example `cluster_create`.
+    key: resource the command runs on, for example the cluster.
+    inputs: JSON serializable inputs of the run.
+
+  Returns:
+    The journal, or None if caching is disabled or in dry run mode.
+  """
+  if not is_cache_enabled() or is_dry_run():
+    return None
+  return StepJournal(_journal_path(kind, key), inputs)
+
+
+def clear_step_journal(kind: str, key: str) -> None:
+  """Removes the journal of a command run on a resource that was deleted.
+
+  Args:
+    kind: kind of command, for example `cluster_create`.
+    key: resource the command runs on, for example the cluster.
+  """
+  if is_dry_run():
+    return
+  with contextlib.suppress(OSError):
+    _journal_path(kind, key).unlink()
+
+
+def _journal_path(kind: str, key: str) -> Path:
+  file_name = hashlib.sha256(key.encode()).hexdigest()[:32]
+  return get_cache_dir() / 'journals' / kind / f'{file_name}.json'
@@ -0,0 +1,140 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .step_journal import (
+    STEP_JOURNAL_TTL_SECONDS,
+    StepJournal,
+    clear_step_journal,
+    get_step_journal,
+)
+
+
+@pytest.fixture
+def journal_path(tmp_path: Path) -> Path:
+  return tmp_path / 'journal.json'
+
+
+def test_records_completed_steps_with_outputs(journal_path: Path):
+  journal = StepJournal(journal_path, {'cluster': 'a'})
+  inputs = journal.step_inputs('create', [])
+  journal.record('create', inputs, {'id': 1})
+
+  reloaded = StepJournal(journal_path, {'cluster': 'a'})
+
+  assert reloaded.completed('create', inputs) == (True, {'id': 1})
+  assert reloaded.completed('other', inputs) == (False, None)
+
+
+def test_step_inputs_depend_on_run_and_dependency_inputs(journal_path: Path):
+  journal = StepJournal(journal_path, {'cluster': 'a'})
+  inputs = journal.step_inputs('install', ['dep'])
+
+  assert inputs == journal.step_inputs('install', ['dep'])
+  assert inputs != journal.step_inputs('install', ['other-dep'])
+  assert inputs != StepJournal(journal_path, {'cluster': 'b'}).step_inputs(
+      'install', ['dep']
+  )
+
+
+def test_ignores_journal_of_other_xpk_version(journal_path: Path):
+  journal_path.write_text(
+      json.dumps({
+          'xpk_version': 'v0.0.0-other',
+          'steps': {'create': {'inputs': 'x', 'outputs': None}},
+      }),
+      encoding='utf-8',
+  )
+
+  assert StepJournal(journal_path, {}).completed('create', 'x') == (
+      False,
+      None,
+  )
+
+
+def test_ignores_expired_steps(journal_path: Path, mocker: MockerFixture):
+  journal = StepJournal(journal_path, {})
+  journal.record('create', 'x')
+  now = time.time()
+
+  mocker.patch(
+      'xpk.core.step_journal.time.time',
+      return_value=now + STEP_JOURNAL_TTL_SECONDS + 1,
+  )
+
+  assert StepJournal(journal_path, {}).completed('create', 'x') == (
+      False,
+      None,
+  )
+
+
+def test_clear_removes_journal(journal_path: Path):
+  journal = StepJournal(journal_path, {})
+  journal.record('create', 'x')
+
+  journal.clear()
+
+  assert not journal_path.exists()
+  assert journal.completed('create', 'x') == (False, None)
+
+
+def test_get_step_journal_keeps_resources_apart(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path))
+  first = get_step_journal('cluster_create', 'p/z/a', {})
+  assert first is not None
+  first.record('create', 'x')
+
+  second = get_step_journal('cluster_create', 'p/z/b', {})
+
+  assert second is not None
+  assert second.completed('create', 'x') == (False, None)
+
+
+@pytest.mark.parametrize('dry_run,use_cache', [(True, True), (False, False)])
+def test_get_step_journal_is_disabled(
+    mocker: MockerFixture, dry_run: bool, use_cache: bool
+):
+  mocker.patch('xpk.core.step_journal.is_dry_run', return_value=dry_run)
+  mocker.patch('xpk.core.step_journal.is_cache_enabled', return_value=use_cache)
+
+  assert get_step_journal('cluster_create', 'p/z/a', {}) is None
+
+
+def test_clear_step_journal_removes_journal_of_resource(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path))
+  deleted = get_step_journal('cluster_create', 'p/z/a', {})
+  other = get_step_journal('cluster_create', 'p/z/b', {})
+  assert deleted is not None and other is not None
+  deleted.record('create', 'x')
+  other.record('create', 'x')
+
+  clear_step_journal('cluster_create', 'p/z/a')
+
+  recreated = get_step_journal('cluster_create', 'p/z/a', {})
+  kept = get_step_journal('cluster_create', 'p/z/b', {})
+  assert recreated is not None and kept is not None
+  assert recreated.completed('create', 'x') == (False, None)
+  assert kept.completed('create', 'x') == (True, None)
@@ -14,9 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 import dataclasses
-from typing import Callable, Literal, Optional
+from functools import cached_property
+from typing import Callable, Literal, NamedTuple, Optional
 
 from ..core.workload_decorators import rdma_decorator, tcpxo_decorator, tcpx_decorator
 from ..utils.topology import get_topology_product
@@ -223,14 +225,78 @@ def generate_tpu_topologies(
   """
   topologies = ['2x2x1', '2x2x2', '2x2x4', '2x4x4']
   MAX = 256
-  for x in range(4, MAX + 1, 4):
-    for y in range(x if enforce_nondecreasing else 4, MAX + 1, 4):
-      for z in range(y if enforce_nondecreasing else 4, MAX + 1, 4):
-        if (x // 4) * (y // 4) * (z // 4) <= max_cubes:
-          topologies.append(f'{x}x{y}x{z}')
+  # Each axis is bounded by the cubes the previous axes leave, so that only
+  # topologies within `max_cubes` are visited.
+  for x in range(4, min(MAX, 4 * max_cubes) + 1, 4):
+    y_max = min(MAX, 4 * (max_cubes // (x // 4)))
+    for y in range(x if enforce_nondecreasing else 4, y_max + 1, 4):
+      z_max = min(MAX, 4 * (max_cubes // ((x // 4) * (y // 4))))
+      for z in range(y if enforce_nondecreasing else 4, z_max + 1, 4):
+        topologies.append(f'{x}x{y}x{z}')
   return topologies
 
 
+@dataclass(frozen=True)
+class _TpuGeneration:
+  """The systems of one TPU machine type, one per supported topology.
+
+  Systems are only created when they are looked up, see
+  `get_tpu_system_characteristics_map` for the meaning of the fields.
+  """
+
+  prefix: str
+  tensorcores_per_chip: int
+  gke_accelerator: str
+  machine_type: str
+  supported_topologies: list[str]
+  docker_platform: DockerPlatform
+  supports_accelerator_network_profile: bool
+  pathways_tpu_version: str
+  tpu_type_requires_workload_policy: bool = False
+  default_topologies: set[str] = field(default_factory=set)
+  sub_slicing_topologies: set[str] = field(default_factory=set)
+  super_slicing_topologies: set[str] = field(default_factory=set)
+  parallel_containers: int = 1
+
+  def topologies_by_key(self) -> dict[str, str]:
+    """Maps each user facing name of the generation to its topology."""
+    topologies: dict[str, str] = {}
+    for topology in self.supported_topologies:
+      num_tensorcores = compute_num_tensorcores(
+          self.tensorcores_per_chip, topology
+      )
+      device_type = f'{self.prefix}-{num_tensorcores}'
+      topologies[f'{self.prefix}-{topology}'] = topology
+      if topology in self.default_topologies or device_type not in topologies:
+        topologies[device_type] = topology
+    return topologies
+
+  def system(self, topology: str) -> SystemCharacteristics:
+    vms_per_slice = compute_vms_per_slice(topology)
+    num_tensorcores = compute_num_tensorcores(
+        self.tensorcores_per_chip, topology
+    )
+    return SystemCharacteristics(
+        topology=topology,
+        vms_per_slice=vms_per_slice,
+        gke_accelerator=self.gke_accelerator,
+        gce_machine_type=self.machine_type,
+        chips_per_vm=compute_chips_per_vm(topology),
+        accelerator_type=AcceleratorType.TPU,
+        device_type=f'{self.prefix}-{num_tensorcores}',
+        requires_workload_policy=self.tpu_type_requires_workload_policy
+        and vms_per_slice > 1,
+        supports_sub_slicing=topology in self.sub_slicing_topologies,
+        supports_super_slicing=topology in self.super_slicing_topologies,
+        supports_accelerator_network_profile=(
+            self.supports_accelerator_network_profile
+        ),
+        docker_platform=self.docker_platform,
+        parallel_containers=self.parallel_containers,
+        pathways_tpu_version=self.pathways_tpu_version,
+    )
+
+
 def get_tpu_system_characteristics_map(
     prefix: str,
     tensorcores_per_chip: int,
@@ -246,40 +312,92 @@ def get_tpu_system_characteristics_map(
     super_slicing_topologies: set[str] | None = None,
     parallel_containers: int = 1,
 ) -> dict[str, SystemCharacteristics]:
-  system_characteristics_map = {}
-  default_topologies = default_topologies or set()
-  sub_slicing_topologies = sub_slicing_topologies or set()
-  super_slicing_topologies = super_slicing_topologies or set()
-  for topology in supported_topologies:
-    chips_per_vm = compute_chips_per_vm(topology)
-    vms_per_slice = compute_vms_per_slice(topology)
-    num_tensorcores = compute_num_tensorcores(tensorcores_per_chip, topology)
-    device_type = f'{prefix}-{num_tensorcores}'
-    system = SystemCharacteristics(
-        topology=topology,
-        vms_per_slice=vms_per_slice,
-        gke_accelerator=gke_accelerator,
-        gce_machine_type=machine_type,
-        chips_per_vm=chips_per_vm,
-        accelerator_type=AcceleratorType.TPU,
-        device_type=device_type,
-        requires_workload_policy=tpu_type_requires_workload_policy
-        and vms_per_slice > 1,
-        supports_sub_slicing=topology in sub_slicing_topologies,
-        supports_super_slicing=topology in super_slicing_topologies,
-        supports_accelerator_network_profile=supports_accelerator_network_profile,
-        docker_platform=docker_platform,
-        parallel_containers=parallel_containers,
-        pathways_tpu_version=pathways_tpu_version,
-    )
-    system_characteristics_map[f'{prefix}-{topology}'] = system
-    if (
-        topology in default_topologies
-        or device_type not in system_characteristics_map
-    ):
-      system_characteristics_map[device_type] = system
+  generation = _TpuGeneration(
+      prefix=prefix,
+      tensorcores_per_chip=tensorcores_per_chip,
+      gke_accelerator=gke_accelerator,
+      machine_type=machine_type,
+      supported_topologies=supported_topologies,
+      docker_platform=docker_platform,
+      supports_accelerator_network_profile=supports_accelerator_network_profile,
+      pathways_tpu_version=pathways_tpu_version,
+      tpu_type_requires_workload_policy=tpu_type_requires_workload_policy,
+      default_topologies=default_topologies or set(),
+      sub_slicing_topologies=sub_slicing_topologies or set(),
+      super_slicing_topologies=super_slicing_topologies or set(),
+      parallel_containers=parallel_containers,
+  )
+  systems = {
+      topology: generation.system(topology) for topology in supported_topologies
+  }
+  return {
+      key: systems[topology]
+      for key, topology in generation.topologies_by_key().items()
+  }
+
 
-  return system_characteristics_map
+class _CatalogEntry(NamedTuple):
+  source: int
+  topology: str | None
+  accelerator_type: AcceleratorType
+
+
+class _SystemCharacteristicsCatalog(Mapping[str, SystemCharacteristics]):
+  """User facing names of all systems, materialized on lookup.
+
+  The catalog is made of fixed systems and of TPU generations. Only a compact
+  index of the names, in the order of the sources, is built up front; a
+  system is created the first time one of its names is looked up. When
+  sources share a name, the later one wins as in a dict merge.
+  """
+
+  def __init__(
+      self, sources: list[dict[str, SystemCharacteristics] | _TpuGeneration]
+  ):
+    self._sources = sources
+    self._systems: dict[tuple[int, str | None], SystemCharacteristics] = {}
+
+  @cached_property
+  def _index(self) -> dict[str, _CatalogEntry]:
+    index: dict[str, _CatalogEntry] = {}
+    for i, source in enumerate(self._sources):
+      if isinstance(source, _TpuGeneration):
+        for key, topology in source.topologies_by_key().items():
+          index[key] = _CatalogEntry(i, topology, AcceleratorType.TPU)
+      else:
+        for key, system in source.items():
+          index[key] = _CatalogEntry(i, None, system.accelerator_type)
+    return index
+
+  def __getitem__(self, key: str) -> SystemCharacteristics:
+    entry = self._index[key]
+    source = self._sources[entry.source]
+    if not isinstance(source, _TpuGeneration):
+      return source[key]
+    assert entry.topology is not None
+    cache_key = (entry.source, entry.topology)
+    system = self._systems.get(cache_key)
+    if system is None:
+      system = self._systems[cache_key] = source.system(entry.topology)
+    return system
+
+  def __contains__(self, key: object) -> bool:
+    return key in self._index
+
+  def __iter__(self) -> Iterator[str]:
+    return iter(self._index)
+
+  def __len__(self) -> int:
+    return len(self._index)
+
+  def keys_by_accelerator_type(
+      self, accelerators: list[AcceleratorType]
+  ) -> list[str]:
+    return [
+        key
+        for key, entry in self._index.items()
+        if entry.accelerator_type in accelerators
+    ]
 
 
 def compute_chips_per_vm(topology: str) -> int:
@@ -301,7 +419,7 @@ IF YOU MODIFY THE BELOW UserFacingNameToSystemCharacteristics MAP YOU SHOULD
 ALSO ADD CORRESPONDING MODIFICATIONS TO UserFacingNameToSystemCharacteristics
 IN MaxText/accelerator_to_spec_map.py !!!!! """
 # vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
-UserFacingNameToSystemCharacteristics = {
+_GPU_SYSTEM_CHARACTERISTICS = {
     # GPU system characteristics
     # l4-$CHIPSc
     'l4-1': SystemCharacteristics(
@@ -533,8 +651,10 @@ UserFacingNameToSystemCharacteristics = {
         ),
         docker_platform=AMD_PLATFORM,
     ),
+}
+_TPU_GENERATIONS = [
     # TPU system characteristics
-    **get_tpu_system_characteristics_map(
+    _TpuGeneration(
         prefix='tpu7',
         tensorcores_per_chip=2,
         gke_accelerator='tpu7',
@@ -545,7 +665,7 @@ UserFacingNameToSystemCharacteristics = {
         docker_platform=AMD_PLATFORM,
         pathways_tpu_version='tpu7',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuGeneration(
         prefix='tpu7',
         tensorcores_per_chip=2,
         gke_accelerator='tpu7',
@@ -569,7 +689,7 @@ UserFacingNameToSystemCharacteristics = {
         ]),
         pathways_tpu_version='tpu7',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuGeneration(
         prefix='tpu7x',
         tensorcores_per_chip=2,
         gke_accelerator='tpu7x',
@@ -580,7 +700,7 @@ UserFacingNameToSystemCharacteristics = {
         docker_platform=AMD_PLATFORM,
         pathways_tpu_version='tpu7x',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuGeneration(
         prefix='tpu7x',
         tensorcores_per_chip=2,
         gke_accelerator='tpu7x',
@@ -693,7 +813,7 @@ UserFacingNameToSystemCharacteristics = {
             '8x8x92',
         ]),
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuGeneration(
         prefix='v6e',
         tensorcores_per_chip=1,
         gke_accelerator='tpu-v6e-slice',
@@ -703,7 +823,7 @@ UserFacingNameToSystemCharacteristics = {
         supports_accelerator_network_profile=True,
         pathways_tpu_version='tpuv6e',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuGeneration(
         prefix='v6e',
         tensorcores_per_chip=1,
         gke_accelerator='tpu-v6e-slice',
@@ -714,7 +834,7 @@ UserFacingNameToSystemCharacteristics = {
         supports_accelerator_network_profile=True,
         pathways_tpu_version='tpuv6e',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuGeneration(
         prefix='v5p',
         tensorcores_per_chip=2,
         gke_accelerator='tpu-v5p-slice',
@@ -822,7 +942,7 @@ UserFacingNameToSystemCharacteristics = {
             '16x20x28',
         ]),
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuGeneration(
         prefix='v5litepod',
         tensorcores_per_chip=1,
         gke_accelerator='tpu-v5-lite-podslice',
@@ -832,7 +952,7 @@ UserFacingNameToSystemCharacteristics = {
         supports_accelerator_network_profile=False,
         pathways_tpu_version='tpuv5e',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuGeneration(
         prefix='v4',
         tensorcores_per_chip=2,
         gke_accelerator='tpu-v4-podslice',
@@ -857,6 +977,8 @@ UserFacingNameToSystemCharacteristics = {
             '8x16x16',
         ]),
     ),
+]
+_CPU_SYSTEM_CHARACTERISTICS = {
     # CPU system characteristics.
     # Note that chips_per_vm is actually the number of vCPUs in that CPU.
     # There are no chips in CPUs.
@@ -1162,6 +1284,11 @@ UserFacingNameToSystemCharacteristics = {
         docker_platform=AMD_PLATFORM,
     ),
 }
+UserFacingNameToSystemCharacteristics = _SystemCharacteristicsCatalog([
+    _GPU_SYSTEM_CHARACTERISTICS,
+    *_TPU_GENERATIONS,
+    _CPU_SYSTEM_CHARACTERISTICS,
+])
 """ If you modify UserFacingNameToSystemCharacteristics you should also modify
 the corresponding Map in MaxText/accelerator_to_spec_map.py """
 
@@ -1172,11 +1299,9 @@ def get_system_characteristics_keys_by_accelerator_type(
   """Returns UserFacingNameToSystemCharacteristics keys for given AcceleratorTypes."""
   if accelerators is None:
     accelerators = list(AcceleratorType)
-  return [
-      key
-      for key, value in UserFacingNameToSystemCharacteristics.items()
-      if value.accelerator_type in accelerators
-  ]
+  return UserFacingNameToSystemCharacteristics.keys_by_accelerator_type(
+      accelerators
+  )
 
 
 def create_accelerator_label(system: SystemCharacteristics) -> str:
@@ -14,8 +14,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import subprocess
+import sys
+
 import pytest
 from .system_characteristics import (
+    UserFacingNameToSystemCharacteristics,
+    _SystemCharacteristicsCatalog,
+    _TpuGeneration,
+    get_system_characteristics_keys_by_accelerator_type,
     get_tpu_system_characteristics_map,
     generate_tpu_topologies,
     DockerPlatform,
@@ -212,6 +219,130 @@ def test_generate_tpu_topologies_contains_sub_cube_slices():
   assert one_cube == ["2x2x1", "2x2x2", "2x2x4", "2x4x4", "4x4x4"]
 
 
+@pytest.mark.parametrize(
+    "max_cubes,enforce_nondecreasing",
+    [(1, True), (6, False), (64, False), (144, True)],
+)
+def test_generate_tpu_topologies_matches_exhaustive_search(
+    max_cubes: int, enforce_nondecreasing: bool
+):
+  expected = ["2x2x1", "2x2x2", "2x2x4", "2x4x4"]
+  for x in range(4, 257, 4):
+    for y in range(x if enforce_nondecreasing else 4, 257, 4):
+      for z in range(y if enforce_nondecreasing else 4, 257, 4):
+        if (x // 4) * (y // 4) * (z // 4) <= max_cubes:
+          expected.append(f"{x}x{y}x{z}")
+
+  assert generate_tpu_topologies(max_cubes, enforce_nondecreasing) == expected
+
+
+def _generation(prefix: str, topologies: list[str]) -> _TpuGeneration:
+  return _TpuGeneration(
+      prefix=prefix,
+      tensorcores_per_chip=1,
+      gke_accelerator="test",
+      machine_type="test",
+      supported_topologies=topologies,
+      docker_platform=DockerPlatform.AMD,
+      supports_accelerator_network_profile=False,
+      pathways_tpu_version="test",
+  )
+
+
+def test_catalog_materializes_systems_on_lookup(mocker):
+  system_spy = mocker.spy(_TpuGeneration, "system")
+  generation = _generation("test", ["2x2", "4x4"])
+  catalog = _SystemCharacteristicsCatalog([generation])
+
+  assert list(catalog) == ["test-2x2", "test-4", "test-4x4", "test-16"]
+  assert "test-16" in catalog
+  system_spy.assert_not_called()
+
+  assert catalog["test-4"] is catalog["test-2x2"]
+  assert catalog["test-4"].topology == "2x2"
+  system_spy.assert_called_once_with(generation, "2x2")
+
+
+def test_catalog_later_sources_take_precedence():
+  gpu = SystemCharacteristics(
+      topology="N/A",
+      vms_per_slice=1,
+      gke_accelerator="nvidia-l4",
+      gce_machine_type="g2-standard-12",
+      chips_per_vm=1,
+      accelerator_type=AcceleratorType.GPU,
+      device_type="test-4",
+      supports_sub_slicing=False,
+      supports_super_slicing=False,
+      supports_accelerator_network_profile=False,
+      docker_platform=DockerPlatform.AMD,
+      gpu_config=GpuConfig(requires_topology=False),
+  )
+  catalog = _SystemCharacteristicsCatalog(
+      [{"test-4": gpu}, _generation("test", ["2x2"])]
+  )
+
+  assert list(catalog) == ["test-4", "test-2x2"]
+  assert catalog["test-4"].accelerator_type == AcceleratorType.TPU
+  assert catalog.keys_by_accelerator_type([AcceleratorType.GPU]) == []
+
+
+def test_catalog_matches_eager_tpu_maps():
+  generation = _generation("test", generate_tpu_topologies(max_cubes=2))
+  catalog = _SystemCharacteristicsCatalog([generation])
+
+  assert dict(catalog) == get_tpu_system_characteristics_map(
+      prefix="test",
+      tensorcores_per_chip=1,
+      gke_accelerator="test",
+      machine_type="test",
+      supported_topologies=generate_tpu_topologies(max_cubes=2),
+      docker_platform=DockerPlatform.AMD,
+      supports_accelerator_network_profile=False,
+      pathways_tpu_version="test",
+  )
+
+
+def test_get_system_characteristics_keys_by_accelerator_type():
+  gpu_keys = get_system_characteristics_keys_by_accelerator_type(
+      [AcceleratorType.GPU]
+  )
+
+  assert "l4-1" in gpu_keys
+  assert "v5p-8" not in gpu_keys
+  assert get_system_characteristics_keys_by_accelerator_type() == list(
+      UserFacingNameToSystemCharacteristics
+  )
+
+
+def test_benchmark_system_characteristics_import(tmp_path):
+  """Times a fresh import, the name index and materializing every system."""
+  script = """
+import time
+start = time.perf_counter()
+from xpk.core import system_characteristics as sc
+imported = time.perf_counter()
+sc.get_system_characteristics_keys_by_accelerator_type()
+indexed = time.perf_counter()
+eager = dict(sc.UserFacingNameToSystemCharacteristics)
+materialized = time.perf_counter()
+print(
+    f'import {(imported - start) * 1000:.1f} ms,'
+    f' index {(indexed - imported) * 1000:.1f} ms,'
+    f' all {len(eager)} systems {(materialized - indexed) * 1000:.1f} ms'
+)
+"""
+  result = subprocess.run(
+      [sys.executable, "-c", script],
+      cwd=tmp_path,
+      capture_output=True,
+      text=True,
+      check=True,
+  )
+
+  print(f"system_characteristics: {result.stdout.strip()}")
+
+
 def test_system_characteristics_post_init_sets_workload_policy_for_gpu():
   """Tests that __post_init__ correctly sets requires_workload_policy for GPUs."""
   gpu_system = SystemCharacteristics(
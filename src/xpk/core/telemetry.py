@@ -23,14 +23,19 @@ import sys
 import importlib.resources
 import subprocess
 import tempfile
-import requests
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from dataclasses import dataclass
 from .config import get_config, CLIENT_ID_KEY, SEND_TELEMETRY_KEY, __version__ as xpk_version
 from ..utils.execution_context import is_dry_run
 from ..utils.user_agent import get_user_agent
 from ..utils.feature_flags import FeatureFlags, is_tester
+from ..utils.imports import lazy_import
+
+if TYPE_CHECKING:
+  import requests
+else:
+  requests = lazy_import("requests")
 
 
 def should_send_telemetry():
@@ -16,9 +16,11 @@ limitations under the License.
 
 import re
 import sys
+from typing import Iterator
 from pytest_mock import MockerFixture
 
 from ..commands import FailedCommand
+from ..retry import DEFAULT_RETRY_POLICY, RetryPolicy
 
 
 class CommandsTester:
@@ -41,6 +43,7 @@ class CommandsTester:
         "run_command_with_full_controls": (
             self.__fake_run_command_with_full_controls
         ),
+        "run_command_for_stream": self.__fake_run_command_for_stream,
     }
 
     # Auto-patching: find all xpk modules and patch the command functions if they exist.
@@ -101,7 +104,7 @@ class CommandsTester:
       task: str,
       verbose=True,
       num_retry_attempts=5,
-      wait_seconds=10,
+      retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
   ) -> int:
     return self.__common_fake_run_command(command, (0, ""))[0]
 
@@ -113,6 +116,7 @@ class CommandsTester:
       print_timer=False,
       hide_error=False,
       quiet=False,
+      retry_policy: RetryPolicy | None = None,
   ) -> tuple[int, str]:
     return self.__common_fake_run_command(command, (0, dry_run_return_val))
 
@@ -122,6 +126,9 @@ class CommandsTester:
       jobname: str,
       per_command_name: list[str],
       output_logs: list[str],
+      max_concurrency: int | None = None,
+      priorities: list[int] | None = None,
+      retry_policy: RetryPolicy | None = None,
   ) -> list[FailedCommand]:
     failures = []
     for i, command in enumerate(commands):
@@ -145,6 +152,15 @@ class CommandsTester:
   ) -> int:
     return self.__common_fake_run_command(command, (0, ""))[0]
 
+  def __fake_run_command_for_stream(
+      self,
+      command: str,
+      task: str,
+      timeout_seconds: float | None = None,
+  ) -> Iterator[str]:
+    output = self.__common_fake_run_command(command, (0, ""))[1]
+    return iter(output.splitlines(keepends=True))
+
   # pylint: enable=unused-argument
 
   def __common_fake_run_command(
@@ -15,12 +15,21 @@ limitations under the License.
 """
 
 import json
+import subprocess
+import sys
+import time
 from json.decoder import JSONDecodeError
+from pathlib import Path
+from typing import Any
 from .commands import run_command_for_value
+from ..utils.cache import get_cache_dir, read_json_file, write_json_file
 from ..utils.console import xpk_print
 from ..utils.execution_context import is_dry_run
 from packaging.version import Version
-from .config import __version__
+from .config import __version__, get_config, CHECK_FOR_UPDATES_KEY
+
+# How long the latest xpk version found by a check is reused.
+UPDATE_CHECK_INTERVAL_SECONDS = 24 * 60 * 60
 
 
 def get_latest_xpk_version() -> tuple[int, Version | None]:
@@ -43,15 +52,107 @@ def get_latest_xpk_version() -> tuple[int, Version | None]:
     return 1, None
 
 
+def should_check_for_updates() -> bool:
+  return get_config().get(CHECK_FOR_UPDATES_KEY) != "false"
+
+
+def _latest_version_path() -> Path:
+  return get_cache_dir() / "latest_version.json"
+
+
+def _read_latest_version() -> tuple[float, Version | None]:
+  """Returns when the latest version was last checked and the version found."""
+  cached = read_json_file(_latest_version_path())
+  if not isinstance(cached, dict):
+    return 0.0, None
+  try:
+    checked_at = float(cached.get("checked_at", 0.0))
+    latest = cached.get("latest")
+    return checked_at, None if latest is None else Version(latest)
+  except (TypeError, ValueError):
+    return 0.0, None
+
+
+def _write_latest_version(latest_version: Version | None) -> bool:
+  return write_json_file(
+      _latest_version_path(),
+      {
+          "checked_at": time.time(),
+          "latest": None if latest_version is None else str(latest_version),
+      },
+  )
+
+
+def refresh_latest_version() -> None:
+  """Checks the latest xpk version and caches it for the following runs."""
+  return_code, latest_version = get_latest_xpk_version()
+  if return_code == 0 and latest_version is not None:
+    _write_latest_version(latest_version)
+
+
+def _schedule_latest_version_refresh(
+    cached_version: Version | None,
+) -> bool:
+  """Refreshes the cached latest version in a detached process.
+
+  The check is recorded before it starts, so that concurrent runs do not
+  start another one and an unreachable index is retried only after
+  UPDATE_CHECK_INTERVAL_SECONDS.
+
+  Args:
+    cached_version: latest version found by the previous check, kept until
+        the new check completes.
+
+  Returns:
+    True if the check was started and False otherwise.
+  """
+  if not _write_latest_version(cached_version):
+    return False
+
+  kwargs: dict[str, Any] = {}
+  if sys.platform == "win32":
+    kwargs["creationflags"] = (
+        subprocess.DETACHED_PROCESS | subprocess.CREATE_NO_WINDOW
+    )
+  else:
+    kwargs["start_new_session"] = True
+
+  try:
+    subprocess.Popen(
+        args=[sys.executable, "-m", __name__],
+        # Keeps a local xpk directory from shadowing the installed package.
+        cwd=get_cache_dir(),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs,
+    )
+  except OSError:
+    return False
+  return True
+
+
 def print_xpk_hello() -> None:
+  """Greets the user and reports a newer xpk version found by a past check.
+
+  The latest version is looked up in the background at most once every
+  UPDATE_CHECK_INTERVAL_SECONDS and reported from the next run on, so
+  startup never waits for the package index.
+  """
   current_version = Version(__version__)
   xpk_print(f"Starting xpk v{current_version}", flush=True)
-  return_code, latest_version = get_latest_xpk_version()
-  if return_code != 0 or latest_version is None:
+  if is_dry_run() or not should_check_for_updates():
     return
-  if current_version < latest_version:
+  checked_at, latest_version = _read_latest_version()
+  if time.time() - checked_at >= UPDATE_CHECK_INTERVAL_SECONDS:
+    _schedule_latest_version_refresh(latest_version)
+  if latest_version is not None and current_version < latest_version:
     xpk_print(
         f"XPK version v{current_version} is outdated. Please consider upgrading"
         f" to v{latest_version}",
         flush=True,
     )
+
+
+if __name__ == "__main__":
+  refresh_latest_version()
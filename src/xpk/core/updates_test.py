@@ -14,13 +14,54 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import json
+import time
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
 from ..utils.execution_context import set_dry_run
-from .updates import get_latest_xpk_version, print_xpk_hello
+from .updates import (
+    UPDATE_CHECK_INTERVAL_SECONDS,
+    get_latest_xpk_version,
+    print_xpk_hello,
+    refresh_latest_version,
+)
 from packaging.version import Version
-from .config import __version__
+from .config import __version__, get_config, CHECK_FOR_UPDATES_KEY
 from unittest.mock import MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path))
+  yield tmp_path / 'xpk'
+  set_dry_run(False)
+
+
+@pytest.fixture
+def popen(mocker: MockerFixture) -> MagicMock:
+  return mocker.patch('xpk.core.updates.subprocess.Popen')
+
+
+def _cache_latest_version(
+    cache_home: Path, latest: str | None, age_seconds: float = 0
+) -> None:
+  cache_home.mkdir(parents=True, exist_ok=True)
+  (cache_home / 'latest_version.json').write_text(
+      json.dumps({'checked_at': time.time() - age_seconds, 'latest': latest}),
+      encoding='utf-8',
+  )
+
+
+def _read_cached_latest_version(cache_home: Path) -> dict:
+  cached: dict = json.loads(
+      (cache_home / 'latest_version.json').read_text(encoding='utf-8')
+  )
+  return cached
+
+
 def test_get_latest_xpk_version_returns_current_version_for_dry_run():
   set_dry_run(True)
   return_code, version = get_latest_xpk_version()
@@ -51,30 +92,84 @@ def test_get_latest_xpk_version_returns_version_returned_from_command(
 
 
 @patch('xpk.core.updates.xpk_print')
-@patch('xpk.core.updates.get_latest_xpk_version')
-def test_print_xpk_hello_does_not_print_update_when_version_check_fails(
-    get_latest_xpk_version: MagicMock, xpk_print: MagicMock
+def test_print_xpk_hello_does_not_print_update_when_version_is_unknown(
+    xpk_print: MagicMock, popen: MagicMock
 ):
-  get_latest_xpk_version.return_value = (1, None)
+  set_dry_run(False)
   print_xpk_hello()
   xpk_print.assert_called_once()
+  popen.assert_called_once()
 
 
 @patch('xpk.core.updates.xpk_print')
-@patch('xpk.core.updates.get_latest_xpk_version')
 def test_print_xpk_hello_does_not_print_update_when_xpk_is_up_to_date(
-    get_latest_xpk_version: MagicMock, xpk_print: MagicMock
+    xpk_print: MagicMock, popen: MagicMock, cache_home: Path
 ):
-  get_latest_xpk_version.return_value = (0, Version(__version__))
+  _cache_latest_version(cache_home, __version__)
+  set_dry_run(False)
   print_xpk_hello()
   xpk_print.assert_called_once()
+  popen.assert_not_called()
 
 
 @patch('xpk.core.updates.xpk_print')
-@patch('xpk.core.updates.get_latest_xpk_version')
 def test_print_xpk_hello_prints_update_when_xpk_is_outdated(
-    get_latest_xpk_version: MagicMock, xpk_print: MagicMock
+    xpk_print: MagicMock, popen: MagicMock, cache_home: Path
 ):
-  get_latest_xpk_version.return_value = (0, Version('99.99.99'))
+  _cache_latest_version(cache_home, '99.99.99')
+  set_dry_run(False)
   print_xpk_hello()
   assert xpk_print.call_count == 2
+  popen.assert_not_called()
+
+
+def test_print_xpk_hello_refreshes_stale_version_in_background(
+    popen: MagicMock, cache_home: Path
+):
+  _cache_latest_version(
+      cache_home, '99.99.99', age_seconds=UPDATE_CHECK_INTERVAL_SECONDS + 1
+  )
+  set_dry_run(False)
+
+  print_xpk_hello()
+
+  popen.assert_called_once()
+  assert popen.call_args.kwargs['args'][-1] == 'xpk.core.updates'
+  cached = _read_cached_latest_version(cache_home)
+  assert cached['latest'] == '99.99.99'
+  assert time.time() - cached['checked_at'] < UPDATE_CHECK_INTERVAL_SECONDS
+
+
+def test_print_xpk_hello_skips_check_when_disabled(popen: MagicMock):
+  get_config().set(CHECK_FOR_UPDATES_KEY, 'false')
+  set_dry_run(False)
+  try:
+    print_xpk_hello()
+  finally:
+    get_config().set(CHECK_FOR_UPDATES_KEY, None)
+  popen.assert_not_called()
+
+
+def test_print_xpk_hello_skips_check_for_dry_run(popen: MagicMock):
+  set_dry_run(True)
+  print_xpk_hello()
+  popen.assert_not_called()
+
+
+@patch('xpk.core.updates.get_latest_xpk_version')
+def test_refresh_latest_version_caches_latest_version(
+    get_latest_xpk_version: MagicMock, cache_home: Path
+):
+  get_latest_xpk_version.return_value = (0, Version('1.2.3'))
+  refresh_latest_version()
+  assert _read_cached_latest_version(cache_home)['latest'] == '1.2.3'
+
+
+@patch('xpk.core.updates.get_latest_xpk_version')
+def test_refresh_latest_version_keeps_cache_when_check_fails(
+    get_latest_xpk_version: MagicMock, cache_home: Path
+):
+  _cache_latest_version(cache_home, '1.0.0')
+  get_latest_xpk_version.return_value = (1, None)
+  refresh_latest_version()
+  assert _read_cached_latest_version(cache_home)['latest'] == '1.0.0'
@@ -15,10 +15,9 @@ limitations under the License.
 """
 
 from ..utils.console import xpk_print
+from .config import DEFAULT_VERTEX_TENSORBOARD_NAME
 from .resources import ConfigMapType, get_cluster_configmap
 
-DEFAULT_VERTEX_TENSORBOARD_NAME = 'tb-instance'
-
 
 def create_vertex_tensorboard(args) -> dict:
   """Creates a Tensorboard instance in Vertex AI.
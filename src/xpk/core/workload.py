@@ -17,7 +17,8 @@ limitations under the License.
 import argparse
 import itertools
 import json
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass
 from enum import Enum
 import re
 from typing import Any, Optional, Callable, Union
@@ -25,6 +26,8 @@ from typing import Any, Optional, Callable, Union
 from ..utils.console import xpk_exit, xpk_print
 from .commands import run_command_for_value
 from .gcloud_context import get_cluster_location
+from .jobset_watch import MAX_WAIT_SECONDS, JobSetPhase, watch_jobset_phases
+from .kube_backend import get_kube_backend
 from .kubectl_common import KubernetesCondition, KubernetesStatus, parse_kubernetes_status
 
 _ACCELERATOR_LABELS = frozenset({
@@ -241,34 +244,22 @@ def _fetch_workloads(
     filter_by_status: _StatusFilter,
     filter_by_job: Optional[str] = None,
 ) -> tuple[int, list[_WorkloadListRow]]:
-  """Fetches and parses the raw workload list from the cluster."""
-  command = 'kubectl get workloads --ignore-not-found -o=json'
+  """Fetches the workloads matching the filters from the cluster.
 
+  Workloads are listed page by page and each one is parsed and filtered as
+  soon as it arrives, so only the matching rows are kept in memory.
+  """
   task = f'List Jobs with filter-by-status={filter_by_status.value}'
   if filter_by_job:
     task += f' with filter-by-job={filter_by_job}'
 
-  return_code, data = run_command_for_value(
-      command, task, dry_run_return_val=''
-  )
-
-  if return_code != 0:
-    return return_code, []
-
-  if not data:
-    return 0, []
-
-  try:
-    parsed_data = json.loads(data)
-  except json.JSONDecodeError:
-    xpk_print('Error: Failed to parse JSON output from kubectl.')
-    return 1, []
-
-  data_rows = [
-      _parse_workload_item(item) for item in parsed_data.get('items', [])
-  ]
+  def to_row(item: dict[str, Any]) -> Optional[_WorkloadListRow]:
+    row = _parse_workload_item(item)
+    if not _filter_workload(row, filter_by_status, filter_by_job):
+      return None
+    return row
 
-  return 0, data_rows
+  return get_kube_backend().list_workloads(task, to_row)
 
 
 def _filter_workload(
@@ -323,17 +314,18 @@ def _filter_workload(
       raise RuntimeError(f'Can not find filter type: {filter_by_status}')
 
 
-def _filter_workloads(
-    rows: list[_WorkloadListRow],
-    filter_by_status: _StatusFilter,
-    filter_by_job: Optional[str],
-) -> list[_WorkloadListRow]:
-  """Filters rows based on status and job filters."""
-  return [
-      row
-      for row in rows
-      if _filter_workload(row, filter_by_status, filter_by_job)
-  ]
+def _render_table(headers: list[str], rows: list[list[str]]) -> str:
+  """Formats rows into a string table with left aligned columns."""
+  col_widths = [len(h) for h in headers]
+  for row in rows:
+    for i, val in enumerate(row):
+      col_widths[i] = max(col_widths[i], len(val))
+
+  fmt = '   '.join(f'{{:<{w}}}' for w in col_widths)
+
+  output = [fmt.format(*headers)] + [fmt.format(*row) for row in rows]
+
+  return '\n'.join(output)
 
 
 def _render_workloads(
@@ -355,16 +347,7 @@ def _render_workloads(
         [format_val(col.getter(row_data)) for col in _WORKLOAD_COLUMNS]
     )
 
-  col_widths = [len(h) for h in headers]
-  for row in filtered_rows:
-    for i, val in enumerate(row):
-      col_widths[i] = max(col_widths[i], len(val))
-
-  fmt = '   '.join(f'{{:<{w}}}' for w in col_widths)
-
-  output = [fmt.format(*headers)] + [fmt.format(*row) for row in filtered_rows]
-
-  return '\n'.join(output)
+  return _render_table(headers, filtered_rows)
 
 
 def _get_status_filter(filter_by_status: str) -> _StatusFilter:
@@ -399,12 +382,10 @@ def get_workload_list(args: argparse.Namespace) -> tuple[int, str]:
   filter_by_job = getattr(args, 'filter_by_job', None)
   filter_by_status = _get_status_filter(args.filter_by_status)
 
-  return_code, raw_rows = _fetch_workloads(filter_by_status, filter_by_job)
+  return_code, filtered_rows = _fetch_workloads(filter_by_status, filter_by_job)
   if return_code != 0:
     return return_code, ''
 
-  filtered_rows = _filter_workloads(raw_rows, filter_by_status, filter_by_job)
-
   formatted_output = _render_workloads(filtered_rows)
 
   return 0, formatted_output
@@ -442,111 +423,220 @@ def check_if_workload_exists(args: argparse.Namespace) -> bool:
   return False
 
 
-def _get_jobset_status(workload_name: str) -> tuple[int, str]:
-  """Retrieves the current status of a given jobset workload.
+def _get_wait_timeout(args: argparse.Namespace) -> tuple[float, str]:
+  """Returns the wait timeout in seconds and its user-facing description."""
+  if args.timeout is None:
+    return MAX_WAIT_SECONDS, 'max timeout (1 week)'
+  return args.timeout, f'{args.timeout}s'
 
-  Args:
-    workload_name: The name of the workload to retrieve the status for.
+
+def _get_wait_return_code(phase: JobSetPhase | None) -> int:
+  """Maps the last phase of a waited workload to the wait return code.
 
   Returns:
-    A tuple containing the return code of the command (0 for success) and the status string.
+    0 if completed, 124 if not finished, 125 if failed, 1 if not found or
+    deleted.
   """
-  status_cmd = f'kubectl get jobset {workload_name} -o json'
-  return_code, return_value = run_command_for_value(
-      status_cmd, 'Get jobset status'
-  )
-  if return_code != 0:
-    xpk_print(f'Get workload status request returned ERROR {return_code}')
-    return return_code, 'Unknown'
-
-  try:
-    jobset_json = json.loads(return_value)
-    k8s_status = parse_kubernetes_status(jobset_json.get('status'))
-
-    for condition in k8s_status.conditions:
-      if (
-          condition.type in ('Completed', 'Failed')
-          and condition.status == 'True'
-      ):
-        return 0, condition.type
-
-    latest_condition = _get_latest_condition(k8s_status)
-    final_status = (
-        latest_condition.type if latest_condition else None
-    ) or 'Unknown'
-    return 0, final_status
-  except json.JSONDecodeError:
-    xpk_print('Failed to parse jobset status JSON')
-    return 125, 'Unknown'
+  if phase is None or phase == JobSetPhase.DELETED:
+    return 1
+  if not phase.is_terminal():
+    return 124
+  if phase == JobSetPhase.FAILED:
+    return 125
+  return 0
 
 
 def wait_for_job_completion(args: argparse.Namespace) -> int:
   """Function to wait for job completion.
 
+  The JobSet of the workload is followed through a watch stream, every
+  admission and running transition is reported as it happens and the wait
+  ends on the first terminal condition.
+
   Args:
     args: user provided arguments for running the command.
 
   Returns:
     return_code: 0 if successful, 124 if timeout, 125 if unsuccessful job, 1 otherwise
   """
-  # Check that the workload exists
   args.workload = args.wait_for_job_completion
-  workload_exists = check_if_workload_exists(args)
-  if not workload_exists:
-    xpk_print(f'Workload named {args.workload} does not exist.')
-    return 1
+  timeout_seconds, timeout_msg = _get_wait_timeout(args)
+  xpk_print(
+      f'Waiting for workload {args.workload} to finish with timeout of'
+      f' {timeout_msg}'
+  )
+  start = time.monotonic()
 
-  # Get the full workload name
-  get_workload_name_cmd = f'kubectl get workloads | grep jobset-{args.workload}'
-  return_code, return_value = run_command_for_value(
-      get_workload_name_cmd, 'Get full workload name'
+  def report(name: str, phase: JobSetPhase) -> None:
+    elapsed = int(time.monotonic() - start)
+    xpk_print(f'[{elapsed}s] Workload {name} is {phase.value}')
+
+  return_code, phases = watch_jobset_phases(
+      {args.workload}, timeout_seconds, report
   )
   if return_code != 0:
-    xpk_print(f'Get full workload name request returned ERROR {return_code}')
+    xpk_print(f'Wait for workload returned ERROR {return_code}')
     return return_code
-  full_workload_name = return_value.split(' ')[0]
 
-  # Call kubectl wait on the workload using the full workload name
-  timeout_val = args.timeout if args.timeout is not None else -1
-  timeout_msg = (
-      f'{timeout_val}s' if timeout_val != -1 else 'max timeout (1 week)'
-  )
-  wait_cmd = (
-      'kubectl wait --for=condition=Finished'
-      f' workload {full_workload_name} --timeout={timeout_val}s'
+  phase = phases.get(args.workload)
+  if phase is None:
+    xpk_print(f'Workload named {args.workload} does not exist.')
+    return 1
+
+  # pylint: disable=line-too-long
+  workload_link = (
+      f'https://console.cloud.google.com/kubernetes/service/{get_cluster_location(args.project, args.cluster, args.zone)}/{args.cluster}/default/{args.workload}/details?project={args.project}'
   )
-  return_code, return_value = run_command_for_value(
-      wait_cmd,
-      f'Wait for workload to finish with timeout of {timeout_msg}',
-      print_timer=True,
+  return_code = _get_wait_return_code(phase)
+  if return_code == 124:
+    xpk_print(
+        f'Timed out waiting for your workload after {timeout_msg}, see your'
+        f' workload here: {workload_link}'
+    )
+    return 124
+  if phase == JobSetPhase.DELETED:
+    xpk_print(f'Workload {args.workload} was deleted before it finished.')
+    return 1
+
+  xpk_print(
+      'Finished waiting for your workload, see your workload here:'
+      f' {workload_link}'
   )
+  xpk_print(f'Your workload finished with status: {phase.value}')
   if return_code != 0:
-    if 'timed out' in return_value:
-      xpk_print(
-          f'Timed out waiting for your workload after {timeout_msg}, see your'
-          ' workload here:'
-          # pylint: disable=line-too-long
-          f' https://console.cloud.google.com/kubernetes/service/{get_cluster_location(args.project, args.cluster, args.zone)}/{args.cluster}/default/{args.workload}/details?project={args.project}'
-      )
-      return 124
-    else:
-      xpk_print(f'{return_value}')
-      xpk_print(f'Wait for workload returned ERROR {return_code}')
-      return return_code
+    xpk_print('Your workload did not complete successfully')
+  return return_code
+
+
+@dataclass
+class _JobWaitResult:
+  """Outcome of one workload in a multi-workload wait."""
+
+  job: str
+  status: str
+  return_code: int
+  finished_after_seconds: Optional[int]
+
+
+class _WaitProgress:
+  """Tracks the phases of waited workloads and prints aggregate progress.
+
+  Progress is printed at most once per `interval_seconds`, so that listing
+  hundreds of workloads does not print one line per workload.
+  """
+
+  def __init__(self, interval_seconds: float = 10) -> None:
+    self.start = time.monotonic()
+    self.interval_seconds = interval_seconds
+    self.phases: dict[str, JobSetPhase] = {}
+    self.finished_after: dict[str, int] = {}
+    self._last_print = -interval_seconds
+
+  def elapsed(self) -> int:
+    return int(time.monotonic() - self.start)
+
+  def update(self, name: str, phase: JobSetPhase) -> None:
+    self.phases[name] = phase
+    if phase.is_terminal():
+      self.finished_after[name] = self.elapsed()
+      xpk_print(f'[{self.elapsed()}s] Workload {name} is {phase.value}')
+    if time.monotonic() - self._last_print >= self.interval_seconds:
+      self.print_summary()
+
+  def print_summary(self) -> None:
+    self._last_print = time.monotonic()
+    counts = {phase: 0 for phase in JobSetPhase}
+    for phase in self.phases.values():
+      counts[phase] += 1
+    finished = sum(n for phase, n in counts.items() if phase.is_terminal())
+    xpk_print(
+        f'[{self.elapsed()}s] {finished}/{len(self.phases)} workloads'
+        ' finished: '
+        + ', '.join(
+            f'{n} {phase.value.lower()}' for phase, n in counts.items() if n
+        )
+    )
+
+
+def _render_wait_results(results: list[_JobWaitResult]) -> str:
+  """Formats the per-workload wait results into a string table."""
+  return _render_table(
+      ['Job', 'Status', 'Return Code', 'Finished After'],
+      [
+          [
+              result.job,
+              result.status,
+              str(result.return_code),
+              (
+                  f'{result.finished_after_seconds}s'
+                  if result.finished_after_seconds is not None
+                  else '<none>'
+              ),
+          ]
+          for result in results
+      ],
+  )
+
+
+def wait_for_jobs(args: argparse.Namespace) -> tuple[int, str]:
+  """Waits for many workloads at once over a single JobSet watch.
+
+  The workloads are given either by name with `--wait-for-jobs` or by label
+  selector with `--wait-for-jobs-selector`, in which case every workload
+  matching the selector when the wait starts is followed. If
+  `--wait-results-file` is set, the per-workload results are also written
+  there as JSON.
+
+  Args:
+    args: user provided arguments for running the command.
+
+  Returns:
+    return_code: 0 if all workloads completed, otherwise 1 if any workload
+      was not found or deleted, 124 if any did not finish in time, 125 if
+      any failed.
+    return_value: table with the result of each workload.
+  """
+  names = (
+      list(dict.fromkeys(args.wait_for_jobs)) if args.wait_for_jobs else None
+  )
+  label_selector = args.wait_for_jobs_selector
+  timeout_seconds, timeout_msg = _get_wait_timeout(args)
   xpk_print(
-      'Finished waiting for your workload, see your workload here:'
-      # pylint: disable=line-too-long
-      f' https://console.cloud.google.com/kubernetes/service/{get_cluster_location(args.project, args.cluster, args.zone)}/{args.cluster}/default/{args.workload}/details?project={args.project}'
+      f'Waiting for {len(names) if names else "selected"} workloads to'
+      f' finish with timeout of {timeout_msg}'
+  )
+
+  progress = _WaitProgress()
+  return_code, phases = watch_jobset_phases(
+      names, timeout_seconds, progress.update, label_selector
   )
-  return_code, return_value = _get_jobset_status(args.workload)
   if return_code != 0:
-    return return_code
+    xpk_print(f'Wait for workloads returned ERROR {return_code}')
+    return return_code, ''
+  if not phases and not names:
+    xpk_print(f'No workloads match the selector {label_selector}.')
+    return 1, ''
+  progress.print_summary()
+
+  results = []
+  for name in names or sorted(phases):
+    phase = phases.get(name)
+    results.append(
+        _JobWaitResult(
+            job=name,
+            status=phase.value if phase else 'NotFound',
+            return_code=_get_wait_return_code(phase),
+            finished_after_seconds=progress.finished_after.get(name),
+        )
+    )
 
-  xpk_print(f'Your workload finished with status: {return_value}')
-  if return_value != 'Completed':
-    xpk_print('Your workload did not complete successfully')
-    return 125
-  return 0
+  if args.wait_results_file:
+    with open(args.wait_results_file, 'w', encoding='utf-8') as f:
+      json.dump([asdict(result) for result in results], f, indent=2)
+
+  result_codes = {result.return_code for result in results}
+  return_code = next((c for c in (1, 124, 125) if c in result_codes), 0)
+  return return_code, _render_wait_results(results)
 
 
 _GCP_NAME_FILTER_VALUE_REGEX = re.compile(r'[a-z0-9\-]+')
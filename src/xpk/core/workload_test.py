@@ -14,13 +14,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import argparse
 from unittest.mock import MagicMock
 import pytest
 import re
 import json
+from typing import Any
 from pytest_mock import MockerFixture
 from xpk.core.testing.commands_tester import CommandsTester
-from xpk.core.workload import _parse_workload_item, get_jobsets_list_gcp_link, get_workload_list, wait_for_job_completion, _get_jobset_status
+from xpk.core.workload import _parse_workload_item, get_jobsets_list_gcp_link, get_workload_list, wait_for_job_completion, wait_for_jobs
 
 
 from dataclasses import dataclass
@@ -377,263 +379,300 @@ def test_parse_workload_item_priority_not_found():
   assert row.priority is None
 
 
-def test_get_jobset_status_success(commands_tester: CommandsTester):
-  mock_status = json.dumps({
-      'status': {
-          'conditions': [{
-              'type': 'Completed',
-              'status': 'True',
-              'lastTransitionTime': '2024-01-01T00:00:00Z',
-          }]
-      }
-  })
+def _jobset_event(event_type: str, phase: str, resource_version: str) -> str:
+  jobset: dict[str, Any] = {
+      'metadata': {'name': 'test-job', 'resourceVersion': resource_version},
+      'spec': {'suspend': phase == 'Queued'},
+      'status': {},
+  }
+  if phase == 'Running':
+    jobset['status']['replicatedJobsStatus'] = [{'name': 'slice', 'active': 1}]
+  if phase in ('Completed', 'Failed'):
+    jobset['status']['conditions'] = [{'type': phase, 'status': 'True'}]
+  return json.dumps({'type': event_type, 'object': jobset}, indent=2) + '\n'
+
+
+def _set_jobset_watch(commands_tester: CommandsTester, *events: str):
   commands_tester.set_result_for_command(
-      (0, mock_status), 'kubectl', 'get', 'jobset', 'test-job', '-o', 'json'
+      (0, ''.join(events)), 'kubectl get jobsets', '--watch'
   )
-  return_code, status = _get_jobset_status('test-job')
-  assert return_code == 0
-  assert status == 'Completed'
 
 
-def test_get_jobset_status_terminal_precedence_completed(
-    commands_tester: CommandsTester,
-):
-  """Verify Completed status takes precedence over others with same timestamp."""
-  mock_status = json.dumps({
-      'status': {
-          'conditions': [
-              {
-                  'type': 'StartupPolicyCompleted',
-                  'status': 'True',
-                  'lastTransitionTime': '2024-01-01T00:00:00Z',
-              },
-              {
-                  'type': 'Completed',
-                  'status': 'True',
-                  'lastTransitionTime': '2024-01-01T00:00:00Z',
-              },
-          ]
-      }
-  })
+def _set_jobset_list(commands_tester: CommandsTester, *jobsets: dict):
   commands_tester.set_result_for_command(
-      (0, mock_status), 'kubectl', 'get', 'jobset', 'test-job', '-o', 'json'
+      (0, json.dumps({'items': list(jobsets)})),
+      'kubectl get jobsets',
+      "-l 'xpk.google.com/workload=test-job'",
+  )
+
+
+def _wait_args() -> MagicMock:
+  args = MagicMock()
+  args.wait_for_job_completion = 'test-job'
+  args.timeout = 100
+  args.project = 'test-project'
+  args.cluster = 'test-cluster'
+  args.zone = 'test-zone'
+  return args
+
+
+def test_wait_for_job_completion_success(commands_tester: CommandsTester):
+  _set_jobset_watch(
+      commands_tester,
+      _jobset_event('ADDED', 'Queued', '1'),
+      _jobset_event('MODIFIED', 'Admitted', '2'),
+      _jobset_event('MODIFIED', 'Running', '3'),
+      _jobset_event('MODIFIED', 'Completed', '4'),
+  )
+  _set_jobset_list(
+      commands_tester,
+      {'metadata': {'name': 'test-job'}, 'spec': {'suspend': True}},
   )
-  return_code, status = _get_jobset_status('test-job')
+
+  return_code = wait_for_job_completion(_wait_args())
+
   assert return_code == 0
-  assert status == 'Completed'
+  commands_tester.assert_command_run('kubectl get jobsets', '--watch')
+  commands_tester.assert_command_not_run('kubectl wait')
+  commands_tester.assert_command_not_run('kubectl get workloads')
 
 
-def test_get_jobset_status_terminal_precedence_failed(
+def test_wait_for_job_completion_already_finished(
     commands_tester: CommandsTester,
 ):
-  """Verify Failed status takes precedence over others with same timestamp."""
-  mock_status = json.dumps({
-      'status': {
-          'conditions': [
-              {
-                  'type': 'StartupPolicyCompleted',
-                  'status': 'True',
-                  'lastTransitionTime': '2024-01-01T00:00:00Z',
-              },
-              {
-                  'type': 'Failed',
-                  'status': 'True',
-                  'lastTransitionTime': '2024-01-01T00:00:00Z',
-              },
-          ]
-      }
-  })
-  commands_tester.set_result_for_command(
-      (0, mock_status), 'kubectl', 'get', 'jobset', 'test-job', '-o', 'json'
+  _set_jobset_list(
+      commands_tester,
+      {
+          'metadata': {'name': 'test-job'},
+          'status': {'conditions': [{'type': 'Completed', 'status': 'True'}]},
+      },
   )
-  return_code, status = _get_jobset_status('test-job')
+
+  return_code = wait_for_job_completion(_wait_args())
+
   assert return_code == 0
-  assert status == 'Failed'
+  commands_tester.assert_command_not_run('kubectl get jobsets', '--watch')
 
 
-def test_get_jobset_status_json_error(commands_tester: CommandsTester):
-  commands_tester.set_result_for_command(
-      (0, 'invalid json'), 'kubectl', 'get', 'jobset', 'test-job', '-o', 'json'
+def test_wait_for_job_completion_failed_status(commands_tester: CommandsTester):
+  _set_jobset_watch(
+      commands_tester,
+      _jobset_event('ADDED', 'Running', '1'),
+      _jobset_event('MODIFIED', 'Failed', '2'),
   )
-  return_code, status = _get_jobset_status('test-job')
-  assert return_code == 125
-  assert status == 'Unknown'
+  _set_jobset_list(commands_tester, {'metadata': {'name': 'test-job'}})
 
+  return_code = wait_for_job_completion(_wait_args())
 
-def test_get_jobset_status_cmd_error(commands_tester: CommandsTester):
-  commands_tester.set_result_for_command(
-      (1, 'error'), 'kubectl', 'get', 'jobset', 'test-job', '-o', 'json'
-  )
-  return_code, status = _get_jobset_status('test-job')
-  assert return_code == 1
-  assert status == 'Unknown'
+  assert return_code == 125
 
 
-def test_wait_for_job_completion_success(commands_tester: CommandsTester):
-  args = MagicMock()
-  args.wait_for_job_completion = 'test-job'
-  args.timeout = 100
-  args.project = 'test-project'
-  args.cluster = 'test-cluster'
-  args.zone = 'test-zone'
+def test_wait_for_job_completion_not_found(commands_tester: CommandsTester):
+  _set_jobset_list(commands_tester)
 
-  commands_tester.set_result_for_command(
-      (0, 'Jobset\ntest-job\nother-job'),
-      'kubectl',
-      'get',
-      'workloads',
-      'custom-columns',
-  )
+  return_code = wait_for_job_completion(_wait_args())
 
-  commands_tester.set_result_for_command(
-      (0, 'jobset-test-job-12345    other stuff'),
-      'kubectl',
-      'get',
-      'workloads',
-      'grep',
-      'jobset-test-job',
-  )
+  assert return_code == 1
+  commands_tester.assert_command_not_run('kubectl get jobsets', '--watch')
 
-  commands_tester.set_result_for_command(
-      (0, ''),
-      'kubectl',
-      'wait',
-      '--for=condition=Finished',
-      'workload',
-      'jobset-test-job-12345',
-      '--timeout=100s',
-  )
 
-  mock_status = json.dumps(
-      {'status': {'conditions': [{'type': 'Completed', 'status': 'True'}]}}
+def test_wait_for_job_completion_finds_jobset_without_workload_label(
+    commands_tester: CommandsTester,
+):
+  _set_jobset_watch(
+      commands_tester, _jobset_event('MODIFIED', 'Completed', '2')
   )
+  _set_jobset_list(commands_tester)
   commands_tester.set_result_for_command(
-      (0, mock_status), 'kubectl', 'get', 'jobset', 'test-job', '-o', 'json'
+      (0, json.dumps({'items': [{'metadata': {'name': 'test-job'}}]})),
+      'kubectl get jobsets',
+      "--field-selector 'metadata.name=test-job'",
   )
 
-  return_code = wait_for_job_completion(args)
-  assert return_code == 0
+  return_code = wait_for_job_completion(_wait_args())
 
+  assert return_code == 0
   commands_tester.assert_command_run(
-      'kubectl',
-      'wait',
-      '--for=condition=Finished',
-      'workload',
-      'jobset-test-job-12345',
-      '--timeout=100s',
-  )
-  commands_tester.assert_command_run(
-      'kubectl', 'get', 'jobset', 'test-job', '-o', 'json'
+      'kubectl get jobsets',
+      "--field-selector 'metadata.name=test-job'",
+      '--watch',
   )
 
 
-def test_wait_for_job_completion_failed_status(commands_tester: CommandsTester):
-  args = MagicMock()
-  args.wait_for_job_completion = 'test-job'
-  args.timeout = 100
-  args.project = 'test-project'
-  args.cluster = 'test-cluster'
-  args.zone = 'test-zone'
+def test_wait_for_job_completion_deleted(commands_tester: CommandsTester):
+  _set_jobset_watch(commands_tester, _jobset_event('DELETED', 'Running', '2'))
+  _set_jobset_list(commands_tester, {'metadata': {'name': 'test-job'}})
 
-  commands_tester.set_result_for_command(
-      (0, 'Jobset\ntest-job\nother-job'),
-      'kubectl',
-      'get',
-      'workloads',
-      'custom-columns',
-  )
+  return_code = wait_for_job_completion(_wait_args())
 
-  commands_tester.set_result_for_command(
-      (0, 'jobset-test-job-12345    other stuff'),
-      'kubectl',
-      'get',
-      'workloads',
-      'grep',
-      'jobset-test-job',
-  )
+  assert return_code == 1
 
-  commands_tester.set_result_for_command(
-      (0, ''),
-      'kubectl',
-      'wait',
-      '--for=condition=Finished',
-      'workload',
-      'jobset-test-job-12345',
-      '--timeout=100s',
-  )
 
-  mock_status = json.dumps(
-      {'status': {'conditions': [{'type': 'Failed', 'status': 'True'}]}}
-  )
-  commands_tester.set_result_for_command(
-      (0, mock_status), 'kubectl', 'get', 'jobset', 'test-job', '-o', 'json'
-  )
+def test_wait_for_job_completion_timeout(
+    commands_tester: CommandsTester, mocker: MockerFixture
+):
+  _set_jobset_watch(commands_tester, _jobset_event('ADDED', 'Running', '1'))
+  _set_jobset_list(commands_tester, {'metadata': {'name': 'test-job'}})
+  mocker.patch('xpk.core.jobset_watch.time.sleep')
+  args = _wait_args()
+  args.timeout = 0.2
 
   return_code = wait_for_job_completion(args)
-  assert return_code == 125
 
-  commands_tester.assert_command_run(
-      'kubectl',
-      'wait',
-      '--for=condition=Finished',
-      'workload',
-      'jobset-test-job-12345',
-      '--timeout=100s',
-  )
-  commands_tester.assert_command_run(
-      'kubectl', 'get', 'jobset', 'test-job', '-o', 'json'
-  )
+  assert return_code == 124
 
 
-def test_wait_for_job_completion_not_found(commands_tester: CommandsTester):
-  args = MagicMock()
-  args.wait_for_job_completion = 'test-job'
+def _wait_for_jobs_args(**kwargs) -> argparse.Namespace:
+  defaults = {
+      'wait_for_jobs': None,
+      'wait_for_jobs_selector': None,
+      'wait_results_file': None,
+      'timeout': 100,
+  }
+  return argparse.Namespace(**(defaults | kwargs))
 
+
+def _finished_jobset(name: str, condition: str) -> dict:
+  return {
+      'metadata': {'name': name},
+      'status': {'conditions': [{'type': condition, 'status': 'True'}]},
+  }
+
+
+def test_wait_for_jobs_reports_each_job(
+    commands_tester: CommandsTester, tmp_path
+):
   commands_tester.set_result_for_command(
-      (0, 'Jobset\nother-job'), 'kubectl', 'get', 'workloads', 'custom-columns'
+      (
+          0,
+          json.dumps({
+              'items': [
+                  _finished_jobset('job-a', 'Completed'),
+                  _finished_jobset('job-b', 'Failed'),
+              ]
+          }),
+      ),
+      'kubectl get jobsets',
+      "-l 'xpk.google.com/workload in (job-a,job-b,job-c)'",
   )
+  results_file = tmp_path / 'results.json'
 
-  return_code = wait_for_job_completion(args)
-  assert return_code == 1
+  return_code, table = wait_for_jobs(
+      _wait_for_jobs_args(
+          wait_for_jobs=['job-a', 'job-b', 'job-c', 'job-a'],
+          wait_results_file=str(results_file),
+      )
+  )
 
+  assert return_code == 1
+  assert _parse_workload_table(table) == [
+      {
+          'Job': 'job-a',
+          'Status': 'Completed',
+          'Return Code': '0',
+          'Finished After': '0s',
+      },
+      {
+          'Job': 'job-b',
+          'Status': 'Failed',
+          'Return Code': '125',
+          'Finished After': '0s',
+      },
+      {
+          'Job': 'job-c',
+          'Status': 'NotFound',
+          'Return Code': '1',
+          'Finished After': '<none>',
+      },
+  ]
+  assert json.loads(results_file.read_text()) == [
+      {
+          'job': 'job-a',
+          'status': 'Completed',
+          'return_code': 0,
+          'finished_after_seconds': 0,
+      },
+      {
+          'job': 'job-b',
+          'status': 'Failed',
+          'return_code': 125,
+          'finished_after_seconds': 0,
+      },
+      {
+          'job': 'job-c',
+          'status': 'NotFound',
+          'return_code': 1,
+          'finished_after_seconds': None,
+      },
+  ]
+  commands_tester.assert_command_run('kubectl get jobsets', times=1)
 
-def test_wait_for_job_completion_timeout(commands_tester: CommandsTester):
-  args = MagicMock()
-  args.wait_for_job_completion = 'test-job'
-  args.timeout = 100
-  args.project = 'test-project'
-  args.cluster = 'test-cluster'
-  args.zone = 'test-zone'
 
+def test_wait_for_jobs_by_selector_multiplexes_one_watch(
+    commands_tester: CommandsTester,
+):
+  commands_tester.set_result_for_command(
+      (
+          0,
+          json.dumps(
+              {
+                  'type': 'MODIFIED',
+                  'object': _finished_jobset('job-a', 'Completed'),
+              },
+              indent=2,
+          )
+          + '\n'
+          + json.dumps(
+              {
+                  'type': 'MODIFIED',
+                  'object': _finished_jobset('job-b', 'Completed'),
+              },
+              indent=2,
+          )
+          + '\n',
+      ),
+      'kubectl get jobsets',
+      '--watch',
+  )
   commands_tester.set_result_for_command(
-      (0, 'Jobset\ntest-job\nother-job'),
-      'kubectl',
-      'get',
-      'workloads',
-      'custom-columns',
+      (
+          0,
+          json.dumps({
+              'items': [
+                  {'metadata': {'name': 'job-a'}},
+                  {'metadata': {'name': 'job-b'}},
+              ]
+          }),
+      ),
+      'kubectl get jobsets',
+      "-l 'team=ml'",
   )
 
-  commands_tester.set_result_for_command(
-      (0, 'jobset-test-job-12345    other stuff'),
-      'kubectl',
-      'get',
-      'workloads',
-      'grep',
-      'jobset-test-job',
+  return_code, table = wait_for_jobs(
+      _wait_for_jobs_args(wait_for_jobs_selector='team=ml')
   )
 
+  assert return_code == 0
+  assert [row['Job'] for row in _parse_workload_table(table)] == [
+      'job-a',
+      'job-b',
+  ]
+  commands_tester.assert_command_run('kubectl get jobsets', '--watch', times=1)
+
+
+def test_wait_for_jobs_selector_without_matches(
+    commands_tester: CommandsTester,
+):
   commands_tester.set_result_for_command(
-      (1, 'error: timed out waiting for the condition'),
-      'kubectl',
-      'wait',
-      '--for=condition=Finished',
-      'workload',
-      'jobset-test-job-12345',
-      '--timeout=100s',
+      (0, json.dumps({'items': []})), 'kubectl get jobsets'
   )
 
-  return_code = wait_for_job_completion(args)
-  assert return_code == 124
+  return_code, table = wait_for_jobs(
+      _wait_for_jobs_args(wait_for_jobs_selector='team=ml')
+  )
+
+  assert return_code == 1
+  assert table == ''
 
 
 def test_parse_workload_item_excludes_pathways_head():
@@ -40,11 +40,14 @@ from .parser.core import set_parser
 from .parser.common import extract_command_path, enable_flags_usage_tracking, retrieve_flags
 from .core.updates import print_xpk_hello
 from .core.config import set_config, get_config, FileSystemConfig, CUSTOM_BINARIES_PATH_KEY
+from .core.kube_backend import ApiClientBackend, set_kube_backend
+from .core.reservation import set_refresh_reservations
 from .core.telemetry import MetricsCollector, send_clearcut_payload, should_send_telemetry
 from .utils.console import xpk_print, exit_code_to_int
-from .utils.execution_context import set_context
+from .utils.execution_context import is_dry_run, set_context
+from .utils.feature_flags import FeatureFlags
 from .utils.environment import custom_binaries_path_env
-from .utils.kubectl import sandbox_kubeconfig
+from .utils.kubeconfig import sandbox_kubeconfig
 ################### Compatibility Check ###################
 # Check that the user runs the below version or greater.
 
@@ -82,7 +85,13 @@ def main() -> None:
             ('quiet' in main_args and main_args.quiet)
             or ('force' in main_args and main_args.force)
         ),
+        use_cache_value=not ('no_cache' in main_args and main_args.no_cache),
     )
+    set_refresh_reservations(
+        'refresh_reservations' in main_args and main_args.refresh_reservations
+    )
+    if FeatureFlags.NATIVE_KUBE_CLIENT_ENABLED and not is_dry_run():
+      set_kube_backend(ApiClientBackend())
     MetricsCollector.log_start(
         command=extract_command_path(parser, main_args),
         flags=retrieve_flags(main_args),
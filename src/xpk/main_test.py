@@ -0,0 +1,126 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import re
+import subprocess
+import sys
+from importlib import metadata
+from pathlib import Path
+
+# Modules only the subcommand handlers need, which `xpk --help`, tab
+# completion and argument parsing must not load.
+DEFERRED_MODULES = (
+    'docker',
+    'google.cloud.resourcemanager_v3',
+    'google.cloud.storage',
+    'jinja2',
+    'kubernetes',
+    'requests',
+    'ruamel',
+    'xpk.commands',
+)
+# Third-party distributions `import xpk.main` may run, along with their own
+# requirements. Anything else slows down every xpk invocation.
+EAGER_DISTRIBUTIONS = ('argcomplete', 'packaging', 'PyYAML', 'setuptools-scm')
+# Number of xpk modules `import xpk.main` runs. Raise it deliberately when
+# building the parser really needs another module.
+XPK_MODULE_BUDGET = 46
+
+
+def _modules_executed(cwd: Path, code: str) -> list[str]:
+  """Runs code in a new interpreter and lists the modules it executed.
+
+  Modules imported through `lazy_import` sit in sys.modules until first used,
+  so the list comes from `-X importtime` which only reports executed ones.
+  """
+  result = subprocess.run(
+      [sys.executable, '-X', 'importtime', '-c', code],
+      cwd=cwd,
+      capture_output=True,
+      text=True,
+      check=True,
+  )
+  return [
+      line.split('|')[-1].strip()
+      for line in result.stderr.splitlines()
+      if line.startswith('import time:') and 'cumulative' not in line
+  ]
+
+
+def _normalize(distribution: str) -> str:
+  return re.sub(r'[-_.]+', '-', distribution).lower()
+
+
+def _with_requirements(distributions: tuple[str, ...]) -> set[str]:
+  """Returns the distributions and everything they require to run."""
+  closure: set[str] = set()
+  pending = [_normalize(distribution) for distribution in distributions]
+  while pending:
+    distribution = pending.pop()
+    if distribution in closure:
+      continue
+    closure.add(distribution)
+    try:
+      requirements = metadata.requires(distribution) or []
+    except metadata.PackageNotFoundError:
+      continue
+    for requirement in requirements:
+      if 'extra ==' in requirement:
+        continue
+      match = re.match(r'[A-Za-z0-9_.\-]+', requirement)
+      if match:
+        pending.append(_normalize(match.group(0)))
+  return closure
+
+
+def test_import_main_defers_subcommand_modules(tmp_path: Path):
+  loaded = [
+      module
+      for module in _modules_executed(tmp_path, 'import xpk.main')
+      for deferred in DEFERRED_MODULES
+      if module == deferred or module.startswith(f'{deferred}.')
+  ]
+  assert not loaded
+
+
+def test_import_main_runs_only_allowed_distributions(tmp_path: Path):
+  interpreter_startup = {
+      module.split('.')[0] for module in _modules_executed(tmp_path, 'pass')
+  }
+  allowed = _with_requirements(EAGER_DISTRIBUTIONS)
+  distributions = metadata.packages_distributions()
+
+  unexpected = sorted({
+      f'{package} ({", ".join(distributions[package])})'
+      for package in {
+          module.split('.')[0]
+          for module in _modules_executed(tmp_path, 'import xpk.main')
+      }
+      - interpreter_startup
+      if package in distributions
+      and package != 'xpk'
+      and not allowed.intersection(map(_normalize, distributions[package]))
+  })
+  assert not unexpected
+
+
+def test_import_main_stays_within_module_budget(tmp_path: Path):
+  xpk_modules = [
+      module
+      for module in _modules_executed(tmp_path, 'import xpk.main')
+      if module == 'xpk' or module.startswith('xpk.')
+  ]
+  assert len(xpk_modules) <= XPK_MODULE_BUDGET
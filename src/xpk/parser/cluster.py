@@ -16,20 +16,9 @@ limitations under the License.
 
 from argparse import ArgumentParser
 
-from ..commands.cluster import (
-    cluster_adapt,
-    cluster_cacheimage,
-    cluster_create,
-    cluster_create_pathways,
-    cluster_create_ray_cluster,
-    cluster_delete,
-    cluster_describe,
-    cluster_list,
-)
 from ..core.config import get_config
-from ..core.config import CFG_BUCKET_KEY
-from ..core.vertex import DEFAULT_VERTEX_TENSORBOARD_NAME
-from .common import add_shared_arguments, ParserOrArgumentGroup, add_tpu_type_argument, add_tpu_and_device_type_arguments
+from ..core.config import CFG_BUCKET_KEY, DEFAULT_VERTEX_TENSORBOARD_NAME
+from .common import command_handler, add_shared_arguments, ParserOrArgumentGroup, add_tpu_type_argument, add_tpu_and_device_type_arguments
 from .validators import name_type
 from ..utils.feature_flags import FeatureFlags
 
@@ -147,6 +136,7 @@ def set_cluster_create_parser(cluster_create_parser: ArgumentParser):
   add_shared_cluster_create_capacity_arguments(
       cluster_create_capacity_arguments
   )
+  add_cluster_create_plan_only_argument(cluster_create_capacity_arguments)
 
   ### Tensorboard arguments specific to "cluster create"
   cluster_create_tensorboard_arguments = (
@@ -172,7 +162,9 @@ def set_cluster_create_parser(cluster_create_parser: ArgumentParser):
   )
   add_resource_limits(cluster_create_resource_limits)
 
-  cluster_create_parser.set_defaults(func=cluster_create)
+  cluster_create_parser.set_defaults(
+      func=command_handler('cluster', 'cluster_create')
+  )
 
 
 def set_cluster_create_pathways_parser(
@@ -228,6 +220,9 @@ def set_cluster_create_pathways_parser(
   add_shared_cluster_create_capacity_arguments(
       cluster_create_pathways_capacity_arguments
   )
+  add_cluster_create_plan_only_argument(
+      cluster_create_pathways_capacity_arguments
+  )
 
   ### Tensorboard arguments specific to "cluster create-pathways"
   cluster_create_pathways_tensorboard_arguments = cluster_create_pathways_parser.add_argument_group(
@@ -256,7 +251,9 @@ def set_cluster_create_pathways_parser(
   )
   add_resource_limits(cluster_create_resource_limits)
 
-  cluster_create_pathways_parser.set_defaults(func=cluster_create_pathways)
+  cluster_create_pathways_parser.set_defaults(
+      func=command_handler('cluster', 'cluster_create_pathways')
+  )
 
 
 def set_cluster_create_ray_parser(cluster_create_ray_parser: ArgumentParser):
@@ -312,6 +309,7 @@ def set_cluster_create_ray_parser(cluster_create_ray_parser: ArgumentParser):
   add_shared_cluster_create_capacity_arguments(
       cluster_create_ray_capacity_arguments
   )
+  add_cluster_create_plan_only_argument(cluster_create_ray_capacity_arguments)
 
   ### Tensorboard arguments specific to "cluster create-ray"
   cluster_create_ray_tensorboard_arguments = (
@@ -338,7 +336,7 @@ def set_cluster_create_ray_parser(cluster_create_ray_parser: ArgumentParser):
   add_resource_limits(cluster_create_resource_limits)
 
   cluster_create_ray_parser.set_defaults(
-      func=cluster_create_ray_cluster,
+      func=command_handler('cluster', 'cluster_create_ray_cluster'),
       sub_slicing=False,
       super_slicing=False,
       num_cubes=None,
@@ -380,7 +378,9 @@ def set_cluster_delete_parser(cluster_delete_parser: ArgumentParser):
       ),
   )
 
-  cluster_delete_parser.set_defaults(func=cluster_delete)
+  cluster_delete_parser.set_defaults(
+      func=command_handler('cluster', 'cluster_delete')
+  )
 
 
 def set_cluster_cacheimage_parser(cluster_cacheimage_parser: ArgumentParser):
@@ -429,7 +429,9 @@ def set_cluster_cacheimage_parser(cluster_cacheimage_parser: ArgumentParser):
       required=False,
   )
 
-  cluster_cacheimage_parser.set_defaults(func=cluster_cacheimage)
+  cluster_cacheimage_parser.set_defaults(
+      func=command_handler('cluster', 'cluster_cacheimage')
+  )
 
 
 def set_cluster_describe_parser(cluster_describe_parser: ArgumentParser):
@@ -456,7 +458,9 @@ def set_cluster_describe_parser(cluster_describe_parser: ArgumentParser):
   )
   add_shared_arguments(cluster_describe_optional_arguments)
 
-  cluster_describe_parser.set_defaults(func=cluster_describe)
+  cluster_describe_parser.set_defaults(
+      func=command_handler('cluster', 'cluster_describe')
+  )
 
 
 def set_cluster_list_parser(cluster_list_parser: ArgumentParser):
@@ -466,7 +470,9 @@ def set_cluster_list_parser(cluster_list_parser: ArgumentParser):
   )
   add_shared_arguments(cluster_list_optional_arguments)
 
-  cluster_list_parser.set_defaults(func=cluster_list)
+  cluster_list_parser.set_defaults(
+      func=command_handler('cluster', 'cluster_list')
+  )
 
 
 def set_cluster_adapt_parser(cluster_adapt_parser: ArgumentParser):
@@ -535,7 +541,9 @@ def set_cluster_adapt_parser(cluster_adapt_parser: ArgumentParser):
       cluster_adapt_tensorboard_arguments
   )
 
-  cluster_adapt_parser.set_defaults(func=cluster_adapt)
+  cluster_adapt_parser.set_defaults(
+      func=command_handler('cluster', 'cluster_adapt')
+  )
 
 
 def add_autoprovisioning_arguments(parser_or_group: ParserOrArgumentGroup):
@@ -885,6 +893,15 @@ def add_shared_cluster_create_capacity_arguments(
           ' `--flex` or `--on-demand` for other capacity types.'
       ),
   )
+  parser_or_group.add_argument(
+      '--refresh-reservations',
+      action='store_true',
+      help=(
+          'Describe the reservations again instead of reusing the snapshots,'
+          ' including their in-use counts, taken by xpk runs of the last few'
+          ' minutes.'
+      ),
+  )
   parser_or_group.add_argument(
       '--spot',
       action='store_true',
@@ -905,6 +922,25 @@ def add_shared_cluster_create_capacity_arguments(
   )
 
 
+def add_cluster_create_plan_only_argument(
+    parser_or_group: ParserOrArgumentGroup,
+):
+  """Add the argument printing the reservation plan of cluster create.
+
+  Args:
+    parser_or_group: cluster create argument parser or argument group
+  """
+  parser_or_group.add_argument(
+      '--plan-only',
+      action='store_true',
+      help=(
+          'Print which reservations, blocks and sub-blocks the node pools'
+          ' would be created in, and exit without creating anything.'
+          ' Requires `--reservation`.'
+      ),
+  )
+
+
 def add_shared_cluster_create_mtc_arguments(
     parser_or_group: ParserOrArgumentGroup,
 ):
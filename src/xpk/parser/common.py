@@ -15,7 +15,8 @@ limitations under the License.
 """
 
 import argparse
-from typing import Protocol, Any
+import importlib
+from typing import Callable, Protocol, Any
 from ..core.system_characteristics import get_system_characteristics_keys_by_accelerator_type, AcceleratorType
 from ..utils.feature_flags import FeatureFlags
 import difflib
@@ -25,6 +26,31 @@ from argparse import Action, ArgumentError
 _DEFAULT_DEST_ATTR_NAME = '_supplied_flags'
 
 
+def command_handler(
+    module: str, name: str
+) -> Callable[[argparse.Namespace], Any]:
+  """Returns a subcommand handler that imports its command module when run.
+
+  Command modules pull in the Kubernetes and Google Cloud SDKs, so importing
+  them only for the chosen subcommand keeps `--help`, tab completion and
+  light subcommands fast.
+
+  Args:
+    module: name of the module in `xpk.commands` defining the handler.
+    name: name of the handler function.
+
+  Returns:
+    A function calling the handler with the parsed arguments.
+  """
+
+  def run(args: argparse.Namespace) -> Any:
+    commands = importlib.import_module(f'..commands.{module}', __package__)
+    return getattr(commands, name)(args)
+
+  run.__name__ = run.__qualname__ = name
+  return run
+
+
 class ParserOrArgumentGroup(Protocol):
 
   def add_argument(self, *args, **kwargs) -> Any:
@@ -139,6 +165,16 @@ def add_shared_arguments(
       help='Disables prompting before unintended destructive actions.',
       required=required,
   )
+  custom_parser_or_group.add_argument(
+      '--no-cache',
+      action='store_true',
+      default=False,
+      help=(
+          'Do not reuse cached outputs of read-only gcloud and kubectl'
+          ' commands from previous xpk runs.'
+      ),
+      required=required,
+  )
   custom_parser_or_group.add_argument(
       '--sandbox-kubeconfig',
       action=argparse.BooleanOptionalAction,
@@ -15,7 +15,8 @@ limitations under the License.
 """
 
 import argparse
-from .common import extract_command_path, enable_flags_usage_tracking, retrieve_flags, add_shared_arguments, FeatureFlags
+from pytest_mock import MockerFixture
+from .common import command_handler, extract_command_path, enable_flags_usage_tracking, retrieve_flags, add_shared_arguments, FeatureFlags
 from .core import set_parser
 
 
@@ -78,3 +79,28 @@ def test_add_shared_arguments_dependency_auto_download_disabled():
   add_shared_arguments(parser)
 
   assert '--dependency-auto-download' not in parser.format_help()
+
+
+def test_command_handler_calls_handler_of_command_module(
+    mocker: MockerFixture,
+):
+  version = mocker.patch('xpk.commands.version.version', return_value=0)
+  args = argparse.Namespace()
+
+  handler = command_handler('version', 'version')
+
+  assert handler.__name__ == 'version'
+  assert handler(args) == 0
+  version.assert_called_once_with(args)
+
+
+def test_set_parser_binds_lazy_command_handlers(mocker: MockerFixture):
+  cluster_list = mocker.patch('xpk.commands.cluster.cluster_list')
+  parser = argparse.ArgumentParser()
+  set_parser(parser=parser)
+
+  args = parser.parse_args(['cluster', 'list', '--project', 'p'])
+  args.func(args)
+
+  assert args.func.__name__ == 'cluster_list'
+  cluster_list.assert_called_once_with(args)
@@ -14,8 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from ..commands.info import info
-from .common import add_shared_arguments
+from .common import command_handler, add_shared_arguments
 from .validators import name_type
 import argparse
 
@@ -61,4 +60,4 @@ def set_info_parser(info_parser: argparse.ArgumentParser) -> None:
       help='Show only localqueues resources and usage',
   )
   add_shared_arguments(info_optional_arguments)
-  info_parser.set_defaults(func=info)
+  info_parser.set_defaults(func=command_handler('info', 'info'))
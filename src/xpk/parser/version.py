@@ -14,10 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from ..commands.version import (version)
-from .common import add_shared_arguments
+from .common import command_handler, add_shared_arguments
 
 
 def set_version_parser(version_parser):
   add_shared_arguments(version_parser)
-  version_parser.set_defaults(func=version)
+  version_parser.set_defaults(func=command_handler('version', 'version'))
@@ -16,14 +16,8 @@ limitations under the License.
 
 import argparse
 from argparse import ArgumentParser
-from ..commands.workload import (
-    workload_create,
-    workload_create_pathways,
-    workload_delete,
-    workload_list,
-)
 from ..core.docker_image import DEFAULT_DOCKER_IMAGE, DEFAULT_SCRIPT_DIR
-from .common import add_shared_arguments, add_tpu_type_argument, add_tpu_and_device_type_arguments
+from .common import command_handler, add_shared_arguments, add_tpu_type_argument, add_tpu_and_device_type_arguments
 from .validators import directory_path_type, name_type
 
 
@@ -224,7 +218,9 @@ def set_workload_create_parser(workload_create_parser: ArgumentParser):
   add_shared_workload_create_autoprovisioning_arguments([
       workload_create_autoprovisioning_arguments,
   ])
-  workload_create_parser.set_defaults(func=workload_create)
+  workload_create_parser.set_defaults(
+      func=command_handler('workload', 'workload_create')
+  )
 
 
 def set_workload_create_pathways_parser(
@@ -402,7 +398,9 @@ def set_workload_create_pathways_parser(
   add_shared_workload_create_autoprovisioning_arguments([
       workload_create_pathways_autoprovisioning_arguments,
   ])
-  workload_create_pathways_parser.set_defaults(func=workload_create_pathways)
+  workload_create_pathways_parser.set_defaults(
+      func=command_handler('workload', 'workload_create_pathways')
+  )
 
 
 def set_workload_delete_parser(workload_delete_parser: ArgumentParser):
@@ -471,7 +469,9 @@ def set_workload_delete_parser(workload_delete_parser: ArgumentParser):
           'Forces workload deletion command to run without additional approval.'
       ),
   )
-  workload_delete_parser.set_defaults(func=workload_delete)
+  workload_delete_parser.set_defaults(
+      func=command_handler('workload', 'workload_delete')
+  )
 
 
 def set_workload_list_parser(workload_list_parser: ArgumentParser):
@@ -520,7 +520,11 @@ def set_workload_list_parser(workload_list_parser: ArgumentParser):
       )
   )
 
-  workload_list_wait_for_job_completion_arguments.add_argument(
+  workload_list_wait_targets = (
+      workload_list_wait_for_job_completion_arguments.add_mutually_exclusive_group()
+  )
+
+  workload_list_wait_targets.add_argument(
       '--wait-for-job-completion',
       type=str,
       default=None,
@@ -528,6 +532,42 @@ def set_workload_list_parser(workload_list_parser: ArgumentParser):
       required=False,
   )
 
+  workload_list_wait_targets.add_argument(
+      '--wait-for-jobs',
+      action='extend',
+      nargs='+',
+      default=None,
+      help=(
+          'The names of the jobs to wait on, all of them are followed over'
+          ' one watch connection and a table with the result of each job is'
+          ' printed. Example usage: --wait-for-jobs job-1 job-2'
+      ),
+      required=False,
+  )
+
+  workload_list_wait_targets.add_argument(
+      '--wait-for-jobs-selector',
+      type=str,
+      default=None,
+      help=(
+          'Label selector of the jobs to wait on, every job matching it when'
+          ' the wait starts is followed like with --wait-for-jobs. Example'
+          ' usage: --wait-for-jobs-selector sweep=lr-search'
+      ),
+      required=False,
+  )
+
+  workload_list_wait_for_job_completion_arguments.add_argument(
+      '--wait-results-file',
+      type=str,
+      default=None,
+      help=(
+          'Path of a file to write the result of each job to as JSON, used'
+          ' with --wait-for-jobs or --wait-for-jobs-selector.'
+      ),
+      required=False,
+  )
+
   workload_list_wait_for_job_completion_arguments.add_argument(
       '--timeout',
       type=int,
@@ -541,7 +581,9 @@ def set_workload_list_parser(workload_list_parser: ArgumentParser):
 
   add_shared_arguments(workload_list_parser)
 
-  workload_list_parser.set_defaults(func=workload_list)
+  workload_list_parser.set_defaults(
+      func=command_handler('workload', 'workload_list')
+  )
 
 
 def add_shared_workload_create_required_arguments(args_parsers):
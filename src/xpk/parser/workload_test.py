@@ -15,7 +15,8 @@ limitations under the License.
 """
 
 import argparse
-from xpk.parser.workload import set_workload_create_parser
+import pytest
+from xpk.parser.workload import set_workload_create_parser, set_workload_list_parser
 
 
 def test_workload_create_parses():
@@ -34,3 +35,36 @@ def test_workload_create_parses():
   ])
 
   assert args
+
+
+def test_workload_list_parses_wait_for_jobs():
+  parser = argparse.ArgumentParser()
+
+  set_workload_list_parser(parser)
+  args = parser.parse_args([
+      "--cluster",
+      "test-cluster",
+      "--wait-for-jobs",
+      "job-1",
+      "job-2",
+      "--wait-for-jobs",
+      "job-3",
+  ])
+
+  assert args.wait_for_jobs == ["job-1", "job-2", "job-3"]
+  assert args.wait_for_job_completion is None
+
+
+def test_workload_list_rejects_multiple_wait_targets():
+  parser = argparse.ArgumentParser()
+  set_workload_list_parser(parser)
+
+  with pytest.raises(SystemExit):
+    parser.parse_args([
+        "--cluster",
+        "test-cluster",
+        "--wait-for-job-completion",
+        "job-1",
+        "--wait-for-jobs-selector",
+        "team=ml",
+    ])
@@ -0,0 +1,85 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator
+
+if sys.platform != "win32":
+  import fcntl
+
+
+def get_cache_dir() -> Path:
+  """Returns the xpk cache directory, `$XPK_CACHE_HOME/xpk` or `~/.cache/xpk`."""
+  cache_dir = os.environ.get("XPK_CACHE_HOME", Path.home() / ".cache")
+  return Path(cache_dir).expanduser() / "xpk"
+
+
+def read_json_file(path: Path) -> Any | None:
+  """Reads a JSON cache file, returning None if it is missing or corrupted."""
+  try:
+    with open(path, "r", encoding="utf-8") as f:
+      return json.load(f)
+  except (OSError, ValueError):
+    return None
+
+
+def write_json_file(path: Path, value: Any) -> bool:
+  """Atomically writes a JSON cache file.
+
+  The content is written to a temporary file in the same directory and then
+  renamed, so concurrent xpk processes never observe a partially written file.
+
+  Returns:
+    True if the file was written, False otherwise. Cache write failures are
+    never fatal.
+  """
+  try:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+  except OSError:
+    return False
+  try:
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+      json.dump(value, f)
+    os.replace(tmp_path, path)
+    return True
+  except (OSError, TypeError, ValueError):
+    with contextlib.suppress(OSError):
+      os.unlink(tmp_path)
+    return False
+
+
+@contextlib.contextmanager
+def exclusive_lock(lock_path: Path) -> Iterator[None]:
+  """Holds an exclusive lock on a file, waiting for other xpk processes.
+
+  The lock is released by the operating system if the process dies. Files
+  cannot be locked this way on Windows, where the lock is not taken.
+  """
+  if sys.platform == "win32":
+    yield
+    return
+  with open(lock_path, "a", encoding="utf-8") as f:
+    fcntl.flock(f, fcntl.LOCK_EX)  # pylint: disable=possibly-used-before-assignment
+    try:
+      yield
+    finally:
+      fcntl.flock(f, fcntl.LOCK_UN)
@@ -17,6 +17,7 @@ limitations under the License.
 import sys
 import shutil
 import hashlib
+import http.client
 import tarfile
 import os
 import tempfile
@@ -26,9 +27,12 @@ import urllib.parse
 import urllib.request
 import pathlib
 
+from ..cache import exclusive_lock
 from ..console import xpk_print
 from .binary_dependencies import BinaryDependency
 
+_CHUNK_SIZE = 1 << 16
+
 
 _OS_MAP: dict[str, str] = {"Linux": "linux", "Darwin": "darwin"}
 _ARCH_MAP: dict[str, str] = {
@@ -63,31 +67,68 @@ def _format_url(
   )
 
 
-def _download_file(url: str, path: pathlib.Path, name: str) -> bool:
-  """Downloads a file from a URL to a local path."""
-  try:
+def _download_file(url: str, part_path: pathlib.Path, name: str) -> str | None:
+  """Downloads a file from a URL, resuming a previous partial download.
+
+  The file is hashed while it is written, the bytes of a partial download
+  are hashed once before the rest is requested with an HTTP Range.
+
+  Args:
+    url: URL of the file.
+    part_path: file receiving the download, kept when the download fails so
+        that it can be resumed.
+    name: name of the dependency, for messages.
+
+  Returns:
+    SHA-256 hex digest of the complete file, or None if the download failed.
+  """
+  sha256 = hashlib.sha256()
+  offset = 0
+  if part_path.exists():
+    with open(part_path, "rb") as f:
+      while chunk := f.read(_CHUNK_SIZE):
+        sha256.update(chunk)
+        offset += len(chunk)
+
+  request = urllib.request.Request(url)
+  if offset:
+    request.add_header("Range", f"bytes={offset}-")
+    xpk_print(f"Resuming download of {url} at byte {offset} ...")
+  else:
     xpk_print(f"Downloading {url} ...")
-    with urllib.request.urlopen(url) as response, open(path, "wb") as f:
-      shutil.copyfileobj(response, f)
-    return True
+  try:
+    with urllib.request.urlopen(request) as response:
+      if offset and response.status != 206:
+        # The server sends the whole file when it does not support ranges.
+        sha256, offset = hashlib.sha256(), 0
+      with open(part_path, "ab" if offset else "wb") as f:
+        while chunk := response.read(_CHUNK_SIZE):
+          sha256.update(chunk)
+          f.write(chunk)
+      if response.length:
+        # http.client ends the body early, without an error, when the
+        # connection is cut before Content-Length bytes were received.
+        xpk_print(
+            f"Error downloading {name}: connection closed with"
+            f" {response.length} bytes left"
+        )
+        return None
+    return sha256.hexdigest()
   except urllib.error.HTTPError as e:
+    if e.code == 416 and offset:
+      # A previous run downloaded the whole file.
+      return sha256.hexdigest()
     xpk_print(f"Error downloading {name}: HTTP {e.code} - {e.reason}")
-    return False
-  except urllib.error.URLError as e:
+    return None
+  except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+    # The partial download is kept, the next fetch resumes it.
     xpk_print(f"Error downloading {name}: {e}")
-    return False
+    return None
 
 
-def _verify_checksum(
-    path: pathlib.Path, expected_checksum: str, name: str
-) -> bool:
-  """Verifies the SHA-256 checksum of a file."""
-  sha256 = hashlib.sha256()
-  with open(path, "rb") as f:
-    while chunk := f.read(65536):
-      sha256.update(chunk)
-
-  if sha256.hexdigest() != expected_checksum:
+def _verify_checksum(checksum: str, expected_checksum: str, name: str) -> bool:
+  """Compares the SHA-256 checksum of a download with the expected one."""
+  if checksum != expected_checksum:
     xpk_print(
         f"Error: Checksum mismatch for {name}. Download might be corrupted."
     )
@@ -111,10 +152,14 @@ def _extract_archive(
 
 
 def _install_binary(src_path: pathlib.Path, target_path: pathlib.Path) -> None:
-  """Moves the binary to the target path and makes it executable."""
+  """Makes the binary executable and atomically moves it to the target path.
+
+  The source must be on the same file system as the target, so that other
+  processes never run a partially copied binary.
+  """
   os.makedirs(os.path.dirname(target_path), exist_ok=True)
-  shutil.move(src_path, target_path)
-  os.chmod(target_path, 0o755)
+  os.chmod(src_path, 0o755)
+  os.replace(src_path, target_path)
 
 
 def _process_downloaded_file(
@@ -146,7 +191,12 @@ def fetch_dependency(
     binary_dependency: BinaryDependency,
     target_dir: pathlib.Path,
 ) -> bool:
-  """Fetches, verifies, and installs a binary dependency."""
+  """Fetches, verifies, and installs a binary dependency.
+
+  Concurrent xpk processes fetching the same dependency wait for each other,
+  so it is downloaded once, and an interrupted download is resumed by the
+  next fetch.
+  """
   os_name, arch_name = _get_os_and_arch()
   if not os_name or not arch_name:
     xpk_print(
@@ -169,21 +219,33 @@ def fetch_dependency(
     return False
 
   url = _format_url(binary_dependency, os_name, arch_name)
-
-  with tempfile.TemporaryDirectory() as temp_dir:
-    temp_dir_path = pathlib.Path(temp_dir)
-    filename = pathlib.Path(urllib.parse.urlparse(url).path).name
-    download_path = temp_dir_path / filename
-
-    if not _download_file(url, download_path, binary_dependency.binary_name):
+  name = binary_dependency.binary_name
+  final_path = target_dir / name
+  # The download and lock files sit next to the version directories, so
+  # that partial downloads are resumed and installs are atomic renames.
+  work_dir = target_dir.parent
+  os.makedirs(work_dir, exist_ok=True)
+
+  with exclusive_lock(work_dir / f"{target_dir.name}.lock"):
+    if final_path.exists() and os.access(final_path, os.X_OK):
+      # Installed by another xpk process while this one waited for the lock.
+      return True
+
+    part_path = work_dir / f"{target_dir.name}.part"
+    checksum = _download_file(url, part_path, name)
+    if checksum is None:
       return False
-
-    if not _verify_checksum(
-        download_path, expected_checksum, binary_dependency.binary_name
-    ):
+    if not _verify_checksum(checksum, expected_checksum, name):
+      part_path.unlink(missing_ok=True)
       return False
 
-    final_path = target_dir / binary_dependency.binary_name
-    return _process_downloaded_file(
-        binary_dependency, download_path, temp_dir_path, final_path
-    )
+    with tempfile.TemporaryDirectory(dir=work_dir) as temp_dir:
+      temp_dir_path = pathlib.Path(temp_dir)
+      # Archives are unpacked according to the extension of their file name.
+      download_path = (
+          temp_dir_path / pathlib.Path(urllib.parse.urlparse(url).path).name
+      )
+      os.replace(part_path, download_path)
+      return _process_downloaded_file(
+          binary_dependency, download_path, temp_dir_path, final_path
+      )
@@ -19,8 +19,10 @@ import io
 import os
 import pathlib
 import tarfile
+import threading
 import urllib.error
-from typing import Any
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
 import pytest
 
 from xpk.utils.dependencies.binary_dependencies import BinaryDependency
@@ -52,6 +54,8 @@ class MockResponse:
 
   def __init__(self, data: bytes) -> None:
     self.data = io.BytesIO(data)
+    # Bytes left to read, None when the length is unknown.
+    self.length = None
 
   def read(self, *args: Any, **kwargs: Any) -> bytes:
     return self.data.read(*args, **kwargs)
@@ -63,6 +67,77 @@ class MockResponse:
     pass
 
 
+class _FileServer:
+  """Serves one file over HTTP, honoring Range requests if enabled.
+
+  If `cut_first_response_after` is set, the connection of the first
+  response is closed after that many bytes of the body.
+  """
+
+  def __init__(
+      self,
+      content: bytes,
+      support_ranges: bool = True,
+      cut_first_response_after: int | None = None,
+  ) -> None:
+    self.ranges: list[str | None] = []
+    ranges = self.ranges
+
+    class Handler(BaseHTTPRequestHandler):
+      """Answers GET requests with the file or a part of it."""
+
+      def do_GET(self):  # pylint: disable=invalid-name
+        requested = self.headers.get('Range')
+        ranges.append(requested)
+        if requested and support_ranges:
+          start = int(requested.removeprefix('bytes=').rstrip('-'))
+          if start >= len(content):
+            self.send_response(416)
+            self.end_headers()
+            return
+          self.send_response(206)
+          body = content[start:]
+        else:
+          self.send_response(200)
+          body = content
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if cut_first_response_after is not None and len(ranges) == 1:
+          body = body[:cut_first_response_after]
+        self.wfile.write(body)
+
+      def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+    self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    self.url = f'http://127.0.0.1:{self._server.server_port}'
+    self._thread = threading.Thread(
+        target=self._server.serve_forever, daemon=True
+    )
+    self._thread.start()
+
+  def close(self) -> None:
+    self._server.shutdown()
+    self._server.server_close()
+
+
+@pytest.fixture
+def file_server() -> Iterator[_FileServer]:
+  server = _FileServer(FAKE_BINARY_CONTENT)
+  yield server
+  server.close()
+
+
+def _served_dependency(server: _FileServer) -> BinaryDependency:
+  return BinaryDependency(
+      archive_type='binary',
+      binary_name='dummy_bin',
+      checksums={'linux_amd64': FAKE_BINARY_SHA256},
+      url_template=f'{server.url}/{{version}}/{{os}}/{{arch}}/dummy_bin',
+      version='v1.0.0',
+  )
+
+
 @pytest.fixture(autouse=True)
 def mock_platform(monkeypatch: pytest.MonkeyPatch) -> None:
   monkeypatch.setattr(
@@ -250,3 +325,124 @@ def test_fetch_dependency_archive_extract_failure(
 
   result = downloader.fetch_dependency(corrupted_archive_dependency, tmp_path)
   assert result is False
+
+
+def test_fetch_dependency_from_local_server(
+    tmp_path: pathlib.Path, file_server: _FileServer
+) -> None:
+  target_dir = tmp_path / 'bin' / 'dummy_bin-v1.0.0'
+
+  assert downloader.fetch_dependency(
+      _served_dependency(file_server), target_dir
+  )
+
+  assert (target_dir / 'dummy_bin').read_bytes() == FAKE_BINARY_CONTENT
+  assert file_server.ranges == [None]
+  assert sorted(p.name for p in target_dir.parent.iterdir()) == [
+      'dummy_bin-v1.0.0',
+      'dummy_bin-v1.0.0.lock',
+  ]
+
+
+def test_fetch_dependency_resumes_partial_download(
+    tmp_path: pathlib.Path, file_server: _FileServer
+) -> None:
+  target_dir = tmp_path / 'bin' / 'dummy_bin-v1.0.0'
+  target_dir.parent.mkdir()
+  (target_dir.parent / 'dummy_bin-v1.0.0.part').write_bytes(
+      FAKE_BINARY_CONTENT[:5]
+  )
+
+  assert downloader.fetch_dependency(
+      _served_dependency(file_server), target_dir
+  )
+
+  assert (target_dir / 'dummy_bin').read_bytes() == FAKE_BINARY_CONTENT
+  assert file_server.ranges == ['bytes=5-']
+
+
+def test_fetch_dependency_resumes_download_cut_mid_body(
+    tmp_path: pathlib.Path,
+) -> None:
+  server = _FileServer(FAKE_BINARY_CONTENT, cut_first_response_after=5)
+  target_dir = tmp_path / 'bin' / 'dummy_bin-v1.0.0'
+  dependency = _served_dependency(server)
+  try:
+    assert not downloader.fetch_dependency(dependency, target_dir)
+    assert (target_dir.parent / 'dummy_bin-v1.0.0.part').read_bytes() == (
+        FAKE_BINARY_CONTENT[:5]
+    )
+    assert downloader.fetch_dependency(dependency, target_dir)
+  finally:
+    server.close()
+
+  assert (target_dir / 'dummy_bin').read_bytes() == FAKE_BINARY_CONTENT
+  assert server.ranges == [None, 'bytes=5-']
+
+
+def test_fetch_dependency_installs_complete_partial_download(
+    tmp_path: pathlib.Path, file_server: _FileServer
+) -> None:
+  target_dir = tmp_path / 'bin' / 'dummy_bin-v1.0.0'
+  target_dir.parent.mkdir()
+  (target_dir.parent / 'dummy_bin-v1.0.0.part').write_bytes(FAKE_BINARY_CONTENT)
+
+  assert downloader.fetch_dependency(
+      _served_dependency(file_server), target_dir
+  )
+
+  assert (target_dir / 'dummy_bin').read_bytes() == FAKE_BINARY_CONTENT
+
+
+def test_fetch_dependency_restarts_when_server_ignores_range(
+    tmp_path: pathlib.Path,
+) -> None:
+  server = _FileServer(FAKE_BINARY_CONTENT, support_ranges=False)
+  target_dir = tmp_path / 'bin' / 'dummy_bin-v1.0.0'
+  target_dir.parent.mkdir()
+  (target_dir.parent / 'dummy_bin-v1.0.0.part').write_bytes(b'fake')
+  try:
+    assert downloader.fetch_dependency(_served_dependency(server), target_dir)
+  finally:
+    server.close()
+
+  assert (target_dir / 'dummy_bin').read_bytes() == FAKE_BINARY_CONTENT
+
+
+def test_fetch_dependency_discards_corrupted_partial_download(
+    tmp_path: pathlib.Path, file_server: _FileServer
+) -> None:
+  target_dir = tmp_path / 'bin' / 'dummy_bin-v1.0.0'
+  target_dir.parent.mkdir()
+  part_path = target_dir.parent / 'dummy_bin-v1.0.0.part'
+  part_path.write_bytes(b'corrupted')
+  dependency = _served_dependency(file_server)
+
+  assert not downloader.fetch_dependency(dependency, target_dir)
+  assert not part_path.exists()
+  assert downloader.fetch_dependency(dependency, target_dir)
+  assert (target_dir / 'dummy_bin').read_bytes() == FAKE_BINARY_CONTENT
+
+
+def test_concurrent_fetches_download_once(
+    tmp_path: pathlib.Path, file_server: _FileServer
+) -> None:
+  target_dir = tmp_path / 'bin' / 'dummy_bin-v1.0.0'
+  dependency = _served_dependency(file_server)
+  results: list[bool] = []
+
+  threads = [
+      threading.Thread(
+          target=lambda: results.append(
+              downloader.fetch_dependency(dependency, target_dir)
+          )
+      )
+      for _ in range(4)
+  ]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert results == [True] * 4
+  assert file_server.ranges == [None]
@@ -15,15 +15,18 @@ limitations under the License.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Sequence
 
+from ..cache import get_cache_dir
 from .binary_dependencies import BinaryDependencies, BinaryDependency
 from .downloader import fetch_dependency
+from .validation_cache import record_validated
 
 
 def _get_cache_bin_dir() -> Path:
-  cache_dir = os.environ.get("XPK_CACHE_HOME", Path.home() / ".cache")
-  return Path(cache_dir).expanduser() / "xpk" / "bin"
+  return get_cache_dir() / "bin"
 
 
 def _filename(dependency: BinaryDependency) -> str:
@@ -36,17 +39,42 @@ def get_dependencies_path() -> list[str]:
   return [str(cache_bin / _filename(dep.value)) for dep in BinaryDependencies]
 
 
-def ensure_dependency(dependency: BinaryDependency) -> bool:
-  """Ensures dependency is downloaded."""
-  cache_bin = _get_cache_bin_dir()
+def _is_installed(dependency: BinaryDependency) -> bool:
+  binary_path = (
+      _get_cache_bin_dir() / _filename(dependency) / dependency.binary_name
+  )
+  return binary_path.exists() and os.access(binary_path, os.X_OK)
 
-  version_dir = cache_bin / _filename(dependency)
-  binary_path = version_dir / dependency.binary_name
 
-  if binary_path.exists() and os.access(binary_path, os.X_OK):
-    return True
+def _fetch(dependency: BinaryDependency) -> bool:
+  """Downloads a dependency and records it as validated.
 
-  return fetch_dependency(
+  Downloaded binaries match their checksums, so their installation is not
+  checked again.
+  """
+  version_dir = _get_cache_bin_dir() / _filename(dependency)
+  if not fetch_dependency(
       binary_dependency=dependency,
       target_dir=version_dir,
-  )
+  ):
+    return False
+  record_validated([str(version_dir / dependency.binary_name)])
+  return True
+
+
+def ensure_dependencies(dependencies: Sequence[BinaryDependency]) -> bool:
+  """Ensures dependencies are downloaded, fetching the missing ones concurrently.
+
+  Returns:
+    True if all dependencies are available, False otherwise.
+  """
+  missing = [dep for dep in dependencies if not _is_installed(dep)]
+  if not missing:
+    return True
+  with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+    return all(list(pool.map(_fetch, missing)))
+
+
+def ensure_dependency(dependency: BinaryDependency) -> bool:
+  """Ensures dependency is downloaded."""
+  return ensure_dependencies([dependency])
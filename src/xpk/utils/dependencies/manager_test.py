@@ -15,11 +15,13 @@ limitations under the License.
 """
 
 import pathlib
+import threading
 import pytest
 from pytest_mock import MockerFixture
 
 from xpk.utils.dependencies import manager
 from xpk.utils.dependencies.binary_dependencies import BinaryDependencies
+from xpk.utils.dependencies.validation_cache import is_validated
 
 
 def test_get_dependencies_path_default_cache_dir(
@@ -134,3 +136,56 @@ def test_ensure_dependency_needs_download(
   mock_fetch.assert_called_once_with(
       binary_dependency=dep, target_dir=expected_version_dir
   )
+
+
+def test_ensure_dependency_records_downloaded_binary_as_validated(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+) -> None:
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path))
+  dep = BinaryDependencies.KUBECTL.value
+
+  def fetch(binary_dependency, target_dir: pathlib.Path) -> bool:
+    target_dir.mkdir(parents=True)
+    binary_path = target_dir / binary_dependency.binary_name
+    binary_path.touch()
+    binary_path.chmod(0o755)
+    return True
+
+  mocker.patch(
+      'xpk.utils.dependencies.manager.fetch_dependency', side_effect=fetch
+  )
+
+  assert manager.ensure_dependency(dep) is True
+
+  binary_path = (
+      tmp_path / 'xpk' / 'bin' / f'{dep.binary_name}-{dep.version}' / 'kubectl'
+  )
+  assert is_validated([str(binary_path)])
+
+
+def test_ensure_dependencies_fetches_missing_dependencies_concurrently(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+) -> None:
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path))
+  dependencies = [
+      BinaryDependencies.KUBECTL.value,
+      BinaryDependencies.CRANE.value,
+  ]
+  # Each fetch waits for the other one, so sequential fetches time out.
+  both_fetching = threading.Barrier(len(dependencies), timeout=5)
+
+  def fetch(binary_dependency, target_dir: pathlib.Path) -> bool:
+    del binary_dependency, target_dir
+    both_fetching.wait()
+    return True
+
+  mock_fetch = mocker.patch(
+      'xpk.utils.dependencies.manager.fetch_dependency', side_effect=fetch
+  )
+
+  assert manager.ensure_dependencies(dependencies) is True
+  assert mock_fetch.call_count == 2
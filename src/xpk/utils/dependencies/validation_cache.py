@@ -0,0 +1,96 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Iterable
+
+from ...core.config import __version__ as xpk_version
+from ..cache import get_cache_dir, read_json_file, write_json_file
+from ..execution_context import is_cache_enabled, is_dry_run
+
+
+def _cache_path() -> Path:
+  return get_cache_dir() / "validated_binaries.json"
+
+
+def _is_active() -> bool:
+  return is_cache_enabled() and not is_dry_run()
+
+
+def _resolve(binary: str) -> str | None:
+  """Returns the real path of the binary run for `binary`, if it is found."""
+  path = shutil.which(binary)
+  return None if path is None else os.path.realpath(path)
+
+
+def _fingerprint(path: str) -> dict[str, Any] | None:
+  """Identifies a binary file, so that replacing or updating it is noticed."""
+  try:
+    stat = os.stat(path)
+  except OSError:
+    return None
+  return {
+      "mtime_ns": stat.st_mtime_ns,
+      "size": stat.st_size,
+      "xpk_version": xpk_version,
+  }
+
+
+def _read_validated() -> dict[str, Any]:
+  validated = read_json_file(_cache_path())
+  return validated if isinstance(validated, dict) else {}
+
+
+def is_validated(binaries: Iterable[str]) -> bool:
+  """Checks whether all binaries were validated by this version of xpk.
+
+  Args:
+    binaries: names or paths of the binaries, names are looked up in PATH.
+
+  Returns:
+    True if every binary is recorded as validated and was not changed since.
+  """
+  if not _is_active():
+    return False
+  validated = _read_validated()
+  for binary in binaries:
+    path = _resolve(binary)
+    if path is None:
+      return False
+    fingerprint = _fingerprint(path)
+    if fingerprint is None or validated.get(path) != fingerprint:
+      return False
+  return True
+
+
+def record_validated(binaries: Iterable[str]) -> None:
+  """Records binaries as validated, skipping the ones that are not found.
+
+  Args:
+    binaries: names or paths of the binaries, names are looked up in PATH.
+  """
+  if not _is_active():
+    return
+  fingerprints = {}
+  for binary in binaries:
+    path = _resolve(binary)
+    fingerprint = None if path is None else _fingerprint(path)
+    if path is not None and fingerprint is not None:
+      fingerprints[path] = fingerprint
+  if fingerprints:
+    write_json_file(_cache_path(), _read_validated() | fingerprints)
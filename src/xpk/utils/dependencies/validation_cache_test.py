@@ -0,0 +1,74 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pathlib
+
+import pytest
+from pytest_mock import MockerFixture
+
+from xpk.utils.dependencies.validation_cache import (
+    is_validated,
+    record_validated,
+)
+
+
+@pytest.fixture
+def binary(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> pathlib.Path:
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path / 'cache'))
+  binary_path = tmp_path / 'tool'
+  binary_path.write_text('#!/bin/sh\n', encoding='utf-8')
+  binary_path.chmod(0o755)
+  return binary_path
+
+
+def test_is_validated_after_record(binary: pathlib.Path) -> None:
+  assert not is_validated([str(binary)])
+
+  record_validated([str(binary)])
+
+  assert is_validated([str(binary)])
+
+
+def test_is_validated_requires_every_binary(binary: pathlib.Path) -> None:
+  record_validated([str(binary), str(binary.parent / 'missing')])
+
+  assert is_validated([str(binary)])
+  assert not is_validated([str(binary), str(binary.parent / 'missing')])
+
+
+def test_is_validated_after_xpk_upgrade(
+    binary: pathlib.Path, mocker: MockerFixture
+) -> None:
+  record_validated([str(binary)])
+  mocker.patch(
+      'xpk.utils.dependencies.validation_cache.xpk_version', '99.99.99'
+  )
+
+  assert not is_validated([str(binary)])
+
+
+def test_is_validated_without_cache(
+    binary: pathlib.Path, mocker: MockerFixture
+) -> None:
+  record_validated([str(binary)])
+  mocker.patch(
+      'xpk.utils.dependencies.validation_cache.is_cache_enabled',
+      return_value=False,
+  )
+
+  assert not is_validated([str(binary)])
@@ -16,12 +16,16 @@ limitations under the License.
 
 dry_run = False
 quiet = False
+use_cache = True
 
 
-def set_context(dry_run_value: bool, quiet_value: bool) -> None:
-  """Sets the dry_run and quiet flags."""
+def set_context(
+    dry_run_value: bool, quiet_value: bool, use_cache_value: bool = True
+) -> None:
+  """Sets the dry_run, quiet and use_cache flags."""
   set_dry_run(dry_run_value)
   set_quiet(quiet_value)
+  set_use_cache(use_cache_value)
 
 
 def set_dry_run(dry_run_value: bool) -> None:
@@ -36,6 +40,12 @@ def set_quiet(quiet_value: bool) -> None:
   quiet = quiet_value
 
 
+def set_use_cache(use_cache_value: bool) -> None:
+  """Sets the use_cache flag."""
+  global use_cache
+  use_cache = use_cache_value
+
+
 def is_dry_run() -> bool:
   """Returns the current value of the dry_run flag."""
   return dry_run
@@ -44,3 +54,8 @@ def is_dry_run() -> bool:
 def is_quiet() -> bool:
   """Returns the current value of the quiet flag."""
   return quiet
+
+
+def is_cache_enabled() -> bool:
+  """Returns the current value of the use_cache flag."""
+  return use_cache
@@ -47,6 +47,9 @@ class _FeatureFlags:
   NATIVE_CLUSTER_TOOLKIT_ENABLED = _get_boolean_flag(
       "NATIVE_CLUSTER_TOOLKIT_ENABLED", default=True
   )
+  NATIVE_KUBE_CLIENT_ENABLED = _get_boolean_flag(
+      "NATIVE_KUBE_CLIENT_ENABLED", default=True
+  )
 
 
 FeatureFlags = _FeatureFlags()
@@ -0,0 +1,48 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+  """Imports a top-level module and defers running it until first used.
+
+  The returned module is registered in `sys.modules` right away, but its code
+  only runs when one of its attributes is accessed. Heavy SDKs used by a few
+  subcommands are imported this way, so that the rest of xpk starts fast.
+
+  Args:
+    name: name of a top-level module, e.g. 'kubernetes'. Submodules are not
+        supported, as finding them would import their package eagerly.
+
+  Returns:
+    The module, loaded lazily unless it was already imported.
+  """
+  if '.' in name:
+    raise ValueError(f'Only top-level modules can be imported lazily: {name}')
+  if name in sys.modules:
+    return sys.modules[name]
+  spec = importlib.util.find_spec(name)
+  if spec is None or spec.loader is None:
+    raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+  loader = importlib.util.LazyLoader(spec.loader)
+  spec.loader = loader
+  module = importlib.util.module_from_spec(spec)
+  sys.modules[name] = module
+  loader.exec_module(module)
+  return module
@@ -0,0 +1,55 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from .imports import lazy_import
+
+
+def test_lazy_import_runs_module_on_first_attribute_access(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+  marker = tmp_path / 'executed'
+  (tmp_path / 'xpk_lazy_sample.py').write_text(
+      f'open({str(marker)!r}, "w").close()\nVALUE = 42\n', encoding='utf-8'
+  )
+  monkeypatch.syspath_prepend(str(tmp_path))
+  monkeypatch.delitem(sys.modules, 'xpk_lazy_sample', raising=False)
+
+  module = lazy_import('xpk_lazy_sample')
+
+  assert sys.modules['xpk_lazy_sample'] is module
+  assert not marker.exists()
+  assert module.VALUE == 42
+  assert marker.exists()
+
+
+def test_lazy_import_returns_already_imported_module():
+  assert lazy_import('json') is json
+
+
+def test_lazy_import_rejects_submodules():
+  with pytest.raises(ValueError):
+    lazy_import('kubernetes.client')
+
+
+def test_lazy_import_missing_module():
+  with pytest.raises(ModuleNotFoundError):
+    lazy_import('xpk_missing_module')
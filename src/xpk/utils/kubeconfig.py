@@ -0,0 +1,159 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import contextlib
+import hashlib
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterator
+
+from .cache import exclusive_lock, get_cache_dir, read_json_file, write_json_file
+
+_CURRENT_CONTEXT_REGEX = re.compile(
+    r'^current-context:\s*["\']?([^\s"\']*)', re.MULTILINE
+)
+
+# GKE kubeconfigs fetch short-lived tokens through gke-gcloud-auth-plugin, so
+# a cached kubeconfig only goes stale when the cluster endpoint changes.
+CLUSTER_KUBECONFIG_TTL_SECONDS = 3600
+
+
+def get_kubeconfig_path() -> Path:
+  """Returns the kubeconfig file kubectl writes to, honoring KUBECONFIG."""
+  kubeconfig = os.environ.get('KUBECONFIG', '').split(os.pathsep)[0]
+  return Path(kubeconfig or Path.home() / '.kube' / 'config').expanduser()
+
+
+def get_current_context_key() -> str:
+  """Identifies the active kubectl context without spawning kubectl.
+
+  Returns:
+    `<kubeconfig path>:<current context>`, or an empty string if the
+    kubeconfig cannot be read.
+  """
+  path = get_kubeconfig_path()
+  try:
+    content = path.read_text(encoding='utf-8')
+  except OSError:
+    return ''
+  match = _CURRENT_CONTEXT_REGEX.search(content)
+  return f'{path}:{match.group(1) if match else ""}'
+
+
+@contextlib.contextmanager
+def _set_env(key: str, value: str) -> Iterator[None]:
+  environ = os.environ
+
+  backup = environ.get(key)
+  environ[key] = value
+  try:
+    yield
+  finally:
+    if backup is None:
+      del environ[key]
+    else:
+      environ[key] = backup
+
+
+@contextlib.contextmanager
+def sandbox_kubeconfig() -> Iterator[None]:
+  """Context manager to use a temporary k8s config file.
+
+  This ensures that xpk operations do not interfere with the user's default
+  k8s config file by limiting all operation into a temporary file for the
+  duration of the context.
+
+  We use KUBECONFIG environment so it's process wide and not thread safe.
+  """
+
+  with (
+      tempfile.TemporaryDirectory(prefix='xpk-kube-') as dir_name,
+      _set_env('KUBECONFIG', os.path.join(dir_name, 'config')),
+  ):
+    yield
+
+
+class ClusterKubeconfig:
+  """Kubeconfig of a single cluster, cached in the xpk cache directory.
+
+  Each cluster gets its own file, selected through KUBECONFIG, so xpk runs
+  targeting different clusters never write to the same kubeconfig. Runs
+  targeting the same cluster serialize on a lock file while they check and
+  refresh the credentials.
+  """
+
+  def __init__(self, project: str, location: str, cluster: str):
+    key = hashlib.sha256(f'{project}/{location}/{cluster}'.encode())
+    self.directory = get_cache_dir() / 'kubeconfigs' / key.hexdigest()[:32]
+    self.path = self.directory / 'config'
+    self._metadata_path = self.directory / 'metadata.json'
+
+  @contextlib.contextmanager
+  def lock(self) -> Iterator[None]:
+    """Holds the lock of this cluster's kubeconfig."""
+    self.directory.mkdir(parents=True, exist_ok=True)
+    with exclusive_lock(self.directory / 'lock'):
+      yield
+
+  def is_fresh(self) -> bool:
+    """Returns whether the cached credentials can be reused."""
+    metadata = read_json_file(self._metadata_path)
+    return (
+        isinstance(metadata, dict)
+        and metadata.get('expires_at', 0) > time.time()
+        and self.path.is_file()
+    )
+
+  @contextlib.contextmanager
+  def staging(self) -> Iterator[Path]:
+    """Points KUBECONFIG to an empty file for fetching new credentials.
+
+    Readers of the cached kubeconfig never see it half written, the staged
+    file only replaces it once passed to `store`.
+    """
+    staged = self.directory / f'.config.{os.getpid()}'
+    staged.unlink(missing_ok=True)
+    try:
+      with _set_env('KUBECONFIG', str(staged)):
+        yield staged
+    finally:
+      staged.unlink(missing_ok=True)
+
+  def store(self, staged: Path) -> bool:
+    """Replaces the cached kubeconfig with a staged one.
+
+    Returns:
+      True if the kubeconfig was stored, False otherwise.
+    """
+    try:
+      os.replace(staged, self.path)
+    except OSError:
+      return False
+    return write_json_file(
+        self._metadata_path,
+        {'expires_at': time.time() + CLUSTER_KUBECONFIG_TTL_SECONDS},
+    )
+
+  def activate(self) -> None:
+    """Makes kubectl use this kubeconfig for the rest of the process."""
+    os.environ['KUBECONFIG'] = str(self.path)
+
+  def forget(self) -> None:
+    """Drops the cached credentials, for example once the cluster is gone."""
+    self._metadata_path.unlink(missing_ok=True)
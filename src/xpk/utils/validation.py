@@ -14,35 +14,51 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from ..core.commands import run_command_for_value
 from .console import xpk_exit, xpk_print
 from enum import Enum
 from dataclasses import dataclass
 from .feature_flags import FeatureFlags
 from .dependencies.binary_dependencies import BinaryDependencies
-from .dependencies.manager import ensure_dependency
+from .dependencies.manager import ensure_dependencies
+from .dependencies.validation_cache import is_validated, record_validated
 
 
 @dataclass
 class _SystemDependency:
   command: str
+  # Binaries run by `command`, a change to any of them invalidates the
+  # cached validation.
+  binaries: tuple[str, ...]
   binary_dependency: BinaryDependencies | None = None
+  # Whether a successful validation is cached until the binaries change.
+  cacheable: bool = True
 
 
 class SystemDependency(Enum):
   """Represents required system dependencies."""
 
   KUBECTL = _SystemDependency(
-      command='kubectl --help', binary_dependency=BinaryDependencies.KUBECTL
+      command='kubectl --help',
+      binaries=('kubectl',),
+      binary_dependency=BinaryDependencies.KUBECTL,
+  )
+  GCLOUD = _SystemDependency(command='gcloud version', binaries=('gcloud',))
+  # `docker version` also checks that the daemon is running, which can change
+  # without the binary changing.
+  DOCKER = _SystemDependency(
+      command='docker version', binaries=('docker',), cacheable=False
   )
-  GCLOUD = _SystemDependency(command='gcloud version')
-  DOCKER = _SystemDependency(command='docker version')
   KUEUECTL = _SystemDependency(
       command='kubectl kueue --help',
+      binaries=('kubectl', 'kubectl-kueue'),
       binary_dependency=BinaryDependencies.KUBECTL_KUEUE,
   )
   CRANE = _SystemDependency(
-      command='crane --help', binary_dependency=BinaryDependencies.CRANE
+      command='crane --help',
+      binaries=('crane',),
+      binary_dependency=BinaryDependencies.CRANE,
   )
 
 
@@ -53,26 +69,53 @@ def should_validate_dependencies(args):
 
 
 def validate_dependencies_list(args, dependencies: list[SystemDependency]):
-  """Validates a list of system dependencies and returns none or exits with error."""
-  for dependency in dependencies:
-    auto_download = getattr(args, 'dependency_auto_download', True)
-    if (
-        FeatureFlags.DEPENDENCY_AUTO_DOWNLOAD
-        and auto_download
-        and dependency.value.binary_dependency is not None
-    ):
-      ensure_dependency(dependency.value.binary_dependency.value)
-    _validate_dependency(dependency)
-
-
-def _validate_dependency(dependency: SystemDependency) -> None:
-  """Validates system dependency and returns none or exits with error."""
+  """Validates a list of system dependencies and returns none or exits with error.
+
+  Cacheable dependencies whose binaries were validated before and did not
+  change since are skipped, the others are validated in parallel.
+  """
+  auto_download = getattr(args, 'dependency_auto_download', True)
+  binary_dependencies = [
+      dependency.value.binary_dependency.value
+      for dependency in dependencies
+      if dependency.value.binary_dependency is not None
+  ]
+  if (
+      FeatureFlags.DEPENDENCY_AUTO_DOWNLOAD
+      and auto_download
+      and binary_dependencies
+  ):
+    ensure_dependencies(binary_dependencies)
+
+  pending = [
+      dependency
+      for dependency in dependencies
+      if not dependency.value.cacheable
+      or not is_validated(dependency.value.binaries)
+  ]
+  if not pending:
+    return
+  with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+    return_codes = list(pool.map(_validate_dependency, pending))
+
+  for dependency, code in zip(pending, return_codes):
+    if code != 0:
+      xpk_print(
+          f'`{dependency.name.lower()}` not installed. Please follow  '
+          ' https://github.com/AI-Hypercomputer/xpk/blob/main/docs/installation.md#1-prerequisites'
+          ' to install xpk prerequisites.'
+      )
+      xpk_exit(code)
+  record_validated(
+      binary
+      for dependency in pending
+      if dependency.value.cacheable
+      for binary in dependency.value.binaries
+  )
+
+
+def _validate_dependency(dependency: SystemDependency) -> int:
+  """Runs the validation command of a system dependency."""
   name, cmd = dependency.name, dependency.value.command
   code, _ = run_command_for_value(cmd, f'Validate {name} installation.')
-  if code != 0:
-    xpk_print(
-        f'`{name.lower()}` not installed. Please follow  '
-        ' https://github.com/AI-Hypercomputer/xpk/blob/main/docs/installation.md#1-prerequisites'
-        ' to install xpk prerequisites.'
-    )
-    xpk_exit(code)
+  return code
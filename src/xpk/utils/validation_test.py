@@ -14,6 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import os
+from pathlib import Path
+
 import pytest
 from .validation import (
     validate_dependencies_list,
@@ -27,6 +30,31 @@ class Args:
   pass
 
 
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path / 'cache'))
+
+
+@pytest.fixture
+def bin_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+  directory = tmp_path / 'bin'
+  directory.mkdir()
+  monkeypatch.setenv('PATH', f'{directory}{os.pathsep}{os.environ["PATH"]}')
+  return directory
+
+
+def _fake_binary(bin_dir: Path, name: str) -> Path:
+  binary = bin_dir / name
+  binary.write_text('#!/bin/sh\n', encoding='utf-8')
+  binary.chmod(0o755)
+  return binary
+
+
+@pytest.fixture
+def fake_gcloud(bin_dir: Path) -> Path:
+  return _fake_binary(bin_dir, 'gcloud')
+
+
 def test_should_validate_dependencies_returns_true_by_default():
   assert should_validate_dependencies(Args())
 
@@ -75,13 +103,13 @@ def test_validate_dependencies_list_downloads_dependency_if_feature_flag_enabled
   mocker.patch(
       'xpk.utils.validation.run_command_for_value', return_value=(0, '')
   )
-  mock_ensure = mocker.patch('xpk.utils.validation.ensure_dependency')
+  mock_ensure = mocker.patch('xpk.utils.validation.ensure_dependencies')
   FeatureFlags.DEPENDENCY_AUTO_DOWNLOAD = True
 
   validate_dependencies_list(Args(), [SystemDependency.KUBECTL])
 
   mock_ensure.assert_called_once_with(
-      SystemDependency.KUBECTL.value.binary_dependency.value
+      [SystemDependency.KUBECTL.value.binary_dependency.value]
   )
 
 
@@ -91,7 +119,7 @@ def test_validate_dependencies_list_skips_download_if_feature_flag_disabled(
   mocker.patch(
       'xpk.utils.validation.run_command_for_value', return_value=(0, '')
   )
-  mock_ensure = mocker.patch('xpk.utils.validation.ensure_dependency')
+  mock_ensure = mocker.patch('xpk.utils.validation.ensure_dependencies')
   FeatureFlags.DEPENDENCY_AUTO_DOWNLOAD = False
 
   validate_dependencies_list(Args(), [SystemDependency.KUBECTL])
@@ -105,7 +133,7 @@ def test_validate_dependencies_list_skips_download_if_no_binary_dependency(
   mocker.patch(
       'xpk.utils.validation.run_command_for_value', return_value=(0, '')
   )
-  mock_ensure = mocker.patch('xpk.utils.validation.ensure_dependency')
+  mock_ensure = mocker.patch('xpk.utils.validation.ensure_dependencies')
   FeatureFlags.DEPENDENCY_AUTO_DOWNLOAD = True
 
   validate_dependencies_list(Args(), [SystemDependency.DOCKER])
@@ -119,7 +147,7 @@ def test_validate_dependencies_list_skips_download_if_args_flag_disabled(
   mocker.patch(
       'xpk.utils.validation.run_command_for_value', return_value=(0, '')
   )
-  mock_ensure = mocker.patch('xpk.utils.validation.ensure_dependency')
+  mock_ensure = mocker.patch('xpk.utils.validation.ensure_dependencies')
   FeatureFlags.DEPENDENCY_AUTO_DOWNLOAD = True
   args = Args()
   args.dependency_auto_download = False
@@ -135,7 +163,7 @@ def test_validate_dependencies_list_downloads_dependency_if_args_flag_enabled(
   mocker.patch(
       'xpk.utils.validation.run_command_for_value', return_value=(0, '')
   )
-  mock_ensure = mocker.patch('xpk.utils.validation.ensure_dependency')
+  mock_ensure = mocker.patch('xpk.utils.validation.ensure_dependencies')
   FeatureFlags.DEPENDENCY_AUTO_DOWNLOAD = True
   args = Args()
   args.dependency_auto_download = True
@@ -143,5 +171,78 @@ def test_validate_dependencies_list_downloads_dependency_if_args_flag_enabled(
   validate_dependencies_list(args, [SystemDependency.KUBECTL])
 
   mock_ensure.assert_called_once_with(
-      SystemDependency.KUBECTL.value.binary_dependency.value
+      [SystemDependency.KUBECTL.value.binary_dependency.value]
+  )
+
+
+def test_validate_dependencies_list_skips_validated_dependencies(
+    mocker, fake_gcloud: Path
+):
+  del fake_gcloud
+  run = mocker.patch(
+      'xpk.utils.validation.run_command_for_value', return_value=(0, '')
+  )
+
+  validate_dependencies_list(Args(), [SystemDependency.GCLOUD])
+  validate_dependencies_list(Args(), [SystemDependency.GCLOUD])
+
+  run.assert_called_once()
+
+
+def test_validate_dependencies_list_validates_changed_binaries_again(
+    mocker, fake_gcloud: Path
+):
+  run = mocker.patch(
+      'xpk.utils.validation.run_command_for_value', return_value=(0, '')
   )
+
+  validate_dependencies_list(Args(), [SystemDependency.GCLOUD])
+  fake_gcloud.write_text('#!/bin/sh\nexit 0\n', encoding='utf-8')
+  validate_dependencies_list(Args(), [SystemDependency.GCLOUD])
+
+  assert run.call_count == 2
+
+
+def test_validate_dependencies_list_always_checks_docker_daemon(
+    mocker, bin_dir: Path
+):
+  _fake_binary(bin_dir, 'docker')
+  run = mocker.patch(
+      'xpk.utils.validation.run_command_for_value', return_value=(0, '')
+  )
+
+  validate_dependencies_list(Args(), [SystemDependency.DOCKER])
+  validate_dependencies_list(Args(), [SystemDependency.DOCKER])
+
+  assert run.call_count == 2
+
+
+def test_validate_dependencies_list_does_not_cache_failed_validation(
+    mocker, fake_gcloud: Path
+):
+  del fake_gcloud
+  run = mocker.patch(
+      'xpk.utils.validation.run_command_for_value', return_value=(1, '')
+  )
+
+  for _ in range(2):
+    with pytest.raises(SystemExit):
+      validate_dependencies_list(Args(), [SystemDependency.GCLOUD])
+
+  assert run.call_count == 2
+
+
+def test_validate_dependencies_list_runs_every_pending_validation(mocker):
+  run = mocker.patch(
+      'xpk.utils.validation.run_command_for_value', return_value=(0, '')
+  )
+  FeatureFlags.DEPENDENCY_AUTO_DOWNLOAD = False
+
+  validate_dependencies_list(
+      Args(), [SystemDependency.GCLOUD, SystemDependency.DOCKER]
+  )
+
+  assert sorted(call.args[0] for call in run.call_args_list) == [
+      'docker version',
+      'gcloud version',
+  ]